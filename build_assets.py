@@ -0,0 +1,181 @@
+"""
+build_assets.py - 프런트엔드 정적 자산 빌드 스크립트
+
+사용법:
+    python build_assets.py              # Tailwind CSS 생성 + 외부 라이브러리 내려받기(검증)
+    python build_assets.py --css-only   # Tailwind CSS만 다시 생성
+    python build_assets.py --update-lock  # 버전 변경(또는 최초 고정) 후 vendor.json의 SHA-256 갱신
+    python build_assets.py --check      # 커밋된 자산 확인만 (도입 후 없거나 해시가 다르면 종료 코드 1)
+
+출력:
+    web/assets/app.css                 (web/index.html·web/js/*.js에서 실제 쓰는 클래스만 담은 Tailwind CSS)
+    web/assets/vendor/<파일>            (tools/assets/vendor.json에 버전이 고정된 Chart.js, html2canvas)
+
+Tailwind:
+    tools/assets/tailwind.config.js 의 content 경로를 스캔해 사용 클래스만 생성(purge)·압축한다.
+    실행 파일은 TAILWIND_BIN 환경변수 → PATH의 tailwindcss → npx tailwindcss@<버전> 순으로 찾는다.
+    JS에서 문자열 조합으로 만드는 클래스(bg-${color}-100 등)는 config의 safelist에 추가해야 한다.
+
+규칙:
+    ★ 생성된 web/assets/ 파일은 저장소에 커밋한다 — 현장 PC는 인터넷 없이도 동작해야 하고,
+      build_patch.py도 커밋된 파일만 패치에 담는다.
+    ★ web/index.html은 web/assets/ 파일이 없을 때만 CDN으로 대체 로드한다 (개발 환경용).
+    ★ build_embedded.bat·build_patch.py는 --check(check_assets)가 실패하면 배포물을 만들지 않는다.
+      단, 아직 한 번도 생성·고정하지 않은 상태(app.css 없음 + vendor.json 해시 전부 비어 있음)에서는
+      경고만 하고 통과한다 — 그동안 index.html은 CDN 대체 로드로 동작한다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+ASSET_SRC_DIR = ROOT / "tools" / "assets"
+TAILWIND_CONFIG = ASSET_SRC_DIR / "tailwind.config.js"
+TAILWIND_INPUT = ASSET_SRC_DIR / "tailwind.input.css"
+VENDOR_LOCK = ASSET_SRC_DIR / "vendor.json"
+ASSETS_DIR = ROOT / "web" / "assets"
+VENDOR_DIR = ASSETS_DIR / "vendor"
+CSS_OUTPUT = ASSETS_DIR / "app.css"
+
+# npx로 실행할 때 고정할 Tailwind 버전 (CDN 런타임과 같은 v3 계열)
+TAILWIND_VERSION = "3.4.17"
+
+
+def _tailwind_command() -> list:
+    env_bin = os.environ.get("TAILWIND_BIN")
+    if env_bin:
+        return [env_bin]
+    found = shutil.which("tailwindcss")
+    if found:
+        return [found]
+    npx = shutil.which("npx")
+    if npx:
+        return [npx, "--yes", f"tailwindcss@{TAILWIND_VERSION}"]
+    raise SystemExit(
+        "[오류] Tailwind 실행 파일을 찾을 수 없습니다. "
+        "TAILWIND_BIN 환경변수에 standalone tailwindcss 경로를 지정하거나 Node.js(npx)를 설치하세요."
+    )
+
+
+def build_css():
+    """사용 중인 클래스만 담은 압축 CSS 생성"""
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    cmd = _tailwind_command() + [
+        "-c", str(TAILWIND_CONFIG),
+        "-i", str(TAILWIND_INPUT),
+        "-o", str(CSS_OUTPUT),
+        "--minify",
+    ]
+    print(f"  Tailwind: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=str(ROOT), check=True)
+    print(f"  [생성] {CSS_OUTPUT.relative_to(ROOT)} ({CSS_OUTPUT.stat().st_size:,} bytes)")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def fetch_vendor(update_lock: bool = False):
+    """vendor.json에 고정된 라이브러리를 내려받아 SHA-256 확인 후 web/assets/vendor/에 저장"""
+    lock = json.loads(VENDOR_LOCK.read_text(encoding="utf-8"))
+    VENDOR_DIR.mkdir(parents=True, exist_ok=True)
+    changed = False
+
+    for entry in lock["packages"]:
+        target = VENDOR_DIR / entry["file"]
+        expected = entry.get("sha256") or ""
+        if target.exists() and expected and _sha256(target.read_bytes()) == expected:
+            print(f"  [유지] {entry['name']} {entry['version']}")
+            continue
+
+        print(f"  [다운로드] {entry['name']} {entry['version']} ← {entry['url']}")
+        req = urllib.request.Request(entry["url"], headers={"User-Agent": "WorkManagement-AssetBuild"})
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            data = resp.read()
+        actual = _sha256(data)
+
+        if not update_lock:
+            if not expected:
+                raise SystemExit(
+                    f"[오류] {entry['name']} SHA-256이 고정되지 않았습니다. "
+                    f"내려받은 파일을 확인한 뒤 --update-lock으로 고정하세요."
+                )
+            if actual != expected:
+                raise SystemExit(
+                    f"[오류] {entry['name']} 해시 불일치 (기대 {expected[:12]}…, 실제 {actual[:12]}…). "
+                    f"버전을 바꿨다면 --update-lock으로 다시 실행하세요."
+                )
+        else:
+            entry["sha256"] = actual
+            changed = True
+        target.write_bytes(data)
+
+    if changed:
+        VENDOR_LOCK.write_text(json.dumps(lock, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"  [갱신] {VENDOR_LOCK.relative_to(ROOT)}")
+
+
+def check_assets() -> list:
+    """배포 전 확인 — 커밋된 app.css·vendor 파일이 있고 vendor.json 해시와 맞는지 → 문제 목록 (없으면 [])"""
+    problems = []
+    if not CSS_OUTPUT.exists() or CSS_OUTPUT.stat().st_size == 0:
+        problems.append(f"{CSS_OUTPUT.relative_to(ROOT)} 없음")
+    lock = json.loads(VENDOR_LOCK.read_text(encoding="utf-8"))
+    for entry in lock["packages"]:
+        target = VENDOR_DIR / entry["file"]
+        expected = entry.get("sha256") or ""
+        if not expected:
+            problems.append(f"{entry['name']} SHA-256 미고정 ({VENDOR_LOCK.relative_to(ROOT)})")
+        if not target.exists():
+            problems.append(f"{target.relative_to(ROOT)} 없음")
+        elif expected and _sha256(target.read_bytes()) != expected:
+            problems.append(f"{target.relative_to(ROOT)} 해시 불일치")
+    return problems
+
+
+def assets_adopted() -> bool:
+    """정적 자산을 도입했는지 — app.css가 있거나 vendor.json에 고정된 해시가 하나라도 있으면 True"""
+    if CSS_OUTPUT.exists():
+        return True
+    lock = json.loads(VENDOR_LOCK.read_text(encoding="utf-8"))
+    return any(entry.get("sha256") for entry in lock["packages"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프런트엔드 정적 자산 빌드")
+    parser.add_argument("--css-only", action="store_true", help="Tailwind CSS만 생성")
+    parser.add_argument("--update-lock", action="store_true", help="vendor.json SHA-256 갱신")
+    parser.add_argument("--check", action="store_true", help="커밋된 자산 확인만 (실패 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    if args.check:
+        if not assets_adopted():
+            print("  [경고] 정적 자산이 아직 생성되지 않았습니다 — CDN 대체 로드로 배포됩니다. "
+                  "인터넷이 되는 PC에서 python build_assets.py --update-lock 실행 후 커밋하세요.")
+            return 0
+        problems = check_assets()
+        for problem in problems:
+            print(f"  [오류] {problem}")
+        if problems:
+            print("정적 자산이 준비되지 않았습니다 — 인터넷이 되는 PC에서 python build_assets.py 실행 후 커밋하세요.")
+            return 1
+        print("정적 자산 확인 완료")
+        return 0
+
+    print("[1] Tailwind CSS 생성")
+    build_css()
+    if not args.css_only:
+        print("[2] 외부 라이브러리 고정 버전 확인")
+        fetch_vendor(update_lock=args.update_lock)
+    print("완료 — web/assets/ 변경 사항을 커밋하세요.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
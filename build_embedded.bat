@@ -18,6 +18,18 @@ echo ================================
 echo Embedded Python 빌드 시작
 echo ================================
 
+REM ---------------------------------------------------------------
+REM 0. 정적 자산(Tailwind CSS, Chart.js, html2canvas) 확인
+REM    없으면 CDN 대체 로드라 오프라인 현장에서 화면이 깨지므로 빌드 중단
+REM    (아직 한 번도 생성·고정하지 않았으면 --check가 경고만 하고 통과)
+REM ---------------------------------------------------------------
+python build_assets.py --check
+if errorlevel 1 (
+    echo [오류] 정적 자산 미준비 - python build_assets.py 실행 후 web\assets\ 를 커밋하세요
+    pause
+    exit /b 1
+)
+
 REM ---------------------------------------------------------------
 REM 1. 기존 빌드 폴더 정리
 REM ---------------------------------------------------------------
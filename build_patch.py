@@ -2,13 +2,21 @@
 build_patch.py - 표준 패치 ZIP 빌드 스크립트
 
 사용법:
-    python build_patch.py <version> <file1> [<file2> ...]
+    python build_patch.py <version> <file1> [<file2> ...] [--base-ref <git 태그/커밋>]
 
 예시:
     python build_patch.py 1.3.5 web/js/splash.js src/utils/update_manager.py
+    python build_patch.py 1.3.6 src/web/api.py --base-ref v1.3.5
 
 출력:
     patch_build/patch_v<version>/patch_v<version>.zip
+    patch_build/patch_v<version>/patch_v<version>_full.zip  (--base-ref 지정 시, 델타 적용 실패 대비 전체 파일본)
+    patch_build/patch_v<version>/patch_manifest.json  (ZIP의 SHA-256 — 릴리스에 ZIP과 함께 업로드)
+
+델타 패치 (--base-ref):
+    base-ref 시점의 파일(현장 PC에 설치된 이전 버전)과 비교해 변경 구간만 담은 .wmdelta 파일을 만든다.
+    patch.json 항목에 기준/결과 SHA-256을 기록하고, 델타가 전체 파일의 절반 이상이면 전체 파일을 넣는다.
+    현장 PC 파일이 기준과 다르면 UpdateManager가 _full.zip을 받아 다시 적용한다.
 
 규칙 (재발 방지):
     ★ 패치 ZIP 안에는 반드시 'patch_v<version>/' 래퍼 폴더가 최상위에 있어야 함.
@@ -17,62 +25,137 @@ build_patch.py - 표준 패치 ZIP 빌드 스크립트
 """
 
 import sys
+import argparse
+import hashlib
 import json
+import subprocess
 import zipfile
 import shutil
 from pathlib import Path
 
+from src.utils.delta_patch import DELTA_SUFFIX, make_delta, sha256_bytes
+
+
+MANIFEST_NAME = "patch_manifest.json"
+
+
+def write_manifest(version: str, zip_paths: list[Path], manifest_path: Path) -> Path:
+    """릴리스 에셋 검증용 매니페스트 작성 — UpdateManager가 다운로드 후 SHA-256을 대조한다"""
+    assets = {}
+    for zp in zip_paths:
+        digest = hashlib.sha256(zp.read_bytes()).hexdigest()
+        assets[zp.name] = {"sha256": digest, "size": zp.stat().st_size}
+    manifest = {"version": version, "assets": assets}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest_path
+
+
+# 델타가 전체 파일 크기의 이 비율 이상이면 전체 파일을 넣는다
+DELTA_MAX_RATIO = 0.5
+
+
+def _read_base_file(repo_root: Path, base_ref: str, src: str, current: bytes):
+    """base_ref 시점의 파일 내용. 없으면 None
+
+    현장 PC 파일은 작업 트리와 같은 줄바꿈으로 설치되므로, 현재 파일이 CRLF이면
+    .gitattributes 필터(eol=crlf)를 적용한 내용을, 아니면 저장소 원본(LF)을 기준으로 삼는다.
+    """
+    cmd = ["git", "cat-file", "--filters", f"{base_ref}:{src}"] if b"\r\n" in current \
+        else ["git", "cat-file", "blob", f"{base_ref}:{src}"]
+    try:
+        return subprocess.run(cmd, cwd=repo_root, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError:
+        return None
+
+
+def _write_patch_zip(zip_path: Path, patch_name: str, patch_json: dict, entries: list) -> list:
+    """patch.json + (arcname, bytes) 목록으로 ZIP 작성 후 래퍼 폴더 구조 검증 → ZIP 내부 이름 목록"""
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{patch_name}/patch.json", json.dumps(patch_json, indent=2, ensure_ascii=False))
+        for rel, data in entries:
+            arcname = f"{patch_name}/{rel}"
+            zf.writestr(arcname, data)
+            print(f"  추가: {arcname} ({len(data):,} bytes)")
+
+    # 검증: 최상위 폴더가 정확히 1개인지 확인
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        names = zf.namelist()
+        top_dirs = set()
+        for name in names:
+            parts = name.split("/")
+            if parts[0]:
+                top_dirs.add(parts[0])
+        assert len(top_dirs) == 1 and top_dirs.pop() == patch_name, \
+            f"ZIP 구조 오류: top_dirs={top_dirs} (반드시 {{'{patch_name}'}} 이어야 함)"
+    return names
+
 
-def build_patch(version: str, source_files: list[str]):
+def build_patch(version: str, source_files: list[str], base_ref: str = None):
     repo_root = Path(__file__).parent
     patch_name = f"patch_v{version}"
     patch_dir = repo_root / "patch_build" / patch_name
     zip_path = patch_dir / f"{patch_name}.zip"
+    full_zip_path = patch_dir / f"{patch_name}_full.zip"
 
     # 패치 디렉토리 생성
     patch_dir.mkdir(parents=True, exist_ok=True)
 
-    # patch.json 생성
-    files_list = []
+    # 전체 파일 항목 (결과 SHA-256 포함)
+    contents = {}
+    full_files, full_entries = [], []
     for src in source_files:
-        files_list.append({"source": src, "target": src})
+        src_path = repo_root / src
+        if not src_path.exists():
+            print(f"[경고] 파일 없음: {src_path}")
+            continue
+        contents[src] = src_path.read_bytes()
+        full_files.append({"source": src, "target": src, "sha256": sha256_bytes(contents[src])})
+        full_entries.append((src, contents[src]))
+
+    files_list, entries = full_files, full_entries
+    if base_ref:
+        # 델타 항목 — 기준 파일이 없거나 델타 이득이 적으면 전체 파일 유지
+        files_list, entries = [], []
+        for full_item, (src, data) in zip(full_files, full_entries):
+            base = _read_base_file(repo_root, base_ref, src, data)
+            delta = make_delta(base, data) if base is not None else None
+            if delta is not None and len(delta) < len(data) * DELTA_MAX_RATIO:
+                files_list.append({
+                    "source": src + DELTA_SUFFIX, "target": src, "type": "delta",
+                    "base_sha256": sha256_bytes(base), "sha256": full_item["sha256"],
+                })
+                entries.append((src + DELTA_SUFFIX, delta))
+            else:
+                files_list.append(full_item)
+                entries.append((src, data))
 
     patch_json = {
         "version": version,
         "description": f"v{version} 패치",
         "files": files_list
     }
+    if base_ref:
+        patch_json["base_ref"] = base_ref
     patch_json_path = patch_dir / "patch.json"
     with open(patch_json_path, "w", encoding="utf-8") as f:
         json.dump(patch_json, f, indent=2, ensure_ascii=False)
 
     # ZIP 빌드 — 반드시 patch_vX.X.X/ 래퍼 폴더 포함
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        # patch.json
-        zf.write(patch_json_path, f"{patch_name}/patch.json")
-
-        # 소스 파일들
-        for src in source_files:
-            src_path = repo_root / src
-            if not src_path.exists():
-                print(f"[경고] 파일 없음: {src_path}")
-                continue
-            arcname = f"{patch_name}/{src}"
-            zf.write(src_path, arcname)
-            print(f"  추가: {arcname}")
-
-    # 검증: 최상위 폴더가 정확히 1개인지 확인
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        names = zf.namelist()
-        top_dirs = set()
-        for name in names:
-            parts = name.split("/")
-            if parts[0]:
-                top_dirs.add(parts[0])
-        assert len(top_dirs) == 1 and top_dirs.pop() == patch_name, \
-            f"ZIP 구조 오류: top_dirs={top_dirs} (반드시 {{'{patch_name}'}} 이어야 함)"
-
-    print(f"\nOK 패치 ZIP 빌드 완료: {zip_path}")
+    names = _write_patch_zip(zip_path, patch_name, patch_json, entries)
+    zip_paths = [zip_path]
+    if base_ref:
+        full_json = dict(patch_json, files=full_files)
+        full_json.pop("base_ref", None)
+        _write_patch_zip(full_zip_path, patch_name, full_json, full_entries)
+        zip_paths.append(full_zip_path)
+
+    manifest_path = write_manifest(version, zip_paths, patch_dir / MANIFEST_NAME)
+
+    print(f"\nOK 패치 ZIP 빌드 완료: {zip_path} ({zip_path.stat().st_size:,} bytes)")
+    if base_ref:
+        print(f"  전체 파일본: {full_zip_path} ({full_zip_path.stat().st_size:,} bytes)")
+    print(f"  매니페스트: {manifest_path}")
     print(f"  내부 구조:")
     for name in names:
         print(f"    {name}")
@@ -94,11 +177,30 @@ if __name__ == "__main__":
         print("예시: python build_patch.py 1.3.5 web/js/splash.js src/utils/update_manager.py")
         sys.exit(1)
 
-    version = sys.argv[1]
-    files = sys.argv[2:]
-
-    print(f"패치 빌드: v{version}")
-    print(f"파일 목록: {files}")
+    parser = argparse.ArgumentParser(usage=__doc__)
+    parser.add_argument("version")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--base-ref", default=None)
+    args = parser.parse_args()
+
+    # web/ 파일을 배포할 때는 로컬 정적 자산이 준비돼 있어야 한다 (없으면 현장 PC가 CDN에 의존)
+    # 아직 한 번도 생성·고정하지 않았으면 경고만 한다
+    if any(f.replace("\\", "/").startswith("web/") for f in args.files):
+        from build_assets import assets_adopted, check_assets
+        adopted = assets_adopted()
+        if not adopted:
+            print("[경고] 정적 자산 미생성 — CDN 대체 로드로 배포됩니다 (python build_assets.py --update-lock 후 커밋 권장)")
+        problems = check_assets() if adopted else []
+        if problems:
+            for problem in problems:
+                print(f"[오류] {problem}")
+            print("먼저 python build_assets.py 실행 후 web/assets/ 를 커밋하세요.")
+            sys.exit(1)
+
+    print(f"패치 빌드: v{args.version}")
+    print(f"파일 목록: {args.files}")
+    if args.base_ref:
+        print(f"델타 기준: {args.base_ref}")
     print()
 
-    build_patch(version, files)
+    build_patch(args.version, args.files, base_ref=args.base_ref)
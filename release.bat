@@ -173,6 +173,17 @@ powershell -Command ^
     "Invoke-RestMethod -Uri $uri -Method POST -Headers $h -Body $bytes | Out-Null;" ^
     "Write-Host '    업로드 완료'"
 
+REM ── SHA-256 매니페스트 업로드 (앱이 다운로드 후 해시 검증) ─────
+echo     매니페스트 업로드 중: patch_manifest.json
+powershell -Command ^
+    "$hash = (Get-FileHash -Algorithm SHA256 '!ZIP_NAME!').Hash.ToLower();" ^
+    "$size = (Get-Item '!ZIP_NAME!').Length;" ^
+    "$manifest = @{ version='!VERSION!'; assets=@{ '!ZIP_NAME!'=@{ sha256=$hash; size=$size } } } ^| ConvertTo-Json -Depth 5;" ^
+    "$h = @{ Authorization = 'token !GH_TOKEN!'; 'Content-Type' = 'application/json' };" ^
+    "$uri = 'https://uploads.github.com/repos/!REPO_OWNER!/!REPO_NAME!/releases/!RELEASE_ID!/assets?name=patch_manifest.json';" ^
+    "Invoke-RestMethod -Uri $uri -Method POST -Headers $h -Body ([System.Text.Encoding]::UTF8.GetBytes($manifest)) | Out-Null;" ^
+    "Write-Host '    업로드 완료'"
+
 del "!ZIP_NAME!" >nul 2>&1
 
 echo.
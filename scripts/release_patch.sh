@@ -117,6 +117,20 @@ PATCH_FOLDER_NAME="$(basename "$PATCH_DIR")"
 
 echo "패치 zip 생성: $ZIP_PATH"
 
+# 다운로드 검증용 SHA-256 매니페스트 생성 (앱의 UpdateManager가 대조)
+MANIFEST_PATH="/tmp/patch_manifest.json"
+python3 - "$VERSION" "$ZIP_PATH" "$MANIFEST_PATH" <<'PY'
+import hashlib, json, os, sys
+version, zip_path, manifest_path = sys.argv[1:4]
+with open(zip_path, 'rb') as f:
+    digest = hashlib.sha256(f.read()).hexdigest()
+manifest = {"version": version,
+            "assets": {os.path.basename(zip_path): {"sha256": digest, "size": os.path.getsize(zip_path)}}}
+with open(manifest_path, 'w', encoding='utf-8') as f:
+    json.dump(manifest, f, indent=2)
+PY
+echo "매니페스트 생성: $MANIFEST_PATH"
+
 # release 생성 (이미 있으면 실패하지 않음)
 if gh release view "$TAG" --repo "$REPO" >/dev/null 2>&1; then
   echo "기존 릴리즈가 존재합니다: $TAG"
@@ -136,8 +150,8 @@ else
 fi
 
 # asset 업로드 (동일 이름 있으면 덮어쓰기)
-gh release upload "$TAG" "$ZIP_PATH" \
+gh release upload "$TAG" "$ZIP_PATH" "$MANIFEST_PATH" \
   --repo "$REPO" \
   --clobber
 
-echo "asset 업로드 완료: $TAG / $ZIP_NAME"
+echo "asset 업로드 완료: $TAG / $ZIP_NAME (+ patch_manifest.json)"
@@ -0,0 +1,233 @@
+# src/business/completion_stats.py - 엔진 모델·작업 내용별 공사 기간 통계 (완료일 예측)
+# 마일스톤 편집 창의 완료 예상일(estimate_completion)이 호출마다 LIKE 검색으로 평균을 내던 것을 대신한다.
+# 표본: 보드 프로젝트 마일스톤(목표 착수일 → 실제 완료일) + 준공된 계약의 작업 기간(첫 작업일 → 마지막 작업일)
+# 표본은 completion_samples에, 키별 중앙값·P80은 completion_stats에 저장한다. estimate()는 통계 테이블만 읽고,
+# 갱신(refresh — 달라진 표본만 반영해 해당 키의 통계만 재계산)은 일일 스케줄러와
+# 조회 시 백그라운드 스레드(데이터 변경 + REFRESH_MIN_INTERVAL 경과 시)에서 한다.
+
+import re
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.logger import logger
+from .project_status import project_status_resolver, STATUS_DONE
+
+# 유효 표본 기간(일)
+MIN_DURATION_DAYS = 1
+MAX_DURATION_DAYS = 365
+# 더 구체적인 키(모델+작업)를 쓰기 위한 최소 표본 수 — 부족하면 모델 → 작업 내용 순으로 넓힌다
+MIN_SAMPLES = 3
+# 작업 내용 키 길이 (정규화 후 앞부분)
+WORK_KEY_LENGTH = 10
+# 조회가 요청하는 백그라운드 갱신의 최소 간격(초) — 자동 저장마다 전체 표본을 다시 모으지 않도록
+REFRESH_MIN_INTERVAL = 600
+
+_ENGINE_STRIP = re.compile(r'[\s\-_/.]+')
+_WORK_STRIP = re.compile(r'[\W\d_]+')
+
+
+def engine_key(engine_model: str) -> str:
+    """'6S50MC-C' / '6s50 mcc' → '6S50MCC'"""
+    return _ENGINE_STRIP.sub('', (engine_model or '').upper())
+
+
+def work_key(work_content: str) -> str:
+    """공백·기호·숫자(호기 번호 등)를 뺀 작업 내용 앞부분 ('M/E 오버홀 #2' → 'ME오버홀')"""
+    return _WORK_STRIP.sub('', (work_content or '').upper())[:WORK_KEY_LENGTH]
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """정렬된 값의 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return None
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def _stat_keys(ek: str, wk: str) -> List[str]:
+    keys = []
+    if ek and wk:
+        keys.append(f'both:{ek}|{wk}')
+    if ek:
+        keys.append(f'model:{ek}')
+    if wk:
+        keys.append(f'work:{wk}')
+    return keys
+
+
+def _days_between(start: str, end: str) -> Optional[int]:
+    try:
+        days = (datetime.strptime(end, '%Y-%m-%d') - datetime.strptime(start, '%Y-%m-%d')).days
+    except (TypeError, ValueError):
+        return None
+    return days if MIN_DURATION_DAYS <= days <= MAX_DURATION_DAYS else None
+
+
+class CompletionStats:
+    """완료 기간 표본·통계 테이블 관리와 조회"""
+
+    _BASIS = {'both': '모델+작업', 'model': '엔진 모델', 'work': '작업 내용'}
+
+    def __init__(self, store=None, resolver=None):
+        self._store = store
+        self._resolver = resolver
+        self._lock = threading.Lock()
+        self._generation: Optional[Tuple] = None
+        # 백그라운드 갱신 상태 (마지막 갱신 시각은 time.monotonic 기준)
+        self._schedule_lock = threading.Lock()
+        self._refreshing = False
+        self._last_refresh = 0.0
+
+    @property
+    def store(self):
+        if self._store is None:
+            from ..database.db_manager import db
+            self._store = db
+        return self._store
+
+    @property
+    def resolver(self):
+        return self._resolver or project_status_resolver
+
+    def _current_generation(self) -> Tuple:
+        # DB 데이터 세대 카운터(이 PC·다른 PC 모두) + 자동 준공 판정이 날짜에 따라 바뀌므로 오늘 날짜
+        return self.store.get_data_generation(), date.today().isoformat()
+
+    def _collect_samples(self, conn) -> Dict[Tuple[str, str], Tuple[str, str, int]]:
+        """현재 데이터 기준 표본 {(source, source_id): (engine_key, work_key, 기간)}"""
+        samples: Dict[Tuple[str, str], Tuple[str, str, int]] = {}
+        covered = set()
+        statuses = self.resolver.snapshot()
+        for row in conn.execute(
+                "SELECT id, contract_number, engine_model, work_content, target_start_date, actual_end_date "
+                "FROM board_projects WHERE actual_end_date != '' AND target_start_date != ''"):
+            days = _days_between(row[4], row[5])
+            if days is None:
+                continue
+            samples[('board', str(row[0]))] = (engine_key(row[2]), work_key(row[3]), days)
+            if row[1]:
+                covered.add(row[1])
+        # 보드 마일스톤이 없는 준공 계약은 실제 작업 기간을 표본으로
+        for row in conn.execute(
+                "SELECT contract_number, MAX(engine_model), MAX(work_content), MIN(date), MAX(date) "
+                "FROM work_records WHERE contract_number != '' AND contract_number IS NOT NULL "
+                "GROUP BY contract_number"):
+            if row[0] in covered:
+                continue
+            if statuses.resolve(row[0], row[4] or '') != STATUS_DONE:
+                continue
+            days = _days_between(row[3], row[4])
+            if days is not None:
+                samples[('records', row[0])] = (engine_key(row[1]), work_key(row[2]), days)
+        return samples
+
+    def refresh(self, force: bool = False) -> int:
+        """데이터가 바뀌었으면 달라진 표본만 반영하고 영향받은 키의 통계 재계산 → 다시 계산한 키 수"""
+        with self._lock:
+            generation = self._current_generation()
+            if not force and self._generation == generation:
+                return 0
+            with self.store.get_connection() as conn:
+                current = self._collect_samples(conn)
+                stored = {(r[0], r[1]): (r[2], r[3], r[4]) for r in conn.execute(
+                    'SELECT source, source_id, engine_key, work_key, duration_days FROM completion_samples')}
+
+                upserts = [(src, sid) + value for (src, sid), value in current.items()
+                           if stored.get((src, sid)) != value]
+                deletes = [key for key in stored if key not in current]
+                affected = set()
+                for key in [k[:2] for k in upserts] + deletes:
+                    for value in (stored.get(key), current.get(key)):
+                        if value:
+                            affected.update(_stat_keys(value[0], value[1]))
+                if force:
+                    affected.update(r[0] for r in conn.execute('SELECT stat_key FROM completion_stats'))
+
+                if upserts:
+                    conn.executemany(
+                        'INSERT OR REPLACE INTO completion_samples '
+                        '(source, source_id, engine_key, work_key, duration_days) VALUES (?, ?, ?, ?, ?)', upserts)
+                if deletes:
+                    conn.executemany('DELETE FROM completion_samples WHERE source = ? AND source_id = ?', deletes)
+                self._recompute(conn, affected)
+            self._generation = generation
+            self._last_refresh = time.monotonic()
+            if affected:
+                logger.info(f"완료 기간 통계 갱신: 표본 변경 {len(upserts)}건, 삭제 {len(deletes)}건, "
+                            f"통계 {len(affected)}개")
+            return len(affected)
+
+    def request_refresh(self) -> bool:
+        """데이터가 바뀌었고 마지막 갱신 후 REFRESH_MIN_INTERVAL이 지났으면 백그라운드 갱신 시작 → 시작 여부"""
+        with self._schedule_lock:
+            if self._refreshing:
+                return False
+            if self._generation is not None and (
+                    time.monotonic() - self._last_refresh < REFRESH_MIN_INTERVAL
+                    or self._generation == self._current_generation()):
+                return False
+            self._refreshing = True
+        threading.Thread(target=self._refresh_worker, name='completion-stats', daemon=True).start()
+        return True
+
+    def _refresh_worker(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"완료 기간 통계 갱신 오류: {e}")
+        finally:
+            with self._schedule_lock:
+                self._refreshing = False
+
+    @staticmethod
+    def _recompute(conn, stat_keys: Iterable[str]):
+        now = datetime.now().isoformat(timespec='seconds')
+        for stat_key in stat_keys:
+            kind, _, key = stat_key.partition(':')
+            if kind == 'both':
+                ek, _, wk = key.partition('|')
+                rows = conn.execute('SELECT duration_days FROM completion_samples '
+                                    'WHERE engine_key = ? AND work_key = ?', (ek, wk))
+            else:
+                column = 'engine_key' if kind == 'model' else 'work_key'
+                rows = conn.execute(f'SELECT duration_days FROM completion_samples WHERE {column} = ?', (key,))
+            durations = sorted(r[0] for r in rows)
+            if not durations:
+                conn.execute('DELETE FROM completion_stats WHERE stat_key = ?', (stat_key,))
+                continue
+            conn.execute(
+                'INSERT OR REPLACE INTO completion_stats (stat_key, sample_count, median_days, p80_days, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (stat_key, len(durations), percentile(durations, 0.5), percentile(durations, 0.8), now))
+
+    def estimate(self, engine_model: str, work_content: str) -> Optional[Dict[str, Any]]:
+        """가장 구체적인 키부터 표본 MIN_SAMPLES 이상인 통계 → {'basis', 'sampleCount', 'medianDays', 'p80Days'}
+        (모두 부족하면 표본이 가장 많은 키, 표본이 없으면 None) — 통계 테이블만 읽고 갱신은 백그라운드로 요청"""
+        self.request_refresh()
+        keys = _stat_keys(engine_key(engine_model), work_key(work_content))
+        if not keys:
+            return None
+        with self.store.get_connection() as conn:
+            placeholders = ','.join('?' * len(keys))
+            rows = {r['stat_key']: r for r in conn.execute(
+                f'SELECT stat_key, sample_count, median_days, p80_days FROM completion_stats '
+                f'WHERE stat_key IN ({placeholders})', keys)}
+        found = [rows[k] for k in keys if k in rows]
+        if not found:
+            return None
+        best = next((r for r in found if r['sample_count'] >= MIN_SAMPLES),
+                    max(found, key=lambda r: r['sample_count']))
+        return {
+            'basis': self._BASIS[best['stat_key'].split(':', 1)[0]],
+            'sampleCount': best['sample_count'],
+            'medianDays': round(best['median_days']),
+            'p80Days': round(best['p80_days']),
+        }
+
+
+# 싱글톤 인스턴스
+completion_stats = CompletionStats()
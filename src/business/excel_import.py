@@ -0,0 +1,148 @@
+# src/business/excel_import.py - 엑셀 작업 레코드 불러오기 (스트리밍 파싱)
+
+import io
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..database.models import WorkRecord
+from .calculations import calculate_record_manpower
+
+# OLE2 magic bytes = .xls, 그 외(ZIP header) = .xlsx
+XLS_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# 날짜 헤더 행: "날짜 : YYYY.MM.DD" 형식 (구분자 유연화)
+_DATE_HEADER_RE = re.compile(r'날짜\s*[:\：]?\s*(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})')
+# "날짜 :" 없이 YYYY.MM.DD 단독 셀인 경우
+_DATE_ONLY_RE = re.compile(r'^\s*(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})\s*$')
+
+
+def open_excel_rows(file_bytes: bytes) -> Tuple[int, Iterator[List[Any]]]:
+    """엑셀 파일을 열어 (예상 행 수, 행 값 이터레이터)를 반환.
+
+    .xlsx는 openpyxl read_only 모드로 열어 행을 순차적으로 읽고,
+    .xls는 xlrd on_demand 모드로 첫 시트만 로드한다.
+    xlrd가 없으면 ImportError를 그대로 전달한다.
+    """
+    if file_bytes[:8] == XLS_MAGIC:
+        import xlrd
+        wb_xls = xlrd.open_workbook(file_contents=file_bytes, on_demand=True)
+        ws_xls = wb_xls.sheet_by_index(0)
+        return ws_xls.nrows, _iter_xls_rows(xlrd, wb_xls, ws_xls)
+
+    from openpyxl import load_workbook
+    wb = load_workbook(filename=io.BytesIO(file_bytes), read_only=True, data_only=True)
+    ws = wb.active
+    return ws.max_row or 0, _iter_xlsx_rows(wb, ws)
+
+
+def _iter_xls_rows(xlrd, wb_xls, ws_xls) -> Iterator[List[Any]]:
+    """xls 행 이터레이터 — 날짜 타입 셀(type 3)은 "날짜 : YYYY.MM.DD." 텍스트로 변환하여
+    날짜 감지 정규식이 float 값을 놓치지 않도록 처리"""
+    try:
+        for i in range(ws_xls.nrows):
+            vals = list(ws_xls.row_values(i))
+            types = ws_xls.row_types(i)
+            for j, (v, t) in enumerate(zip(vals, types)):
+                if t == 3:  # XL_CELL_DATE
+                    try:
+                        dt = xlrd.xldate.xldate_as_datetime(v, wb_xls.datemode)
+                        vals[j] = f"날짜 : {dt.strftime('%Y.%m.%d')}."
+                    except Exception:
+                        pass
+            yield vals
+    finally:
+        wb_xls.release_resources()
+
+
+def _iter_xlsx_rows(wb, ws) -> Iterator[List[Any]]:
+    """xlsx 행 이터레이터 (read_only 워크북은 순회 종료 시 닫는다)"""
+    try:
+        for row in ws.iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        wb.close()
+
+
+def _cell_str(val) -> str:
+    """셀 값을 문자열로 변환 (None/숫자 안전)"""
+    if val is None:
+        return ''
+    # xlrd가 숫자형으로 반환하는 경우 정수 변환
+    if isinstance(val, float) and val == int(val):
+        return str(int(val))
+    return str(val).strip()
+
+
+def _match_date_header(row_text: str) -> Optional[str]:
+    date_match = _DATE_HEADER_RE.search(row_text) or _DATE_ONLY_RE.search(row_text.strip())
+    if not date_match:
+        return None
+    y, m, d = date_match.groups()
+    return f'{y}-{int(m):02d}-{int(d):02d}'
+
+
+def iter_excel_work_records(rows: Iterable[List[Any]],
+                            stats: Dict[str, int]) -> Iterator[WorkRecord]:
+    """엑셀 행을 순차적으로 읽어 WorkRecord를 하나씩 생성.
+
+    stats에는 'rows'(읽은 행 수)와 'skipped'(건너뛴 행 수)가 누적된다.
+    record_number는 날짜별로 1부터 이어서 매긴다.
+    """
+    stats.setdefault('rows', 0)
+    stats.setdefault('skipped', 0)
+    record_numbers: Dict[str, int] = {}
+    current_date = None
+
+    for row_values in rows:
+        stats['rows'] += 1
+        row_text = ' '.join(str(v or '') for v in row_values)
+
+        header_date = _match_date_header(row_text)
+        if header_date:
+            current_date = header_date
+            continue
+
+        # 컬럼 헤더 행 스킵 (계약번호, 선사/선명 포함 행)
+        if '계약번호' in row_text or ('선사' in row_text and '선명' in row_text):
+            continue
+
+        # 날짜가 아직 설정되지 않은 경우 건너뜀
+        if current_date is None:
+            continue
+
+        # B열(인덱스 1) 이상이어야 데이터 행으로 처리
+        if len(row_values) < 2:
+            stats['skipped'] += 1
+            continue
+
+        # B~I열 매핑 (실제 엑셀 형식)
+        # B(1)=계약번호, C(2)=선사, D(3)=선명, E(4)=엔진/모델
+        # F(5)=작업내용/장소, G(6)=작업자, H(7)=인원(무시), I(8)=동반자
+        contract_number = _cell_str(row_values[1]) if len(row_values) > 1 else ''
+        company         = _cell_str(row_values[2]) if len(row_values) > 2 else ''
+        ship_name       = _cell_str(row_values[3]).upper() if len(row_values) > 3 else ''
+        engine_model    = _cell_str(row_values[4]).upper() if len(row_values) > 4 else ''
+        work_content    = _cell_str(row_values[5]) if len(row_values) > 5 else ''
+        leader          = _cell_str(row_values[6]) if len(row_values) > 6 else ''
+        # H열(인덱스 7): 인원 수 — 자동 계산으로 대체, 건너뜀
+        teammates       = _cell_str(row_values[8]) if len(row_values) > 8 else ''
+
+        # 유효 데이터 확인 (빈 행 제외)
+        if not any([contract_number, company, ship_name, work_content]):
+            stats['skipped'] += 1
+            continue
+
+        record_numbers[current_date] = record_numbers.get(current_date, 0) + 1
+        yield WorkRecord(
+            date=current_date,
+            record_number=record_numbers[current_date],
+            contract_number=contract_number,
+            company=company,
+            ship_name=ship_name,
+            engine_model=engine_model,
+            work_content=work_content,
+            location='',
+            leader=leader,
+            teammates=teammates,
+            manpower=calculate_record_manpower(leader, teammates)
+        )
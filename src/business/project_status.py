@@ -0,0 +1,113 @@
+# src/business/project_status.py - 프로젝트(계약) 진행 상태 판정
+# 칸반·간트·월간 보고(선박별)·텔레그램 착공/준공 알림이 같은 규칙으로 상태를 정하도록 한 곳에 모은다.
+#   우선순위: project_status 수동 상태 > board_projects 상태(착수/준공) > 자동(마지막 작업일 기준)
+# 보드 프로젝트·수동 상태는 한 번의 조회로 읽고, DB 데이터 세대 카운터가 바뀔 때까지 재사용한다.
+# 호출하는 쪽은 요청마다 snapshot()을 한 번 받아 그 스냅샷으로 판정한다 (계약번호마다 세대를 확인하지 않도록).
+
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from ..utils.logger import logger
+
+STATUS_RECEIVED = '접수'
+STATUS_STARTED = '착수'
+STATUS_DONE = '준공'
+STATUS_ARCHIVE = '아카이브'
+
+# 마지막 작업일이 이 기간보다 오래되면 자동으로 준공 처리
+AUTO_DONE_AFTER_DAYS = 7
+
+# project_status 구버전 값 → 보드 상태
+_STATUS_ALIASES = {'inProgress': STATUS_STARTED, '착공': STATUS_STARTED, 'completed': STATUS_DONE}
+
+
+def normalize_status(status: str) -> str:
+    """구버전·별칭 상태값을 보드 상태(접수/착수/준공)로 ('auto'·빈 값은 '')"""
+    if not status or status == 'auto':
+        return ''
+    return _STATUS_ALIASES.get(status, status)
+
+
+class ProjectStatusSnapshot:
+    """한 시점의 보드 프로젝트·수동 상태 — 계약번호별 최종 상태 판정"""
+
+    def __init__(self, board: List[Dict[str, Any]], manual: Dict[str, str]):
+        self.manual = manual
+        self.reception = [bp for bp in board if bp.get('status') == STATUS_RECEIVED]
+        self.by_contract: Dict[str, Dict[str, Any]] = {}
+        self.by_ship: Dict[str, Dict[str, Any]] = {}
+        # 착수 보드가 준공 보드보다 우선, 같은 상태 안에서는 먼저 등록된 보드 기준
+        for status in (STATUS_DONE, STATUS_STARTED):
+            for bp in board:
+                if bp.get('status') != status:
+                    continue
+                if bp.get('contract_number'):
+                    self.by_contract[bp['contract_number']] = bp
+                if bp.get('ship_name'):
+                    self.by_ship[bp['ship_name']] = bp
+
+    def reception_projects(self) -> List[Dict[str, Any]]:
+        """접수 단계 보드 프로젝트 (최근 등록순)"""
+        return list(self.reception)
+
+    def manual_status(self, contract_number: str) -> str:
+        """project_status에 저장된 원래 값 (없으면 '')"""
+        return self.manual.get(contract_number or '', '')
+
+    def board_project(self, contract_number: str = '', ship_name: str = '') -> Dict[str, Any]:
+        """착수/준공 보드 프로젝트 — 계약번호로, 계약번호가 없으면 선박명으로 매칭"""
+        if contract_number:
+            return self.by_contract.get(contract_number, {})
+        if ship_name:
+            return self.by_ship.get(ship_name, {})
+        return {}
+
+    def resolve(self, contract_number: str, end_date: str = '', ship_name: str = '',
+                today: datetime = None) -> str:
+        """최종 상태: 수동 상태 > 보드 상태 > 자동(마지막 작업일이 AUTO_DONE_AFTER_DAYS 이내면 착수)"""
+        manual = normalize_status(self.manual_status(contract_number))
+        if manual:
+            return manual
+        board = self.board_project(contract_number, ship_name)
+        if board:
+            return board['status']
+        cutoff = ((today or datetime.now()) - timedelta(days=AUTO_DONE_AFTER_DAYS)).strftime('%Y-%m-%d')
+        return STATUS_STARTED if (end_date or '') >= cutoff else STATUS_DONE
+
+
+class ProjectStatusResolver:
+    """데이터 세대별 ProjectStatusSnapshot 캐시"""
+
+    def __init__(self, store=None):
+        self._store = store
+        self._lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self._snapshot: Optional[ProjectStatusSnapshot] = None
+
+    @property
+    def store(self):
+        if self._store is None:
+            from ..database.db_manager import db
+            self._store = db
+        return self._store
+
+    def snapshot(self) -> ProjectStatusSnapshot:
+        """현재 데이터 세대의 스냅샷 — 세대 카운터를 한 번 읽고, 바뀌었을 때만 다시 조회"""
+        generation = self.store.get_data_generation()
+        with self._lock:
+            if self._snapshot is not None and generation is not None and self._generation == generation:
+                return self._snapshot
+            state = self.store.get_project_board_state()
+            self._snapshot = ProjectStatusSnapshot(state['board'], state['manual'])
+            self._generation = generation
+            logger.debug(f"프로젝트 상태 스냅샷 갱신: 보드 {len(state['board'])}건, 수동 {len(state['manual'])}건")
+            return self._snapshot
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+
+
+# 싱글톤 인스턴스
+project_status_resolver = ProjectStatusResolver()
@@ -2,11 +2,13 @@
 
 import sqlite3
 import hashlib
+import hmac
 import json
 import os
 import random
 import string
 import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -14,20 +16,47 @@ from contextlib import contextmanager
 
 from ..utils.logger import logger
 from ..utils.config import config
+from ..utils.startup_trace import LazySingleton
+from ..utils.offload import run_blocking
+
+# 자동 로그인 토큰 유효 기간(일) / 만료 토큰 정리 주기(초)
+TOKEN_VALID_DAYS = 30
+TOKEN_SWEEP_INTERVAL = 3600
+# PBKDF2 반복 횟수 기본값 (설정 auth.pbkdf2_iterations로 조정 — 다른 값으로 저장된 해시는 로그인 시 재해시)
+DEFAULT_PBKDF2_ITERATIONS = 260000
+# 로그인 실패 제한: 연속 실패 LOGIN_MAX_FAILURES회부터 잠금, 잠금 시간은 실패할 때마다 두 배 (최대 LOGIN_LOCK_MAX_SEC)
+LOGIN_MAX_FAILURES = 5
+LOGIN_LOCK_BASE_SEC = 30
+LOGIN_LOCK_MAX_SEC = 900
+# 권한 캐시 유지 시간(초) — 이 PC에서의 변경은 즉시 무효화, 다른 PC에서 바꾼 권한은 이 시간 안에 반영
+PERMISSION_CACHE_TTL = 60
 
 
 class AuthManager:
     """사용자 인증 관리 클래스"""
     
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, token_db_path: str = None):
         if db_path is None:
             db_path = config.db_path
         
         self.db_path = Path(db_path)
-        self._token_lock = threading.Lock()   # #3 — 토큰 파일 동시 접근 방지
+        # 자동 로그인 토큰 DB — 설치 디렉토리 data/ (클라우드 동기화 대상 아님)
+        # auth_manager.py → src/database/ → src/ → app_root(프로젝트 루트 또는 {app}/app/)
+        self.token_db_path = Path(token_db_path) if token_db_path else (
+            Path(__file__).parent.parent.parent / "data" / "auth_tokens.db")
+        self._token_lock = threading.Lock()   # 만료 토큰 정리 주기 판정용
+        self._last_token_sweep = 0.0
+        # 권한 캐시: user_id → (만료 시각, 권한 정보) / full_name → (만료 시각, 쓰기 가능 여부)
+        self._perm_lock = threading.Lock()
+        self._principals: Dict[str, tuple] = {}
+        self._can_write_by_name: Dict[str, tuple] = {}
+        # 로그인 실패 기록: user_id → [연속 실패 수, 잠금 해제 시각(monotonic)]
+        self._login_lock = threading.Lock()
+        self._login_failures: Dict[str, list] = {}
         self._ensure_db_directory()
         self._init_auth_tables()
         self.ensure_admin_account()
+        self._init_token_store()
         logger.info(f"인증 시스템 초기화 완료: {self.db_path}")
     
     def _ensure_db_directory(self):
@@ -147,6 +176,42 @@ class AuthManager:
                 )
             ''')
 
+            # 텔레그램 발송 대기열 (재시작 후에도 미발송 메시지 유지)
+            # status: pending → sending → sent / failed
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS telegram_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    chat_id INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    kind TEXT DEFAULT '',
+                    contract_number TEXT DEFAULT '',
+                    board_project_id INTEGER DEFAULT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at TEXT NOT NULL,
+                    claimed_at TEXT,
+                    last_error TEXT DEFAULT '',
+                    telegram_message_id INTEGER,
+                    created_at TEXT NOT NULL,
+                    sent_at TEXT
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_telegram_outbox_due
+                ON telegram_outbox(status, next_attempt_at)
+            ''')
+
+            # 공유 DB 리스(lease) — 여러 PC 중 한 곳만 실행해야 하는 작업(텔레그램 폴링 등)의 리더 선출
+            # expires_at: epoch 초. 보유자가 갱신하지 않고 만료되면 다른 PC가 가져간다.
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS service_leases (
+                    name TEXT PRIMARY KEY,
+                    holder TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            ''')
+
             # 자동 로그인 세션 테이블
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS auth_sessions (
@@ -183,11 +248,28 @@ class AuthManager:
         except Exception as e:
             logger.error(f"관리자 계정 보장 실패: {e}")
     
+    @property
+    def pbkdf2_iterations(self) -> int:
+        try:
+            return max(100000, int(config.get('auth.pbkdf2_iterations', DEFAULT_PBKDF2_ITERATIONS)))
+        except (TypeError, ValueError):
+            return DEFAULT_PBKDF2_ITERATIONS
+
     def _hash_password(self, password: str) -> str:
-        """비밀번호 해시화 (PBKDF2-HMAC-SHA256, salt 포함)"""
+        """비밀번호 해시화 (PBKDF2-HMAC-SHA256, salt·반복 횟수 포함) — 요청 처리 중이면 스레드 풀에서 계산"""
+        iterations = self.pbkdf2_iterations
         salt = os.urandom(32)
-        dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 260000)
-        return f"pbkdf2${salt.hex()}${dk.hex()}"
+        dk = run_blocking(hashlib.pbkdf2_hmac, 'sha256', password.encode('utf-8'), salt, iterations)
+        return f"pbkdf2${iterations}${salt.hex()}${dk.hex()}"
+
+    @staticmethod
+    def _parse_pbkdf2(stored_hash: str):
+        """'pbkdf2$<반복>$<salt>$<dk>' 또는 구형 'pbkdf2$<salt>$<dk>'(260000회) → (반복, salt, dk_hex)"""
+        parts = stored_hash.split('$')
+        if len(parts) == 4:
+            return int(parts[1]), bytes.fromhex(parts[2]), parts[3]
+        _, salt_hex, dk_hex = parts
+        return DEFAULT_PBKDF2_ITERATIONS, bytes.fromhex(salt_hex), dk_hex
 
     def _verify_password(self, password: str, stored_hash: str) -> bool:
         """비밀번호 검증 (PBKDF2 및 구형 SHA-256 모두 지원)"""
@@ -195,15 +277,44 @@ class AuthManager:
             return False
         if stored_hash.startswith('pbkdf2$'):
             try:
-                _, salt_hex, dk_hex = stored_hash.split('$')
-                salt = bytes.fromhex(salt_hex)
-                dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 260000)
-                return dk.hex() == dk_hex
+                iterations, salt, dk_hex = self._parse_pbkdf2(stored_hash)
+                dk = run_blocking(hashlib.pbkdf2_hmac, 'sha256', password.encode('utf-8'), salt, iterations)
+                return hmac.compare_digest(dk.hex(), dk_hex)
             except Exception:
                 return False
         else:
             # 구형 SHA-256 단순 해시
-            return hashlib.sha256(password.encode()).hexdigest() == stored_hash
+            return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored_hash)
+
+    def _needs_rehash(self, stored_hash: str) -> bool:
+        """구형 SHA-256이거나 현재 설정과 반복 횟수가 다른 해시인지"""
+        if not (stored_hash or '').startswith('pbkdf2$'):
+            return True
+        try:
+            return self._parse_pbkdf2(stored_hash)[0] != self.pbkdf2_iterations
+        except Exception:
+            return True
+
+    def _login_locked_for(self, user_id: str) -> int:
+        """로그인 잠금 남은 초 (잠금 아니면 0)"""
+        with self._login_lock:
+            entry = self._login_failures.get(user_id)
+            if not entry:
+                return 0
+            return max(0, int(entry[1] - time.monotonic() + 0.999))
+
+    def _record_login_failure(self, user_id: str):
+        with self._login_lock:
+            entry = self._login_failures.setdefault(user_id, [0, 0.0])
+            entry[0] += 1
+            if entry[0] >= LOGIN_MAX_FAILURES:
+                lock_sec = min(LOGIN_LOCK_MAX_SEC, LOGIN_LOCK_BASE_SEC * 2 ** (entry[0] - LOGIN_MAX_FAILURES))
+                entry[1] = time.monotonic() + lock_sec
+                logger.warning(f"로그인 연속 실패 {entry[0]}회 — {lock_sec}초 잠금: {user_id[:2]}***")
+
+    def _reset_login_failures(self, user_id: str):
+        with self._login_lock:
+            self._login_failures.pop(user_id, None)
     
     # =========================================================================
     # 인증 관련 메서드
@@ -212,6 +323,10 @@ class AuthManager:
     def authenticate(self, user_id: str, password: str) -> Optional[Dict[str, Any]]:
         """사용자 인증"""
         try:
+            locked_sec = self._login_locked_for(user_id)
+            if locked_sec:
+                return {'error': f'로그인 시도가 너무 많습니다. {locked_sec}초 후 다시 시도하세요.'}
+
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -221,6 +336,7 @@ class AuthManager:
                 if not row:
                     _uid_mask = (user_id[:2] + '***') if user_id else '(empty)'  # #10 — user_id 마스킹
                     logger.warning(f"로그인 실패 - 없는 사용자: {_uid_mask}")
+                    self._record_login_failure(user_id)
                     return {'error': 'USER_NOT_FOUND'}
 
                 user = dict(row)
@@ -228,7 +344,9 @@ class AuthManager:
                 if not self._verify_password(password, user['password_hash']):
                     _uid_mask = (user_id[:2] + '***') if user_id else '(empty)'  # #10
                     logger.warning(f"로그인 실패 - 비밀번호 불일치: {_uid_mask}")
+                    self._record_login_failure(user_id)
                     return {'error': 'WRONG_PASSWORD'}
+                self._reset_login_failures(user_id)
 
                 # 상태 확인
                 if user['status'] == 'pending':
@@ -240,8 +358,8 @@ class AuthManager:
                 elif user['status'] == 'retired':
                     return {'error': '퇴사 처리된 계정입니다. 관리자에게 문의하세요.'}
 
-                # 구형 SHA-256 해시라면 PBKDF2로 자동 업그레이드
-                if not (user['password_hash'] or '').startswith('pbkdf2$'):  # #4 — NULL 안전
+                # 구형 SHA-256 해시이거나 반복 횟수 설정이 바뀌었으면 현재 설정으로 재해시
+                if self._needs_rehash(user['password_hash']):
                     new_hash = self._hash_password(password)
                     cursor.execute(
                         'UPDATE auth_users SET password_hash = ? WHERE id = ?',
@@ -256,7 +374,10 @@ class AuthManager:
                 )
 
                 logger.info(f"사용자 로그인: {user_id} ({user['role']})")
-                return user
+            # 로그인 시 권한 캐시를 채워 이후 저장·관리자 요청의 권한 검사를 DB 없이 처리
+            self.invalidate_permissions(user['user_id'])
+            self._remember_principal(user)
+            return user
 
         except Exception as e:
             logger.error(f"인증 오류: {e}")
@@ -389,6 +510,7 @@ class AuthManager:
                     'UPDATE auth_users SET leave_report_edit = ? WHERE user_id = ?',
                     (1 if enabled else 0, user_id)
                 )
+            self.invalidate_permissions(user_id)
             return True
         except Exception as e:
             logger.error(f"leave_report_edit 설정 실패: {e}")
@@ -402,6 +524,7 @@ class AuthManager:
                     'UPDATE auth_users SET can_write = ? WHERE user_id = ?',
                     (1 if enabled else 0, user_id)
                 )
+            self.invalidate_permissions(user_id)
             return True
         except Exception as e:
             logger.error(f"can_write 설정 실패: {e}")
@@ -415,13 +538,83 @@ class AuthManager:
                     'UPDATE auth_users SET erp_input = ? WHERE user_id = ?',
                     (1 if enabled else 0, user_id)
                 )
+            self.invalidate_permissions(user_id)
             return True
         except Exception as e:
             logger.error(f"erp_input 설정 실패: {e}")
             return False
 
+    # =========================================================================
+    # 권한 캐시 (권한 검사 = dict 조회)
+    # =========================================================================
+
+    @staticmethod
+    def _principal_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        role = row.get('role')
+        return {
+            'id': row.get('id'),
+            'user_id': row.get('user_id'),
+            'full_name': row.get('full_name'),
+            'role': role,
+            'status': row.get('status'),
+            # admin은 can_write 컬럼 무관하게 항상 쓰기 허용
+            'can_write': bool(row.get('can_write', 0)) or role == 'admin',
+            'erp_input': bool(row.get('erp_input', 0)),
+            'leave_report_edit': bool(row.get('leave_report_edit', 0)),
+        }
+
+    def _remember_principal(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """로그인·조회한 사용자 행을 권한 캐시에 저장 → 권한 정보"""
+        principal = self._principal_from_row(row)
+        with self._perm_lock:
+            self._principals[principal['user_id']] = (time.monotonic() + PERMISSION_CACHE_TTL, principal)
+        return dict(principal)
+
+    def invalidate_permissions(self, user_id: str = None):
+        """권한 캐시 무효화 (user_id 없으면 전체) — 권한·상태·이름 변경 후 호출"""
+        with self._perm_lock:
+            if user_id is None:
+                self._principals.clear()
+            else:
+                self._principals.pop(user_id, None)
+            # full_name 캐시는 이름 변경(퇴사 접미어)도 반영해야 하므로 통째로 비운다
+            self._can_write_by_name.clear()
+
+    def get_principal(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """권한 검사용 사용자 정보 (user_id·full_name·role·status·can_write·erp_input, 캐시 사용)"""
+        if not user_id:
+            return None
+        with self._perm_lock:
+            cached = self._principals.get(user_id)
+            if cached and cached[0] > time.monotonic():
+                return dict(cached[1])
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute('SELECT * FROM auth_users WHERE user_id = ?', (user_id,)).fetchone()
+            return self._remember_principal(dict(row)) if row else None
+        except Exception as e:
+            logger.error(f"사용자 권한 조회 실패: {e}")
+            return None
+
+    def is_admin(self, user_id: str) -> bool:
+        principal = self.get_principal(user_id)
+        return bool(principal and principal['role'] == 'admin')
+
     def get_can_write_by_fullname(self, full_name: str) -> bool:
-        """full_name 기준 쓰기 권한 조회 (save_work_records 권한 검증용)"""
+        """full_name 기준 쓰기 권한 조회 (save_work_records 권한 검증용, 캐시 사용)"""
+        with self._perm_lock:
+            cached = self._can_write_by_name.get(full_name)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+        allowed = self._query_can_write_by_fullname(full_name)
+        if allowed is None:
+            return False
+        with self._perm_lock:
+            self._can_write_by_name[full_name] = (time.monotonic() + PERMISSION_CACHE_TTL, allowed)
+        return allowed
+
+    def _query_can_write_by_fullname(self, full_name: str) -> Optional[bool]:
+        """DB에서 쓰기 권한 조회 (오류 시 None — 캐시하지 않음)"""
         try:
             with self.get_connection() as conn:
                 row = conn.execute(
@@ -437,7 +630,7 @@ class AuthManager:
             return bool(row['can_write'])
         except Exception as e:
             logger.error(f"can_write 조회 실패: {e}")
-            return False
+            return None
 
     def get_pending_requests(self) -> List[Dict[str, Any]]:
         """승인 대기 중인 요청 조회"""
@@ -478,7 +671,8 @@ class AuthManager:
                 ''', (admin_id, now, user_id))
                 
                 logger.info(f"사용자 승인: {user_id} by {admin_id}")
-                return True
+            self.invalidate_permissions(user_id)
+            return True
                 
         except Exception as e:
             logger.error(f"사용자 승인 실패: {e}")
@@ -507,7 +701,8 @@ class AuthManager:
                 ''', (admin_id, now, note, user_id))
                 
                 logger.info(f"사용자 거부: {user_id} by {admin_id}")
-                return True
+            self.invalidate_permissions(user_id)
+            return True
                 
         except Exception as e:
             logger.error(f"사용자 거부 실패: {e}")
@@ -540,7 +735,8 @@ class AuthManager:
                 )
 
                 logger.info(f"사용자 퇴사 처리: {user_id} ({new_name}) by {admin_id}")
-                return True
+            self.invalidate_permissions(user_id)
+            return True
 
         except Exception as e:
             logger.error(f"사용자 퇴사 처리 실패: {e}")
@@ -721,9 +917,159 @@ class AuthManager:
                 cursor = conn.cursor()
                 cursor.execute('DELETE FROM telegram_link_codes WHERE created_at < ?', (cutoff_codes,))
                 cursor.execute('DELETE FROM telegram_message_map WHERE created_at < ?', (cutoff_messages,))
+                cursor.execute("DELETE FROM telegram_outbox WHERE status IN ('sent', 'failed') AND created_at < ?",
+                               (cutoff_messages,))
         except Exception as e:
             logger.error(f"텔레그램 데이터 정리 실패: {e}")
 
+    # =========================================================================
+    # 텔레그램 발송 대기열
+    # =========================================================================
+
+    def enqueue_telegram_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """발송 대기열에 메시지 추가 (chat_id, text, kind, contract_number, board_project_id)"""
+        if not messages:
+            return 0
+        now = datetime.now().isoformat()
+        try:
+            with self.get_connection() as conn:
+                conn.executemany('''
+                    INSERT INTO telegram_outbox
+                        (chat_id, text, kind, contract_number, board_project_id,
+                         status, next_attempt_at, created_at)
+                    VALUES (?, ?, ?, ?, ?, 'pending', ?, ?)
+                ''', [(int(m['chat_id']), m['text'], m.get('kind', ''),
+                       m.get('contract_number') or '', m.get('board_project_id'), now, now)
+                      for m in messages])
+            return len(messages)
+        except Exception as e:
+            logger.error(f"텔레그램 대기열 추가 실패: {e}")
+            return 0
+
+    def claim_telegram_outbox(self, limit: int = 100,
+                              stale_after_sec: int = 300) -> List[Dict[str, Any]]:
+        """발송 시점이 된 메시지를 sending 상태로 가져온다.
+        stale_after_sec 이상 sending 상태로 남은 메시지(발송 중 종료)는 다시 발송 대상에 포함한다."""
+        now = datetime.now()
+        now_iso = now.isoformat()
+        stale_iso = (now - timedelta(seconds=stale_after_sec)).isoformat()
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # 공유 DB를 쓰는 다른 PC와 같은 메시지를 중복 선점하지 않도록 쓰기 잠금 후 조회
+                cursor.execute('BEGIN IMMEDIATE')
+                cursor.execute('''
+                    SELECT * FROM telegram_outbox
+                    WHERE (status = 'pending' AND next_attempt_at <= ?)
+                       OR (status = 'sending' AND claimed_at <= ?)
+                    ORDER BY id
+                    LIMIT ?
+                ''', (now_iso, stale_iso, limit))
+                rows = [dict(r) for r in cursor.fetchall()]
+                if rows:
+                    cursor.executemany(
+                        "UPDATE telegram_outbox SET status = 'sending', claimed_at = ? WHERE id = ?",
+                        [(now_iso, r['id']) for r in rows]
+                    )
+                return rows
+        except Exception as e:
+            logger.error(f"텔레그램 대기열 조회 실패: {e}")
+            return []
+
+    def mark_telegram_outbox_sent(self, outbox_id: int, telegram_message_id: Optional[int]):
+        try:
+            with self.get_connection() as conn:
+                conn.execute('''
+                    UPDATE telegram_outbox
+                    SET status = 'sent', attempts = attempts + 1, telegram_message_id = ?,
+                        sent_at = ?, last_error = ''
+                    WHERE id = ?
+                ''', (telegram_message_id, datetime.now().isoformat(), outbox_id))
+        except Exception as e:
+            logger.error(f"텔레그램 발송 결과 기록 실패: {e}")
+
+    def mark_telegram_outbox_retry(self, outbox_id: int, next_attempt_at: str,
+                                   error: str, failed: bool = False, counted: bool = True):
+        """발송 실패 기록 — failed=True이면 재시도하지 않음, counted=False이면 시도 횟수 유지(429·중단)"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute('''
+                    UPDATE telegram_outbox
+                    SET status = ?, attempts = attempts + ?, next_attempt_at = ?, last_error = ?
+                    WHERE id = ?
+                ''', ('failed' if failed else 'pending', 1 if counted else 0,
+                      next_attempt_at, error[:500], outbox_id))
+        except Exception as e:
+            logger.error(f"텔레그램 발송 결과 기록 실패: {e}")
+
+    def get_telegram_outbox_stats(self) -> Dict[str, int]:
+        """상태별 대기열 건수"""
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute(
+                    'SELECT status, COUNT(*) AS cnt FROM telegram_outbox GROUP BY status'
+                ).fetchall()
+                return {row['status']: row['cnt'] for row in rows}
+        except Exception as e:
+            logger.error(f"텔레그램 대기열 현황 조회 실패: {e}")
+            return {}
+
+    # =========================================================================
+    # 리더 선출 (리스)
+    # =========================================================================
+
+    def acquire_lease(self, name: str, holder: str, ttl_sec: float) -> bool:
+        """리스 획득 또는 갱신. 비어 있거나 만료됐거나 이미 보유 중이면 True
+
+        보유 중인 리스는 남은 시간이 ttl_sec의 절반 미만일 때만 갱신해, 매 폴링 주기마다
+        공유 DB에 쓰지 않는다.
+        """
+        now = time.time()
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT holder, expires_at FROM service_leases WHERE name = ?', (name,))
+                row = cursor.fetchone()
+                if row and row['holder'] == holder and row['expires_at'] - now > ttl_sec / 2:
+                    return True
+                cursor.execute('''
+                    INSERT INTO service_leases (name, holder, expires_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        holder = excluded.holder,
+                        expires_at = excluded.expires_at,
+                        updated_at = excluded.updated_at
+                    WHERE service_leases.holder = excluded.holder
+                       OR service_leases.expires_at < ?
+                ''', (name, holder, now + ttl_sec, datetime.now().isoformat(), now))
+                cursor.execute('SELECT holder FROM service_leases WHERE name = ?', (name,))
+                row = cursor.fetchone()
+                return bool(row) and row['holder'] == holder
+        except Exception as e:
+            logger.error(f"리스 획득 실패 ({name}): {e}")
+            return False
+
+    def release_lease(self, name: str, holder: str):
+        """보유 중인 리스 반납 → 다른 PC가 만료를 기다리지 않고 이어받는다"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute('DELETE FROM service_leases WHERE name = ? AND holder = ?', (name, holder))
+        except Exception as e:
+            logger.error(f"리스 반납 실패 ({name}): {e}")
+
+    def get_lease_holder(self, name: str) -> Optional[str]:
+        """현재 유효한 리스 보유자 (없거나 만료됐으면 None)"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    'SELECT holder FROM service_leases WHERE name = ? AND expires_at >= ?',
+                    (name, time.time())
+                ).fetchone()
+                return row['holder'] if row else None
+        except Exception as e:
+            logger.error(f"리스 조회 실패 ({name}): {e}")
+            return None
+
     def update_user_version(self, user_id: str, version: str) -> bool:
         """로그인 성공 시 클라이언트 버전과 last_seen 업데이트"""
         try:
@@ -749,61 +1095,118 @@ class AuthManager:
                 ''', (status, user_id))
 
                 logger.info(f"사용자 상태 변경: {user_id} -> {status} by {admin_id}")
-                return True
+            self.invalidate_permissions(user_id)
+            return True
 
         except Exception as e:
             logger.error(f"사용자 상태 변경 실패: {e}")
             return False
 
     # =========================================================================
-    # 자동 로그인 토큰 (로컬 파일 기반 — 클라우드 동기화 영향 없음)
+    # 자동 로그인 토큰 (로컬 SQLite — 클라우드 동기화 영향 없음)
     # =========================================================================
+    # 공유/동기화 대상인 메인 DB는 파일 통째로 복사되므로 토큰은 설치 디렉토리 data/auth_tokens.db에 둔다.
+    # 검증은 메인 DB를 ATTACH해 token_hash(PK) 조회 + auth_users 조인 한 번으로 끝난다.
 
-    def _get_token_file(self) -> Path:
-        """토큰 저장 파일 경로 (설치 디렉토리 data/ → 클라우드 동기화 대상 아님)"""
-        # auth_manager.py → src/database/ → src/ → app_root(프로젝트 루트 또는 {app}/app/)
-        data_dir = Path(__file__).parent.parent.parent / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "remember_tokens.json"
+    def _init_token_store(self):
+        """토큰 테이블 생성 + 기존 remember_tokens.json 이전 + 만료 토큰 정리"""
+        try:
+            self.token_db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._token_connection(attach_auth=False) as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS auth_tokens (
+                        token_hash TEXT PRIMARY KEY,
+                        user_id TEXT NOT NULL,
+                        created_at TEXT NOT NULL,
+                        expires_at TEXT NOT NULL,
+                        active INTEGER NOT NULL DEFAULT 1
+                    ) WITHOUT ROWID
+                ''')
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_auth_tokens_expires ON auth_tokens(expires_at)')
+            try:
+                os.chmod(self.token_db_path, 0o600)  # 소유자만 읽기/쓰기 (Windows는 무시됨)
+            except Exception:
+                pass
+            self._migrate_token_file()
+            self.sweep_expired_tokens(force=True)
+        except Exception as e:
+            logger.error(f"자동 로그인 토큰 저장소 초기화 실패: {e}")
 
-    def _load_tokens(self) -> Dict[str, Any]:
-        """토큰 파일 로드 — #3: _token_lock 보유 상태에서 호출"""
+    @contextmanager
+    def _token_connection(self, attach_auth: bool = True):
+        """토큰 DB 연결 (attach_auth=True면 메인 DB를 'auth' 스키마로 연결)"""
+        conn = sqlite3.connect(str(self.token_db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
         try:
-            f = self._get_token_file()
-            if f.exists():
-                with open(f, 'r', encoding='utf-8') as fp:
-                    return json.load(fp)
-        except Exception:
-            pass
-        return {}
+            if attach_auth:
+                conn.execute('ATTACH DATABASE ? AS auth', (str(self.db_path),))
+            yield conn
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"토큰 DB 오류: {e}")
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _token_hash(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
 
-    def _save_tokens(self, tokens: Dict[str, Any]) -> None:
-        """토큰 파일 저장 — #3: _token_lock 보유 상태에서 호출"""
-        f = self._get_token_file()
-        with open(f, 'w', encoding='utf-8') as fp:
-            json.dump(tokens, fp, ensure_ascii=False, indent=2)
+    def _migrate_token_file(self):
+        """이전 버전의 data/remember_tokens.json을 테이블로 옮기고 파일 삭제 (유효한 토큰만)"""
+        legacy = self.token_db_path.with_name('remember_tokens.json')
+        if not legacy.exists():
+            return
         try:
-            os.chmod(f, 0o600)  # 소유자만 읽기/쓰기 (Windows는 무시됨)
+            with open(legacy, 'r', encoding='utf-8') as fp:
+                tokens = json.load(fp)
         except Exception:
-            pass
+            tokens = {}
+        now = datetime.now().isoformat()
+        rows = [(token_hash, entry['user_id'], entry.get('created_at') or now, entry['expires_at'])
+                for token_hash, entry in tokens.items()
+                if isinstance(entry, dict) and entry.get('is_active') and entry.get('user_id')
+                and (entry.get('expires_at') or '') > now]
+        with self._token_connection(attach_auth=False) as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO auth_tokens (token_hash, user_id, created_at, expires_at) '
+                'VALUES (?, ?, ?, ?)', rows)
+        legacy.unlink()
+        logger.info(f"자동 로그인 토큰 이전 완료: {len(rows)}건 (remember_tokens.json 삭제)")
+
+    def sweep_expired_tokens(self, force: bool = False) -> int:
+        """만료·비활성 토큰 삭제 (force=False면 TOKEN_SWEEP_INTERVAL마다 한 번만) → 삭제 건수"""
+        now = time.monotonic()
+        with self._token_lock:
+            if not force and now - self._last_token_sweep < TOKEN_SWEEP_INTERVAL:
+                return 0
+            self._last_token_sweep = now
+        try:
+            with self._token_connection(attach_auth=False) as conn:
+                cur = conn.execute('DELETE FROM auth_tokens WHERE active = 0 OR expires_at <= ?',
+                                   (datetime.now().isoformat(),))
+                removed = cur.rowcount
+            if removed:
+                logger.info(f"만료된 자동 로그인 토큰 정리: {removed}건")
+            return removed
+        except Exception as e:
+            logger.error(f"자동 로그인 토큰 정리 실패: {e}")
+            return 0
 
     def create_remember_token(self, user_id: str) -> Optional[str]:
-        """자동 로그인 토큰 생성 (30일 유효, 로컬 파일 저장)"""
+        """자동 로그인 토큰 생성 (30일 유효, 로컬 토큰 DB 저장)"""
         import uuid
         token = str(uuid.uuid4())
-        expires_at = (datetime.now() + timedelta(days=30)).isoformat()
-        try:
-            with self._token_lock:  # #3 — 파일 락
-                tokens = self._load_tokens()
-                token_hash = hashlib.sha256(token.encode()).hexdigest()
-                tokens[token_hash] = {
-                    'user_id': user_id,
-                    'created_at': datetime.now().isoformat(),
-                    'expires_at': expires_at,
-                    'is_active': True
-                }
-                self._save_tokens(tokens)
+        now = datetime.now()
+        try:
+            with self._token_connection(attach_auth=False) as conn:
+                conn.execute(
+                    'INSERT INTO auth_tokens (token_hash, user_id, created_at, expires_at) VALUES (?, ?, ?, ?)',
+                    (self._token_hash(token), user_id, now.isoformat(),
+                     (now + timedelta(days=TOKEN_VALID_DAYS)).isoformat()))
             logger.info(f"자동 로그인 토큰 생성: {user_id}")
+            self.sweep_expired_tokens()
             return token
         except Exception as e:
             logger.error(f"Remember token 생성 실패: {e}")
@@ -812,40 +1215,27 @@ class AuthManager:
     def validate_remember_token(self, token: str) -> Optional[Dict[str, Any]]:
         """토큰 검증 → 유효하면 사용자 정보 반환"""
         try:
-            with self._token_lock:  # #3 — 파일 락
-                tokens = self._load_tokens()
-                token_hash = hashlib.sha256(token.encode()).hexdigest()
-                entry = tokens.get(token_hash)
-            if not entry:
-                return None
-            if not entry.get('is_active', False):
+            with self._token_connection() as conn:
+                row = conn.execute('''
+                    SELECT u.* FROM auth_tokens t
+                    JOIN auth.auth_users u ON u.user_id = t.user_id
+                    WHERE t.token_hash = ? AND t.active = 1 AND t.expires_at > ?
+                ''', (self._token_hash(token), datetime.now().isoformat())).fetchone()
+            if not row:
                 return None
-            if entry.get('expires_at', '') <= datetime.now().isoformat():
+            user = dict(row)
+            uid, full_name, role, status = user['user_id'], user['full_name'], user['role'], user['status']
+            if status not in ('active', 'approved'):
                 return None
-            user_id = entry['user_id']
-            # DB에서 사용자 현재 상태 확인
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    'SELECT * FROM auth_users WHERE user_id = ?',
-                    (user_id,)
-                )
-                row = cursor.fetchone()
-                if not row:
-                    return None
-                user = dict(row)
-                uid, full_name, role, status = user['user_id'], user['full_name'], user['role'], user['status']
-                tray_mode = bool(user.get('tray_mode', 0))
-                leave_report_edit = bool(user.get('leave_report_edit', 0))
-                # admin은 can_write 컬럼 무관하게 항상 쓰기 허용
-                can_write = bool(user.get('can_write', 0)) or (role == 'admin')
-                erp_input = bool(user.get('erp_input', 0))
-                if status not in ('active', 'approved'):
-                    return None
+            self.invalidate_permissions(uid)
+            self._remember_principal(user)
             logger.info(f"자동 로그인 토큰 검증 성공: {uid}")
             return {'user_id': uid, 'full_name': full_name, 'role': role,
-                    'tray_mode': tray_mode, 'leave_report_edit': leave_report_edit,
-                    'can_write': can_write, 'erp_input': erp_input,
+                    'tray_mode': bool(user.get('tray_mode', 0)),
+                    'leave_report_edit': bool(user.get('leave_report_edit', 0)),
+                    # admin은 can_write 컬럼 무관하게 항상 쓰기 허용
+                    'can_write': bool(user.get('can_write', 0)) or (role == 'admin'),
+                    'erp_input': bool(user.get('erp_input', 0)),
                     'client_version': user.get('client_version', '')}
         except Exception as e:
             logger.error(f"Remember token 검증 실패: {e}")
@@ -854,32 +1244,27 @@ class AuthManager:
     def get_token_days_remaining(self, token: str) -> int:
         """토큰 만료까지 남은 일수 반환 (없거나 만료 시 0)"""
         try:
-            with self._token_lock:  # #3 — 파일 락
-                tokens = self._load_tokens()
-                token_hash = hashlib.sha256(token.encode()).hexdigest()
-                entry = tokens.get(token_hash)
-            if not entry or not entry.get('is_active'):
+            with self._token_connection(attach_auth=False) as conn:
+                row = conn.execute(
+                    'SELECT expires_at FROM auth_tokens WHERE token_hash = ? AND active = 1',
+                    (self._token_hash(token),)).fetchone()
+            if not row:
                 return 0
-            expires_at = datetime.fromisoformat(entry.get('expires_at', ''))
-            delta = expires_at - datetime.now()
+            delta = datetime.fromisoformat(row['expires_at']) - datetime.now()
             return max(0, delta.days)
         except Exception:
             return 0
 
     def clear_remember_token(self, token: str) -> bool:
-        """토큰 비활성화 (로그아웃 시)"""
-        try:
-            with self._token_lock:  # #3 — 파일 락
-                tokens = self._load_tokens()
-                token_hash = hashlib.sha256(token.encode()).hexdigest()
-                if token_hash in tokens:
-                    tokens[token_hash]['is_active'] = False
-                    self._save_tokens(tokens)
+        """토큰 삭제 (로그아웃 시)"""
+        try:
+            with self._token_connection(attach_auth=False) as conn:
+                conn.execute('DELETE FROM auth_tokens WHERE token_hash = ?', (self._token_hash(token),))
             return True
         except Exception as e:
             logger.error(f"Remember token 삭제 실패: {e}")
             return False
 
 
-# 싱글톤 인스턴스
-auth_manager = AuthManager()
+# 싱글톤 인스턴스 (첫 사용 시 테이블 초기화·관리자 계정 확인)
+auth_manager = LazySingleton(AuthManager, 'auth')
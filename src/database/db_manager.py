@@ -3,14 +3,20 @@
 import json
 import sqlite3
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Callable
 from contextlib import contextmanager
 
 from .models import WorkRecord, User, ActivityLog, AppSettings
 from ..utils.logger import logger
 from ..utils.config import config
+from ..utils.startup_trace import LazySingleton
+from ..utils.activity_log_writer import ActivityLogWriter
+from .log_archive import LogArchive
+from ..utils.error_fingerprint import error_fingerprint
+from ..utils.change_bus import (change_bus, TOPIC_WORK_RECORDS, TOPIC_HOLIDAY, TOPIC_VACATION,
+                                TOPIC_BOARD, TOPIC_COMMENTS)
 
 _NIGHT_REPORT_DEFAULT_ROSTER = [
     {'department': '관리부', 'rank': '대리', 'name': '나은진'},
@@ -38,6 +44,15 @@ _NIGHT_REPORT_DEFAULT_ROSTER = [
 
 _DEFAULT_EMPLOYEE_EXTERNAL_HEADERS = ['외부계정1', '외부계정2']
 
+# 오류 묶음(error_issues)당 보관할 원본 리포트 수 / 영향 사용자·버전 목록 최대 길이
+_ERROR_SAMPLES_PER_ISSUE = 5
+_ERROR_ISSUE_MAX_TAGS = 20
+# job_history 보관 건수 기본값 (설정 jobs.history_keep)
+_JOB_HISTORY_KEEP = 500
+# 변경 시 data_generation 카운터를 올리는 화면 데이터 테이블 (다른 PC의 쓰기 감지용)
+_DATA_GENERATION_TABLES = ('work_records', 'holiday_work_entries', 'vacation_records',
+                           'board_projects', 'project_status', 'project_comments')
+
 
 class DatabaseManager:
     """SQLite 데이터베이스 관리 클래스"""
@@ -49,6 +64,8 @@ class DatabaseManager:
         self.db_path = Path(db_path)
         self._ensure_db_directory()
         self._init_database()
+        self._activity_writer = ActivityLogWriter(self._write_activity_logs)
+        self.log_archive = LogArchive(self)
         logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
     
     def _ensure_db_directory(self):
@@ -62,7 +79,10 @@ class DatabaseManager:
         conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 반환
         try:
             yield conn
+            # 커밋 직전 세대 값을 읽어 이 프로세스의 쓰기를 외부 변경으로 오인하지 않도록 알린다
+            generation = self._read_data_generation(conn) if conn.in_transaction else None
             conn.commit()
+            change_bus.note_local_generation(self.db_path, generation)
         except Exception as e:
             conn.rollback()
             logger.error(f"데이터베이스 오류: {e}")
@@ -135,6 +155,63 @@ class DatabaseManager:
                 )
             ''')
 
+            # 오류 묶음 (같은 fingerprint의 리포트를 한 행에 누적 — 원본은 error_reports에 최근 몇 건만)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS error_issues (
+                    fingerprint   TEXT PRIMARY KEY,
+                    error_type    TEXT,
+                    error_message TEXT,
+                    count         INTEGER NOT NULL DEFAULT 0,
+                    first_seen    TEXT,
+                    last_seen     TEXT,
+                    users         TEXT DEFAULT '[]',
+                    versions      TEXT DEFAULT '[]',
+                    is_read       INTEGER DEFAULT 0
+                )
+            ''')
+
+            # 백그라운드 작업 이력 (job_runner 종료 작업 기록)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS job_history (
+                    job_id      TEXT PRIMARY KEY,
+                    name        TEXT NOT NULL,
+                    status      TEXT NOT NULL,
+                    progress    INTEGER DEFAULT 0,
+                    message     TEXT DEFAULT '',
+                    data_json   TEXT DEFAULT '',
+                    result_json TEXT DEFAULT '',
+                    created_by  TEXT DEFAULT '',
+                    created_at  TEXT,
+                    started_at  TEXT DEFAULT '',
+                    finished_at TEXT DEFAULT ''
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_job_history_created
+                ON job_history(created_at DESC)
+            ''')
+
+            # 완료 기간 표본 (보드 마일스톤·준공 계약의 작업 기간) / 키별 분포 통계 — CompletionStats가 갱신
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS completion_samples (
+                    source        TEXT NOT NULL,
+                    source_id     TEXT NOT NULL,
+                    engine_key    TEXT NOT NULL DEFAULT '',
+                    work_key      TEXT NOT NULL DEFAULT '',
+                    duration_days INTEGER NOT NULL,
+                    PRIMARY KEY (source, source_id)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS completion_stats (
+                    stat_key     TEXT PRIMARY KEY,
+                    sample_count INTEGER NOT NULL,
+                    median_days  REAL,
+                    p80_days     REAL,
+                    updated_at   TEXT
+                )
+            ''')
+
             # 앱 설정 테이블
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS app_settings (
@@ -344,6 +421,11 @@ class DatabaseManager:
                 ON activity_logs(timestamp DESC)
             ''')
 
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_activity_logs_user
+                ON activity_logs(user, timestamp DESC)
+            ''')  # 사용자 필터 조회 풀테이블 스캔 방지
+
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_leave_grant_emp
                 ON leave_grant_history(employee_name)
@@ -402,6 +484,25 @@ class DatabaseManager:
             except Exception as _me:
                 logger.warning(f"vacation_records 마이그레이션 실패 (무시): {_me}")
 
+            # activity_logs.repeat_count 컬럼 마이그레이션 (같은 내용 반복 기록 횟수)
+            try:
+                cursor.execute("ALTER TABLE activity_logs ADD COLUMN repeat_count INTEGER NOT NULL DEFAULT 1")
+                logger.info("activity_logs.repeat_count 컬럼 추가 완료")
+            except Exception:
+                pass  # 이미 존재하면 무시
+
+            # error_reports.fingerprint 컬럼 마이그레이션 (오류 묶음) + 기존 리포트 묶기
+            try:
+                cursor.execute("ALTER TABLE error_reports ADD COLUMN fingerprint TEXT")
+                logger.info("error_reports.fingerprint 컬럼 추가 완료")
+            except Exception:
+                pass  # 이미 존재하면 무시
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_error_reports_fingerprint
+                ON error_reports(fingerprint, id DESC)
+            ''')
+            self._backfill_error_issues(cursor)
+
             # work_records.is_as 컬럼 마이그레이션 (A/S 여부)
             try:
                 cursor.execute("ALTER TABLE work_records ADD COLUMN is_as INTEGER DEFAULT 0")
@@ -520,6 +621,42 @@ class DatabaseManager:
                 except Exception:
                     pass
 
+            # 데이터 세대 카운터 — 화면 데이터 테이블이 바뀔 때마다 같은 트랜잭션에서 트리거로 1씩 증가
+            # (work_records 재생성 마이그레이션 뒤에 트리거를 만들어야 하므로 초기화 마지막에 둔다)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS data_generation (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    value INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute("INSERT OR IGNORE INTO data_generation (id, value) VALUES (1, 0)")
+            for _table in _DATA_GENERATION_TABLES:
+                for _op in ('INSERT', 'UPDATE', 'DELETE'):
+                    cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS trg_datagen_{_table}_{_op.lower()}
+                        AFTER {_op} ON {_table}
+                        BEGIN
+                            UPDATE data_generation SET value = value + 1 WHERE id = 1;
+                        END
+                    ''')
+
+    @staticmethod
+    def _read_data_generation(conn) -> Optional[int]:
+        try:
+            row = conn.execute("SELECT value FROM data_generation WHERE id = 1").fetchone()
+        except sqlite3.Error:
+            return None  # 초기화 전
+        return int(row[0]) if row else None
+
+    def get_data_generation(self) -> Optional[int]:
+        """데이터 세대 카운터 현재 값 (읽기 실패 시 None)"""
+        try:
+            with self.get_connection() as conn:
+                return self._read_data_generation(conn)
+        except Exception as e:
+            logger.error(f"데이터 세대 조회 실패: {e}")
+            return None
+
     # =========================================================================
     # 작업 레코드 관련 메서드
     # =========================================================================
@@ -589,12 +726,78 @@ class DatabaseManager:
             # add_activity_log는 with 블록 밖에서 호출 (안에서 호출 시 conn 중첩 → 30초 데드락)
             self.add_activity_log(username, 'save', date,
                                   f'{inserted_count}개 레코드 저장 [{work_type}]')
+            change_bus.publish(TOPIC_WORK_RECORDS, f'{date}:{work_type}')
             return True
 
         except Exception as e:
             logger.error(f"작업 레코드 저장 실패: {e}")
             return False
 
+    def import_work_records(self, records: Iterable[WorkRecord], username: str,
+                            work_type: str = 'day', batch_size: int = 500,
+                            progress_callback: Callable[[Dict[str, int]], None] = None) -> Dict[str, int]:
+        """엑셀 불러오기용 일괄 저장 (전체 날짜를 단일 트랜잭션으로 기록).
+
+        records는 지연 생성되는 이터러블이어도 되며, batch_size 단위로 executemany 삽입한다.
+        날짜별 기존 레코드는 해당 날짜가 처음 등장할 때 한 번만 삭제한다.
+        실패 시 예외를 그대로 전달하고 전체 트랜잭션은 롤백된다.
+        반환: {날짜: 저장 건수}
+        """
+        date_counts: Dict[str, int] = {}
+        batch: List[tuple] = []
+        now = datetime.now().isoformat()
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            def _flush():
+                if not batch:
+                    return
+                cursor.executemany('''
+                    INSERT INTO work_records (
+                        date, record_number, contract_number, company, ship_name,
+                        engine_model, work_content, location, leader, teammates,
+                        manpower, is_as, work_type, end_time,
+                        created_at, updated_at, created_by, updated_by
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', batch)
+                batch.clear()
+                if progress_callback:
+                    progress_callback(date_counts)
+
+            for record in records:
+                if record.date not in date_counts:
+                    cursor.execute(
+                        'DELETE FROM work_records WHERE date = ? AND work_type = ?',
+                        (record.date, work_type)
+                    )
+                    date_counts[record.date] = 0
+                date_counts[record.date] += 1
+                batch.append((
+                    record.date, record.record_number, record.contract_number,
+                    record.company, record.ship_name, record.engine_model,
+                    record.work_content, record.location, record.leader,
+                    record.teammates, record.manpower,
+                    getattr(record, 'is_as', 0),
+                    work_type,
+                    getattr(record, 'end_time', ''),
+                    now, now, username, username
+                ))
+                if len(batch) >= batch_size:
+                    _flush()
+            _flush()
+
+            # 활동 로그도 같은 트랜잭션에서 1건만 기록 (add_activity_log 별도 연결 사용 시 write lock 대기)
+            cursor.execute('''
+                INSERT INTO activity_logs (user, action, target, details)
+                VALUES (?, ?, ?, ?)
+            ''', (username, 'import', 'excel',
+                  f'{len(date_counts)}일, {sum(date_counts.values())}개 레코드 불러오기 [{work_type}]'))
+
+        logger.info(f"엑셀 일괄 저장 완료: {len(date_counts)}일, {sum(date_counts.values())}개 [{work_type}]")
+        change_bus.publish(TOPIC_WORK_RECORDS)
+        return date_counts
+
     def load_work_records(self, date: str, work_type: str = 'day') -> List[WorkRecord]:
         """작업 레코드 로드 (날짜 + work_type별)"""
         try:
@@ -705,6 +908,7 @@ class DatabaseManager:
                     ))
             self.add_activity_log(username, 'save', period_key,
                                   f'휴일 작업 명단 저장 {len(entries)}건')
+            change_bus.publish(TOPIC_HOLIDAY, period_key)
             return True
         except Exception as e:
             logger.error(f"휴일 작업 명단 저장 실패: {e}")
@@ -751,27 +955,56 @@ class DatabaseManager:
     # =========================================================================
     
     def add_activity_log(self, user: str, action: str, target: str = "", details: str = "") -> bool:
-        """활동 로그 추가"""
+        """활동 로그 추가 (대기열에 넣고 몇 초 뒤 한 트랜잭션으로 기록 — ActivityLogWriter)"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO activity_logs (user, action, target, details)
-                    VALUES (?, ?, ?, ?)
-                ''', (user, action, target, details))
-                return True
-                
+            self._activity_writer.submit(user, action, target, details)
+            return True
         except Exception as e:
             logger.error(f"활동 로그 추가 실패: {e}")
             return False
-    
-    def get_activity_logs(self, limit: int = 100, user: str = None) -> List[ActivityLog]:
-        """활동 로그 조회"""
+
+    def flush_activity_logs(self, stop: bool = False) -> None:
+        """대기 중인 활동 로그 즉시 기록 (stop=True면 기록 스레드도 종료 — 앱 종료 시)"""
+        if stop:
+            self._activity_writer.stop()
+        else:
+            self._activity_writer.flush()
+
+    def _write_activity_logs(self, entries: List[Dict[str, Any]], coalesce_window: int) -> None:
+        """대기열 항목 기록 — coalesce_window초 안에 같은 내용의 행이 있으면 repeat_count만 증가,
+        나머지는 executemany 한 번으로 INSERT (모두 한 트랜잭션)"""
+        cutoff = (datetime.utcnow() - timedelta(seconds=coalesce_window)).strftime('%Y-%m-%d %H:%M:%S')
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            inserts = []
+            for e in entries:
+                cursor.execute('''
+                    UPDATE activity_logs SET repeat_count = repeat_count + ?, timestamp = ?
+                    WHERE id = (
+                        SELECT id FROM activity_logs
+                        WHERE timestamp >= ? AND user = ? AND action = ? AND target = ? AND details = ?
+                        ORDER BY timestamp DESC LIMIT 1
+                    )
+                ''', (e['count'], e['timestamp'], cutoff, e['user'], e['action'], e['target'], e['details']))
+                if cursor.rowcount == 0:
+                    inserts.append((e['user'], e['action'], e['target'], e['details'],
+                                    e['timestamp'], e['count']))
+            if inserts:
+                cursor.executemany('''
+                    INSERT INTO activity_logs (user, action, target, details, timestamp, repeat_count)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', inserts)
+
+    def get_activity_logs(self, limit: int = 100, user: str = None,
+                          include_archive: bool = False) -> List[ActivityLog]:
+        """활동 로그 조회 (대기 중인 로그를 먼저 기록, include_archive면 연도별 보관 DB 포함)"""
+        self._activity_writer.flush()
         try:
-            with self.get_connection() as conn:
+            connect = self.log_archive.union_connection if include_archive else self.get_connection
+            with connect() as conn:
                 cursor = conn.cursor()
                 
-                query = 'SELECT * FROM activity_logs'
+                query = f"SELECT * FROM {'activity_logs_all' if include_archive else 'activity_logs'}"
                 params = []
                 
                 if user:
@@ -795,30 +1028,128 @@ class DatabaseManager:
 
     def add_error_report(self, user_id: str, user_name: str, app_version: str,
                          error_type: str, error_message: str, stack_trace: str = '') -> bool:
-        """오류 리포트 저장"""
+        """오류 리포트 저장 — error_issues 묶음에 누적하고 원본은 묶음당 최근 몇 건만 보관"""
         try:
+            fingerprint = error_fingerprint(error_type, error_message, stack_trace)
+            now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                # users·versions 목록을 읽고 고쳐 쓰므로 SELECT 전에 쓰기 잠금을 잡는다
+                # (DB 스레드 풀·다른 PC의 동시 리포트가 서로의 항목을 덮어쓰지 않도록)
+                cursor.execute('BEGIN IMMEDIATE')
+                self._record_error_issue(cursor, fingerprint, error_type or '', error_message or '',
+                                         user_name or user_id or '', app_version or '', now)
                 cursor.execute(
-                    'INSERT INTO error_reports (user_id, user_name, app_version, error_type, error_message, stack_trace) '
-                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    'INSERT INTO error_reports (user_id, user_name, app_version, error_type, error_message, '
+                    'stack_trace, timestamp, fingerprint) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
                     (user_id or '', user_name or '', app_version or '', error_type or '',
-                     error_message[:2000] if error_message else '', (stack_trace or '')[:4000])
+                     error_message[:2000] if error_message else '', (stack_trace or '')[:4000], now, fingerprint)
                 )
+                self._trim_error_samples(cursor, fingerprint)
             return True
         except Exception as e:
             logger.error(f"오류 리포트 저장 실패: {e}")
             return False
 
-    def get_error_reports(self, limit: int = 50) -> List[dict]:
-        """오류 리포트 목록 조회 (최신순)"""
+    @staticmethod
+    def _record_error_issue(cursor, fingerprint: str, error_type: str, error_message: str,
+                            user: str, version: str, seen_at: str, count: int = 1,
+                            first_seen: str = None, is_read: int = 0):
+        """error_issues 누적 (다시 발생하면 읽지 않음으로 되돌린다)"""
+        cursor.execute('SELECT count, users, versions, first_seen FROM error_issues WHERE fingerprint = ?',
+                       (fingerprint,))
+        row = cursor.fetchone()
+        users = json.loads(row[1] or '[]') if row else []
+        versions = json.loads(row[2] or '[]') if row else []
+        if user and user not in users and len(users) < _ERROR_ISSUE_MAX_TAGS:
+            users.append(user)
+        if version and version not in versions:
+            versions = (versions + [version])[-_ERROR_ISSUE_MAX_TAGS:]
+        if row:
+            cursor.execute(
+                'UPDATE error_issues SET count = count + ?, last_seen = MAX(last_seen, ?), '
+                'users = ?, versions = ?, is_read = ? WHERE fingerprint = ?',
+                (count, seen_at, json.dumps(users, ensure_ascii=False), json.dumps(versions), is_read, fingerprint))
+        else:
+            cursor.execute(
+                'INSERT INTO error_issues (fingerprint, error_type, error_message, count, first_seen, last_seen, '
+                'users, versions, is_read) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (fingerprint, error_type, error_message[:2000], count, first_seen or seen_at, seen_at,
+                 json.dumps(users, ensure_ascii=False), json.dumps(versions), is_read))
+
+    @staticmethod
+    def _trim_error_samples(cursor, fingerprint: str):
+        cursor.execute(
+            'DELETE FROM error_reports WHERE fingerprint = ? AND id NOT IN '
+            '(SELECT id FROM error_reports WHERE fingerprint = ? ORDER BY id DESC LIMIT ?)',
+            (fingerprint, fingerprint, _ERROR_SAMPLES_PER_ISSUE))
+
+    def _backfill_error_issues(self, cursor):
+        """fingerprint 없는 기존 리포트를 묶음으로 옮기고 원본은 묶음당 최근 몇 건만 남긴다"""
+        cursor.execute('SELECT id, user_id, user_name, app_version, error_type, error_message, stack_trace, '
+                       'timestamp, is_read FROM error_reports WHERE fingerprint IS NULL ORDER BY id')
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        touched = set()
+        for row in rows:
+            fingerprint = error_fingerprint(row['error_type'], row['error_message'], row['stack_trace'])
+            self._record_error_issue(cursor, fingerprint, row['error_type'] or '', row['error_message'] or '',
+                                     row['user_name'] or row['user_id'] or '', row['app_version'] or '',
+                                     row['timestamp'] or '', is_read=1 if row['is_read'] else 0)
+            cursor.execute('UPDATE error_reports SET fingerprint = ? WHERE id = ?', (fingerprint, row['id']))
+            touched.add(fingerprint)
+        for fingerprint in touched:
+            self._trim_error_samples(cursor, fingerprint)
+        logger.info(f"기존 오류 리포트 {len(rows)}건을 {len(touched)}개 묶음으로 정리")
+
+    def get_error_issues(self, limit: int = 50) -> List[dict]:
+        """오류 묶음 목록 (읽지 않은 것 먼저, 최근 발생순) + 최근 원본 리포트 1건"""
         try:
             with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT i.*, r.stack_trace AS sample_stack_trace, r.error_message AS sample_message
+                    FROM error_issues i
+                    LEFT JOIN error_reports r ON r.id = (
+                        SELECT id FROM error_reports WHERE fingerprint = i.fingerprint ORDER BY id DESC LIMIT 1)
+                    ORDER BY i.is_read ASC, i.last_seen DESC
+                    LIMIT ?
+                ''', (limit,))
+                issues = []
+                for row in cursor.fetchall():
+                    issue = dict(row)
+                    issue['users'] = json.loads(issue.get('users') or '[]')
+                    issue['versions'] = json.loads(issue.get('versions') or '[]')
+                    issues.append(issue)
+                return issues
+        except Exception as e:
+            logger.error(f"오류 묶음 조회 실패: {e}")
+            return []
+
+    def mark_error_issue_read(self, fingerprint: str) -> bool:
+        """오류 묶음 읽음 처리 (보관 중인 원본 리포트도 함께)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('UPDATE error_issues SET is_read=1 WHERE fingerprint=?', (fingerprint,))
+                cursor.execute('UPDATE error_reports SET is_read=1 WHERE fingerprint=?', (fingerprint,))
+            return True
+        except Exception as e:
+            logger.error(f"오류 묶음 읽음 처리 실패: {e}")
+            return False
+
+    def get_error_reports(self, limit: int = 50, include_archive: bool = False) -> List[dict]:
+        """오류 리포트 목록 조회 (최신순, include_archive면 연도별 보관 DB 포함)"""
+        try:
+            connect = self.log_archive.union_connection if include_archive else self.get_connection
+            with connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     'SELECT id, user_id, user_name, app_version, error_type, '
                     'error_message, stack_trace, timestamp, is_read '
-                    'FROM error_reports ORDER BY timestamp DESC LIMIT ?',
+                    f"FROM {'error_reports_all' if include_archive else 'error_reports'} "
+                    'ORDER BY timestamp DESC LIMIT ?',
                     (limit,)
                 )
                 rows = cursor.fetchall()
@@ -838,6 +1169,74 @@ class DatabaseManager:
             logger.error(f"오류 리포트 읽음 처리 실패: {e}")
             return False
 
+    # =========================================================================
+    # 백그라운드 작업 이력
+    # =========================================================================
+
+    def save_job_history(self, job: Dict[str, Any]) -> bool:
+        """종료된 작업 기록 (job_runner.Job.to_dict() 형식)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO job_history
+                        (job_id, name, status, progress, message, data_json, result_json,
+                         created_by, created_at, started_at, finished_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    job['job_id'], job['name'], job['status'], job.get('progress', 0),
+                    job.get('message', ''),
+                    json.dumps(job.get('data') or {}, ensure_ascii=False, default=str),
+                    json.dumps(job.get('result'), ensure_ascii=False, default=str),
+                    job.get('created_by', ''), job.get('created_at', ''),
+                    job.get('started_at', ''), job.get('finished_at', '')
+                ))
+                # 동기화되는 메인 DB가 계속 커지지 않도록 최근 jobs.history_keep건만 보관
+                keep = max(1, int(config.get('jobs.history_keep', _JOB_HISTORY_KEEP)))
+                cursor.execute('DELETE FROM job_history WHERE job_id NOT IN '
+                               '(SELECT job_id FROM job_history ORDER BY created_at DESC LIMIT ?)', (keep,))
+            return True
+        except Exception as e:
+            logger.error(f"작업 이력 저장 실패: {e}")
+            return False
+
+    def _job_history_row_to_dict(self, row) -> Dict[str, Any]:
+        item = dict(row)
+        for key, target in (('data_json', 'data'), ('result_json', 'result')):
+            raw = item.pop(key, '') or ''
+            try:
+                item[target] = json.loads(raw) if raw else None
+            except Exception:
+                item[target] = None
+        item['data'] = item['data'] or {}
+        item['cancel_requested'] = False
+        return item
+
+    def get_job_history_entry(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 이력 단건 조회"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM job_history WHERE job_id = ?', (job_id,))
+                row = cursor.fetchone()
+                return self._job_history_row_to_dict(row) if row else None
+        except Exception as e:
+            logger.error(f"작업 이력 조회 실패: {e}")
+            return None
+
+    def get_job_history(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """작업 이력 목록 (최신순)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'SELECT * FROM job_history ORDER BY created_at DESC LIMIT ?', (limit,)
+                )
+                return [self._job_history_row_to_dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"작업 이력 조회 실패: {e}")
+            return []
+
     # =========================================================================
     # 앱 설정 관련 메서드
     # =========================================================================
@@ -907,7 +1306,8 @@ class DatabaseManager:
                     ''', (contract_number, status, datetime.now().isoformat(), username,
                           status, datetime.now().isoformat(), username))
                 logger.info(f"프로젝트 상태 변경: {contract_number} → {status}")
-                return True
+            change_bus.publish(TOPIC_BOARD, f'cn:{contract_number}')
+            return True
         except Exception as e:
             logger.error(f"프로젝트 상태 변경 실패: {e}")
             return False
@@ -948,7 +1348,8 @@ class DatabaseManager:
                 ))
                 project_id = cursor.lastrowid
                 logger.info(f"보드 프로젝트 생성: ID={project_id}")
-                return project_id
+            change_bus.publish(TOPIC_BOARD, f'bp:{project_id}')
+            return project_id
         except Exception as e:
             logger.error(f"보드 프로젝트 생성 실패: {e}")
             return None
@@ -973,7 +1374,8 @@ class DatabaseManager:
                 values.append(project_id)
                 cursor.execute(f"UPDATE board_projects SET {', '.join(fields)} WHERE id = ?", values)
                 logger.info(f"보드 프로젝트 업데이트: ID={project_id}")
-                return True
+            change_bus.publish(TOPIC_BOARD, f'bp:{project_id}')
+            return True
         except Exception as e:
             logger.error(f"보드 프로젝트 업데이트 실패: {e}")
             return False
@@ -984,7 +1386,8 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('DELETE FROM board_projects WHERE id = ?', (project_id,))
-                return True
+            change_bus.publish(TOPIC_BOARD, f'bp:{project_id}')
+            return True
         except Exception as e:
             logger.error(f"보드 프로젝트 삭제 실패: {e}")
             return False
@@ -1004,6 +1407,34 @@ class DatabaseManager:
             logger.error(f"보드 프로젝트 조회 실패: {e}")
             return []
 
+    def get_project_board_state(self) -> Dict[str, Any]:
+        """보드 프로젝트 전체 + 수동 상태를 한 번의 조회로 → {'board': [...], 'manual': {계약번호: 상태}}
+        (ProjectStatusResolver가 데이터 세대별로 캐시)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT 'board' AS source, id, contract_number, company, ship_name, engine_model,
+                           work_content, status, target_start_date, target_end_date, actual_end_date,
+                           created_at
+                    FROM board_projects
+                    UNION ALL
+                    SELECT 'manual', NULL, contract_number, '', '', '', '', status, '', '', '', updated_at
+                    FROM project_status
+                    ORDER BY source, created_at DESC
+                ''')
+                board, manual = [], {}
+                for row in cursor.fetchall():
+                    item = dict(row)
+                    if item.pop('source') == 'manual':
+                        manual[item['contract_number']] = item['status']
+                    else:
+                        board.append(item)
+                return {'board': board, 'manual': manual}
+        except Exception as e:
+            logger.error(f"프로젝트 상태 일괄 조회 실패: {e}")
+            return {'board': [], 'manual': {}}
+
     # =========================================================================
     # 댓글 관련 메서드
     # =========================================================================
@@ -1020,7 +1451,9 @@ class DatabaseManager:
                 ''', (contract_number, board_project_id, parent_id, user_id, user_name, content, now))
                 comment_id = cursor.lastrowid
                 logger.info(f"댓글 추가: ID={comment_id}, 계약={contract_number}")
-                return comment_id
+            change_bus.publish(TOPIC_COMMENTS, f'cn:{contract_number}' if contract_number
+                               else f'bp:{board_project_id}')
+            return comment_id
         except Exception as e:
             logger.error(f"댓글 추가 실패: {e}")
             return None
@@ -1047,13 +1480,19 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                # 삭제 알림용 대상 조회
+                cursor.execute('SELECT contract_number, board_project_id FROM project_comments WHERE id = ? AND user_id = ?',
+                               (comment_id, user_id))
+                target = cursor.fetchone()
+                if target is None:
+                    return False
                 # 대댓글도 함께 삭제
                 cursor.execute('DELETE FROM project_comments WHERE id = ? AND user_id = ?', (comment_id, user_id))
-                if cursor.rowcount > 0:
-                    cursor.execute('DELETE FROM project_comments WHERE parent_id = ?', (comment_id,))
-                    logger.info(f"댓글 삭제: ID={comment_id}")
-                    return True
-                return False
+                cursor.execute('DELETE FROM project_comments WHERE parent_id = ?', (comment_id,))
+                logger.info(f"댓글 삭제: ID={comment_id}")
+            change_bus.publish(TOPIC_COMMENTS, f"cn:{target['contract_number']}" if target['contract_number']
+                               else f"bp:{target['board_project_id']}")
+            return True
         except Exception as e:
             logger.error(f"댓글 삭제 실패: {e}")
             return False
@@ -1087,7 +1526,8 @@ class DatabaseManager:
                 cursor.execute('DELETE FROM work_records')
                 deleted_count = cursor.rowcount
                 logger.info(f"전체 작업 레코드 삭제 완료: {deleted_count}개")
-                return True
+            change_bus.publish(TOPIC_WORK_RECORDS)
+            return True
         except Exception as e:
             logger.error(f"전체 작업 레코드 삭제 실패: {e}")
             return False
@@ -1136,6 +1576,7 @@ class DatabaseManager:
                         ''', (name, date, category, days, '일일작업현황 자동'))
 
             logger.info(f"휴가자 현황 저장 + 연차 사용 연동: {date}")
+            change_bus.publish(TOPIC_VACATION, date)
             return True
         except Exception as e:
             logger.error(f"휴가자 현황 저장 실패: {e}")
@@ -1735,5 +2176,5 @@ class DatabaseManager:
         return result
 
 
-# 싱글톤 인스턴스
-db = DatabaseManager()
+# 싱글톤 인스턴스 (첫 사용 시 스키마 초기화)
+db = LazySingleton(DatabaseManager, 'db')
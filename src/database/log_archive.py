@@ -0,0 +1,189 @@
+# src/database/log_archive.py - 활동 로그·오류 리포트 연도별 보관 DB
+# activity_logs·error_reports는 계속 쌓이기만 해서 메인 DB(클라우드 동기화·백업 때 파일 통째로 복사)를
+# 키운다. 보관 기간(archive.keep_days)이 지난 행을 메인 DB 옆 archive/<DB이름>_logs_<연도>.db로 옮기고,
+# 긴 텍스트 컬럼은 zlib으로 압축해 저장한다. 일일 스케줄러가 하루 한 번 실행한다.
+# 관리자 조회는 union_connection()이 만드는 임시 뷰(<테이블>_all)로 메인 + 보관 DB를 함께 읽는다.
+
+import re
+import sqlite3
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..utils.logger import logger
+from ..utils.config import config
+
+# 기본 보관 기간(일) — 0이면 보관 이동을 하지 않는다
+DEFAULT_KEEP_DAYS = 180
+# 조회 시 함께 붙일 최대 보관 DB 수 (SQLite ATTACH 기본 한도 10 — main·temp 외 여유 포함)
+MAX_ATTACHED_YEARS = 8
+
+# 보관 대상 테이블: 컬럼 순서 / 압축 컬럼 / 이동 조건(미확인 오류 리포트는 메인에 남긴다)
+ARCHIVE_TABLES: Dict[str, Dict[str, Any]] = {
+    'activity_logs': {
+        'columns': ['id', 'user', 'action', 'target', 'details', 'timestamp', 'repeat_count'],
+        'compressed': ['details'],
+        'where': '',
+    },
+    'error_reports': {
+        'columns': ['id', 'user_id', 'user_name', 'app_version', 'error_type',
+                    'error_message', 'stack_trace', 'timestamp', 'is_read'],
+        'compressed': ['error_message', 'stack_trace'],
+        'where': 'AND is_read = 1',
+    },
+}
+
+_ARCHIVE_SCHEMA = [
+    '''CREATE TABLE IF NOT EXISTS activity_logs (
+        id INTEGER PRIMARY KEY,
+        user TEXT NOT NULL,
+        action TEXT NOT NULL,
+        target TEXT,
+        details BLOB,
+        timestamp TEXT,
+        repeat_count INTEGER NOT NULL DEFAULT 1
+    )''',
+    'CREATE INDEX IF NOT EXISTS idx_activity_logs_timestamp ON activity_logs(timestamp DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_activity_logs_user ON activity_logs(user, timestamp DESC)',
+    '''CREATE TABLE IF NOT EXISTS error_reports (
+        id INTEGER PRIMARY KEY,
+        user_id TEXT,
+        user_name TEXT,
+        app_version TEXT,
+        error_type TEXT,
+        error_message BLOB,
+        stack_trace BLOB,
+        timestamp TEXT,
+        is_read INTEGER DEFAULT 0
+    )''',
+    'CREATE INDEX IF NOT EXISTS idx_error_reports_timestamp ON error_reports(timestamp DESC)',
+]
+
+_YEAR_FILE = re.compile(r'_logs_(\d{4})\.db$')
+
+
+def _zip_text(value):
+    if value is None or value == '':
+        return value
+    return zlib.compress(str(value).encode('utf-8'), 6)
+
+
+def _unzip_text(value):
+    if isinstance(value, bytes):
+        try:
+            return zlib.decompress(value).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError):
+            return ''
+    return value
+
+
+def _register_functions(conn: sqlite3.Connection):
+    conn.create_function('zip_text', 1, _zip_text, deterministic=True)
+    conn.create_function('unzip_text', 1, _unzip_text, deterministic=True)
+
+
+class LogArchive:
+    """메인 DB의 오래된 로그 행을 연도별 보관 DB로 이동하고, 합쳐 읽는 연결을 제공"""
+
+    def __init__(self, store, archive_dir: str = None):
+        self._store = store
+        self.archive_dir = Path(archive_dir) if archive_dir else Path(store.db_path).parent / 'archive'
+
+    @property
+    def keep_days(self) -> int:
+        try:
+            return max(0, int(config.get('archive.keep_days', DEFAULT_KEEP_DAYS)))
+        except (TypeError, ValueError):
+            return DEFAULT_KEEP_DAYS
+
+    def archive_path(self, year: str) -> Path:
+        return self.archive_dir / f"{Path(self._store.db_path).stem}_logs_{year}.db"
+
+    def archive_years(self) -> List[str]:
+        """보관 DB가 있는 연도 (최신순)"""
+        if not self.archive_dir.exists():
+            return []
+        stem = Path(self._store.db_path).stem
+        years = []
+        for path in self.archive_dir.glob(f'{stem}_logs_*.db'):
+            m = _YEAR_FILE.search(path.name)
+            if m:
+                years.append(m.group(1))
+        return sorted(years, reverse=True)
+
+    def archive(self, keep_days: int = None) -> Dict[str, Any]:
+        """keep_days보다 오래된 행을 연도별 보관 DB로 이동 → {'success', 'message', 'moved'}"""
+        keep_days = self.keep_days if keep_days is None else keep_days
+        if keep_days <= 0:
+            return {'success': True, 'message': '보관 이동 비활성 (archive.keep_days=0)', 'moved': {}}
+        # 저장된 timestamp는 CURRENT_TIMESTAMP(UTC) 형식
+        cutoff = (datetime.utcnow() - timedelta(days=keep_days)).strftime('%Y-%m-%d %H:%M:%S')
+        moved: Dict[str, int] = {}
+        try:
+            conn = sqlite3.connect(str(self._store.db_path), timeout=30)
+            try:
+                _register_functions(conn)
+                for table, spec in ARCHIVE_TABLES.items():
+                    years = [r[0] for r in conn.execute(
+                        f"SELECT DISTINCT substr(timestamp, 1, 4) FROM {table} "
+                        f"WHERE timestamp < ? {spec['where']}", (cutoff,))]
+                    for year in years:
+                        if not year or not year.isdigit():
+                            continue
+                        moved[table] = moved.get(table, 0) + self._move_year(conn, table, spec, year, cutoff)
+                if sum(moved.values()):
+                    conn.execute('VACUUM')  # 옮긴 만큼 메인 DB 파일 크기 축소
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"로그 보관 이동 실패: {e}")
+            return {'success': False, 'message': str(e), 'moved': moved}
+        total = sum(moved.values())
+        if total:
+            logger.info(f"로그 보관 이동 완료: {moved} (기준 {cutoff})")
+        return {'success': True, 'message': f'{total}건 보관 이동', 'moved': moved}
+
+    def _move_year(self, conn: sqlite3.Connection, table: str, spec: Dict[str, Any],
+                   year: str, cutoff: str) -> int:
+        """한 연도분 복사·삭제를 한 트랜잭션으로 (메인·보관 DB 모두 롤백 저널이라 함께 커밋된다)"""
+        path = self.archive_path(year)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = spec['columns']
+        select = ', '.join(f'zip_text({c})' if c in spec['compressed'] else c for c in columns)
+        where = f"timestamp < ? AND substr(timestamp, 1, 4) = ? {spec['where']}"
+        conn.execute('ATTACH DATABASE ? AS arc', (str(path),))
+        try:
+            for stmt in _ARCHIVE_SCHEMA:
+                conn.execute(stmt.replace('EXISTS ', 'EXISTS arc.', 1))
+            conn.commit()
+            conn.execute(f"INSERT OR IGNORE INTO arc.{table} ({', '.join(columns)}) "
+                         f"SELECT {select} FROM main.{table} WHERE {where}", (cutoff, year))
+            count = conn.execute(f"DELETE FROM main.{table} WHERE {where}", (cutoff, year)).rowcount
+            conn.commit()
+            return count
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute('DETACH DATABASE arc')
+
+    @contextmanager
+    def union_connection(self):
+        """메인 + 최근 보관 DB를 붙이고 임시 뷰 <테이블>_all을 만든 연결 (읽기 전용으로 사용)"""
+        with self._store.get_connection() as conn:
+            _register_functions(conn)
+            aliases = []
+            for year in self.archive_years()[:MAX_ATTACHED_YEARS]:
+                alias = f'arc{year}'
+                conn.execute(f'ATTACH DATABASE ? AS {alias}', (str(self.archive_path(year)),))
+                aliases.append(alias)
+            for table, spec in ARCHIVE_TABLES.items():
+                columns = ', '.join(spec['columns'])
+                parts = [f'SELECT {columns} FROM main.{table}']
+                unzip = ', '.join(f'unzip_text({c}) AS {c}' if c in spec['compressed'] else c
+                                  for c in spec['columns'])
+                parts += [f'SELECT {unzip} FROM {alias}.{table}' for alias in aliases]
+                conn.execute(f'CREATE TEMP VIEW {table}_all AS ' + ' UNION ALL '.join(parts))
+            yield conn
@@ -66,6 +66,7 @@ class ActivityLog:
     target: str = ""  # 작업 날짜 등
     details: str = ""
     timestamp: Optional[str] = None
+    repeat_count: int = 1  # 같은 내용이 짧은 시간 안에 반복 기록된 횟수
     
     def to_dict(self) -> dict:
         return asdict(self)
@@ -61,19 +61,26 @@ except ImportError:
     except Exception:
         _TRAY_AVAILABLE = False
 
-import eel
-
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils.logger import logger
-from src.utils.config import config
-from src.sync.cloud_sync import cloud_sync
-from src.utils.patch_system import patch_system
-from src.utils.update_manager import update_manager
-from src.utils.telegram_notifier import telegram_notifier
-from src.utils.daily_scheduler import daily_scheduler
-import src.web.api  # API 함수들을 로드
+# 시작 타임라인 기록 (가장 먼저 import — 이후 구간은 이 시점 기준 ms)
+from src.utils.startup_trace import startup_trace
+
+with startup_trace.phase('import:eel'):
+    import eel
+
+with startup_trace.phase('import:app'):
+    from src.utils.logger import logger
+    from src.utils.config import config
+    from src.sync.cloud_sync import cloud_sync
+    from src.utils.patch_system import patch_system
+    from src.utils.update_manager import update_manager
+    from src.utils.telegram_notifier import telegram_notifier
+    from src.utils.daily_scheduler import daily_scheduler
+    import src.web.api  # API 함수들을 로드
+    from src.web.api import flush_pending_writes
+    from src.web.static_assets import create_app as create_static_app
 
 
 # ---------------------------------------------------------------------------
@@ -92,6 +99,11 @@ def set_python_tray_mode(enabled: bool):
 
 def _do_full_cleanup():
     """앱 종료 전 정리 — finally 블록과 트레이 '종료' 메뉴 양쪽에서 호출"""
+    # 대기 중인 활동 로그를 먼저 기록 (os._exit 경로에서도 유실되지 않고 종료 동기화에 포함되도록)
+    try:
+        flush_pending_writes()
+    except Exception as e:
+        logger.error(f"종료 시 활동 로그 기록 실패: {e}")
     try:
         telegram_notifier.stop_polling()
     except Exception:
@@ -115,13 +127,21 @@ def _do_full_cleanup():
     logger.info(f"{config.app_name} 종료")
 
 
+def _browser_cmdline_args() -> list:
+    """Chrome/Edge 앱 창 추가 플래그 — 개발자 도구 모드에서만 HTTP 캐시를 끈다
+
+    eel 기본값(['--disable-http-cache'])을 그대로 두면 해시 URL + 장기 캐시 헤더(static_assets)가 무시되므로
+    eel.start와 트레이 재열기 모두 이 값을 사용한다.
+    """
+    return ['--disable-http-cache'] if config.get('ui.enable_dev_tools', False) else []
+
+
 def _open_window_from_tray():
     """트레이 → 앱 창 다시 열기 (Eel과 동일한 브라우저 감지 + 동일한 플래그 사용)"""
     url = 'http://localhost:8686/index.html'
     w = config.get('ui.window_width', 1400)
     h = config.get('ui.window_height', 900)
-    # Eel과 동일한 플래그 — disable-http-cache로 캐시 문제 방지
-    extra_args = [f'--window-size={w},{h}', '--disable-http-cache']
+    extra_args = [f'--window-size={w},{h}'] + _browser_cmdline_args()
 
     # Eel의 레지스트리 기반 find_path()로 실제 설치 경로 우선 탐색
     try:
@@ -262,13 +282,51 @@ def _wait_for_local_port_release(host: str, port: int, timeout: float = 15.0, in
     return False
 
 
+def _start_background_patch_check():
+    """UI 시작 후 GitHub 새 패치를 받아 patches/에 준비 — 준비되면 화면에 재시작 안내"""
+    if not config.get('update.check_on_startup', True):
+        return
+
+    def _worker():
+        time.sleep(max(0.0, float(config.get('update.background_check_delay', 5))))
+        result = update_manager.stage_patches()
+        if result.get('staged_count', 0) > 0:
+            from src.utils.change_bus import change_bus, TOPIC_UPDATE
+            change_bus.publish(TOPIC_UPDATE)
+
+    threading.Thread(target=_worker, name='patch-check', daemon=True).start()
+
+
+def _start_background_telegram():
+    """UI 시작 후 텔레그램 설정 보완 로드 + 봇 폴링 시작 (getMe 네트워크 대기가 첫 화면을 막지 않도록)"""
+
+    def _worker():
+        try:
+            # DB에서 텔레그램 설정 보완 로드 (다른 PC에서 settings.json에 토큰이 없을 때)
+            if not config.get('telegram.bot_token', ''):
+                from src.database.db_manager import db as _db
+                db_token = _db.get_setting('telegram.bot_token', '')
+                if db_token:
+                    db_enabled = _db.get_setting('telegram.enabled', 'false') == 'true'
+                    config.set('telegram.bot_token', db_token)
+                    config.set('telegram.enabled', db_enabled)
+                    telegram_notifier.bot_token = db_token
+                    telegram_notifier.enabled = db_enabled
+                    logger.info("텔레그램 설정을 DB app_settings에서 로드했습니다.")
+            telegram_notifier.start_polling()
+        except Exception as e:
+            logger.error(f"텔레그램 봇 시작 실패: {e}")
+
+    threading.Thread(target=_worker, name='telegram-start', daemon=True).start()
+
+
 def main():
     """메인 애플리케이션 실행"""
     logger.info("="*60)
     logger.info(f"{config.app_name} v{config.version} 시작")
     logger.info("="*60)
 
-    # 패치 확인 및 적용 (GitHub에서 자동 다운로드 + 적용)
+    # 준비된 패치 적용 (GitHub 확인·다운로드는 UI 시작 후 백그라운드에서 — _start_background_patch_check)
     # 무한 재시작 방지: 재시작 횟수를 just_updated.json에 기록, 3회 초과 시 재시작 없이 실행
     import json as _json
     _marker_path = Path(__file__).parent.parent / "data" / "just_updated.json"
@@ -298,21 +356,13 @@ def main():
         sys.exit(0)
 
     try:
-        logger.info("GitHub에서 패치 확인 및 자동 다운로드 중...")
-        patch_result = update_manager.download_and_apply_patches()
-        applied = patch_result.get('applied_count', 0)
-        if applied > 0:
-            logger.info(f"패치 {applied}개 적용 완료. 재시작 필요.")
-        elif patch_result.get('downloaded_count', 0) > 0:
-            logger.info(f"패치 {patch_result['downloaded_count']}개 다운로드됨.")
-        else:
-            # 다운로드할 것 없으면 로컬 patches/ 폴더만 재확인 (수동 설치 패치 대비)
+        # 이전 실행에서 백그라운드로 받아 둔 patches/ 폴더의 패치만 적용 (네트워크 대기 없음)
+        with startup_trace.phase('patch_apply'):
             applied = patch_system.check_and_apply_patches()
-            if applied > 0:
-                logger.info(f"로컬 패치 {applied}개 적용 완료.")
-        # 패치가 적용된 경우 자동 재시작 (Python 프로세스 교체 → 신코드 로드)
         if applied > 0:
-            _do_restart(applied, 'github')
+            logger.info(f"준비된 패치 {applied}개 적용 완료. 재시작 필요.")
+            # 패치가 적용된 경우 자동 재시작 (Python 프로세스 교체 → 신코드 로드)
+            _do_restart(applied, 'staged')
 
         # 재시작 없이 정상 실행 시 카운터 초기화
         if _marker_path.exists():
@@ -325,44 +375,38 @@ def main():
 
         patch_system._startup_patches_applied = applied
     except Exception as e:
-        logger.error(f"패치 확인/적용 오류: {e}")
+        logger.error(f"패치 적용 오류: {e}")
         patch_system._startup_patches_applied = 0
-        # GitHub 접근 실패 시 로컬 패치만 적용
-        try:
-            local = patch_system.check_and_apply_patches()
-            if local > 0:
-                _do_restart(local, 'local')
-            patch_system._startup_patches_applied = local
-        except Exception as e2:
-            logger.error(f"로컬 패치 적용 오류: {e2}")
 
     # Eel 초기화
     web_folder = Path(__file__).parent.parent / "web"
-    eel.init(str(web_folder), allowed_extensions=['.js', '.html'])
+    with startup_trace.phase('eel_init'):
+        eel.init(str(web_folder), allowed_extensions=['.js', '.html'])
 
     # 시작 시 클라우드 동기화 (sync_mode 기반)
-    _sync_mode = cloud_sync.sync_mode
-    if _sync_mode == 'company' and cloud_sync.enabled:
-        if cloud_sync.check_notification():
-            logger.info("외부 PC 변경 알림 감지 → 클라우드 DB 반영 후 시작")
+    with startup_trace.phase('cloud_sync'):
+        _sync_mode = cloud_sync.sync_mode
+        if _sync_mode == 'company' and cloud_sync.enabled:
+            if cloud_sync.check_notification():
+                logger.info("외부 PC 변경 알림 감지 → 클라우드 DB 반영 후 시작")
+                cloud_sync.sync_from_cloud()
+                cloud_sync.delete_notification()
+                # 클라우드 DB 덮어쓰기 후 마이그레이션 재실행 + 관리자 계정 재보장
+                # (클라우드 DB가 이전 버전일 경우 신규 컬럼 누락 대비)
+                from src.database.auth_manager import auth_manager as _am
+                from src.database.db_manager import db as _db
+                _am._init_auth_tables()
+                _db._init_database()
+            else:
+                logger.info("변경 알림 없음 → 로컬 DB 그대로 사용 [company]")
+        elif _sync_mode == 'external' and cloud_sync.enabled:
+            logger.info("외부 PC 시작 → 클라우드 DB 자동 pull")
             cloud_sync.sync_from_cloud()
-            cloud_sync.delete_notification()
             # 클라우드 DB 덮어쓰기 후 마이그레이션 재실행 + 관리자 계정 재보장
-            # (클라우드 DB가 이전 버전일 경우 신규 컬럼 누락 대비)
             from src.database.auth_manager import auth_manager as _am
             from src.database.db_manager import db as _db
             _am._init_auth_tables()
             _db._init_database()
-        else:
-            logger.info("변경 알림 없음 → 로컬 DB 그대로 사용 [company]")
-    elif _sync_mode == 'external' and cloud_sync.enabled:
-        logger.info("외부 PC 시작 → 클라우드 DB 자동 pull")
-        cloud_sync.sync_from_cloud()
-        # 클라우드 DB 덮어쓰기 후 마이그레이션 재실행 + 관리자 계정 재보장
-        from src.database.auth_manager import auth_manager as _am
-        from src.database.db_manager import db as _db
-        _am._init_auth_tables()
-        _db._init_database()
 
     # 브라우저 모드 결정 (Chrome → Edge → 기본 브라우저 순으로 시도)
     browser_mode = _detect_browser_mode()
@@ -376,7 +420,10 @@ def main():
         'size': (config.get('ui.window_width', 1400),
                 config.get('ui.window_height', 900)),
         'position': 'center',
-        'disable_cache': config.get('ui.enable_dev_tools', False)
+        'disable_cache': config.get('ui.enable_dev_tools', False),
+        'cmdline_args': _browser_cmdline_args(),
+        # 페이지·js·assets는 내용 해시 URL + 장기 캐시로 제공 (src/web/static_assets.py)
+        'app': create_static_app(dev_mode=config.get('ui.enable_dev_tools', False))
     }
 
     if _restart_count > 0:
@@ -387,25 +434,19 @@ def main():
             interval=0.5
         )
 
-    # DB에서 텔레그램 설정 보완 로드 (다른 PC에서 settings.json에 토큰이 없을 때)
-    if not config.get('telegram.bot_token', ''):
-        from src.database.db_manager import db as _db
-        db_token = _db.get_setting('telegram.bot_token', '')
-        if db_token:
-            db_enabled = _db.get_setting('telegram.enabled', 'false') == 'true'
-            config.set('telegram.bot_token', db_token)
-            config.set('telegram.enabled', db_enabled)
-            logger.info("텔레그램 설정을 DB app_settings에서 로드했습니다.")
-
-    # 텔레그램 봇 폴링 시작
-    telegram_notifier.start_polling()
+    with startup_trace.phase('services'):
+        # 일일 스케줄러 시작 (자동 백업 + 텔레그램 일일 요약)
+        daily_scheduler.start()
 
-    # 일일 스케줄러 시작 (자동 백업 + 텔레그램 일일 요약)
-    daily_scheduler.start()
+    # 텔레그램 봇(getMe·데이터 정리)과 GitHub 패치 확인은 창이 뜬 뒤 백그라운드에서
+    _start_background_telegram()
+    _start_background_patch_check()
 
     try:
         # 앱 실행
-        logger.info(f"웹 UI 시작: http://localhost:{window_options['port']}")
+        logger.info(f"웹 UI 시작: http://localhost:{window_options['port']} "
+                    f"(시작 준비 {startup_trace.elapsed_ms():.0f}ms)")
+        startup_trace.mark('eel_start')
         eel.start('index.html', close_callback=_close_callback, **window_options)
 
     except KeyboardInterrupt:
@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Optional
 from ..utils.logger import logger
 from ..utils.config import config
+from ..utils.startup_trace import LazySingleton
+from ..utils.change_bus import change_bus, TOPIC_ALL
 
 
 class CloudSync:
@@ -31,6 +33,7 @@ class CloudSync:
         self.local_db_path = config.db_path
         self.cloud_folder = self._get_cloud_folder()
         self.last_sync = None
+        self._cloud_signature = None  # 마지막 push/pull 시점의 클라우드 DB (mtime_ns, size)
 
         mode = self.sync_mode
         if self.enabled and self.cloud_folder:
@@ -131,6 +134,7 @@ class CloudSync:
             # 로컬 -> 클라우드 복사
             shutil.copy2(self.local_db_path, cloud_db_path)
             self.last_sync = datetime.now()
+            self._cloud_signature = self._file_signature(cloud_db_path)
             logger.info(f"클라우드 동기화 완료: {cloud_db_path}")
             return True
             
@@ -138,6 +142,22 @@ class CloudSync:
             logger.error(f"클라우드 동기화 실패: {e}")
             return False
     
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[tuple]:
+        try:
+            st = path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def cloud_changed_since_last_sync(self) -> bool:
+        """마지막 push/pull 이후 클라우드 DB 파일이 바뀌었는지 (stat만 확인, 파일 복사 없음)"""
+        if not self.enabled or not self.cloud_folder:
+            return False
+        cloud_db_path = self.cloud_folder / self.local_db_path.name
+        signature = self._file_signature(cloud_db_path)
+        return signature is not None and signature != self._cloud_signature
+
     def sync_from_cloud(self) -> bool:
         """클라우드 DB를 로컬로 동기화 (다운로드)"""
         if not self.enabled or not self.cloud_folder:
@@ -168,7 +188,10 @@ class CloudSync:
             # 클라우드 -> 로컬 복사
             shutil.copy2(cloud_db_path, self.local_db_path)
             self.last_sync = datetime.now()
+            self._cloud_signature = self._file_signature(cloud_db_path)
             logger.info(f"클라우드에서 동기화 완료: {self.local_db_path}")
+            # 로컬 DB 전체가 교체되었으므로 열린 화면 전체 갱신 알림
+            change_bus.publish(TOPIC_ALL)
             return True
             
         except Exception as e:
@@ -541,5 +564,5 @@ class CloudSync:
         return ok
 
 
-# 싱글톤 인스턴스
-cloud_sync = CloudSync()
+# 싱글톤 인스턴스 (첫 사용 시 클라우드 폴더 탐색)
+cloud_sync = LazySingleton(CloudSync, 'cloud_sync')
@@ -0,0 +1,103 @@
+# src/utils/activity_log_writer.py - 활동 로그 쓰기 지연(write-behind) 대기열
+# 작업 저장(30초 자동 저장 포함)마다 별도 연결로 activity_logs에 INSERT하던 것을 메모리 대기열에 쌓고,
+# 몇 초마다(또는 종료 시) 한 트랜잭션으로 기록한다. 같은 사용자·동작·대상·내용이 반복되면
+# 새 행을 만들지 않고 최근 행의 repeat_count를 올린다 (DatabaseManager._write_activity_logs).
+
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .logger import logger
+from .config import config
+
+# 대기열 기록 주기(초) / 같은 내용을 한 행으로 합칠 시간 범위(초)
+DEFAULT_FLUSH_INTERVAL = 3.0
+DEFAULT_COALESCE_WINDOW = 600
+
+
+class ActivityLogWriter:
+    """활동 로그 대기열 — submit()은 메모리에만 쌓고, 백그라운드 스레드가 주기적으로 sink에 넘긴다"""
+
+    def __init__(self, sink: Callable[[List[Dict[str, Any]], int], None],
+                 flush_interval: float = None, coalesce_window: int = None):
+        self._sink = sink
+        self.flush_interval = float(flush_interval if flush_interval is not None
+                                    else config.get('logging.activity_flush_sec', DEFAULT_FLUSH_INTERVAL))
+        self.coalesce_window = int(coalesce_window if coalesce_window is not None
+                                   else config.get('logging.activity_coalesce_sec', DEFAULT_COALESCE_WINDOW))
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # (user, action, target, details) → 항목 (같은 주기 안의 중복은 여기서 합쳐진다)
+        self._pending: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def submit(self, user: str, action: str, target: str = '', details: str = ''):
+        """로그 항목 추가 (DB 접근 없음)"""
+        key = (user or '', action or '', target or '', details or '')
+        # activity_logs.timestamp 기본값(CURRENT_TIMESTAMP)과 같은 UTC 형식
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry:
+                entry['count'] += 1
+                entry['timestamp'] = now
+            else:
+                self._pending[key] = {'user': key[0], 'action': key[1], 'target': key[2],
+                                      'details': key[3], 'timestamp': now, 'count': 1}
+            self._ensure_thread()
+
+    def flush(self) -> int:
+        """대기 중인 항목을 기록 → 기록한 항목 수 (실패 시 다음 주기에 다시 시도)"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                entries = list(self._pending.values())
+                self._pending = {}
+            try:
+                self._sink(entries, self.coalesce_window)
+                return len(entries)
+            except Exception as e:
+                logger.error(f"활동 로그 기록 실패 ({len(entries)}건, 다음 주기에 재시도): {e}")
+                with self._lock:
+                    for entry in entries:
+                        key = (entry['user'], entry['action'], entry['target'], entry['details'])
+                        newer = self._pending.get(key)
+                        if newer:
+                            newer['count'] += entry['count']
+                        else:
+                            self._pending[key] = entry
+                return 0
+
+    def stop(self, timeout: float = 5.0):
+        """스레드 종료 + 남은 항목 기록 (앱 종료 시)"""
+        with self._lock:
+            self._running = False
+            thread = self._thread
+            self._thread = None
+        self._wake.set()
+        if thread and thread.is_alive():
+            thread.join(timeout=timeout)
+        self.flush()
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _ensure_thread(self):
+        # _lock 보유 상태에서 호출
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._running = True
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
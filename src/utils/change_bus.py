@@ -0,0 +1,114 @@
+# src/utils/change_bus.py - 데이터 변경 이벤트 버스
+# DatabaseManager 쓰기 메서드가 커밋 후 publish()로 변경 주제를 알리고,
+# 브라우저는 wait_for_changes(since_seq) 롱폴링으로 자신이 보고 있는 데이터의 변경만 받아 갱신한다.
+# 대기 중인 클라이언트는 메모리의 seq만 확인하므로 DB 조회가 발생하지 않는다.
+# 다른 PC(공유 DB 파일)·클라우드 동기화의 쓰기는 이 프로세스에서 publish되지 않으므로,
+# check_external()이 DB의 데이터 세대 카운터(data_generation)를 주기적으로 비교해 바뀌었으면 'all'을 발행한다.
+# 카운터는 화면 데이터 테이블(근무기록·휴일근무·휴가·보드·코멘트)의 트리거가 같은 트랜잭션에서 올리므로
+# 세션·리스·로그 같은 관리용 쓰기는 신호가 되지 않는다.
+# 이 프로세스의 커밋은 note_local_generation()으로 알려 외부 변경으로 오인하지 않는다.
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+# 주제 목록
+TOPIC_WORK_RECORDS = 'work_records'   # key: 'YYYY-MM-DD:day|night' (일괄 변경 시 '')
+TOPIC_HOLIDAY = 'holiday'             # key: period_key
+TOPIC_VACATION = 'vacation'           # key: 날짜
+TOPIC_BOARD = 'board'                 # key: 'cn:계약번호' / 'bp:보드ID'
+TOPIC_COMMENTS = 'comments'           # key: 'cn:계약번호' / 'bp:보드ID'
+TOPIC_UPDATE = 'update'               # 다음 시작 시 적용할 패치가 준비됨
+TOPIC_ALL = 'all'                     # 병합·클라우드 동기화·다른 PC의 쓰기 등 전체 갱신 필요
+
+# 데이터 세대 카운터 확인 최소 간격(초)
+EXTERNAL_CHECK_INTERVAL = 2.0
+
+
+class ChangeBus:
+    """단조 증가 seq를 가진 최근 변경 이벤트 링 버퍼"""
+
+    def __init__(self, max_events: int = 500):
+        self._events: deque = deque(maxlen=max_events)
+        self._seq = 0
+        self._lock = threading.Lock()
+        # 외부 변경 감지용 DB 파일 경로·마지막으로 알고 있는 세대 값·마지막 확인 시각
+        self._gen_path: Optional[str] = None
+        self._gen_value: Optional[int] = None
+        self._gen_checked = 0.0
+        self._gen_notes = 0  # note_local_generation 호출 횟수 (카운터를 읽는 동안의 로컬 커밋 감지용)
+
+    @property
+    def latest_seq(self) -> int:
+        return self._seq
+
+    def publish(self, topic: str, key: str = '') -> int:
+        """변경 이벤트 발행 → 발행된 seq 반환"""
+        with self._lock:
+            self._seq += 1
+            self._events.append({'seq': self._seq, 'topic': topic,
+                                 'key': key or '', 'ts': time.time()})
+            return self._seq
+
+    def note_local_generation(self, path, generation: Optional[int]) -> None:
+        """이 프로세스가 데이터 테이블을 커밋한 직후 호출 — 커밋 시점의 세대 값을 알려진 상태로 기록
+
+        동시에 커밋한 스레드의 알림 순서가 뒤바뀔 수 있으므로 더 큰 값만 반영한다.
+        """
+        if generation is None:
+            return
+        path = str(path)
+        with self._lock:
+            if self._gen_path in (None, path):
+                self._gen_path = path
+                if self._gen_value is None or generation > self._gen_value:
+                    self._gen_value = generation
+                self._gen_notes += 1
+
+    def check_external(self, path, read_generation: Callable[[], Optional[int]],
+                       min_interval: float = EXTERNAL_CHECK_INTERVAL) -> bool:
+        """DB 세대 카운터가 마지막으로 알던 값과 다르면 'all' 발행 → 발행 여부 (min_interval초에 한 번만 확인)"""
+        path = str(path)
+        now = time.monotonic()
+        with self._lock:
+            if self._gen_path == path and now - self._gen_checked < min_interval:
+                return False
+            self._gen_checked = now
+            notes = self._gen_notes
+        generation = read_generation()
+        if generation is None:
+            return False
+        with self._lock:
+            if self._gen_path != path or self._gen_value is None:
+                # 처음 감시하는 DB는 현재 값을 기준으로
+                self._gen_path, self._gen_value = path, generation
+                return False
+            if generation == self._gen_value or notes != self._gen_notes:
+                # 읽는 사이 이 프로세스가 커밋했으면 읽은 값이 낡았을 수 있으므로 다음 확인으로 미룬다
+                return False
+            # 클라우드에서 받은 DB로 교체되면 값이 줄어들 수도 있으므로 크기 비교가 아닌 불일치로 판단
+            self._gen_value = generation
+        self.publish(TOPIC_ALL)
+        return True
+
+    def since(self, seq: int) -> Dict[str, Any]:
+        """seq 이후 이벤트 조회
+
+        버퍼에서 밀려난 이벤트가 있거나(클라이언트가 너무 오래 뒤처짐) 앱 재시작으로
+        seq가 클라이언트보다 작아진 경우 'all' 이벤트 하나로 대체한다.
+        """
+        with self._lock:
+            latest = self._seq
+            if seq == latest:
+                return {'seq': latest, 'events': []}
+            oldest = self._events[0]['seq'] if self._events else latest + 1
+            if seq > latest or seq < oldest - 1:
+                return {'seq': latest,
+                        'events': [{'seq': latest, 'topic': TOPIC_ALL, 'key': '', 'ts': time.time()}]}
+            events: List[Dict[str, Any]] = [dict(e) for e in self._events if e['seq'] > seq]
+            return {'seq': latest, 'events': events}
+
+
+# 싱글톤 인스턴스
+change_bus = ChangeBus()
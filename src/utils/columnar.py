@@ -0,0 +1,129 @@
+# src/utils/columnar.py - 대용량 목록 응답용 컬럼형 인코딩
+# 레코드 dict 목록을 필드 목록 + 컬럼 배열로 변환하여 eel 웹소켓 전송량을 줄인다.
+# 반복이 많은 문자열 컬럼(선사·선명·작업자 등)은 사전(dictionary) 인코딩한다.
+# JS 측 decodeColumnar()(web/js/app.js)가 원래의 dict 목록으로 복원한다.
+# 날짜 집합(간트 작업일 등)은 encode_day_bitmap()으로 기준일 대비 일수 비트맵으로 보내고
+# JS decodeDayBitmap()이 날짜 문자열 목록으로 되돌린다.
+
+import base64
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+COLUMNAR_FORMAT = 'columnar'
+
+# 사전 인코딩 조건: 고유값 수가 행 수의 절반 이하이고 최소 행 수 이상인 문자열 컬럼
+_DICT_MIN_ROWS = 4
+
+
+def encode_columnar(records: List[Dict[str, Any]],
+                    aliases: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """dict 목록 → 컬럼형 payload
+
+    aliases: {별칭 필드: 원본 필드} — 같은 값을 중복 전송하는 필드(snake_case 사본 등)는
+             전송하지 않고 디코더가 원본 값으로 다시 채운다.
+    일부 레코드에만 있는 필드는 sparse에 {필드: 키가 없는 행 번호 목록}으로 기록하여 디코딩 시 그 행에서만
+    키를 빼고 복원한다 (값이 None인 키와 구분된다).
+    """
+    aliases = aliases or {}
+    fields: List[str] = []
+    seen = set()
+    for rec in records:
+        for key in rec:
+            if key not in seen and key not in aliases:
+                seen.add(key)
+                fields.append(key)
+
+    n = len(records)
+    sparse: Dict[str, List[int]] = {}
+    for field in fields:
+        missing = [i for i, rec in enumerate(records) if field not in rec]
+        if missing:
+            sparse[field] = missing
+    columns: List[List[Any]] = []
+    dicts: Dict[str, List[Any]] = {}
+    for field in fields:
+        col = [rec.get(field) for rec in records]
+        if n >= _DICT_MIN_ROWS and all(isinstance(v, str) for v in col):
+            index: Dict[str, int] = {}
+            for v in col:
+                if v not in index:
+                    index[v] = len(index)
+            if len(index) * 2 <= n:
+                dicts[field] = list(index)
+                col = [index[v] for v in col]
+        columns.append(col)
+
+    payload: Dict[str, Any] = {
+        'format': COLUMNAR_FORMAT,
+        'length': n,
+        'fields': fields,
+        'columns': columns,
+    }
+    if dicts:
+        payload['dicts'] = dicts
+    if sparse:
+        payload['sparse'] = sparse
+    used_aliases = {a: src for a, src in aliases.items() if src in seen}
+    if used_aliases:
+        payload['aliases'] = used_aliases
+    return payload
+
+
+def decode_columnar(payload: Any) -> Any:
+    """컬럼형 payload → dict 목록 (컬럼형이 아니면 그대로 반환, 테스트/파이썬 측 사용)"""
+    if not isinstance(payload, dict) or payload.get('format') != COLUMNAR_FORMAT:
+        return payload
+    fields = payload.get('fields', [])
+    columns = payload.get('columns', [])
+    dicts = payload.get('dicts', {})
+    missing = {field: set(rows) for field, rows in payload.get('sparse', {}).items()}
+    aliases = payload.get('aliases', {})
+    records: List[Dict[str, Any]] = []
+    for i in range(payload.get('length', 0)):
+        rec: Dict[str, Any] = {}
+        for field, col in zip(fields, columns):
+            if field in missing and i in missing[field]:
+                continue
+            v = col[i]
+            if field in dicts:
+                v = dicts[field][v]
+            rec[field] = v
+        for alias, src in aliases.items():
+            if src in rec:
+                rec[alias] = rec[src]
+        records.append(rec)
+    return records
+
+
+def encode_day_bitmap(dates: Iterable[str], origin: date) -> Tuple[int, str]:
+    """'YYYY-MM-DD' 집합 → (첫 날짜의 origin 대비 일수, base64 비트맵)
+
+    비트 i(바이트 i // 8의 하위 비트부터)가 첫 날짜 + i일의 포함 여부. 날짜가 없으면 (0, '')
+    """
+    offsets = set()
+    for d in dates:
+        try:
+            offsets.add((date.fromisoformat(d) - origin).days)
+        except (TypeError, ValueError):
+            continue
+    if not offsets:
+        return 0, ''
+    first = min(offsets)
+    bits = bytearray((max(offsets) - first) // 8 + 1)
+    for offset in offsets:
+        i = offset - first
+        bits[i >> 3] |= 1 << (i & 7)
+    return first, base64.b64encode(bytes(bits)).decode('ascii')
+
+
+def decode_day_bitmap(offset: int, bitmap: str, origin: date) -> List[str]:
+    """encode_day_bitmap 역변환 → 정렬된 'YYYY-MM-DD' 목록 (테스트/파이썬 측 사용)"""
+    if not bitmap:
+        return []
+    start = origin + timedelta(days=offset)
+    result = []
+    for byte_index, byte in enumerate(base64.b64decode(bitmap)):
+        for bit in range(8):
+            if byte & (1 << bit):
+                result.append((start + timedelta(days=byte_index * 8 + bit)).isoformat())
+    return result
@@ -1,75 +1,196 @@
 # src/utils/daily_scheduler.py — 일일 자동 작업 스케줄러
-# 60초 간격으로 시각을 확인해 자동 백업·텔레그램 일일 요약을 실행한다.
+# 자동 백업·텔레그램 일일 요약/알림·일일 보고 캡처를 타이머 힙으로 관리한다.
+# 다음 실행 시각까지 잠들었다가 깨어나 작업을 워커 풀에서 실행하므로, 느린 백업이 다른 알림을 지연시키지 않는다.
+# 마지막 실행 회차는 DB app_settings(scheduler.last_run.<작업키>)에 저장되어 재시작·절전 후 놓친 작업을 따라잡는다.
 
+import heapq
+import itertools
 import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
 
 from .logger import logger
 from .config import config
 
+# 요일 이름 → isoweekday (월=1 … 일=7)
+WEEKDAY_NAMES = {'mon': 1, 'tue': 2, 'wed': 3, 'thu': 4, 'fri': 5, 'sat': 6, 'sun': 7}
+# 정시 실행으로 간주하는 지연 허용치 (catch_up_sec=0인 작업도 이 범위 안이면 실행)
+_ON_TIME_GRACE_SEC = 120
+# 최대 대기 시간 — 시스템 절전·시계 변경 후에도 늦지 않게 주기적으로 힙을 다시 확인
+_MAX_SLEEP_SEC = 300
+_LAST_RUN_PREFIX = 'scheduler.last_run.'
+_RUN_KEY_FORMAT = '%Y-%m-%dT%H:%M'
+
+
+def _parse_weekday(token: str) -> int:
+    token = token.strip().lower()[:3]
+    if token in WEEKDAY_NAMES:
+        return WEEKDAY_NAMES[token]
+    n = int(token)
+    if n == 0:       # cron 표기: 0 = 일요일
+        n = 7
+    if not 1 <= n <= 7:
+        raise ValueError(f"요일 범위 오류: {token}")
+    return n
+
+
+def parse_weekdays(spec: Any) -> frozenset:
+    """cron 요일 필드와 같은 표기 → isoweekday 집합
+
+    예: '*' (매일), '1-5' / 'mon-fri' (평일), 'fri', '1,3,5', 'sat-mon' (주말 걸침)
+    """
+    if spec is None or str(spec).strip() in ('', '*'):
+        return frozenset(range(1, 8))
+    days = set()
+    for part in str(spec).split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (_parse_weekday(p) for p in part.split('-', 1))
+            if start <= end:
+                days.update(range(start, end + 1))
+            else:
+                days.update(range(start, 8))
+                days.update(range(1, end + 1))
+        else:
+            days.add(_parse_weekday(part))
+    return frozenset(days)
+
+
+def normalize_hm(t: str) -> str:
+    """'9:30' → '09:30' 형식으로 정규화 (잘못된 값이면 빈 문자열)"""
+    if not t or ':' not in str(t):
+        return ''
+    try:
+        h, m = str(t).split(':', 1)
+        hi, mi = int(h), int(m)
+    except ValueError:
+        return ''
+    if not (0 <= hi <= 23 and 0 <= mi <= 59):
+        return ''
+    return f"{hi:02d}:{mi:02d}"
+
+
+class ScheduledJob:
+    """'HH:MM' + 요일 규칙으로 정의되는 반복 작업
+
+    catch_up_sec: 예정 시각을 놓쳤을 때(앱 종료·절전) 이 시간 안이면 늦게라도 실행한다.
+    """
+
+    def __init__(self, key: str, hm: str, weekdays: Any, fn: Callable[[str], None],
+                 catch_up_sec: int = 0):
+        self.key = key
+        self.hm = normalize_hm(hm)
+        if not self.hm:
+            raise ValueError(f"시각 형식 오류: {hm}")
+        self.hour, self.minute = (int(x) for x in self.hm.split(':'))
+        self.weekdays = weekdays if isinstance(weekdays, frozenset) else parse_weekdays(weekdays)
+        self.fn = fn
+        self.catch_up_sec = max(0, int(catch_up_sec))
+
+    def next_after(self, dt: datetime) -> Optional[datetime]:
+        """dt 이후 첫 실행 시각"""
+        candidate = dt.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if candidate <= dt:
+            candidate += timedelta(days=1)
+        for _ in range(8):
+            if candidate.isoweekday() in self.weekdays:
+                return candidate
+            candidate += timedelta(days=1)
+        return None
+
+    def last_at_or_before(self, dt: datetime) -> Optional[datetime]:
+        """dt 이전(포함) 마지막 예정 시각"""
+        candidate = dt.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if candidate > dt:
+            candidate -= timedelta(days=1)
+        for _ in range(8):
+            if candidate.isoweekday() in self.weekdays:
+                return candidate
+            candidate -= timedelta(days=1)
+        return None
+
 
 class DailyScheduler:
-    """분 단위 일일 작업 스케줄러 (백그라운드 daemon 스레드)"""
+    """타이머 힙 기반 일일 작업 스케줄러 (백그라운드 daemon 스레드 + 워커 풀)"""
 
-    def __init__(self):
+    def __init__(self, store=None, max_workers: int = None):
+        self._store = store
+        self.max_workers = max(1, int(max_workers or config.get('scheduler.max_workers', 3)))
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[tuple] = []          # (실행 시각 epoch, seq, 작업키)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
         self._running = False
+        self._running_keys = set()
         self._thread: threading.Thread = None
-        self._ran_today: dict = {}   # task_key -> 'YYYY-MM-DD' (중복 실행 방지)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def store(self):
+        if self._store is None:
+            from ..database.db_manager import db
+            self._store = db
+        return self._store
 
-    def start(self):
+    def start(self, jobs: List[ScheduledJob] = None):
         """스케줄러 백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
         if self._thread and self._thread.is_alive():
             return
-        self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='scheduler-job')
+        with self._cond:
+            self._running = True
+            self._load_jobs(jobs if jobs is not None else self._build_jobs())
         self._thread = threading.Thread(
             target=self._run, name='daily-scheduler', daemon=True
         )
         self._thread.start()
-        logger.info("일일 스케줄러 시작")
+        logger.info(f"일일 스케줄러 시작 (작업 {len(self._jobs)}개)")
 
     def stop(self):
-        """스케줄러 중단"""
-        self._running = False
+        """스케줄러 중단 (실행 중인 작업은 끝날 때까지 백그라운드에서 계속된다)"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def reload(self):
+        """설정 변경 후 작업 목록을 다시 구성"""
+        with self._cond:
+            self._load_jobs(self._build_jobs())
+            self._cond.notify_all()
+        logger.info(f"일일 스케줄러 작업 재구성 (작업 {len(self._jobs)}개)")
+
+    def get_schedule(self) -> List[Dict[str, Any]]:
+        """예약된 작업과 다음 실행 시각 (실행 시각 순)"""
+        with self._cond:
+            entries = sorted(self._heap)
+        return [{'key': key, 'next_run': datetime.fromtimestamp(ts).isoformat(timespec='minutes')}
+                for ts, _, key in entries]
 
     # -------------------------------------------------------------------------
-    # 내부 루프
+    # 작업 구성
     # -------------------------------------------------------------------------
 
-    def _run(self):
-        while self._running:
-            try:
-                self._tick()
-            except Exception as e:
-                logger.error(f"스케줄러 오류: {e}")
-            time.sleep(60)
+    def _build_jobs(self) -> List[ScheduledJob]:
+        """config 값으로 작업 목록 생성 (시작·재구성 시에만 읽는다)
 
-    @staticmethod
-    def _normalize_hm(t: str) -> str:
-        """'9:30' → '09:30' 형식으로 정규화 (strftime('%H:%M') 비교용)"""
-        if not t or ':' not in t:
-            return t
-        try:
-            h, m = t.split(':', 1)
-            hi, mi = int(h), int(m)
-            if not (0 <= hi <= 23 and 0 <= mi <= 59):
-                return t  # 범위 초과 시 원본 반환
-            return f"{hi:02d}:{mi:02d}"
-        except ValueError:
-            return t
-
-    def _tick(self):
-        now = datetime.now()
-        today = now.strftime('%Y-%m-%d')
-        hm = now.strftime('%H:%M')
+        요일 규칙은 scheduler.weekdays.<작업키>로 덮어쓸 수 있다 (예: "mon-fri", "1,3,5").
+        """
+        overrides = config.get('scheduler.weekdays', {}) or {}
+        specs = []
 
-        # ── 자동 백업 ──────────────────────────────────────────────────────────
-        backup_time = self._normalize_hm(config.get('backup.auto_schedule_time', ''))
-        if backup_time and hm == backup_time and self._ran_today.get('backup') != today:
-            self._ran_today['backup'] = today
-            self._do_backup()
+        # ── 자동 백업 (매일) ──────────────────────────────────────────────────
+        specs.append(('backup', config.get('backup.auto_schedule_time', ''), '*',
+                      lambda date: self._do_backup(), 24 * 3600))
 
-        # ── 일일 작업 요약 텔레그램 발송 (복수 시각 지원) ─────────────────────
+        # ── 일일 작업 요약 텔레그램 발송 (평일, 복수 시각 지원) ────────────────
         summary_times = config.get('telegram.daily_summary_times', [])
         if not summary_times:                         # 구버전 호환
             _single = config.get('telegram.daily_summary_time', '')
@@ -78,41 +199,135 @@ class DailyScheduler:
         if isinstance(summary_times, str):
             summary_times = [summary_times]
         for _t in summary_times:
-            _t_norm = self._normalize_hm(_t)   # '9:30' → '09:30' 정규화
-            _key = f'summary_{_t_norm}'
-            if _t_norm and hm == _t_norm and self._ran_today.get(_key) != today:
-                self._ran_today[_key] = today   # 주말에도 마킹 (중복 방지)
-                if now.isoweekday() <= 5:        # 평일(월=1~금=5)만 발송
-                    self._do_daily_summary(today)
-                else:
-                    logger.info(f"일일 요약 건너뜀 (주말: {now.strftime('%A')})")
+            specs.append((f'summary_{normalize_hm(_t)}', _t, '1-5', self._do_daily_summary, 6 * 3600))
 
         # ── 금요일 휴일 근로 현황 알림 ───────────────────────────────────────
-        if now.isoweekday() == 5:   # 금요일
-            _hol_time = self._normalize_hm(
-                config.get('telegram.holiday_reminder_time', '17:30'))
-            _hol_key = f'holiday_reminder_{today}'
-            if _hol_time and hm == _hol_time and self._ran_today.get(_hol_key) != today:
-                self._ran_today[_hol_key] = today
-                self._do_holiday_reminder()
-
-        # ── 평일 16:30 야간 보고 입력 요청 알림 ─────────────────────────────
-        if now.isoweekday() <= 5:   # 평일(월~금)
-            _night_time = self._normalize_hm(
-                config.get('telegram.night_report_reminder_time', '16:30'))
-            _night_key = f'night_report_reminder_{today}'
-            if _night_time and hm == _night_time and self._ran_today.get(_night_key) != today:
-                self._ran_today[_night_key] = today
-                self._do_night_report_reminder()
-
-        # ── 평일 17:00 일일 보고(주간) 자동 캡처 저장 ───────────────────────
-        if now.isoweekday() <= 5:   # 평일(월~금)
-            _capture_time = self._normalize_hm(
-                config.get('scheduler.daily_capture_time', '17:00'))
-            _capture_key = f'daily_capture_{today}'
-            if _capture_time and hm == _capture_time and self._ran_today.get(_capture_key) != today:
-                self._ran_today[_capture_key] = today
-                self._do_daily_capture(today)
+        specs.append(('holiday_reminder', config.get('telegram.holiday_reminder_time', '17:30'), 'fri',
+                      lambda date: self._do_holiday_reminder(), 6 * 3600))
+
+        # ── 평일 야간 보고 입력 요청 알림 ───────────────────────────────────
+        specs.append(('night_report_reminder', config.get('telegram.night_report_reminder_time', '16:30'),
+                      '1-5', lambda date: self._do_night_report_reminder(), 3 * 3600))
+
+        # ── 평일 일일 보고(주간) 자동 캡처 — 브라우저 연결이 필요하므로 늦은 실행은 하지 않음 ──
+        specs.append(('daily_capture', config.get('scheduler.daily_capture_time', '17:00'),
+                      '1-5', self._do_daily_capture, 0))
+
+        # ── 오래된 활동 로그·오류 리포트 연도별 보관 DB로 이동 (매일, 놓치면 다음 실행 때) ──
+        specs.append(('log_archive', config.get('archive.schedule_time', '03:30'), '*',
+                      lambda date: self._do_log_archive(), 24 * 3600))
+
+        # ── 완료 기간 통계(완료일 예측) 갱신 (매일, 놓치면 다음 실행 때) ──────────
+        specs.append(('completion_stats', config.get('scheduler.completion_stats_time', '03:45'), '*',
+                      lambda date: self._do_completion_stats(), 24 * 3600))
+
+        jobs = []
+        for key, hm, weekdays, fn, catch_up_sec in specs:
+            if not normalize_hm(hm):
+                if hm:
+                    logger.warning(f"스케줄 시각 형식 오류로 건너뜀: {key}={hm}")
+                continue
+            try:
+                jobs.append(ScheduledJob(key, hm, overrides.get(key, weekdays), fn, catch_up_sec))
+            except ValueError as e:
+                logger.warning(f"스케줄 규칙 오류로 건너뜀: {key} - {e}")
+        return jobs
+
+    def _load_jobs(self, jobs: List[ScheduledJob]):
+        """힙 재구성 (self._cond 보유 상태에서 호출)"""
+        self._jobs = {job.key: job for job in jobs}
+        self._heap = []
+        now = datetime.now()
+        for job in jobs:
+            due = self._initial_due(job, now)
+            if due:
+                heapq.heappush(self._heap, (due.timestamp(), next(self._seq), job.key))
+
+    def _initial_due(self, job: ScheduledJob, now: datetime) -> Optional[datetime]:
+        """놓친 회차가 따라잡기 허용 범위 안이면 그 회차, 아니면 다음 회차"""
+        last_due = job.last_at_or_before(now)
+        if last_due and (now - last_due).total_seconds() <= max(job.catch_up_sec, _ON_TIME_GRACE_SEC):
+            if self._load_last_run(job.key) < last_due.strftime(_RUN_KEY_FORMAT):
+                return last_due
+        return job.next_after(now)
+
+    # -------------------------------------------------------------------------
+    # 내부 루프
+    # -------------------------------------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                if not self._heap:
+                    self._cond.wait(_MAX_SLEEP_SEC)
+                    continue
+                due_ts, _, key = self._heap[0]
+                delay = due_ts - time.time()
+                if delay > 0:
+                    self._cond.wait(min(delay, _MAX_SLEEP_SEC))
+                    continue
+                heapq.heappop(self._heap)
+                job = self._jobs.get(key)
+                if job is None:
+                    continue
+                due = datetime.fromtimestamp(due_ts)
+                now = datetime.now()
+                # 다음 회차 예약 — 오래 잠들어 여러 회차를 놓쳤어도 한 번만 실행되도록 현재 시각 기준
+                next_due = job.next_after(max(now, due))
+                if next_due:
+                    heapq.heappush(self._heap, (next_due.timestamp(), next(self._seq), key))
+            try:
+                self._dispatch(job, due, now)
+            except Exception as e:
+                logger.error(f"스케줄러 오류: {e}")
+
+    def _dispatch(self, job: ScheduledJob, due: datetime, now: datetime):
+        late_sec = (now - due).total_seconds()
+        if late_sec > max(job.catch_up_sec, _ON_TIME_GRACE_SEC):
+            logger.info(f"예약 작업 건너뜀 (지연 {int(late_sec)}초): {job.key} {due:%Y-%m-%d %H:%M}")
+            return
+        run_key = due.strftime(_RUN_KEY_FORMAT)
+        if self._load_last_run(job.key) >= run_key:
+            return  # 다른 PC 또는 이전 실행에서 이미 처리
+        with self._cond:
+            if job.key in self._running_keys:
+                logger.warning(f"이전 실행이 끝나지 않아 건너뜀: {job.key}")
+                return
+            self._running_keys.add(job.key)
+            executor = self._executor
+        if executor is None:
+            with self._cond:
+                self._running_keys.discard(job.key)
+            return
+        # 실행 전에 기록 — 작업 도중 종료돼도 같은 회차를 반복 실행하지 않는다
+        self._save_last_run(job.key, run_key)
+        if late_sec > _ON_TIME_GRACE_SEC:
+            logger.info(f"놓친 예약 작업 실행: {job.key} {due:%Y-%m-%d %H:%M}")
+        executor.submit(self._execute, job, due.strftime('%Y-%m-%d'))
+
+    def _execute(self, job: ScheduledJob, date: str):
+        try:
+            job.fn(date)
+        except Exception as e:
+            logger.error(f"예약 작업 오류: {job.key} - {e}")
+        finally:
+            with self._cond:
+                self._running_keys.discard(job.key)
+
+    def _load_last_run(self, key: str) -> str:
+        try:
+            return self.store.get_setting(_LAST_RUN_PREFIX + key, '') or ''
+        except Exception as e:
+            logger.error(f"스케줄 실행 기록 조회 실패: {e}")
+            return ''
+
+    def _save_last_run(self, key: str, run_key: str):
+        try:
+            self.store.set_setting(_LAST_RUN_PREFIX + key, run_key)
+        except Exception as e:
+            logger.error(f"스케줄 실행 기록 저장 실패: {e}")
 
     # -------------------------------------------------------------------------
     # 실행 작업
@@ -129,6 +344,21 @@ class DailyScheduler:
         except Exception as e:
             logger.error(f"자동 백업 오류: {e}")
 
+    def _do_log_archive(self):
+        try:
+            result = self.store.log_archive.archive()
+            if not result.get('success'):
+                logger.error(f"로그 보관 이동 실패: {result.get('message', '')}")
+        except Exception as e:
+            logger.error(f"로그 보관 이동 오류: {e}")
+
+    def _do_completion_stats(self):
+        try:
+            from ..business.completion_stats import completion_stats
+            completion_stats.refresh()
+        except Exception as e:
+            logger.error(f"완료 기간 통계 갱신 오류: {e}")
+
     def _do_daily_summary(self, date: str):
         try:
             from .telegram_notifier import telegram_notifier
@@ -0,0 +1,108 @@
+# src/utils/delta_patch.py - 패치용 바이너리 델타 (COPY/ADD 명령열)
+# 기준 파일(이전 버전)에서 재사용할 구간은 COPY(오프셋, 길이), 새 내용은 ADD(바이트)로 기록한다.
+# 소스 파일은 대부분 줄 단위로 바뀌므로 줄 단위로 일치 구간을 찾고, 명령은 바이트 오프셋으로 저장한다.
+# build_patch.py가 생성하고 PatchSystem.apply_patch가 기준/결과 SHA-256 확인과 함께 적용한다.
+
+import difflib
+import hashlib
+from typing import List, Tuple
+
+DELTA_MAGIC = b'WMD1'
+DELTA_SUFFIX = '.wmdelta'
+
+_OP_COPY = 0x01
+_OP_ADD = 0x02
+
+
+class DeltaError(Exception):
+    """델타 형식 오류 또는 기준 파일 불일치"""
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_varint(out: bytearray, n: int):
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        if pos >= len(data):
+            raise DeltaError('델타 데이터가 잘렸습니다.')
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def make_delta(base: bytes, target: bytes) -> bytes:
+    """base → target 변환 델타 생성"""
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    offsets = [0]
+    for line in base_lines:
+        offsets.append(offsets[-1] + len(line))
+
+    ops: List[Tuple[int, object]] = []
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            start, length = offsets[i1], offsets[i2] - offsets[i1]
+            if ops and ops[-1][0] == _OP_COPY and sum(ops[-1][1]) == start:
+                ops[-1] = (_OP_COPY, (ops[-1][1][0], ops[-1][1][1] + length))
+            else:
+                ops.append((_OP_COPY, (start, length)))
+        elif j2 > j1:   # replace / insert (delete는 명령 없음)
+            ops.append((_OP_ADD, b''.join(target_lines[j1:j2])))
+
+    out = bytearray(DELTA_MAGIC)
+    _write_varint(out, len(target))
+    for op, arg in ops:
+        out.append(op)
+        if op == _OP_COPY:
+            _write_varint(out, arg[0])
+            _write_varint(out, arg[1])
+        else:
+            _write_varint(out, len(arg))
+            out.extend(arg)
+    return bytes(out)
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """델타를 base에 적용해 결과 바이트 반환"""
+    if not delta.startswith(DELTA_MAGIC):
+        raise DeltaError('델타 형식이 아닙니다.')
+    pos = len(DELTA_MAGIC)
+    target_len, pos = _read_varint(delta, pos)
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op == _OP_COPY:
+            start, pos = _read_varint(delta, pos)
+            length, pos = _read_varint(delta, pos)
+            if start + length > len(base):
+                raise DeltaError('COPY 범위가 기준 파일을 벗어납니다.')
+            out.extend(base[start:start + length])
+        elif op == _OP_ADD:
+            length, pos = _read_varint(delta, pos)
+            if pos + length > len(delta):
+                raise DeltaError('델타 데이터가 잘렸습니다.')
+            out.extend(delta[pos:pos + length])
+            pos += length
+        else:
+            raise DeltaError(f'알 수 없는 델타 명령: {op}')
+    if len(out) != target_len:
+        raise DeltaError('델타 적용 결과 크기가 다릅니다.')
+    return bytes(out)
@@ -0,0 +1,61 @@
+# src/utils/error_fingerprint.py - 오류 리포트 묶음(fingerprint) 계산
+# 같은 원인의 오류는 메시지 속 숫자·ID·경로와 스택의 줄 번호만 다르다. 오류 유형 + 정규화한 메시지 +
+# 스택 상위 프레임(함수명·파일명)으로 해시를 만들어, DatabaseManager가 error_issues 한 행에 횟수를 누적한다.
+
+import hashlib
+import re
+from typing import List
+
+# 지문에 쓰는 스택 상위 프레임 수
+TOP_FRAMES = 3
+
+_NORMALIZERS = [
+    (re.compile(r'https?://\S+'), '<url>'),
+    (re.compile(r'[A-Za-z]:\\[^\s\'"]+|/(?:[\w.-]+/)+[\w.-]+'), '<path>'),
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.I), '<uuid>'),
+    (re.compile(r'\b0x[0-9a-f]+\b|\b[0-9a-f]{12,}\b', re.I), '<hex>'),
+    (re.compile(r'(["\']).*?\1'), '<str>'),
+    (re.compile(r'\d+'), '<n>'),
+    (re.compile(r'\s+'), ' '),
+]
+
+# JS: "at fn (http://host/js/app.js?v=abc:10:5)" / "at http://host/js/app.js:10:5" / "fn@http://…:10:5"
+_JS_FRAME = re.compile(r'(?:at\s+(?:async\s+)?(?:(?P<fn>[^\s(]+)\s+\()?|(?P<fn2>[^\s@]*)@)(?P<file>[^\s()]+?)(?::\d+){1,2}\)?\s*$')
+# Python: 'File "C:\...\api.py", line 10, in get_data'
+_PY_FRAME = re.compile(r'File "(?P<file>[^"]+)", line \d+, in (?P<fn>\S+)')
+
+
+def normalize_message(message: str) -> str:
+    """가변 부분(URL·경로·UUID·16진수·따옴표 문자열·숫자)을 자리표시자로 바꾼 메시지"""
+    text = (message or '').strip()
+    for pattern, repl in _NORMALIZERS:
+        text = pattern.sub(repl, text)
+    return text[:500]
+
+
+def _basename(path: str) -> str:
+    path = path.split('?', 1)[0].split('#', 1)[0]
+    return re.split(r'[\\/]', path)[-1]
+
+
+def top_frames(stack_trace: str, limit: int = TOP_FRAMES) -> List[str]:
+    """스택에서 '함수@파일명' 목록 (줄 번호·쿼리 제외) — Python은 가장 안쪽 호출부터"""
+    lines = (stack_trace or '').splitlines()
+    py_frames = [m for m in (_PY_FRAME.search(line) for line in lines) if m]
+    if py_frames:
+        return [f"{m.group('fn')}@{_basename(m.group('file'))}" for m in reversed(py_frames)][:limit]
+    frames = []
+    for line in lines:
+        m = _JS_FRAME.search(line.strip())
+        if m:
+            fn = m.group('fn') or m.group('fn2') or '<anonymous>'
+            frames.append(f"{fn}@{_basename(m.group('file'))}")
+            if len(frames) >= limit:
+                break
+    return frames
+
+
+def error_fingerprint(error_type: str, message: str, stack_trace: str = '') -> str:
+    """오류 유형 + 정규화 메시지 + 상위 프레임의 해시 (16자리)"""
+    parts = [(error_type or '').strip().lower(), normalize_message(message)] + top_frames(stack_trace)
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:16]
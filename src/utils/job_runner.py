@@ -0,0 +1,287 @@
+# src/utils/job_runner.py — 백그라운드 작업 실행기
+# 엑셀 불러오기·병합·백업·클라우드 연결 등 장시간 관리자 작업을 고정 크기 워커 풀에서 실행한다.
+# 각 작업은 job_id로 진행률/취소/결과를 조회할 수 있고, 종료된 작업은 DB job_history에 기록된다.
+
+import itertools
+import queue
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .logger import logger
+from .config import config
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+_FINISHED_STATES = ('completed', 'failed', 'cancelled')
+
+
+class JobCancelled(Exception):
+    """작업 함수가 취소 요청을 감지했을 때 발생"""
+
+
+class Job:
+    """실행 단위 작업 — 작업 함수는 첫 인자로 Job을 받아 진행률 보고/취소 확인에 사용한다."""
+
+    def __init__(self, name: str, priority: int = PRIORITY_NORMAL,
+                 created_by: str = '', heavy: bool = False):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.priority = priority
+        self.created_by = created_by
+        self.heavy = heavy
+        self.status = 'queued'
+        self.progress = 0
+        self.message = ''
+        self.data: Dict[str, Any] = {}
+        self.result: Any = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at = ''
+        self.finished_at = ''
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """취소 요청이 있으면 JobCancelled 발생 (작업 함수의 안전한 지점에서 호출)"""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def update(self, progress: int = None, message: str = None, **data) -> None:
+        """진행률(0~100)·메시지·부가 정보 갱신"""
+        with self._lock:
+            if progress is not None:
+                self.progress = max(0, min(100, int(progress)))
+            if message is not None:
+                self.message = message
+            if data:
+                self.data.update(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'job_id': self.job_id,
+                'name': self.name,
+                'status': self.status,
+                'progress': self.progress,
+                'message': self.message,
+                'data': dict(self.data),
+                'result': self.result,
+                'created_by': self.created_by,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'cancel_requested': self._cancel_event.is_set(),
+            }
+
+
+class JobRunner:
+    """우선순위 큐 + 고정 크기 워커 풀
+
+    - 워커 수는 jobs.max_workers (기본 2)로 제한
+    - heavy=True 작업(대량 DB 쓰기)은 한 번에 하나만 실행해 UI 쿼리와 DB 잠금 경쟁을 줄인다
+      (실행 중에 꺼낸 다른 heavy 작업은 보류했다가 끝나면 다시 대기열에 넣어, 워커가 잠금을 기다리며
+      묶이지 않고 가벼운 작업을 계속 처리하게 한다)
+    - 종료된 작업은 메모리에 최근 jobs.keep_finished 건만 유지하고, DB job_history에 영속화
+    """
+
+    def __init__(self, max_workers: int = None, keep_finished: int = None):
+        self.max_workers = max(1, int(max_workers or config.get('jobs.max_workers', 2)))
+        self.keep_finished = int(keep_finished or config.get('jobs.keep_finished', 200))
+        self._queue: 'queue.PriorityQueue' = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._finished_order: List[str] = []
+        self._lock = threading.Lock()
+        self._heavy_running = False
+        self._deferred_heavy: List[tuple] = []  # heavy 작업 실행 중에 꺼낸 heavy 대기열 항목
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._shutdown = False
+        self.persist_history = True
+
+    # -------------------------------------------------------------------------
+    # 공개 API
+    # -------------------------------------------------------------------------
+
+    def submit(self, name: str, fn: Callable[..., Any], *args,
+               priority: int = PRIORITY_NORMAL, created_by: str = '',
+               heavy: bool = False, unique: bool = False, **kwargs) -> Job:
+        """작업 등록 → Job 반환. fn(job, *args, **kwargs)의 반환값이 job.result가 된다.
+
+        unique=True이면 같은 이름의 작업이 이미 대기 중일 때 새로 등록하지 않고 기존 작업을 반환한다.
+        """
+        job = Job(name, priority=priority, created_by=created_by, heavy=heavy)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('JobRunner가 종료되었습니다.')
+            if unique:
+                for existing in self._jobs.values():
+                    if existing.name == name and existing.status == 'queued':
+                        return existing
+            self._jobs[job.job_id] = job
+            self._queue.put((priority, next(self._seq), job, fn, args, kwargs))
+            self._ensure_worker()
+        logger.info(f"작업 등록: {name} (job={job.job_id}, priority={priority})")
+        return job
+
+    def get_status(self, job_id: str, include_history: bool = True) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (메모리에 없으면 DB 이력에서 조회 — include_history=False면 메모리만)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        if not self.persist_history or not include_history:
+            return None
+        try:
+            from ..database.db_manager import db
+            return db.get_job_history_entry(job_id)
+        except Exception as e:
+            logger.error(f"작업 이력 조회 실패: {e}")
+            return None
+
+    def cancel(self, job_id: str) -> bool:
+        """취소 요청 — 대기 중이면 즉시 취소, 실행 중이면 작업 함수가 확인할 때 중단"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.status in _FINISHED_STATES:
+            return False
+        job._cancel_event.set()
+        if job.status == 'queued':
+            self._finish(job, 'cancelled', message='취소되었습니다.')
+        logger.info(f"작업 취소 요청: {job.name} (job={job_id})")
+        return True
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """메모리에 있는 작업 목록 (최신순)"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [j.to_dict() for j in sorted(jobs, key=lambda j: j.created_at, reverse=True)]
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self._lock:
+            running = sum(1 for j in self._jobs.values() if j.status == 'running')
+            queued = sum(1 for j in self._jobs.values() if j.status == 'queued')
+            return {
+                'max_workers': self.max_workers,
+                'workers': len(self._workers),
+                'running': running,
+                'queued': queued,
+            }
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """대기 중 작업 취소 + 실행 중 작업에 취소 요청 후 워커 종료 대기"""
+        with self._lock:
+            self._shutdown = True
+            jobs = list(self._jobs.values())
+            workers = list(self._workers)
+        for job in jobs:
+            if job.status not in _FINISHED_STATES:
+                self.cancel(job.job_id)
+        for _ in workers:
+            self._queue.put((PRIORITY_HIGH - 1, next(self._seq), None, None, (), {}))
+        for t in workers:
+            t.join(timeout=timeout)
+
+    # -------------------------------------------------------------------------
+    # 내부
+    # -------------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        """대기 워커가 없고 상한 미만이면 워커 추가 (self._lock 보유 상태에서 호출)"""
+        self._workers = [t for t in self._workers if t.is_alive()]
+        if self._queue.qsize() <= self._idle_workers or len(self._workers) >= self.max_workers:
+            return
+        t = threading.Thread(target=self._worker_loop,
+                             name=f'job-worker-{len(self._workers) + 1}', daemon=True)
+        self._workers.append(t)
+        t.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            try:
+                item = self._queue.get()
+            finally:
+                with self._lock:
+                    self._idle_workers -= 1
+            _, _, job, fn, args, kwargs = item
+            if job is None:
+                return
+            if job.status != 'queued':
+                continue  # 대기 중 취소됨
+            if not job.heavy:
+                self._run_job(job, fn, args, kwargs)
+                continue
+            with self._lock:
+                if self._heavy_running:
+                    self._deferred_heavy.append(item)
+                    continue
+                self._heavy_running = True
+            try:
+                self._run_job(job, fn, args, kwargs)
+            finally:
+                with self._lock:
+                    self._heavy_running = False
+                    deferred, self._deferred_heavy = self._deferred_heavy, []
+                    for entry in deferred:
+                        self._queue.put(entry)  # 원래 (priority, seq) 그대로 → 순서 유지
+                    if deferred:
+                        self._ensure_worker()
+
+    def _run_job(self, job: Job, fn, args, kwargs) -> None:
+        if job.cancel_requested:
+            self._finish(job, 'cancelled', message='취소되었습니다.')
+            return
+        with job._lock:
+            job.status = 'running'
+            job.started_at = datetime.now().isoformat()
+        try:
+            result = fn(job, *args, **kwargs)
+            job.result = result
+            if isinstance(result, dict) and result.get('success') is False:
+                self._finish(job, 'failed', message=result.get('message', ''))
+            else:
+                self._finish(job, 'completed', progress=100)
+        except JobCancelled:
+            self._finish(job, 'cancelled', message='취소되었습니다.')
+        except Exception as e:
+            logger.error(f"작업 실행 오류: {job.name} (job={job.job_id}) - {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            self._finish(job, 'failed', message='작업 중 오류가 발생했습니다.')
+
+    def _finish(self, job: Job, status: str, progress: int = None, message: str = None) -> None:
+        with job._lock:
+            if job.status in _FINISHED_STATES:
+                return
+            job.status = status
+            if progress is not None:
+                job.progress = progress
+            if message is not None:
+                job.message = message
+            job.finished_at = datetime.now().isoformat()
+        logger.info(f"작업 종료: {job.name} (job={job.job_id}) → {status}")
+
+        with self._lock:
+            self._finished_order.append(job.job_id)
+            while len(self._finished_order) > self.keep_finished:
+                self._jobs.pop(self._finished_order.pop(0), None)
+
+        if self.persist_history:
+            try:
+                from ..database.db_manager import db
+                db.save_job_history(job.to_dict())
+            except Exception as e:
+                logger.error(f"작업 이력 저장 실패: {e}")
+
+
+# 싱글톤 인스턴스
+job_runner = JobRunner()
@@ -0,0 +1,220 @@
+# src/utils/offload.py - CPU·블로킹 작업을 gevent 루프 밖 OS 스레드에서 실행
+# eel은 bottle + gevent 단일 루프에서 요청을 처리하고, 이 앱은 monkey-patch를 하지 않는다.
+# 요청 처리 greenlet 안에서 오래 걸리는 작업(비밀번호 해시, SQLite 조회 등)을 직접 실행하면 그동안 다른
+# UI 요청이 모두 멈추므로, 스레드 풀에 맡기고 결과가 나올 때까지 greenlet만 양보하며 기다린다.
+# greenlet 밖(메인 스레드 시작 단계, 백그라운드 스레드)에서 호출하면 그냥 바로 실행한다.
+#
+# api.py의 노출 함수는 @eel.expose 대신 여기의 @expose로 등록한다.
+#   @expose               → DB 접근 함수: 크기 제한 스레드 풀(db_dispatcher)에서 실행
+#   @expose(inline=True)  → 메모리만 보는 가벼운 함수, gevent.sleep으로 대기하는 롱폴링 등: 루프에서 바로 실행
+#   @expose(coalesce=True) → 읽기 전용 조회: 같은 인자로 동시에 들어온 중복 호출은 먼저 시작된 계산 결과를 공유
+
+import functools
+import json
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from .config import config
+from .change_bus import change_bus
+
+# DB 스레드 풀 기본 크기 (설정 server.db_threads) — SQLite 쓰기는 어차피 직렬화되므로 크게 잡지 않는다
+DEFAULT_DB_THREADS = 4
+
+
+def _in_request_greenlet() -> bool:
+    """gevent가 로드되어 있고 현재 실행 주체가 gevent Greenlet(eel 요청 처리 등)인지"""
+    gevent = sys.modules.get('gevent')
+    if gevent is None:
+        return False
+    try:
+        return isinstance(gevent.getcurrent(), gevent.Greenlet)
+    except Exception:
+        return False
+
+
+def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """fn(*args, **kwargs) 실행 — 요청 greenlet이면 hub 스레드 풀에서 실행하고 양보하며 대기"""
+    if not _in_request_greenlet():
+        return fn(*args, **kwargs)
+    import gevent
+    return gevent.get_hub().threadpool.apply(fn, args, kwargs)
+
+
+class DbDispatcher:
+    """eel 요청을 크기가 제한된 gevent 스레드 풀에서 실행하고 대기열 지표를 집계"""
+
+    def __init__(self, size: int = None):
+        self._size = size
+        self._pool = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._peak_depth = 0
+        self._completed = 0
+        self._errors = 0
+        self._wait_ms_total = 0.0
+        self._run_ms_total = 0.0
+        self._slowest: Dict[str, float] = {}
+
+    @property
+    def size(self) -> int:
+        if self._size:
+            return self._size
+        try:
+            return max(1, int(config.get('server.db_threads', DEFAULT_DB_THREADS)))
+        except (TypeError, ValueError):
+            return DEFAULT_DB_THREADS
+
+    def _get_pool(self):
+        # gevent ThreadPool은 만든 스레드의 hub에 묶이므로 첫 요청(메인 스레드 루프)에서 만든다
+        if self._pool is None:
+            from gevent.threadpool import ThreadPool
+            self._pool = ThreadPool(self.size)
+        return self._pool
+
+    def run(self, name: str, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """fn을 풀에서 실행하고 결과 반환 (풀이 가득 차면 greenlet이 양보하며 순서를 기다림)"""
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self._peak_depth = max(self._peak_depth, self._queued + self._active)
+
+        def _task():
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._wait_ms_total += (started - submitted) * 1000
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+                    self._errors += 0 if ok else 1
+                    self._run_ms_total += elapsed_ms
+                    if elapsed_ms > self._slowest.get(name, 0.0):
+                        self._slowest[name] = elapsed_ms
+
+        return self._get_pool().apply(_task)
+
+    def metrics(self) -> Dict[str, Any]:
+        """현재 대기/실행 수, 최대 동시 요청 수, 평균 대기·실행 시간, 느린 함수 상위 10개"""
+        with self._lock:
+            done = self._completed or 1
+            slowest = sorted(self._slowest.items(), key=lambda kv: kv[1], reverse=True)[:10]
+            return {
+                'pool_size': self.size,
+                'queued': self._queued,
+                'active': self._active,
+                'peak_depth': self._peak_depth,
+                'completed': self._completed,
+                'errors': self._errors,
+                'avg_wait_ms': round(self._wait_ms_total / done, 1),
+                'avg_run_ms': round(self._run_ms_total / done, 1),
+                'slowest': [{'name': n, 'max_ms': round(ms, 1)} for n, ms in slowest],
+            }
+
+
+class SingleFlight:
+    """같은 (함수, 인자) 호출이 진행 중이면 새로 계산하지 않고 그 결과를 기다려 공유
+
+    요청 greenlet 사이에서만 합친다 (모두 메인 스레드 루프에서 돌기 때문에 gevent AsyncResult로 대기).
+    키에 change_bus seq를 넣어, 데이터 변경 이후 들어온 호출이 변경 전에 시작된 계산에 합류하지 않게 한다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+        self._coalesced: Dict[str, int] = {}
+
+    @staticmethod
+    def _key(name: str, args: tuple, kwargs: dict) -> tuple:
+        try:
+            arg_key = json.dumps([args, kwargs], sort_keys=True, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            arg_key = repr((args, sorted(kwargs.items())))
+        return name, arg_key, change_bus.latest_seq
+
+    def do(self, name: str, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        if not _in_request_greenlet():
+            return fn(*args, **kwargs)
+        from gevent.event import AsyncResult
+        key = self._key(name, args, kwargs)
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = AsyncResult()
+                leader = True
+            else:
+                self._coalesced[name] = self._coalesced.get(name, 0) + 1
+                leader = False
+        if not leader:
+            return pending.get()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        """함수별 호출 수·합쳐진(재계산하지 않은) 호출 수"""
+        with self._lock:
+            return {
+                'in_flight': len(self._inflight),
+                'coalesced_total': sum(self._coalesced.values()),
+                'by_name': {name: {'calls': calls, 'coalesced': self._coalesced.get(name, 0)}
+                            for name, calls in sorted(self._calls.items())},
+            }
+
+
+def coalesced(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """동시 중복 호출을 single_flight로 합치는 래퍼"""
+    @functools.wraps(fn)
+    def _wrapper(*args, **kwargs):
+        return single_flight.do(fn.__name__, fn, args, kwargs)
+    return _wrapper
+
+
+def offloaded(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """요청 greenlet에서 호출되면 db_dispatcher 스레드 풀에서 실행하는 래퍼"""
+    @functools.wraps(fn)
+    def _wrapper(*args, **kwargs):
+        if not _in_request_greenlet():
+            return fn(*args, **kwargs)
+        return db_dispatcher.run(fn.__name__, fn, args, kwargs)
+    return _wrapper
+
+
+def expose(fn: Callable[..., Any] = None, *, inline: bool = False, coalesce: bool = False):
+    """eel.expose 대체 — 기본은 DB 스레드 풀에서 실행, inline=True면 gevent 루프에서 바로 실행,
+    coalesce=True면 동시 중복 호출을 합친다 (대기하는 중복 호출은 스레드 풀 자리를 차지하지 않음)"""
+    def _decorate(func):
+        import eel
+        target = func if inline else offloaded(func)
+        if coalesce:
+            target = coalesced(target)
+        eel.expose(target)
+        return target
+    if fn is not None:
+        return _decorate(fn)
+    return _decorate
+
+
+# 싱글톤 인스턴스
+db_dispatcher = DbDispatcher()
+single_flight = SingleFlight()
@@ -8,6 +8,7 @@ from typing import Dict, List
 from packaging import version
 from .logger import logger
 from .config import config
+from .delta_patch import DeltaError, apply_delta, sha256_bytes
 
 
 class PatchSystem:
@@ -22,6 +23,8 @@ class PatchSystem:
         self.patches_dir = self.app_root / "patches"
         self.current_version = config.version
         self.applied_patches_file = self.app_root / "data" / "applied_patches.json"
+        # 델타 기준 파일이 현재 파일과 달라 전체 파일 패치가 필요한 패치 ID (UpdateManager가 대체 다운로드)
+        self.needs_full_patch = set()
 
         # 패치 디렉토리 생성
         self.patches_dir.mkdir(parents=True, exist_ok=True)
@@ -176,6 +179,14 @@ class PatchSystem:
         logger.info(f"패치 적용 시작: {patch_id} - {patch_info.get('description', '')}")
 
         try:
+            # 모든 파일 내용을 먼저 준비·검증 — 하나라도 실패하면 아무 파일도 바꾸지 않는다
+            files = patch_info.get('files', [])
+            try:
+                prepared, already_current = self._prepare_patch_files(patch_dir, files)
+            except DeltaError as de:
+                logger.error(f"패치 검증 실패, 적용 중단 ({patch_id}): {de}")
+                return False
+
             # 백업 생성 (실패 시 패치 중단 — 롤백 불가 방지)
             try:
                 self._create_backup()
@@ -184,30 +195,18 @@ class PatchSystem:
                 return False
 
             # 파일 복사
-            files = patch_info.get('files', [])
             files_copied = 0
-            for file_info in files:
-                # files 항목이 문자열인 경우 dict로 정규화
-                if isinstance(file_info, str):
-                    file_info = {'source': file_info, 'target': file_info}
-
-                source_path = patch_dir / file_info['source']
-                target_path = self.app_root / file_info['target']
-
-                if not source_path.exists():
-                    logger.warning(f"패치 파일을 찾을 수 없음: {source_path}")
-                    continue
-
-                # 타겟 디렉토리 생성
+            for target_path, content, label in prepared:
+                # 타겟 디렉토리 생성 후 임시 파일 → 교체 (쓰는 도중 종료돼도 반쯤 쓴 파일이 남지 않게)
                 target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # 파일 복사
-                shutil.copy2(source_path, target_path)
-                logger.info(f"파일 복사: {file_info['source']} → {file_info['target']}")
+                tmp_path = target_path.with_name(target_path.name + '.patching')
+                tmp_path.write_bytes(content)
+                tmp_path.replace(target_path)
+                logger.info(f"파일 적용: {label}")
                 files_copied += 1
 
             # 파일이 하나도 복사 안 됐으면 패치 실패 (applied 기록 안 함)
-            if files and files_copied == 0:
+            if files and files_copied == 0 and not already_current:
                 logger.error(f"패치 파일을 하나도 복사하지 못함: {patch_id}")
                 return False
 
@@ -236,6 +235,49 @@ class PatchSystem:
             logger.error(f"패치 적용 실패 ({patch_id}): {e}")
             return False
     
+    def _prepare_patch_files(self, patch_dir: Path, files: List) -> tuple:
+        """patch.json files 항목 → [(대상 경로, 새 내용, 로그 라벨)], 이미 최신인 파일 수
+
+        - type == 'delta': 현재 파일이 base_sha256과 같을 때만 델타 적용 (이미 sha256이면 건너뜀)
+        - 그 외: 패치 폴더의 파일 전체로 교체
+        - sha256이 있으면 결과 내용과 대조
+        기준 파일 불일치 시 DeltaError를 발생시키고 needs_full_patch에 패치 폴더명을 기록한다.
+        """
+        prepared = []
+        already_current = 0
+        for file_info in files:
+            # files 항목이 문자열인 경우 dict로 정규화
+            if isinstance(file_info, str):
+                file_info = {'source': file_info, 'target': file_info}
+
+            source_path = patch_dir / file_info['source']
+            target_path = self.app_root / file_info['target']
+            expected_sha = (file_info.get('sha256') or '').lower()
+
+            if not source_path.exists():
+                logger.warning(f"패치 파일을 찾을 수 없음: {source_path}")
+                continue
+
+            if file_info.get('type') == 'delta':
+                current = target_path.read_bytes() if target_path.exists() else b''
+                current_sha = sha256_bytes(current)
+                if expected_sha and current_sha == expected_sha:
+                    already_current += 1
+                    continue
+                if current_sha != (file_info.get('base_sha256') or '').lower():
+                    self.needs_full_patch.add(patch_dir.name)
+                    raise DeltaError(f"기준 파일 불일치: {file_info['target']}")
+                content = apply_delta(current, source_path.read_bytes())
+                label = f"{file_info['source']} (델타) → {file_info['target']}"
+            else:
+                content = source_path.read_bytes()
+                label = f"{file_info['source']} → {file_info['target']}"
+
+            if expected_sha and sha256_bytes(content) != expected_sha:
+                raise DeltaError(f"결과 해시 불일치: {file_info['target']}")
+            prepared.append((target_path, content, label))
+        return prepared, already_current
+
     def _create_backup(self):
         """백업 생성"""
         from datetime import datetime
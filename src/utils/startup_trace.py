@@ -0,0 +1,151 @@
+# src/utils/startup_trace.py - 앱 시작 구간별 소요 시간 기록
+# main.py가 시작 구간(모듈 import, 패치 적용, eel 초기화 …)을 phase()로 감싸고, 지연 생성 싱글톤은
+# 처음 생성될 때 'init:<이름>' 구간을 남긴다. 스플래시가 첫 화면을 띄운 뒤 finish()를 호출하면
+# logs/startup.log에 실행 1회당 JSON 한 줄로 기록되어 릴리스별 시작 시간 회귀를 비교할 수 있다.
+# 가장 먼저 import되므로 표준 라이브러리만 사용한다 (logger/config 의존 없음).
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# startup.log에 보관할 최대 실행 기록 수
+_MAX_LOG_LINES = 200
+
+
+class StartupTrace:
+    """시작 타임라인 기록기 — 구간(phase)과 시점(mark)을 시작 기준 ms로 저장"""
+
+    def __init__(self, log_path: Path = None):
+        self.log_path = Path(log_path) if log_path else (
+            Path(__file__).parent.parent.parent / 'logs' / 'startup.log')
+        self._t0 = time.perf_counter()
+        self._phases: List[Dict[str, Any]] = []
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._finished: Optional[Dict[str, Any]] = None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished is not None
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._t0) * 1000, 1)
+
+    @contextmanager
+    def phase(self, name: str):
+        """with 블록 실행 시간을 구간으로 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                if self._finished is None:
+                    self._phases.append({
+                        'name': name,
+                        'start_ms': round((start - self._t0) * 1000, 1),
+                        'ms': round((end - start) * 1000, 1),
+                    })
+
+    def mark(self, name: str):
+        """시점 기록 (같은 이름은 처음 한 번만)"""
+        with self._lock:
+            if self._finished is None:
+                self._marks.setdefault(name, self.elapsed_ms())
+
+    def timeline(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._finished is not None:
+                return dict(self._finished)
+            return {'total_ms': self.elapsed_ms(),
+                    'phases': [dict(p) for p in self._phases],
+                    'marks': dict(self._marks)}
+
+    def finish(self, **extra) -> Dict[str, Any]:
+        """타임라인 마감 후 startup.log에 기록 → 타임라인 (두 번째 호출부터는 기록 없이 반환)"""
+        with self._lock:
+            if self._finished is not None:
+                return dict(self._finished)
+            self._finished = {'total_ms': self.elapsed_ms(),
+                              'phases': [dict(p) for p in self._phases],
+                              'marks': dict(self._marks)}
+            record = {'at': datetime.now().isoformat(timespec='seconds'), **extra, **self._finished}
+        self._append_log(record)
+        return dict(self._finished)
+
+    def _append_log(self, record: Dict[str, Any]):
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            lines = []
+            if self.log_path.exists():
+                lines = self.log_path.read_text(encoding='utf-8').splitlines()[-(_MAX_LOG_LINES - 1):]
+            lines.append(json.dumps(record, ensure_ascii=False))
+            self.log_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        except Exception:
+            pass  # 시작 기록 실패가 앱 실행을 막으면 안 된다
+
+    @staticmethod
+    def read_history(log_path: Path, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 시작 기록 (오래된 순)"""
+        try:
+            lines = Path(log_path).read_text(encoding='utf-8').splitlines()[-limit:]
+        except Exception:
+            return []
+        history = []
+        for line in lines:
+            try:
+                history.append(json.loads(line))
+            except ValueError:
+                continue
+        return history
+
+
+class LazySingleton:
+    """첫 속성 접근 시 factory()로 실제 인스턴스를 만드는 모듈 싱글톤 프록시
+
+    DatabaseManager·AuthManager처럼 생성 시 스키마 초기화 등 무거운 작업을 하는 싱글톤을
+    import 시점이 아닌 실제 사용 시점에 만든다. 생성 시간은 'init:<name>' 구간으로 기록된다.
+    """
+
+    def __init__(self, factory, name: str):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_init_lock', threading.RLock())
+
+    def _resolve(self):
+        instance = object.__getattribute__(self, '_instance')
+        if instance is not None:
+            return instance
+        with object.__getattribute__(self, '_init_lock'):
+            instance = object.__getattribute__(self, '_instance')
+            if instance is None:
+                with startup_trace.phase(f"init:{object.__getattribute__(self, '_name')}"):
+                    instance = object.__getattribute__(self, '_factory')()
+                object.__setattr__(self, '_instance', instance)
+            return instance
+
+    @property
+    def initialized(self) -> bool:
+        return object.__getattribute__(self, '_instance') is not None
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._resolve(), name)
+
+    def __repr__(self):
+        state = 'ready' if self.initialized else 'pending'
+        return f"<LazySingleton {object.__getattribute__(self, '_name')} ({state})>"
+
+
+# 싱글톤 인스턴스 (import 시점 = 시작 기준점)
+startup_trace = StartupTrace()
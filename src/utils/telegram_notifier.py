@@ -1,12 +1,23 @@
 # src/utils/telegram_notifier.py - 텔레그램 봇 알림 및 답장 처리
 
+import os
+import socket
 import threading
-import time
+import uuid
 import requests
 from typing import Optional, Dict, List, Any
 
 from .logger import logger
 from .config import config
+from .telegram_outbox import telegram_outbox
+
+# 여러 PC가 같은 봇 토큰으로 getUpdates를 호출하면 서로 409 Conflict가 나므로
+# 공유 DB 리스를 가진 PC 한 곳만 폴링한다.
+POLL_LEASE_NAME = 'telegram_poller'
+# 리더가 아닐 때 리스 재확인 주기
+_LEASE_RETRY_SEC = 30
+# 오류 시 최대 대기 (지수 백오프 상한)
+_MAX_BACKOFF_SEC = 60
 
 
 class TelegramNotifier:
@@ -15,12 +26,20 @@ class TelegramNotifier:
     def __init__(self):
         self.bot_token = config.get('telegram.bot_token', '')
         self.enabled = config.get('telegram.enabled', False)
+        # 오류 발생 시 백오프 시작 간격 (정상 시에는 롱폴링이 바로 이어진다)
         self.polling_interval = max(0.5, min(config.get('telegram.polling_interval', 2), 60))
+        # getUpdates 서버 측 대기 시간 (텔레그램 최대 50초 권장)
+        self.long_poll_timeout = max(1, min(int(config.get('telegram.long_poll_timeout', 50)), 50))
 
         self._last_update_id = 0
         self._polling_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         self._running = False
         self._bot_username = ''
+        self._is_leader = False
+        self._instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        # 답장·연동 안내 등 즉시 응답용 keep-alive 세션 (알림 발송은 telegram_outbox 담당)
+        self._session = requests.Session()
 
     # =========================================================================
     # 폴링 관리
@@ -32,6 +51,9 @@ class TelegramNotifier:
             logger.info("텔레그램 비활성화 또는 토큰 미설정, 폴링 건너뜀")
             return
 
+        # 발송 대기열은 getMe 실패(일시적 네트워크 차단)와 무관하게 시작 — 재시도로 복구
+        telegram_outbox.start(self.bot_token)
+
         # 봇 정보 가져오기 — 토큰 유효성 확인 포함
         if not self._fetch_bot_info():
             logger.warning("텔레그램 봇 초기화 실패 (토큰 오류 또는 네트워크 차단). 폴링을 시작하지 않습니다.")
@@ -45,8 +67,12 @@ class TelegramNotifier:
             logger.error(f"텔레그램 데이터 정리 실패: {e}")
 
         self._running = True
+        # 스레드마다 별도 중단 이벤트 — 재설정 시 롱폴링 응답을 기다리던 이전 스레드가 되살아나지 않도록
+        self._stop_event = threading.Event()
+        self._is_leader = False
         self._polling_thread = threading.Thread(
             target=self._poll_loop,
+            args=(self._stop_event,),
             name="telegram-poller",
             daemon=True
         )
@@ -56,8 +82,11 @@ class TelegramNotifier:
     def stop_polling(self):
         """폴링 중단"""
         self._running = False
+        self._stop_event.set()
         if self._polling_thread and self._polling_thread.is_alive():
+            # 롱폴링 요청 중이면 응답까지 최대 long_poll_timeout초 걸리므로 짧게만 기다린다 (daemon 스레드)
             self._polling_thread.join(timeout=10)
+        telegram_outbox.stop()
         logger.info("텔레그램 폴링 중단")
 
     def reconfigure(self, bot_token: str, enabled: bool):
@@ -87,7 +116,7 @@ class TelegramNotifier:
 
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-            resp = requests.get(url, timeout=10)
+            resp = self._session.get(url, timeout=10)
             if resp.status_code == 401:
                 logger.error(
                     "텔레그램 봇 토큰 인증 실패 (401 Unauthorized). "
@@ -113,79 +142,132 @@ class TelegramNotifier:
     # 폴링 루프
     # =========================================================================
 
-    def _poll_loop(self):
-        """백그라운드 폴링 루프"""
-        while self._running:
-            try:
-                self._process_updates()
-            except requests.exceptions.ConnectionError:
-                logger.warning("텔레그램 연결 오류, 10초 후 재시도")
-                time.sleep(10)
+    def _poll_loop(self, stop_event: threading.Event):
+        """백그라운드 롱폴링 루프 — 리스를 가진 동안만 getUpdates 호출"""
+        from ..database.auth_manager import auth_manager
+
+        lease_ttl = self.long_poll_timeout * 2 + 30
+        backoff = 0.0
+        while not stop_event.is_set():
+            if not auth_manager.acquire_lease(POLL_LEASE_NAME, self._instance_id, lease_ttl):
+                if self._is_leader:
+                    logger.info("텔레그램 폴링 리스를 다른 PC에 넘김 — 대기 모드")
+                self._is_leader = False
+                stop_event.wait(_LEASE_RETRY_SEC)
                 continue
+            if not self._is_leader:
+                self._is_leader = True
+                # 다른 PC가 처리한 업데이트까지 건너뛰도록 리더가 될 때마다 저장된 offset을 다시 읽는다
+                self._last_update_id = max(self._last_update_id, self._load_update_offset())
+                logger.info(f"텔레그램 폴링 리더 획득 ({self._instance_id}, offset={self._last_update_id})")
+
+            try:
+                ok = self._process_updates(stop_event)
             except Exception as e:
                 logger.error(f"텔레그램 폴링 오류: {e}")
-                time.sleep(5)
+                ok = False
+
+            if ok:
+                backoff = 0.0
                 continue
-            time.sleep(self.polling_interval)
+            backoff = min(max(backoff * 2, self.polling_interval), _MAX_BACKOFF_SEC)
+            stop_event.wait(backoff)
+
+        # 재설정으로 새 스레드가 이미 시작됐다면 같은 보유자 ID의 리스를 건드리지 않는다
+        if self._is_leader and stop_event is self._stop_event:
+            auth_manager.release_lease(POLL_LEASE_NAME, self._instance_id)
+            self._is_leader = False
+
+    def _offset_setting_key(self) -> str:
+        """봇별 offset 저장 키 — update_id는 봇마다 독립적이므로 토큰의 봇 ID로 구분"""
+        return f"telegram.update_offset.{self.bot_token.split(':', 1)[0]}"
 
-    def _process_updates(self):
-        """getUpdates 호출 및 업데이트 처리"""
+    def _load_update_offset(self) -> int:
+        try:
+            from ..database.db_manager import db
+            return int(db.get_setting(self._offset_setting_key(), '0') or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _save_update_offset(self):
+        from ..database.db_manager import db
+        db.set_setting(self._offset_setting_key(), str(self._last_update_id))
+
+    def _process_updates(self, stop_event: threading.Event = None) -> bool:
+        """getUpdates 롱폴링 1회 및 업데이트 처리. 요청·응답 오류면 False (호출 측 백오프)"""
         url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates"
         params = {
             'offset': self._last_update_id + 1,
-            'timeout': 5,
+            'timeout': self.long_poll_timeout,
             'allowed_updates': ['message']
         }
 
         try:
-            resp = requests.get(url, params=params, timeout=15)
+            resp = self._session.get(url, params=params, timeout=self.long_poll_timeout + 10)
         except Exception as e:
             logger.warning(f"getUpdates 요청 실패: {e}")
-            return
+            return False
+
+        # 대기 중 폴링이 중단·재설정됐으면 응답을 처리하지 않는다 (확정 전이므로 다음 리더가 다시 받음)
+        if stop_event is not None and stop_event.is_set():
+            return True
 
         if resp.status_code == 401:
             logger.error("텔레그램 토큰 인증 실패 (401). 폴링 중단. BotFather에서 토큰을 재발급하세요.")
             self._running = False
-            return
+            if stop_event is not None:
+                stop_event.set()
+            return False
+        if resp.status_code == 409:
+            logger.warning("getUpdates 충돌 (409) — 다른 곳에서 같은 봇을 폴링 중이거나 웹훅이 설정됨")
+            return False
         if resp.status_code != 200:
-            return
+            logger.warning(f"getUpdates HTTP 오류: {resp.status_code}")
+            return False
 
         try:
             data = resp.json()
         except Exception as e:
             logger.warning(f"getUpdates JSON 파싱 실패: {e}")
-            return
+            return False
 
         if not data.get('ok'):
-            return
-
-        for update in data.get('result', []):
-            update_id = update.get('update_id', 0)
-            # update_id 먼저 갱신 → 파싱 오류 시 무한 재처리 방지
-            if update_id > self._last_update_id:
-                self._last_update_id = update_id
-
-            message = update.get('message')
-            if not message:
-                continue
-
-            # chat 구조 검증 (KeyError 방어)
-            chat = message.get('chat')
-            if not chat or 'id' not in chat:
-                continue
-
-            text = message.get('text', '')
-            chat_id = chat['id']
+            return False
 
-            # /start 코드 → 계정 연결
-            if text.startswith('/start'):
-                self._handle_link(message)
-            # /link → 연동 안내
-            elif text.lower().startswith('/link'):
-                self._handle_link_command(message)
-            # 답장 → 댓글 등록
-            elif message.get('reply_to_message'):
-                self._handle_reply(message)
+        updates = data.get('result', [])
+        try:
+            for update in updates:
+                update_id = update.get('update_id', 0)
+                # update_id 먼저 갱신 → 파싱 오류 시 무한 재처리 방지
+                if update_id > self._last_update_id:
+                    self._last_update_id = update_id
+
+                message = update.get('message')
+                if not message:
+                    continue
+
+                # chat 구조 검증 (KeyError 방어)
+                chat = message.get('chat')
+                if not chat or 'id' not in chat:
+                    continue
+
+                text = message.get('text', '')
+                chat_id = chat['id']
+
+                # /start 코드 → 계정 연결
+                if text.startswith('/start'):
+                    self._handle_link(message)
+                # /link → 연동 안내
+                elif text.lower().startswith('/link'):
+                    self._handle_link_command(message)
+                # 답장 → 댓글 등록
+                elif message.get('reply_to_message'):
+                    self._handle_reply(message)
+        finally:
+            # 처리한 위치를 공유 DB에 저장 → 재시작·리더 교체 후 같은 업데이트를 다시 처리하지 않음
+            if updates:
+                self._save_update_offset()
+        return True
 
     # =========================================================================
     # 링크 처리
@@ -341,22 +423,13 @@ class TelegramNotifier:
             f"이 메시지에 답장하면 댓글이 등록됩니다."
         )
 
-        for user in linked_users:
-            # 작성자 본인에게는 알림 안 보냄
-            if user['user_id'] == commenter_user_id:
-                continue
-
-            chat_id = int(user['telegram_chat_id'])
-            msg_id = self._send_message(chat_id, text)
-
-            # 메시지 매핑 저장 (답장 시 프로젝트 식별용)
-            if msg_id:
-                auth_manager.save_message_mapping(
-                    telegram_message_id=msg_id,
-                    chat_id=chat_id,
-                    contract_number=contract_number or '',
-                    board_project_id=board_project_id
-                )
+        # 작성자 본인에게는 알림 안 보냄. 답장 시 프로젝트 식별용 매핑은 발송 성공 후 대기열이 저장
+        telegram_outbox.enqueue(
+            [user['telegram_chat_id'] for user in linked_users if user['user_id'] != commenter_user_id],
+            text, kind='comment',
+            contract_number=contract_number or '',
+            board_project_id=board_project_id
+        )
 
     # =========================================================================
     # 유틸리티
@@ -372,7 +445,7 @@ class TelegramNotifier:
                 # parse_mode 제거: 사용자명·댓글 등 임의 텍스트에 <>&가 포함될 경우
                 # HTML 파싱 오류로 silent failure 발생하므로 plain text 사용
             }
-            resp = requests.post(url, json=payload, timeout=10)
+            resp = self._session.post(url, json=payload, timeout=10)
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get('ok'):
@@ -434,9 +507,8 @@ class TelegramNotifier:
             lines += ["━━━━━━━━━━━━━━", f"총 {len(projects)}건 작업"]
             text = '\n'.join(lines)
 
-        for user in linked_users:
-            self._send_message(int(user['telegram_chat_id']), text)
-        logger.info(f"일일 요약 발송 완료 ({len(linked_users)}명, {len(projects)}건)")
+        telegram_outbox.enqueue([user['telegram_chat_id'] for user in linked_users], text, kind='daily_summary')
+        logger.info(f"일일 요약 발송 등록 ({len(linked_users)}명, {len(projects)}건)")
 
     def send_holiday_reminder(self):
         """쓰기 권한 보유 사용자에게 휴일 작업 현황 업데이트 알림 발송 (금요일 17:30)"""
@@ -458,9 +530,8 @@ class TelegramNotifier:
             "📌 보고서 탭 → 일일 보고(휴일)\n"
             "부서 / 직책 / 이름 / 근무 시간대 / 작업내용을 입력하세요."
         )
-        for user in target_users:
-            self._send_message(int(user['telegram_chat_id']), text)
-        logger.info(f"휴일 작업 알림 발송 완료 ({len(target_users)}명)")
+        telegram_outbox.enqueue([user['telegram_chat_id'] for user in target_users], text, kind='holiday_reminder')
+        logger.info(f"휴일 작업 알림 발송 등록 ({len(target_users)}명)")
 
     def send_night_report_reminder(self):
         """쓰기 권한 보유 사용자에게 야간 보고 입력 요청 알림 발송 (평일 16:30)"""
@@ -482,9 +553,8 @@ class TelegramNotifier:
             "📌 보고서 탭 → 일일 보고(야간)\n"
             "오늘 야간 작업 내용 및 종료 시간을 입력해 주세요."
         )
-        for user in target_users:
-            self._send_message(int(user['telegram_chat_id']), text)
-        logger.info(f"야간 보고 알림 발송 완료 ({len(target_users)}명)")
+        telegram_outbox.enqueue([user['telegram_chat_id'] for user in target_users], text, kind='night_reminder')
+        logger.info(f"야간 보고 알림 발송 등록 ({len(target_users)}명)")
 
     def send_project_event(self, contract_number: str, status: str, ship_name: str = ''):
         """착공 또는 준공 이벤트를 연결된 모든 사용자에게 알림"""
@@ -492,12 +562,16 @@ class TelegramNotifier:
             return
 
         from ..database.auth_manager import auth_manager
+        from ..business.project_status import project_status_resolver, normalize_status, STATUS_STARTED
 
         linked_users = auth_manager.get_all_linked_chat_ids()
         if not linked_users:
             return
 
-        is_start = status in ('착수', '착공')
+        # 칸반과 같은 상태 규칙 (구버전 값 'inProgress'/'completed' 포함)
+        is_start = normalize_status(status) == STATUS_STARTED
+        if not ship_name and contract_number:
+            ship_name = project_status_resolver.snapshot().board_project(contract_number).get('ship_name', '')
         icon = '🔨' if is_start else '🏁'
         label = '착공' if is_start else '준공'
         text = (
@@ -508,9 +582,9 @@ class TelegramNotifier:
             f"이 프로젝트가 {label} 처리되었습니다."
         )
 
-        for user in linked_users:
-            self._send_message(int(user['telegram_chat_id']), text)
-        logger.info(f"{label} 알림 발송 완료: {contract_number} ({len(linked_users)}명)")
+        telegram_outbox.enqueue([user['telegram_chat_id'] for user in linked_users], text, kind='project_event',
+                                contract_number=contract_number or '')
+        logger.info(f"{label} 알림 발송 등록: {contract_number} ({len(linked_users)}명)")
 
     def _get_ship_name(self, contract_number: str, board_project_id: int) -> str:
         """프로젝트의 선박명 조회"""
@@ -0,0 +1,242 @@
+# src/utils/telegram_outbox.py - 텔레그램 발송 대기열 처리기
+# 알림 메시지는 DB telegram_outbox 테이블에 먼저 기록되고, 이 워커가 텔레그램 전송 제한
+# (전체 초당 약 30건, 채팅당 초당 1건)에 맞춰 한 구간(window)씩 병렬 발송한다.
+# 실패 시 지수 백오프로 재시도하며 결과(sent/failed)를 테이블에 남기므로 앱이 재시작돼도 메시지가 유실되지 않는다.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .logger import logger
+from .config import config
+
+TELEGRAM_API_BASE = 'https://api.telegram.org'
+
+# 재시도 정책
+_BACKOFF_BASE_SEC = 5
+_BACKOFF_MAX_SEC = 3600
+# 즉시 실패 처리할 HTTP 상태 (잘못된 요청, 봇 차단, 채팅 없음)
+_PERMANENT_STATUS = (400, 403, 404)
+# 대기열이 비었을 때 DB 재확인 주기 (다른 PC가 추가한 메시지·재시도 시점 확인)
+_IDLE_POLL_SEC = 5.0
+
+
+class TelegramOutbox:
+    """영속 발송 대기열 워커 — 풀링된 HTTP 세션 + 스레드 풀로 구간별 병렬 발송"""
+
+    def __init__(self, store=None, api_base: str = TELEGRAM_API_BASE,
+                 rate_per_second: int = None, per_chat_interval: float = None,
+                 max_workers: int = None, max_attempts: int = None):
+        self._store = store
+        self.api_base = api_base.rstrip('/')
+        self.rate_per_second = max(1, int(rate_per_second or config.get('telegram.rate_per_second', 25)))
+        self.per_chat_interval = float(per_chat_interval if per_chat_interval is not None
+                                       else config.get('telegram.per_chat_interval', 1.0))
+        self.max_workers = max(1, int(max_workers or config.get('telegram.outbox_workers', 8)))
+        self.max_attempts = max(1, int(max_attempts or config.get('telegram.max_attempts', 8)))
+
+        self.bot_token = ''
+        self._session: Optional[requests.Session] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._running = False
+        self._buffer: List[Dict[str, Any]] = []
+        self._chat_last_sent: Dict[int, float] = {}
+        self._pause_until = 0.0
+
+    @property
+    def store(self):
+        if self._store is None:
+            from ..database.auth_manager import auth_manager
+            self._store = auth_manager
+        return self._store
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # =========================================================================
+    # 시작/중단
+    # =========================================================================
+
+    def start(self, bot_token: str):
+        """발송 워커 시작 (이미 실행 중이면 토큰만 교체)"""
+        self.bot_token = bot_token
+        if self._running:
+            self.wake()
+            return
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='telegram-send')
+        self._running = True
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._loop, name='telegram-outbox', daemon=True)
+        self._thread.start()
+        logger.info("텔레그램 발송 대기열 시작")
+
+    def stop(self, timeout: float = 10.0):
+        """워커 중단 — 선점했지만 보내지 못한 메시지는 pending으로 되돌린다"""
+        if not self._running:
+            return
+        self._running = False
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        now_iso = datetime.now().isoformat()
+        for row in self._buffer:
+            self.store.mark_telegram_outbox_retry(row['id'], now_iso, 'stopped', counted=False)
+        self._buffer = []
+        if self._session:
+            self._session.close()
+        self._session = None
+        self._executor = None
+        logger.info("텔레그램 발송 대기열 중단")
+
+    def wake(self):
+        """새 메시지 등록 시 대기 중인 워커를 즉시 깨운다"""
+        self._wake.set()
+
+    # =========================================================================
+    # 등록
+    # =========================================================================
+
+    def enqueue(self, chat_ids: List[Any], text: str, kind: str = '',
+                contract_number: str = '', board_project_id: int = None) -> int:
+        """같은 메시지를 여러 채팅에 발송하도록 대기열에 등록 → 등록 건수"""
+        messages = [{
+            'chat_id': int(chat_id),
+            'text': text,
+            'kind': kind,
+            'contract_number': contract_number or '',
+            'board_project_id': board_project_id,
+        } for chat_id in chat_ids]
+        count = self.store.enqueue_telegram_messages(messages)
+        if count:
+            self.wake()
+        return count
+
+    # =========================================================================
+    # 발송 루프
+    # =========================================================================
+
+    def _loop(self):
+        while self._running:
+            try:
+                window_start = time.time()
+                if window_start < self._pause_until:
+                    self._wake.wait(self._pause_until - window_start)
+                    continue
+
+                if len(self._buffer) < self.rate_per_second:
+                    self._buffer.extend(self.store.claim_telegram_outbox(limit=self.rate_per_second * 4))
+
+                batch = self._take_batch(window_start)
+                if not batch:
+                    self._wake.clear()
+                    self._wake.wait(self.per_chat_interval if self._buffer else _IDLE_POLL_SEC)
+                    continue
+
+                futures = [self._executor.submit(self._deliver, row) for row in batch]
+                wait(futures)
+
+                # 한 구간(1초) 안에 rate_per_second 건까지만 발송
+                elapsed = time.time() - window_start
+                if elapsed < 1.0:
+                    time.sleep(1.0 - elapsed)
+            except Exception as e:
+                logger.error(f"텔레그램 발송 루프 오류: {e}")
+                time.sleep(_IDLE_POLL_SEC)
+
+    def _take_batch(self, now: float) -> List[Dict[str, Any]]:
+        """버퍼에서 이번 구간에 보낼 메시지 선택 (채팅당 간격·전체 한도 준수)"""
+        batch: List[Dict[str, Any]] = []
+        rest: List[Dict[str, Any]] = []
+        chats = set()
+        for row in self._buffer:
+            chat_id = row['chat_id']
+            ready = now - self._chat_last_sent.get(chat_id, 0) >= self.per_chat_interval
+            if len(batch) < self.rate_per_second and ready and chat_id not in chats:
+                batch.append(row)
+                chats.add(chat_id)
+                self._chat_last_sent[chat_id] = now
+            else:
+                rest.append(row)
+        self._buffer = rest
+        if len(self._chat_last_sent) > 1000:
+            cutoff = now - self.per_chat_interval
+            self._chat_last_sent = {c: t for c, t in self._chat_last_sent.items() if t >= cutoff}
+        return batch
+
+    def _deliver(self, row: Dict[str, Any]):
+        """메시지 1건 발송 후 결과 기록"""
+        ok, message_id, retry_after, error = self._post(row['chat_id'], row['text'])
+        store = self.store
+        if ok:
+            store.mark_telegram_outbox_sent(row['id'], message_id)
+            if row.get('kind') == 'comment' and message_id:
+                # 답장 시 프로젝트 식별용 매핑
+                store.save_message_mapping(
+                    telegram_message_id=message_id,
+                    chat_id=row['chat_id'],
+                    contract_number=row.get('contract_number') or '',
+                    board_project_id=row.get('board_project_id')
+                )
+            return
+
+        if retry_after is not None:
+            # 429: 텔레그램이 지정한 시간만큼 전체 발송을 멈추고 재시도 (시도 횟수에 포함하지 않음)
+            self._pause_until = max(self._pause_until, time.time() + retry_after)
+            next_at = (datetime.now() + timedelta(seconds=retry_after)).isoformat()
+            store.mark_telegram_outbox_retry(row['id'], next_at, error, counted=False)
+            return
+
+        attempts = int(row.get('attempts') or 0) + 1
+        permanent = error.startswith(tuple(f'HTTP {s}' for s in _PERMANENT_STATUS))
+        if permanent or attempts >= self.max_attempts:
+            logger.error(f"텔레그램 메시지 발송 실패 (chat={row['chat_id']}, 시도 {attempts}회): {error}")
+            store.mark_telegram_outbox_retry(row['id'], datetime.now().isoformat(), error, failed=True)
+            return
+
+        delay = min(_BACKOFF_BASE_SEC * (2 ** (attempts - 1)), _BACKOFF_MAX_SEC)
+        next_at = (datetime.now() + timedelta(seconds=delay)).isoformat()
+        logger.warning(f"텔레그램 메시지 발송 재시도 예약 (chat={row['chat_id']}, {delay}초 후): {error}")
+        store.mark_telegram_outbox_retry(row['id'], next_at, error)
+
+    def _post(self, chat_id: int, text: str) -> Tuple[bool, Optional[int], Optional[float], str]:
+        """sendMessage 호출 → (성공 여부, message_id, retry_after, 오류 메시지)"""
+        session = self._session
+        if session is None or not self.bot_token:
+            return False, None, None, 'outbox not running'
+        try:
+            resp = session.post(f"{self.api_base}/bot{self.bot_token}/sendMessage",
+                                json={'chat_id': chat_id, 'text': text}, timeout=10)
+        except Exception as e:
+            return False, None, None, f'network: {e}'
+
+        try:
+            data = resp.json()
+        except Exception:
+            data = {}
+
+        if resp.status_code == 200 and data.get('ok'):
+            return True, data.get('result', {}).get('message_id'), None, ''
+        if resp.status_code == 429:
+            retry_after = (data.get('parameters') or {}).get('retry_after', 1)
+            return False, None, float(retry_after), 'HTTP 429 Too Many Requests'
+        description = data.get('description') or resp.text[:200]
+        return False, None, None, f'HTTP {resp.status_code} {description}'
+
+
+# 싱글톤 인스턴스
+telegram_outbox = TelegramOutbox()
@@ -5,12 +5,21 @@
 # 2. 아직 다운로드/적용하지 않은 패치 ZIP 다운로드
 # 3. patches/ 폴더에 압축 해제 (patch.json + 파일들)
 # 4. patch_system.py가 시작 시 자동 적용
+#
+# 앱 시작은 네트워크를 기다리지 않는다: main.py는 patches/에 준비된 패치만 적용하고,
+# UI가 뜬 뒤 백그라운드 스레드가 stage_patches()로 다음 시작 때 적용할 패치를 받아 둔다.
+#
+# 다운로드는 에셋별로 병렬 실행되며, 끊기면 임시 폴더의 .part 파일에서 HTTP Range로 이어받는다.
+# 릴리스의 patch_manifest.json(또는 GitHub 에셋 digest)의 SHA-256과 일치해야 압축 해제한다.
 
+import hashlib
 import requests
 import json
+import time
 import zipfile
 import tempfile
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -18,6 +27,18 @@ from packaging import version
 
 from .logger import logger
 from .config import config
+from .startup_trace import LazySingleton
+
+# 릴리스에 함께 올리는 패치 해시 목록 (build_patch.py가 생성)
+PATCH_MANIFEST_NAME = 'patch_manifest.json'
+# 델타 패치의 전체 파일 대체본 (patch_vX.zip ↔ patch_vX_full.zip) — 기준 파일 불일치 시에만 다운로드
+FULL_PATCH_SUFFIX = '_full.zip'
+
+# 다운로드 청크 크기 — 읽기 속도에 따라 범위 안에서 조절
+_MIN_CHUNK = 64 * 1024
+_MAX_CHUNK = 1024 * 1024
+# 같은 URL에서 이어받기 재시도 횟수
+_RESUME_ATTEMPTS = 3
 
 
 class UpdateManager:
@@ -39,6 +60,12 @@ class UpdateManager:
         self.data_dir = self.app_root / "data"
         self.update_cache_file = Path(config.db_path).parent / "update_cache.json"
         self.downloaded_patches_file = self.data_dir / "downloaded_patches.json"
+        self.release_etag_cache_file = self.data_dir / "release_etag_cache.json"
+        self.download_dir = Path(tempfile.gettempdir()) / "WorkManagement_Patches"
+        self.download_workers = max(1, int(config.get('update.download_workers', 3)))
+        self._session = requests.Session()
+        # 마지막 백그라운드 패치 준비 결과 (stage_patches)
+        self.last_stage_result: Dict[str, Any] = {}
         self.update_check_interval = 86400  # 업데이트 발견 시 캐시 24시간
         self.no_update_cache_interval = 0   # 최신 버전 결과는 캐시하지 않음
 
@@ -260,11 +287,13 @@ class UpdateManager:
                         pass  # 버전 파싱 실패 시 포함 (안전한 기본값)
 
                     assets = release.get('assets', [])
+                    manifest = None  # 새 패치가 있을 때만 조회
 
                     for asset in assets:
                         name = asset['name']
                         # ZIP 파일이면 모두 패치 에셋으로 인식 (파일명 형식 무관)
-                        if name.endswith('.zip'):
+                        # 단, 전체 파일 대체본은 델타 적용 실패 시에만 사용
+                        if name.endswith('.zip') and not name.endswith(FULL_PATCH_SUFFIX):
                             asset_id = asset['id']
                             api_download_url = (
                                 f"{self.api_base_url}/repos/"
@@ -277,8 +306,24 @@ class UpdateManager:
                                 'url': api_download_url,
                                 'browser_url': asset.get('browser_download_url', ''),
                                 'release_tag': release_tag,
-                                'asset_id': asset_id
+                                'asset_id': asset_id,
+                                'sha256': ''
                             }
+                            if manifest is None:
+                                manifest = self._get_release_manifest(assets)
+                            patch_entry['sha256'] = self._expected_sha256(asset, manifest)
+                            full_name = name[:-4] + FULL_PATCH_SUFFIX
+                            full_asset = next((a for a in assets if a['name'] == full_name), None)
+                            if full_asset:
+                                patch_entry['full_fallback'] = {
+                                    'name': full_name,
+                                    'size': full_asset['size'],
+                                    'url': (f"{self.api_base_url}/repos/"
+                                            f"{self.github_repo_owner}/{self.github_repo_name}"
+                                            f"/releases/assets/{full_asset['id']}"),
+                                    'browser_url': full_asset.get('browser_download_url', ''),
+                                    'sha256': self._expected_sha256(full_asset, manifest),
+                                }
                             if name not in downloaded:
                                 new_patches.append(patch_entry)
                             else:
@@ -338,44 +383,19 @@ class UpdateManager:
                     'applied_count': 0
                 }
 
-            applied_count = 0
             errors = []
-
-            for patch_info in new_patches:
-                try:
-                    logger.info(f"패치 다운로드 중: {patch_info['name']}")
-
-                    # ZIP 다운로드
-                    zip_path = self._download_patch_zip(patch_info)
-                    if not zip_path:
-                        errors.append(f"{patch_info['name']}: 다운로드 실패")
-                        continue
-
-                    # patches/ 폴더에 압축 해제
-                    extracted = self._extract_patch_zip(zip_path)
-                    if not extracted:
-                        errors.append(f"{patch_info['name']}: 압축 해제 실패")
-                        continue
-
-                    # 다운로드 완료 기록
-                    self._save_downloaded_patch(patch_info['name'])
-                    applied_count += 1
-
-                    logger.info(f"패치 준비 완료: {patch_info['name']} → {extracted}")
-
-                    # 임시 파일 삭제
-                    try:
-                        zip_path.unlink()
-                    except Exception:
-                        pass
-
-                except Exception as e:
-                    errors.append(f"{patch_info['name']}: {str(e)}")
-                    logger.error(f"패치 처리 실패: {patch_info['name']} - {e}")
+            applied_count = self._download_and_extract(new_patches, errors)
 
             # patch_system으로 실제 적용
             from .patch_system import patch_system
+            patch_system.needs_full_patch.clear()
             patches_applied = patch_system.check_and_apply_patches()
+
+            # 델타 기준 파일이 달라 적용하지 못한 패치 → 전체 파일 대체본으로 다시 적용
+            if patch_system.needs_full_patch:
+                if self._apply_full_fallbacks(new_patches, patch_system.needs_full_patch, errors):
+                    patch_system.needs_full_patch.clear()
+                    patches_applied += patch_system.check_and_apply_patches()
             self._refresh_runtime_state()
 
             if applied_count > 0 and patches_applied == 0 and not errors:
@@ -407,44 +427,251 @@ class UpdateManager:
                 'applied_count': 0
             }
 
+    def stage_patches(self) -> Dict[str, Any]:
+        """새 패치 ZIP을 다운로드해 patches/ 폴더에 준비만 해 둔다 (적용은 다음 시작 시)
+
+        앱 실행 중 백그라운드 스레드에서 호출된다. 이미 patches/에 준비된 패치는 다시 받지 않으며,
+        시작 시 델타 기준 파일 불일치로 적용하지 못한 패치는 전체 파일 대체본으로 교체한다.
+        """
+        try:
+            from .patch_system import patch_system
+            self._refresh_runtime_state()
+            new_patches = self._find_new_patch_assets()
+
+            errors = []
+            pending = [p for p in new_patches
+                       if p['name'][:-4] not in patch_system.needs_full_patch
+                       and not (self.patches_dir / p['name'][:-4] / 'patch.json').exists()]
+            downloaded = self._download_and_extract(pending, errors) if pending else 0
+
+            if patch_system.needs_full_patch:
+                if self._apply_full_fallbacks(new_patches, patch_system.needs_full_patch, errors):
+                    patch_system.needs_full_patch.clear()
+
+            patch_system.current_version = self.current_version
+            staged = patch_system.find_available_patches()
+            self.last_stage_result = {
+                'staged_count': len(staged),
+                'versions': [str(p.get('version', '')) for p in staged],
+                'downloaded_count': downloaded,
+                'errors': errors,
+                'checked_at': datetime.now().isoformat(),
+            }
+            if staged:
+                logger.info(f"다음 시작 시 적용할 패치 {len(staged)}개 준비됨 "
+                            f"({', '.join(self.last_stage_result['versions'])})")
+            return dict(self.last_stage_result, success=True)
+        except Exception as e:
+            logger.error(f"패치 준비 실패: {e}")
+            return {'success': False, 'message': f'패치 준비 중 오류: {str(e)}', 'staged_count': 0}
+
+    def _download_and_extract(self, patches: List[Dict[str, Any]], errors: List[str]) -> int:
+        """패치 ZIP 병렬 다운로드 후 순서대로 patches/에 압축 해제 → 준비된 개수"""
+        prepared = 0
+
+        # 에셋별 병렬 다운로드 (압축 해제·기록은 아래에서 순서대로)
+        workers = min(self.download_workers, len(patches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='patch-download') as pool:
+            zip_paths = list(pool.map(self._download_patch_zip, patches))
+
+        for patch_info, zip_path in zip(patches, zip_paths):
+            try:
+                if not zip_path:
+                    errors.append(f"{patch_info['name']}: 다운로드 실패")
+                    continue
+
+                # patches/ 폴더에 압축 해제
+                extracted = self._extract_patch_zip(zip_path)
+                if not extracted:
+                    errors.append(f"{patch_info['name']}: 압축 해제 실패")
+                    continue
+
+                # 다운로드 완료 기록
+                self._save_downloaded_patch(patch_info['name'])
+                prepared += 1
+
+                logger.info(f"패치 준비 완료: {patch_info['name']} → {extracted}")
+
+                # 임시 파일 삭제
+                try:
+                    zip_path.unlink()
+                except Exception:
+                    pass
+
+            except Exception as e:
+                errors.append(f"{patch_info['name']}: {str(e)}")
+                logger.error(f"패치 처리 실패: {patch_info['name']} - {e}")
+
+        return prepared
+
     def _download_patch_zip(self, patch_info: Dict[str, Any]) -> Optional[Path]:
-        """패치 ZIP 파일 다운로드 (Public repo: 토큰 없이 browser_download_url 우선 사용)"""
-        self._refresh_runtime_state()
-        temp_dir = Path(tempfile.gettempdir()) / "WorkManagement_Patches"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        zip_path = temp_dir / patch_info['name']
-
-        # 시도할 URL 목록: browser_download_url(인증 불필요) → API URL(인증)
-        attempts = []
-        browser_url = patch_info.get('browser_url', '')
-        if browser_url:
-            attempts.append({'url': browser_url, 'headers': {'User-Agent': 'WorkManagement-UpdateChecker'}})
-        attempts.append({'url': patch_info['url'],
-                         'headers': {'Accept': 'application/octet-stream',
-                                     'User-Agent': 'WorkManagement-UpdateChecker'}})
-        if self.github_token:
+        """패치 ZIP 파일 다운로드 (Public repo: 토큰 없이 browser_download_url 우선 사용)
+
+        임시 폴더의 .part 파일에 받으며, 연결이 끊기면 Range 요청으로 이어받는다.
+        SHA-256이 주어지면 일치할 때만 완료 처리한다.
+        """
+        name = patch_info['name']
+        try:
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            zip_path = self.download_dir / name
+            part_path = self.download_dir / f"{name}.part"
+            expected_sha = (patch_info.get('sha256') or '').lower()
+            if not expected_sha:
+                logger.warning(f"패치 해시 정보 없음 (검증 생략): {name}")
+
+            # 이전 실행에서 받아 둔 완성 파일이 해시와 일치하면 재사용
+            if zip_path.exists() and expected_sha and self._sha256_of(zip_path) == expected_sha:
+                logger.info(f"패치 ZIP 재사용 (해시 일치): {zip_path}")
+                return zip_path
+
+            # 시도할 URL 목록: browser_download_url(인증 불필요) → API URL(인증)
+            attempts = []
+            browser_url = patch_info.get('browser_url', '')
+            if browser_url:
+                attempts.append({'url': browser_url, 'headers': {'User-Agent': 'WorkManagement-UpdateChecker'}})
             attempts.append({'url': patch_info['url'],
                              'headers': {'Accept': 'application/octet-stream',
-                                         'Authorization': f'token {self.github_token}',
                                          'User-Agent': 'WorkManagement-UpdateChecker'}})
+            if self.github_token:
+                attempts.append({'url': patch_info['url'],
+                                 'headers': {'Accept': 'application/octet-stream',
+                                             'Authorization': f'token {self.github_token}',
+                                             'User-Agent': 'WorkManagement-UpdateChecker'}})
+
+            logger.info(f"패치 다운로드 중: {name}")
+            for attempt in attempts:
+                if not self._download_with_resume(attempt['url'], attempt['headers'], part_path,
+                                                  patch_info.get('size')):
+                    continue
+                if expected_sha:
+                    actual_sha = self._sha256_of(part_path)
+                    if actual_sha != expected_sha:
+                        # 손상된 부분 파일로 다시 이어받지 않도록 삭제 후 다음 URL 시도
+                        logger.error(f"패치 해시 불일치: {name} (기대 {expected_sha[:12]}…, 실제 {actual_sha[:12]}…)")
+                        part_path.unlink(missing_ok=True)
+                        continue
+                part_path.replace(zip_path)
+                logger.info(f"패치 ZIP 다운로드 완료: {zip_path}")
+                return zip_path
+        except Exception as e:
+            logger.error(f"패치 다운로드 오류: {name} - {e}")
 
-        for attempt in attempts:
+        logger.error(f"패치 ZIP 다운로드 최종 실패: {name}")
+        return None
+
+    def _apply_full_fallbacks(self, patches: List[Dict[str, Any]], folder_names: set,
+                              errors: List[str]) -> int:
+        """델타 적용에 실패한 패치 폴더를 전체 파일 ZIP으로 교체 → 교체한 개수"""
+        replaced = 0
+        for patch_info in patches:
+            fallback = patch_info.get('full_fallback')
+            if patch_info['name'][:-4] not in folder_names:
+                continue
+            if not fallback:
+                errors.append(f"{patch_info['name']}: 델타 기준 파일 불일치 (전체 파일 패치 없음)")
+                continue
+            logger.info(f"델타 적용 불가 → 전체 파일 패치 다운로드: {fallback['name']}")
+            zip_path = self._download_patch_zip(fallback)
+            extracted = self._extract_patch_zip(zip_path) if zip_path else None
+            if not extracted:
+                errors.append(f"{fallback['name']}: 전체 파일 패치 준비 실패")
+                continue
+            replaced += 1
+            try:
+                zip_path.unlink()
+            except Exception:
+                pass
+        return replaced
+
+    def _download_with_resume(self, url: str, headers: Dict[str, str], part_path: Path,
+                              expected_size: Optional[int] = None) -> bool:
+        """url을 part_path로 다운로드 — 기존 부분 파일이 있으면 Range로 이어받는다"""
+        for retry in range(_RESUME_ATTEMPTS):
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            if expected_size and offset >= expected_size:
+                if offset == expected_size:
+                    return True
+                part_path.unlink(missing_ok=True)   # 기대 크기보다 크면 손상으로 간주
+                offset = 0
+            req_headers = dict(headers)
+            if offset:
+                req_headers['Range'] = f'bytes={offset}-'
+            try:
+                response = self._session.get(url, headers=req_headers, stream=True,
+                                             timeout=60, allow_redirects=True)
+                with response:
+                    if response.status_code == 416 and offset:
+                        # 이미 끝까지 받은 상태 (서버가 빈 범위 거절)
+                        return True
+                    if response.status_code == 206 and offset:
+                        mode = 'ab'
+                    elif response.status_code == 200:
+                        mode = 'wb'         # 서버가 Range 미지원 → 처음부터
+                    else:
+                        logger.warning(f"다운로드 실패 ({response.status_code}): {url[:60]}")
+                        return False
+                    if offset and mode == 'ab':
+                        logger.info(f"패치 이어받기: {part_path.name} ({offset} bytes부터)")
+                    with open(part_path, mode) as f:
+                        self._copy_stream(response, f)
+                if expected_size and part_path.stat().st_size != expected_size:
+                    raise IOError(f"크기 불일치 {part_path.stat().st_size}/{expected_size}")
+                return True
+            except Exception as e:
+                logger.warning(f"다운로드 중단, 이어받기 재시도 ({retry + 1}/{_RESUME_ATTEMPTS}): {e}")
+                time.sleep(min(2 ** retry, 5))
+        return False
+
+    @staticmethod
+    def _copy_stream(response, f):
+        """응답 본문을 파일로 복사 — 읽기가 빠르면 청크를 키우고 느리면 줄인다"""
+        chunk_size = _MIN_CHUNK
+        while True:
+            started = time.monotonic()
+            chunk = response.raw.read(chunk_size, decode_content=True)
+            if not chunk:
+                break
+            f.write(chunk)
+            elapsed = time.monotonic() - started
+            if elapsed < 0.1 and chunk_size < _MAX_CHUNK:
+                chunk_size *= 2
+            elif elapsed > 1.0 and chunk_size > _MIN_CHUNK:
+                chunk_size //= 2
+
+    @staticmethod
+    def _sha256_of(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_MAX_CHUNK), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _get_release_manifest(self, assets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """릴리스의 patch_manifest.json 조회 → {에셋명: {'sha256', 'size'}} (없으면 빈 dict)"""
+        for asset in assets:
+            if asset.get('name') != PATCH_MANIFEST_NAME:
+                continue
+            url = asset.get('browser_download_url', '')
             try:
-                response = requests.get(attempt['url'], headers=attempt['headers'],
-                                        stream=True, timeout=60, allow_redirects=True)
+                response = self._session.get(url, headers={'User-Agent': 'WorkManagement-UpdateChecker'},
+                                             timeout=15, allow_redirects=True)
                 if response.status_code == 200:
-                    with open(zip_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                    logger.info(f"패치 ZIP 다운로드 완료: {zip_path}")
-                    return zip_path
-                logger.warning(f"다운로드 실패 ({response.status_code}): {attempt['url'][:60]}")
+                    return response.json().get('assets', {}) or {}
+                logger.warning(f"패치 매니페스트 조회 실패 ({response.status_code})")
             except Exception as e:
-                logger.warning(f"다운로드 오류: {e}")
-
-        logger.error(f"패치 ZIP 다운로드 최종 실패: {patch_info['name']}")
-        return None
+                logger.warning(f"패치 매니페스트 조회 오류: {e}")
+        return {}
+
+    @staticmethod
+    def _expected_sha256(asset: Dict[str, Any], manifest: Dict[str, Any]) -> str:
+        """매니페스트 → GitHub 에셋 digest('sha256:…') 순으로 기대 해시 결정"""
+        entry = manifest.get(asset.get('name', '')) or {}
+        if entry.get('sha256'):
+            return str(entry['sha256']).lower()
+        digest = asset.get('digest') or ''
+        if digest.startswith('sha256:'):
+            return digest[len('sha256:'):].lower()
+        return ''
 
     def _extract_patch_zip(self, zip_path: Path) -> Optional[Path]:
         """
@@ -539,10 +766,21 @@ class UpdateManager:
 
         for with_token in (True, False):
             try:
-                response = requests.get(url, headers=self._get_headers(with_token),
-                                        params=params, timeout=10)
+                # 조건부 요청 — 릴리스 목록이 그대로면 304로 본문 없이 응답 (GitHub API 사용량에도 미포함)
+                cache_key = f"{url}?page={page}&per_page={per_page}&auth={int(with_token and bool(self.github_token))}"
+                cached = self._load_etag_cache().get(cache_key)
+                headers = self._get_headers(with_token)
+                if cached and cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                response = self._session.get(url, headers=headers, params=params, timeout=10)
+                if response.status_code == 304 and cached:
+                    logger.info(f"릴리스 목록 변경 없음 (304, {page}페이지)")
+                    return cached.get('body', [])
                 if response.status_code == 200:
-                    return response.json()
+                    body = response.json()
+                    if response.headers.get('ETag'):
+                        self._save_etag_cache(cache_key, response.headers['ETag'], body)
+                    return body
                 if response.status_code in (401, 403):
                     # 토큰 무효 → 인증 없이 재시도 (public repo인 경우 동작)
                     logger.warning(f"GitHub 인증 실패 ({response.status_code}), 토큰 없이 재시도")
@@ -577,6 +815,23 @@ class UpdateManager:
 
     # --- 캐시 관리 ---
 
+    def _load_etag_cache(self) -> Dict[str, Any]:
+        """릴리스 목록 ETag 캐시 {요청키: {'etag', 'body'}}"""
+        try:
+            if self.release_etag_cache_file.exists():
+                return json.loads(self.release_etag_cache_file.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.warning(f"ETag 캐시 로드 실패 (무시): {e}")
+        return {}
+
+    def _save_etag_cache(self, cache_key: str, etag: str, body: Any):
+        try:
+            cache = self._load_etag_cache()
+            cache[cache_key] = {'etag': etag, 'body': body}
+            self.release_etag_cache_file.write_text(json.dumps(cache, ensure_ascii=False), encoding='utf-8')
+        except Exception as e:
+            logger.warning(f"ETag 캐시 저장 실패 (무시): {e}")
+
     def _cache_update_info(self, data: Dict[str, Any]):
         """업데이트 정보 캐시"""
         try:
@@ -613,5 +868,5 @@ class UpdateManager:
             return True
 
 
-# 싱글톤 인스턴스
-update_manager = UpdateManager()
+# 싱글톤 인스턴스 (첫 사용 시 생성)
+update_manager = LazySingleton(UpdateManager, 'update_manager')
@@ -1,14 +1,17 @@
 # src/web/api.py - 웹 API (Python ↔ JavaScript)
 
-import difflib
+import itertools
 import json
-import eel
+import gevent
 import re
 import threading
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from ..business.work_record_service import work_record_service
 from ..business.calculations import separate_workers, split_manpower_by_type
+from ..business.project_status import project_status_resolver, normalize_status
+from ..business.completion_stats import completion_stats
 from ..database.db_manager import db
 from ..database.auth_manager import auth_manager
 from ..sync.cloud_sync import cloud_sync
@@ -18,7 +21,10 @@ from ..utils.settings_manager import settings_manager
 from ..utils.path_manager import path_manager
 from ..utils.update_manager import update_manager
 from ..utils.telegram_notifier import telegram_notifier
-from ..utils.erp_macro import erp_macro
+from ..utils.job_runner import job_runner, PRIORITY_LOW
+from ..utils.change_bus import change_bus, TOPIC_ALL, TOPIC_BOARD
+from ..utils.columnar import encode_columnar, encode_day_bitmap
+from ..utils.offload import expose, db_dispatcher, single_flight, run_blocking
 
 
 # ============================================================================
@@ -48,9 +54,34 @@ def wait_pending_threads(timeout: float = 5.0) -> None:
         threads = list(_pending_threads)
     for t in threads:
         t.join(timeout=timeout)
+    job_runner.shutdown(timeout=timeout)
+    # 작업 종료 후 남은 활동 로그 기록
+    flush_pending_writes()
     logger.info(f"백그라운드 스레드 대기 완료 ({len(threads)}건)")
 
 
+def flush_pending_writes() -> None:
+    """메모리 대기열의 활동 로그를 DB에 기록 — 종료 시 클라우드 업로드 전에 호출 (main._do_full_cleanup)
+    DB를 한 번도 쓰지 않았으면 생성하지 않는다."""
+    if db.initialized:
+        db.flush_activity_logs(stop=True)
+
+
+def _submit_job(name: str, fn, *args, created_by: str = '', heavy: bool = False,
+                priority: int = None, unique: bool = False) -> Dict[str, Any]:
+    """기존 동기 함수 fn(*args)를 백그라운드 작업으로 등록하고 JS에 job_id를 반환.
+    작업 결과(fn 반환 dict)는 get_job_status(job_id)['result']로 조회한다.
+
+    fn은 Job을 받지 않으므로 진행률은 시작(0)·종료(100)만 보고되고, 취소는 실행 전(대기 중)에만 적용된다.
+    병합처럼 한 트랜잭션으로 끝나는 작업용이며, 단계별 진행률·중간 취소가 필요한 작업은
+    job_runner.submit에 fn(job, ...)을 직접 넘겨 job.update()·job.check_cancelled()를 호출한다."""
+    kwargs = {'created_by': created_by, 'heavy': heavy, 'unique': unique}
+    if priority is not None:
+        kwargs['priority'] = priority
+    job = job_runner.submit(name, lambda _job, *a: fn(*a), *args, **kwargs)
+    return {'success': True, 'queued': True, 'job_id': job.job_id}
+
+
 def _date_to_md(date_str: str) -> str:
     """'YYYY-MM-DD' 문자열을 'M/D' 형식으로 변환. 형식이 잘못된 경우 빈 문자열 반환."""
     if not date_str:
@@ -68,13 +99,13 @@ def _date_to_md(date_str: str) -> str:
 # 연결 확인 (스플래시 화면용)
 # ============================================================================
 
-@eel.expose
+@expose(inline=True)
 def ping() -> bool:
     """Python 백엔드 연결 확인용 (스플래시 → 로그인 전환 트리거)"""
     return True
 
 
-@eel.expose
+@expose(inline=True)
 def open_external_url(url: str) -> bool:
     """시스템 기본 브라우저/앱으로 URL 열기 (Eel 앱 내 target=_blank 대체)"""
     try:
@@ -95,7 +126,7 @@ def open_external_url(url: str) -> bool:
 # 인증 관리
 # ============================================================================
 
-@eel.expose
+@expose
 def authenticate(user_id: str, password: str) -> Dict[str, Any]:
     """사용자 인증"""
     try:
@@ -137,7 +168,7 @@ def authenticate(user_id: str, password: str) -> Dict[str, Any]:
         return {'success': False, 'message': '인증 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def create_remember_token(user_id: str) -> Dict[str, Any]:
     """자동 로그인 토큰 생성"""
     try:
@@ -150,7 +181,7 @@ def create_remember_token(user_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def auto_login(token: str) -> Dict[str, Any]:
     """세션 토큰으로 자동 로그인"""
     try:
@@ -164,7 +195,7 @@ def auto_login(token: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def clear_remember_token(token: str) -> Dict[str, Any]:
     """자동 로그인 토큰 삭제 (로그아웃 시)"""
     try:
@@ -174,7 +205,7 @@ def clear_remember_token(token: str) -> Dict[str, Any]:
         return {'success': False}
 
 
-@eel.expose
+@expose
 def register_user(user_id: str, password: str, full_name: str) -> Dict[str, Any]:
     """사용자 등록 요청"""
     try:
@@ -204,11 +235,11 @@ def register_user(user_id: str, password: str, full_name: str) -> Dict[str, Any]
 # 관리자 기능
 # ============================================================================
 
-@eel.expose
+@expose
 def admin_get_all_users(admin_id: str = '') -> List[Dict[str, Any]]:
     """모든 사용자 조회 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return []
         users = auth_manager.get_all_users()
@@ -218,11 +249,11 @@ def admin_get_all_users(admin_id: str = '') -> List[Dict[str, Any]]:
         return []
 
 
-@eel.expose
+@expose
 def admin_get_pending_requests(admin_id: str = '') -> List[Dict[str, Any]]:
     """승인 대기 요청 조회 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return []
         requests = auth_manager.get_pending_requests()
@@ -232,7 +263,7 @@ def admin_get_pending_requests(admin_id: str = '') -> List[Dict[str, Any]]:
         return []
 
 
-@eel.expose
+@expose
 def admin_approve_user(user_id: str, admin_id: str) -> Dict[str, Any]:
     """사용자 승인 (관리자)"""
     try:
@@ -246,7 +277,7 @@ def admin_approve_user(user_id: str, admin_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_reject_user(user_id: str, admin_id: str, note: str = '') -> Dict[str, Any]:
     """사용자 거부 (관리자)"""
     try:
@@ -260,7 +291,7 @@ def admin_reject_user(user_id: str, admin_id: str, note: str = '') -> Dict[str,
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_delete_user(user_id: str, admin_id: str) -> Dict[str, Any]:
     """사용자 퇴사 처리 (관리자) — soft delete"""
     try:
@@ -274,7 +305,7 @@ def admin_delete_user(user_id: str, admin_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_update_user_status(user_id: str, status: str, admin_id: str) -> Dict[str, Any]:
     """사용자 상태 변경 (관리자)"""
     try:
@@ -288,7 +319,7 @@ def admin_update_user_status(user_id: str, status: str, admin_id: str) -> Dict[s
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def select_folder_path() -> Dict[str, Any]:
     """폴더 선택 다이얼로그 (Windows Shell API - Embedded Python 호환)"""
     try:
@@ -339,11 +370,11 @@ def select_folder_path() -> Dict[str, Any]:
         return {'success': False, 'error': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_get_paths(admin_id: str = '') -> Dict[str, Any]:
     """경로 조회 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False, 'paths': {}}
         settings = settings_manager.get_current_settings()
@@ -360,11 +391,11 @@ def admin_get_paths(admin_id: str = '') -> Dict[str, Any]:
         return {'success': False, 'paths': {}}
 
 
-@eel.expose
+@expose
 def admin_get_settings(admin_id: str = '') -> Dict[str, Any]:
     """설정 조회 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {}
         return settings_manager.get_current_settings()
@@ -374,13 +405,14 @@ def admin_get_settings(admin_id: str = '') -> Dict[str, Any]:
 
 
 def _get_admin_user(admin_id: str = '') -> Optional[Dict[str, Any]]:
-    user = auth_manager.get_user(admin_id) if admin_id else None
+    """관리자면 권한 정보 반환 (권한 캐시 조회 — DB 접근 없음)"""
+    user = auth_manager.get_principal(admin_id)
     if not user or user.get('role') != 'admin':
         return None
     return user
 
 
-@eel.expose
+@expose(coalesce=True)
 def admin_get_owner_company_catalog(admin_id: str = '') -> Dict[str, Any]:
     """선사(owner_company) 목록과 선박/장비 요약 조회"""
     try:
@@ -505,7 +537,7 @@ def admin_get_owner_company_catalog(admin_id: str = '') -> Dict[str, Any]:
         }
 
 
-@eel.expose
+@expose(coalesce=True)
 def admin_get_vendor_company_catalog(admin_id: str = '') -> Dict[str, Any]:
     """외주 업체 목록과 소속 인원 집계 조회"""
     try:
@@ -851,7 +883,7 @@ def _plan_merge_owner_ships(owner_name: str, source_names: List[str], target_nam
     }
 
 
-@eel.expose
+@expose
 def admin_preview_merge_vendor_workers(vendor_company: str, source_names: List[str],
                                        target_name: str = '', admin_id: str = '') -> Dict[str, Any]:
     if not _get_admin_user(admin_id):
@@ -859,7 +891,7 @@ def admin_preview_merge_vendor_workers(vendor_company: str, source_names: List[s
     return _plan_merge_vendor_workers(vendor_company, source_names, target_name)
 
 
-@eel.expose
+@expose
 def admin_preview_merge_owner_companies(source_names: List[str], target_name: str = '',
                                         admin_id: str = '') -> Dict[str, Any]:
     if not _get_admin_user(admin_id):
@@ -867,7 +899,7 @@ def admin_preview_merge_owner_companies(source_names: List[str], target_name: st
     return _plan_merge_owner_companies(source_names, target_name)
 
 
-@eel.expose
+@expose
 def admin_preview_merge_owner_ships(owner_name: str, source_names: List[str], target_name: str = '',
                                     admin_id: str = '') -> Dict[str, Any]:
     if not _get_admin_user(admin_id):
@@ -875,7 +907,7 @@ def admin_preview_merge_owner_ships(owner_name: str, source_names: List[str], ta
     return _plan_merge_owner_ships(owner_name, source_names, target_name)
 
 
-@eel.expose
+@expose
 def admin_get_last_merge_undo(admin_id: str = '') -> Dict[str, Any]:
     if not _get_admin_user(admin_id):
         return {'success': False, 'message': '관리자 권한이 필요합니다.', 'available': False}
@@ -891,7 +923,7 @@ def admin_get_last_merge_undo(admin_id: str = '') -> Dict[str, Any]:
     }
 
 
-@eel.expose
+@expose
 def admin_undo_last_merge(admin_id: str = '') -> Dict[str, Any]:
     if not _get_admin_user(admin_id):
         return {'success': False, 'message': '관리자 권한이 필요합니다.'}
@@ -910,6 +942,7 @@ def admin_undo_last_merge(admin_id: str = '') -> Dict[str, Any]:
             str(snapshot.get('details') or '')
         )
         _clear_last_merge_undo()
+        change_bus.publish(TOPIC_ALL)
         return {
             'success': True,
             'message': f'최근 병합 되돌리기 완료: {restored}건 복원',
@@ -920,13 +953,10 @@ def admin_undo_last_merge(admin_id: str = '') -> Dict[str, Any]:
         return {'success': False, 'message': '병합 되돌리기 중 오류가 발생했습니다.'}
 
 
-@eel.expose
-def admin_merge_vendor_workers(vendor_company: str, source_names: List[str],
-                               target_name: str, admin_id: str = '') -> Dict[str, Any]:
+def _do_merge_vendor_workers(vendor_company: str, source_names: List[str],
+                             target_name: str, admin_id: str = '') -> Dict[str, Any]:
     """특정 외주 업체 소속 직원명을 하나의 대표 이름으로 병합"""
     try:
-        if not _get_admin_user(admin_id):
-            return {'success': False, 'message': '관리자 권한이 필요합니다.'}
         plan = _plan_merge_vendor_workers(vendor_company, source_names, target_name)
         if not plan.get('success'):
             return plan
@@ -943,6 +973,7 @@ def admin_merge_vendor_workers(vendor_company: str, source_names: List[str],
             plan.get('updates', []),
         ))
         db.add_activity_log(admin_id, 'merge_vendor_workers', vendor_display, plan.get('details', ''))
+        change_bus.publish(TOPIC_ALL)
         return {
             'success': True,
             'message': f"병합 완료: 작업 {plan.get('workUpdates', 0)}건, 휴일 {plan.get('holidayUpdates', 0)}건 수정",
@@ -954,13 +985,25 @@ def admin_merge_vendor_workers(vendor_company: str, source_names: List[str],
         return {'success': False, 'message': '외주 직원 병합 중 오류가 발생했습니다.'}
 
 
-@eel.expose
-def admin_merge_owner_companies(source_names: List[str], target_name: str,
-                                admin_id: str = '') -> Dict[str, Any]:
-    """중복 선사명을 하나의 대표 이름으로 병합"""
+@expose
+def admin_merge_vendor_workers(vendor_company: str, source_names: List[str],
+                               target_name: str, admin_id: str = '') -> Dict[str, Any]:
+    """특정 외주 업체 소속 직원명을 하나의 대표 이름으로 병합 (백그라운드 작업 → job_id 반환)"""
     try:
         if not _get_admin_user(admin_id):
             return {'success': False, 'message': '관리자 권한이 필요합니다.'}
+        return _submit_job('merge_vendor_workers', _do_merge_vendor_workers,
+                           vendor_company, source_names, target_name, admin_id,
+                           created_by=admin_id, heavy=True)
+    except Exception as e:
+        logger.error(f"외주 직원 병합 오류: {e}")
+        return {'success': False, 'message': '외주 직원 병합 중 오류가 발생했습니다.'}
+
+
+def _do_merge_owner_companies(source_names: List[str], target_name: str,
+                              admin_id: str = '') -> Dict[str, Any]:
+    """중복 선사명을 하나의 대표 이름으로 병합"""
+    try:
         plan = _plan_merge_owner_companies(source_names, target_name)
         if not plan.get('success'):
             return plan
@@ -977,6 +1020,7 @@ def admin_merge_owner_companies(source_names: List[str], target_name: str,
             plan.get('updates', []),
         ))
         db.add_activity_log(admin_id, 'merge_owner_companies', target_display, plan.get('details', ''))
+        change_bus.publish(TOPIC_ALL)
         return {
             'success': True,
             'message': f"병합 완료: 작업 {plan.get('workUpdates', 0)}건, 등록 {plan.get('projectUpdates', 0)}건, 휴일 {plan.get('holidayUpdates', 0)}건 수정",
@@ -989,13 +1033,25 @@ def admin_merge_owner_companies(source_names: List[str], target_name: str,
         return {'success': False, 'message': '선사 병합 중 오류가 발생했습니다.'}
 
 
-@eel.expose
-def admin_merge_owner_ships(owner_name: str, source_names: List[str], target_name: str,
-                            admin_id: str = '') -> Dict[str, Any]:
-    """선사 내부의 중복 선박명을 하나의 대표 이름으로 병합"""
+@expose
+def admin_merge_owner_companies(source_names: List[str], target_name: str,
+                                admin_id: str = '') -> Dict[str, Any]:
+    """중복 선사명을 하나의 대표 이름으로 병합 (백그라운드 작업 → job_id 반환)"""
     try:
         if not _get_admin_user(admin_id):
             return {'success': False, 'message': '관리자 권한이 필요합니다.'}
+        return _submit_job('merge_owner_companies', _do_merge_owner_companies,
+                           source_names, target_name, admin_id,
+                           created_by=admin_id, heavy=True)
+    except Exception as e:
+        logger.error(f"선사 병합 오류: {e}")
+        return {'success': False, 'message': '선사 병합 중 오류가 발생했습니다.'}
+
+
+def _do_merge_owner_ships(owner_name: str, source_names: List[str], target_name: str,
+                          admin_id: str = '') -> Dict[str, Any]:
+    """선사 내부의 중복 선박명을 하나의 대표 이름으로 병합"""
+    try:
         plan = _plan_merge_owner_ships(owner_name, source_names, target_name)
         if not plan.get('success'):
             return plan
@@ -1012,6 +1068,7 @@ def admin_merge_owner_ships(owner_name: str, source_names: List[str], target_nam
             plan.get('updates', []),
         ))
         db.add_activity_log(admin_id, 'merge_owner_ships', owner_display, plan.get('details', ''))
+        change_bus.publish(TOPIC_ALL)
         return {
             'success': True,
             'message': f"병합 완료: 작업 {plan.get('workUpdates', 0)}건, 등록 {plan.get('projectUpdates', 0)}건, 휴일 {plan.get('holidayUpdates', 0)}건 수정",
@@ -1024,11 +1081,26 @@ def admin_merge_owner_ships(owner_name: str, source_names: List[str], target_nam
         return {'success': False, 'message': '선박 병합 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
+def admin_merge_owner_ships(owner_name: str, source_names: List[str], target_name: str,
+                            admin_id: str = '') -> Dict[str, Any]:
+    """선사 내부의 중복 선박명을 하나의 대표 이름으로 병합 (백그라운드 작업 → job_id 반환)"""
+    try:
+        if not _get_admin_user(admin_id):
+            return {'success': False, 'message': '관리자 권한이 필요합니다.'}
+        return _submit_job('merge_owner_ships', _do_merge_owner_ships,
+                           owner_name, source_names, target_name, admin_id,
+                           created_by=admin_id, heavy=True)
+    except Exception as e:
+        logger.error(f"선박 병합 오류: {e}")
+        return {'success': False, 'message': '선박 병합 중 오류가 발생했습니다.'}
+
+
+@expose
 def admin_update_local_db_path(new_path: str, admin_id: str) -> Dict[str, Any]:
     """로컬 DB 경로 변경 (관리자 전용)"""
     try:
-        user = auth_manager.get_user(admin_id)
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False, 'message': '관리자 권한이 필요합니다.'}
         logger.info(f"로컬 DB 경로 변경 요청: {new_path} by {admin_id}")
@@ -1038,11 +1110,11 @@ def admin_update_local_db_path(new_path: str, admin_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_update_cloud_path(new_path: str, admin_id: str) -> Dict[str, Any]:
     """클라우드 경로 변경 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id)
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False, 'message': '관리자 권한이 필요합니다.'}
         logger.info(f"클라우드 경로 변경 요청: {new_path} by {admin_id}")
@@ -1068,11 +1140,11 @@ def admin_update_cloud_path(new_path: str, admin_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_update_backup_path(new_path: str, admin_id: str) -> Dict[str, Any]:
     """백업 경로 변경 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id)
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False, 'message': '관리자 권한이 필요합니다.'}
         logger.info(f"백업 경로 변경 요청: {new_path} by {admin_id}")
@@ -1082,15 +1154,16 @@ def admin_update_backup_path(new_path: str, admin_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_create_backup(admin_id: str) -> Dict[str, Any]:
     """수동 백업 생성 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id)
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False, 'message': '관리자 권한이 필요합니다.'}
         logger.info(f"수동 백업 생성 요청 by {admin_id}")
-        return settings_manager.create_backup()
+        return _submit_job('create_backup', settings_manager.create_backup,
+                           created_by=admin_id, heavy=True)
     except Exception as e:
         logger.error(f"백업 생성 오류: {e}")
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
@@ -1100,7 +1173,7 @@ def admin_create_backup(admin_id: str) -> Dict[str, Any]:
 # 사용자 관리 (기존 호환성 유지)
 # ============================================================================
 
-@eel.expose
+@expose
 def login_user(username: str) -> bool:
     """사용자 로그인 (레거시)"""
     try:
@@ -1114,7 +1187,7 @@ def login_user(username: str) -> bool:
         return False
 
 
-@eel.expose
+@expose
 def get_recent_users() -> List[Dict[str, Any]]:
     """최근 사용자 목록"""
     try:
@@ -1129,7 +1202,7 @@ def get_recent_users() -> List[Dict[str, Any]]:
 # 작업 레코드 관리
 # ============================================================================
 
-@eel.expose
+@expose(coalesce=True)
 def load_work_records(date: str, work_type: str = 'day') -> List[Dict[str, Any]]:
     """작업 레코드 로드 (work_type: 'day'|'night')"""
     try:
@@ -1150,7 +1223,7 @@ def load_work_records(date: str, work_type: str = 'day') -> List[Dict[str, Any]]
         return []  # #15 — JS 호환 유지 (빈 배열=오류/데이터없음 모두 동일 처리)
 
 
-@eel.expose
+@expose
 def save_work_records(date: str, records: List[Dict[str, Any]],
                       username: str, work_type: str = 'day') -> Dict[str, Any]:
     """작업 레코드 저장 (work_type: 'day'|'night')"""
@@ -1173,13 +1246,13 @@ def save_work_records(date: str, records: List[Dict[str, Any]],
         save_result = work_record_service.save_records_for_date(date, records, username, wt)
         success = save_result.get('success', False)
 
-        # 저장 성공 시 클라우드 동기화 (백그라운드 스레드 - UI 블로킹 방지)
+        # 저장 성공 시 클라우드 동기화 (백그라운드 작업 - UI 블로킹 방지, 대기 중 동기화가 있으면 합침)
         if success and cloud_sync.enabled:
             # external 모드: push + 알림 생성 / company 모드: push만
             _sync_fn = (cloud_sync.sync_to_cloud_notify
                         if cloud_sync.sync_mode == 'external'
                         else cloud_sync.sync_to_cloud)
-            _start_tracked_thread(target=_sync_fn)
+            _submit_job('cloud_sync_after_save', _sync_fn, priority=PRIORITY_LOW, unique=True)
 
         return {'success': success, 'message': '저장되었습니다.' if success else save_result.get('message', '저장 실패')}
     except Exception as e:
@@ -1187,7 +1260,7 @@ def save_work_records(date: str, records: List[Dict[str, Any]],
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_date_save_info(date: str, work_type: str = 'day') -> Dict[str, Any]:
     """날짜별 마지막 저장 정보 조회 (JS 충돌 감지용)"""
     try:
@@ -1212,7 +1285,7 @@ def get_date_save_info(date: str, work_type: str = 'day') -> Dict[str, Any]:
         return {'has_records': False, 'updated_at': '', 'updated_by': ''}
 
 
-@eel.expose
+@expose(coalesce=True)
 def load_holiday_work_entries(period_key: str) -> List[Dict[str, Any]]:
     """휴일 작업 인원 명단 로드 (period_key = 해당 주 금요일 날짜 YYYY-MM-DD)"""
     try:
@@ -1244,7 +1317,7 @@ def load_holiday_work_entries(period_key: str) -> List[Dict[str, Any]]:
         return []
 
 
-@eel.expose
+@expose
 def save_holiday_work_entries(period_key: str, entries: List[Dict[str, Any]],
                               username: str) -> Dict[str, Any]:
     """휴일 작업 인원 명단 저장"""
@@ -1262,7 +1335,7 @@ def save_holiday_work_entries(period_key: str, entries: List[Dict[str, Any]],
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def get_latest_friday(date_str: str = '') -> str:
     """주어진 날짜(또는 오늘)로부터 가장 가까운 이전 금요일 반환 (YYYY-MM-DD)"""
     try:
@@ -1279,7 +1352,7 @@ def get_latest_friday(date_str: str = '') -> str:
         return ''
 
 
-@eel.expose
+@expose
 def get_holiday_period_dates(period_key: str) -> Dict[str, str]:
     """period_key(금요일) 기준 금/토/일 날짜+라벨 dict 반환"""
     try:
@@ -1301,7 +1374,7 @@ def get_holiday_period_dates(period_key: str) -> Dict[str, str]:
                 'friLabel': '금', 'satLabel': '토', 'sunLabel': '일'}
 
 
-@eel.expose
+@expose
 def clear_all_records(admin_id: str = '') -> Dict[str, Any]:
     """전체 작업 레코드 삭제 (관리자 전용)"""
     try:
@@ -1310,7 +1383,7 @@ def clear_all_records(admin_id: str = '') -> Dict[str, Any]:
             logger.warning("clear_all_records: admin_id 없음 - 권한 거부")
             return {'success': False, 'message': '관리자 권한이 필요합니다.'}
 
-        user = auth_manager.get_user(admin_id)
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             logger.warning(f"clear_all_records: 권한 없음 - user_id={admin_id}")
             return {'success': False, 'message': '관리자만 실행할 수 있습니다.'}
@@ -1327,7 +1400,7 @@ def clear_all_records(admin_id: str = '') -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(coalesce=True)
 def load_yesterday_records(current_date: str) -> Dict[str, Any]:
     """마지막 평일 작업 불러오기 (주말·공휴일 자동 건너뜀)"""
     try:
@@ -1339,7 +1412,7 @@ def load_yesterday_records(current_date: str) -> Dict[str, Any]:
         return {'records': [], 'date': ''}
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_date_list(start_date: str = None, end_date: str = None) -> List[str]:
     """레코드가 있는 날짜 목록"""
     try:
@@ -1354,7 +1427,7 @@ def get_date_list(start_date: str = None, end_date: str = None) -> List[str]:
 # 보고서
 # ============================================================================
 
-@eel.expose
+@expose
 def generate_report(date: str, username: str) -> Dict[str, Any]:
     """보고서 생성"""
     try:
@@ -1365,7 +1438,7 @@ def generate_report(date: str, username: str) -> Dict[str, Any]:
         return {}
 
 
-@eel.expose
+@expose
 def get_project_start_date_by_contract(contract_number: str) -> str:
     """계약번호 기준 공사 시작일 조회"""
     try:
@@ -1409,7 +1482,7 @@ def get_project_start_date_by_contract(contract_number: str) -> str:
         return ''
 
 
-@eel.expose
+@expose
 def get_project_start_date(ship_name: str) -> str:
     """선박별 공사 시작일 조회 (최초 작업일)"""
     try:
@@ -1440,7 +1513,7 @@ def get_project_start_date(ship_name: str) -> str:
         return ''
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_project_start_dates_batch(contract_numbers: list, ship_names: list) -> dict:
     """여러 계약번호/선박명의 공사 시작일을 한 번에 조회 (일일보고 N+1 방지)"""
     result = {}
@@ -1523,6 +1596,15 @@ def _parse_search_ot(end_time: str) -> float:
         return 0.0
 
 
+# 조회 레코드의 snake_case 사본 필드 (컬럼형 응답에서는 전송하지 않고 JS에서 복원)
+_SEARCH_RECORD_ALIASES = {
+    'contract_number': 'contractNumber',
+    'ship_name': 'shipName',
+    'engine_model': 'engineModel',
+    'work_content': 'workContent',
+}
+
+
 def _build_search_record(row) -> Dict[str, Any]:
     work_type = row[10] or 'day'
     end_time = row[11] or ''
@@ -1550,41 +1632,69 @@ def _build_search_record(row) -> Dict[str, Any]:
     }
 
 
-def _query_search_work_records(search_type: str, query_text: str) -> List[Dict[str, Any]]:
-    base_sql = '''
+def _search_work_records_filter(search_type: str, query_text: str) -> Optional[tuple]:
+    """조회 유형별 work_records WHERE 절과 파라미터 (지원하지 않는 유형이면 None)"""
+    if search_type == 'contract':
+        return ("contract_number = ? AND contract_number IS NOT NULL AND contract_number != ''",
+                [query_text.strip().upper()])
+    if search_type == 'ship':
+        return ("ship_name LIKE ? AND ship_name IS NOT NULL AND ship_name != ''",
+                [f'%{query_text.strip().upper()}%'])
+    if search_type == 'company':
+        name = query_text.strip()
+        return ('(teammates LIKE ? OR teammates LIKE ?)', [f'%{name}(%', f'%{name}[%'])
+    return None
+
+
+def _query_search_work_records(search_type: str, query_text: str, after: Optional[tuple] = None,
+                               limit: int = 0, descending: bool = False) -> List[Dict[str, Any]]:
+    """조회 탭 work_records 검색
+
+    after/limit 지정 시 (date, record_number, work_type) 키셋 기준 다음 페이지만 조회한다.
+    """
+    flt = _search_work_records_filter(search_type, query_text)
+    if flt is None:
+        return []
+    where, params = flt
+    order = ' DESC' if descending else ''
+    if after:
+        where += f" AND (date, record_number, COALESCE(work_type, 'day')) {'<' if descending else '>'} (?, ?, ?)"
+        params = params + list(after)
+    sql = f'''
         SELECT date, record_number, contract_number, company, ship_name, engine_model,
                work_content, leader, manpower, teammates,
                COALESCE(work_type, 'day') AS work_type, COALESCE(end_time, '') AS end_time
         FROM work_records
+        WHERE {where}
+        ORDER BY date{order}, record_number{order}, work_type{order}
     '''
-    if search_type == 'contract':
-        sql = base_sql + '''
-            WHERE contract_number = ?
-              AND contract_number IS NOT NULL
-              AND contract_number != ''
-            ORDER BY date, record_number, work_type
-        '''
-        rows = db.execute_query(sql, (query_text.strip().upper(),))
-    elif search_type == 'ship':
-        sql = base_sql + '''
-            WHERE ship_name LIKE ?
-              AND ship_name IS NOT NULL
-              AND ship_name != ''
-            ORDER BY date, record_number, work_type
-        '''
-        rows = db.execute_query(sql, (f'%{query_text.strip().upper()}%',))
-    elif search_type == 'company':
-        sql = base_sql + '''
-            WHERE (teammates LIKE ? OR teammates LIKE ?)
-            ORDER BY date, record_number, work_type
-        '''
-        name = query_text.strip()
-        rows = db.execute_query(sql, (f'%{name}(%', f'%{name}[%'))
-    else:
-        rows = []
+    if limit:
+        sql += ' LIMIT ?'
+        params = params + [int(limit)]
+    rows = db.execute_query(sql, tuple(params))
     return [_build_search_record(row) for row in (rows or [])]
 
 
+def _search_work_records_totals(search_type: str, query_text: str) -> Dict[str, float]:
+    """조회 결과 건수·인원·야간 OT 합계를 SQL 집계로 계산 (전체 행을 파이썬으로 가져오지 않음)"""
+    flt = _search_work_records_filter(search_type, query_text)
+    if flt is None:
+        return {'count': 0, 'manpower': 0.0, 'nightOt': 0.0}
+    where, params = flt
+    with db.get_connection() as conn:
+        # 야간 OT는 end_time 형식이 다양하여 _parse_search_ot를 SQL 함수로 등록해 집계
+        conn.create_function('search_ot', 1, _parse_search_ot, deterministic=True)
+        row = conn.execute(f'''
+            SELECT COUNT(*),
+                   COALESCE(SUM(manpower), 0),
+                   COALESCE(SUM(CASE WHEN COALESCE(work_type, 'day') = 'night'
+                                     THEN search_ot(end_time) ELSE 0 END), 0)
+            FROM work_records
+            WHERE {where}
+        ''', params).fetchone()
+    return {'count': int(row[0] or 0), 'manpower': float(row[1] or 0), 'nightOt': float(row[2] or 0)}
+
+
 def _holiday_value_to_ot(work_value: Any) -> float:
     text = str(work_value or '').strip()
     return 8.0 if text and text != '-' else 0.0
@@ -1661,6 +1771,7 @@ def _levenshtein_distance_limit_one(left: str, right: str) -> int:
 
 
 def _is_likely_merge_suggestion_pair(left_key: str, right_key: str) -> bool:
+    import difflib
     if not left_key or not right_key or left_key == right_key:
         return False
     if _levenshtein_distance_limit_one(left_key, right_key) <= 1:
@@ -2095,42 +2206,115 @@ def _build_holiday_ot_records(rows) -> List[Dict[str, Any]]:
     return records
 
 
-def _query_holiday_ot_records(search_type: str, query_text: str) -> List[Dict[str, Any]]:
+def _query_holiday_ot_records(search_type: str, query_text: str, after: Optional[tuple] = None,
+                              limit: int = 0, descending: bool = False) -> List[Dict[str, Any]]:
+    """조회 탭 휴일 근로 OT 레코드 (금·토·일 행으로 펼침, 정렬 키 순)
+
+    after/limit 지정 시 키셋 다음 페이지용 — after 이후 레코드만, 주차(period_key) 단위로 읽다가
+    limit건 이상 모이면 중단한다 (한 주차의 금~일 레코드는 다른 주차와 날짜가 겹치지 않는다).
+    """
     if search_type not in ('contract', 'ship', 'company'):
         return []
-    sql = '''
+    where, params = '', []
+    if after:
+        try:
+            after_dt = datetime.strptime(after[0], '%Y-%m-%d')
+        except ValueError:
+            after_dt = None
+        if after_dt is not None:
+            # 주차 시작(금)이 after 날짜보다 최대 2일 앞선 주차부터 해당 날짜 레코드가 나온다
+            bound = after_dt if descending else after_dt - timedelta(days=2)
+            where = f"WHERE period_key {'<=' if descending else '>='} ?"
+            params.append(bound.strftime('%Y-%m-%d'))
+    order = ' DESC' if descending else ''
+    sql = f'''
         SELECT period_key, seq, name, fri_work, sat_work, sun_work, work_content,
                contract_number, company, owner_company, vendor_company, ship_name
         FROM holiday_work_entries
-        ORDER BY period_key, seq
+        {where}
+        ORDER BY period_key{order}, seq{order}
     '''
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(sql)
-        rows = cursor.fetchall()
     period_meta_cache: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = {}
     normalized_query = str(query_text or '').strip()
     normalized_query_upper = normalized_query.upper()
     normalized_query_lower = normalized_query.lower()
-    filtered_rows = []
-    for raw_row in rows:
-        row = _enrich_holiday_entry_metadata(dict(raw_row), period_meta_cache)
-        contract_number = str(row.get('contract_number') or '').strip().upper()
-        ship_name = str(row.get('ship_name') or '').strip().upper()
-        vendor_company = str(row.get('vendor_company') or row.get('company') or '').strip().lower()
-        if search_type == 'contract' and contract_number != normalized_query_upper:
-            continue
-        if search_type == 'ship' and normalized_query_upper not in ship_name:
-            continue
-        if search_type == 'company' and normalized_query_lower not in vendor_company:
-            continue
-        filtered_rows.append(row)
-    return _build_holiday_ot_records(filtered_rows)
+
+    def _after(record):
+        key = _search_sort_key(record)
+        return after is None or (key < after if descending else key > after)
+
+    records: List[Dict[str, Any]] = []
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        period_rows: List[Dict[str, Any]] = []
+        current_period = None
+        for raw_row in itertools.chain(cursor, [None]):
+            if raw_row is None or raw_row['period_key'] != current_period:
+                records.extend(r for r in _build_holiday_ot_records(period_rows) if _after(r))
+                period_rows = []
+                if raw_row is None or (limit and len(records) >= limit):
+                    break
+                current_period = raw_row['period_key']
+            row = _enrich_holiday_entry_metadata(dict(raw_row), period_meta_cache)
+            contract_number = str(row.get('contract_number') or '').strip().upper()
+            ship_name = str(row.get('ship_name') or '').strip().upper()
+            vendor_company = str(row.get('vendor_company') or row.get('company') or '').strip().lower()
+            if search_type == 'contract' and contract_number != normalized_query_upper:
+                continue
+            if search_type == 'ship' and normalized_query_upper not in ship_name:
+                continue
+            if search_type == 'company' and normalized_query_lower not in vendor_company:
+                continue
+            period_rows.append(row)
+    records.sort(key=_search_sort_key, reverse=descending)
+    return records[:limit] if limit else records
+
+
+def _search_sort_key(record: Dict[str, Any]) -> tuple:
+    return (record.get('date', ''), int(record.get('recordNumber', 0)), record.get('workType', ''))
+
+
+def _encode_search_cursor(key: tuple) -> str:
+    return json.dumps(list(key), ensure_ascii=False)
+
+
+def _decode_search_cursor(cursor: Any) -> Optional[tuple]:
+    """이어보기 토큰 → (date, record_number, work_type), 없거나 형식이 잘못되면 None"""
+    if not cursor or cursor == 'null':
+        return None
+    try:
+        date, record_number, work_type = json.loads(cursor)
+        return (str(date), int(record_number), str(work_type))
+    except Exception:
+        return None
+
+
+def _search_summary(search_type: str, query_text: str,
+                    holiday_records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    totals = _search_work_records_totals(search_type, query_text)
+    night_ot = round(totals['nightOt'], 1)
+    holiday_ot = round(sum(float(r.get('ot', 0) or 0) for r in holiday_records), 1)
+    return {
+        'totalRecords': totals['count'] + len(holiday_records),
+        'totalManpower': round(totals['manpower'], 1),
+        'totalOt': round(night_ot + holiday_ot, 1),
+        'nightOt': night_ot,
+        'holidayOt': holiday_ot,
+    }
 
 
-@eel.expose
-def search_records_with_ot(search_type: str, query: str) -> Dict[str, Any]:
-    """조회 탭용 통합 검색 + OT 집계"""
+@expose
+def search_records_with_ot(search_type: str, query: str, columnar: bool = False,
+                           page_size: int = 0, cursor: str = None,
+                           descending: bool = False) -> Dict[str, Any]:
+    """조회 탭용 통합 검색 + OT 집계
+
+    columnar=True이면 records를 컬럼형으로 인코딩한다.
+    page_size > 0이면 (date, record_number, work_type) 키셋 페이지 단위로 반환하고,
+    다음 페이지는 응답의 nextCursor를 cursor로 넘겨 조회한다 (summary는 첫 페이지에만 포함).
+    descending=True이면 최신순으로 페이지를 넘긴다.
+    """
     try:
         st = (search_type or '').strip().lower()
         if st not in ('contract', 'ship', 'company'):
@@ -2138,35 +2322,49 @@ def search_records_with_ot(search_type: str, query: str) -> Dict[str, Any]:
         if not query or not str(query).strip():
             return {'success': False, 'message': '조회어를 입력해주세요.', 'records': [], 'summary': {}}
 
-        work_records = _query_search_work_records(st, str(query))
-        holiday_records = _query_holiday_ot_records(st, str(query))
-        records = sorted(
-            work_records + holiday_records,
-            key=lambda r: (r.get('date', ''), int(r.get('recordNumber', 0)), r.get('workType', '')),
-        )
-
-        night_ot = round(sum(float(r.get('ot', 0) or 0) for r in records if r.get('otSource') == 'night'), 1)
-        holiday_ot = round(sum(float(r.get('ot', 0) or 0) for r in records if r.get('otSource') == 'holiday'), 1)
-        total_ot = round(night_ot + holiday_ot, 1)
-        total_manpower = round(sum(float(r.get('manpower', 0) or 0) for r in records), 1)
+        query_text = str(query)
+        page_size = int(page_size or 0)
+        after = _decode_search_cursor(cursor)
+        result: Dict[str, Any] = {'success': True}
+        # 첫 조회(요약 포함)는 휴일 OT 전체, 이어보기는 커서 이후 page_size+1건까지만
+        holiday_records = []
+        if page_size <= 0 or after is None:
+            holiday_records = _query_holiday_ot_records(st, query_text)
+            if page_size > 0:
+                holiday_records.sort(key=_search_sort_key, reverse=descending)
+
+        if page_size > 0:
+            page_size = min(page_size, 2000)
+            # 두 출처에서 각각 page_size+1건까지 모은 뒤 병합 → 다음 페이지 존재 여부 판단
+            work_page = _query_search_work_records(st, query_text, after=after,
+                                                   limit=page_size + 1, descending=descending)
+            if after is not None:
+                holiday_page = _query_holiday_ot_records(st, query_text, after=after,
+                                                         limit=page_size + 1, descending=descending)
+            else:
+                holiday_page = holiday_records[:page_size + 1]
+            merged = sorted(work_page + holiday_page, key=_search_sort_key, reverse=descending)
+            records = merged[:page_size]
+            has_more = len(merged) > page_size
+            result['hasMore'] = has_more
+            result['nextCursor'] = _encode_search_cursor(_search_sort_key(records[-1])) if has_more else None
+        else:
+            records = sorted(
+                _query_search_work_records(st, query_text) + holiday_records,
+                key=_search_sort_key,
+                reverse=descending,
+            )
 
-        return {
-            'success': True,
-            'records': records,
-            'summary': {
-                'totalRecords': len(records),
-                'totalManpower': total_manpower,
-                'totalOt': total_ot,
-                'nightOt': night_ot,
-                'holidayOt': holiday_ot,
-            }
-        }
+        result['records'] = encode_columnar(records, _SEARCH_RECORD_ALIASES) if columnar else records
+        if page_size <= 0 or after is None:
+            result['summary'] = _search_summary(st, query_text, holiday_records)
+        return result
     except Exception as e:
         logger.error(f"통합 검색 OT 집계 오류: {e}")
         return {'success': False, 'message': '조회 중 오류가 발생했습니다.', 'records': [], 'summary': {}}
 
 
-@eel.expose
+@expose
 def search_records_by_contract(contract_number: str) -> List[Dict[str, Any]]:
     """계약번호로 작업 내역 조회"""
     try:
@@ -2177,7 +2375,7 @@ def search_records_by_contract(contract_number: str) -> List[Dict[str, Any]]:
         return []
 
 
-@eel.expose
+@expose
 def get_latest_record_by_contract(contract_number: str) -> Dict[str, Any]:
     """계약번호의 가장 최근 작업 내역 반환 (일일 작업 입력 자동완성용).
     반환 필드: found, company, shipName, engineModel, workContent, location"""
@@ -2212,7 +2410,7 @@ def get_latest_record_by_contract(contract_number: str) -> Dict[str, Any]:
         return {'found': False}
 
 
-@eel.expose
+@expose
 def get_latest_contract_number() -> str:
     """DB에서 가장 최근 날짜의 계약번호 반환"""
     try:
@@ -2229,7 +2427,7 @@ def get_latest_contract_number() -> str:
         return ''
 
 
-@eel.expose
+@expose(inline=True)
 def validate_contract_number(contract_number: str) -> Dict[str, Any]:
     """계약번호 형식 유효성 검사 (SH-YYYY-NNN-X 형식)"""
     import re
@@ -2247,7 +2445,7 @@ def validate_contract_number(contract_number: str) -> Dict[str, Any]:
     }
 
 
-@eel.expose
+@expose(coalesce=True)
 def load_vacation_data(date: str) -> Dict[str, str]:
     """날짜별 휴가자 현황 로드"""
     try:
@@ -2257,7 +2455,7 @@ def load_vacation_data(date: str) -> Dict[str, str]:
         return {'연차': '', '반차': '', '반반차': '', '공가': ''}
 
 
-@eel.expose
+@expose
 def save_vacation_data(date: str, data: Dict, username: str) -> Dict[str, Any]:
     """날짜별 휴가자 현황 저장"""
     try:
@@ -2272,7 +2470,7 @@ def save_vacation_data(date: str, data: Dict, username: str) -> Dict[str, Any]:
 # 직원 연차 관리 API
 # ============================================================================
 
-@eel.expose
+@expose(coalesce=True)
 def get_employee_leave_info(employee_name: str) -> Dict[str, Any]:
     """직원 연차 전체 정보 조회"""
     try:
@@ -2284,7 +2482,7 @@ def get_employee_leave_info(employee_name: str) -> Dict[str, Any]:
         return {}
 
 
-@eel.expose
+@expose
 def save_employee_annual_config(employee_name: str, generation_month: int, note: str,
                                 generation_day: int = 1) -> Dict[str, Any]:
     """직원 연차 설정 저장"""
@@ -2301,7 +2499,7 @@ def save_employee_annual_config(employee_name: str, generation_month: int, note:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def add_leave_grant(employee_name: str, grant_year: int, grant_month: int,
                     days: float, note: str) -> Dict[str, Any]:
     """연차 부여 이력 추가"""
@@ -2316,7 +2514,7 @@ def add_leave_grant(employee_name: str, grant_year: int, grant_month: int,
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def delete_leave_grant(grant_id: int) -> Dict[str, Any]:
     """연차 부여 이력 삭제"""
     try:
@@ -2327,7 +2525,7 @@ def delete_leave_grant(grant_id: int) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def add_leave_usage(employee_name: str, use_date: str, leave_type: str, note: str) -> Dict[str, Any]:
     """연차 사용 내역 추가"""
     try:
@@ -2342,7 +2540,7 @@ def add_leave_usage(employee_name: str, use_date: str, leave_type: str, note: st
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def delete_leave_usage(usage_id: int) -> Dict[str, Any]:
     """연차 사용 내역 삭제"""
     try:
@@ -2353,7 +2551,7 @@ def delete_leave_usage(usage_id: int) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def get_employee_names_for_leave() -> List[str]:
     """연차 관리용 직원 이름 목록"""
     try:
@@ -2363,7 +2561,7 @@ def get_employee_names_for_leave() -> List[str]:
         return []
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_employee_directory() -> Dict[str, Any]:
     """직원 명부 조회"""
     try:
@@ -2377,7 +2575,7 @@ def get_employee_directory() -> Dict[str, Any]:
         return {'success': False, 'message': '직원 명부를 불러오지 못했습니다.', 'employees': []}
 
 
-@eel.expose
+@expose
 def save_employee_directory(rows_json: str) -> Dict[str, Any]:
     """직원 명부 저장"""
     try:
@@ -2397,7 +2595,7 @@ def save_employee_directory(rows_json: str) -> Dict[str, Any]:
         return {'success': False, 'message': '직원 명부 저장 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def save_work_hours_ot_override(name: str, date: str, start_time: str, end_time: str,
                                 note: str = '') -> Dict[str, Any]:
     """근로시간관리 달력에서 수정한 연장근로 시작/종료 시간을 저장"""
@@ -2419,7 +2617,7 @@ def save_work_hours_ot_override(name: str, date: str, start_time: str, end_time:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_work_hours_by_month(name: str, year: int, month: int,
                              meal_deduct: bool = True) -> Dict[str, Any]:
     """직원 월별 근로 시간 조회 (달력용)
@@ -2625,7 +2823,7 @@ def get_work_hours_by_month(name: str, year: int, month: int,
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def search_records_by_ship(ship_name: str) -> List[Dict[str, Any]]:
     """선명으로 작업 내역 조회"""
     try:
@@ -2636,7 +2834,7 @@ def search_records_by_ship(ship_name: str) -> List[Dict[str, Any]]:
         return []
 
 
-@eel.expose
+@expose
 def search_records_by_company(company_name: str) -> List[Dict[str, Any]]:
     """외주 업체명으로 작업 내역 조회"""
     try:
@@ -2647,7 +2845,7 @@ def search_records_by_company(company_name: str) -> List[Dict[str, Any]]:
         return []
 
 
-@eel.expose
+@expose
 def get_outsource_company_names() -> List[str]:
     """외주 업체명 목록 조회 (드롭다운 자동완성용)"""
     try:
@@ -2676,7 +2874,7 @@ def get_outsource_company_names() -> List[str]:
         return []
 
 
-@eel.expose
+@expose
 def get_project_end_date(ship_name: str) -> str:
     """선박별 공사 마지막 작업일 조회"""
     try:
@@ -2704,7 +2902,7 @@ def get_project_end_date(ship_name: str) -> str:
         return ''
 
 
-@eel.expose
+@expose
 def debug_check_data(year: int, month: int) -> Dict[str, Any]:
     """디버깅용 데이터 확인"""
     try:
@@ -2751,7 +2949,7 @@ def debug_check_data(year: int, month: int) -> Dict[str, Any]:
         return {}
 
 
-@eel.expose
+@expose(coalesce=True)
 def load_monthly_report_grouped(year: int, month: int) -> List[Dict[str, Any]]:
     """월간 보고서 - 선박별 그룹핑"""
     try:
@@ -2790,20 +2988,7 @@ def load_monthly_report_grouped(year: int, month: int) -> List[Dict[str, Any]]:
                          WHERE wr2.ship_name = wr.ship_name
                          AND (wr2.contract_number = '' OR wr2.contract_number IS NULL))
                 END as true_end_date,
-                COALESCE(
-                    (SELECT ps.status FROM project_status ps
-                     WHERE ps.contract_number = wr.contract_number
-                     AND wr.contract_number != ''
-                     AND wr.contract_number IS NOT NULL
-                     ORDER BY ps.updated_at DESC LIMIT 1),
-                    (SELECT bp.status FROM board_projects bp
-                     WHERE bp.contract_number = wr.contract_number
-                     AND wr.contract_number != ''
-                     AND wr.contract_number IS NOT NULL
-                     ORDER BY bp.id DESC LIMIT 1),
-                    (SELECT bp.status FROM board_projects bp
-                     WHERE bp.ship_name = wr.ship_name ORDER BY bp.id DESC LIMIT 1)
-                ) as board_status
+                wr.contract_number
             FROM work_records wr
             WHERE strftime('%Y', wr.date) = ?
             AND strftime('%m', wr.date) = ?
@@ -2822,16 +3007,17 @@ def load_monthly_report_grouped(year: int, month: int) -> List[Dict[str, Any]]:
         if not results:
             return []
 
+        statuses = project_status_resolver.snapshot()
         grouped_data = []
         for row in results:
             ship_name = row[1]
 
-            # 공사기간: 전체 프로젝트 기간 기준, 보드 상태로 준공 여부 판단
+            # 공사기간: 전체 프로젝트 기간 기준, 칸반과 같은 규칙으로 준공 여부 판단
             true_start_date = row[8] or ''
             true_end_date   = row[9] or ''
-            board_status    = row[10] or ''
+            status = statuses.resolve(row[10] or '', true_end_date, ship_name)
 
-            if board_status == '준공':
+            if status == '준공':
                 project_period = f"{true_start_date} ~ {true_end_date}"
             else:
                 project_period = f"{true_start_date} ~ 진행중" if true_start_date else "진행중"
@@ -2867,7 +3053,7 @@ def load_monthly_report_grouped(year: int, month: int) -> List[Dict[str, Any]]:
         return []
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_analytics_data(year: int) -> Dict[str, Any]:
     """E: 연간 통계 — 월별 공수 합계, 회사별 상위 10, 계약별 상위 10"""
     try:
@@ -2982,7 +3168,7 @@ def get_analytics_data(year: int) -> Dict[str, Any]:
 # v1.8.6 — 사용자 현황 / 오류 리포트
 # =============================================================================
 
-@eel.expose
+@expose
 def update_client_version(user_id: str, version: str) -> dict:
     """로그인 후 클라이언트가 자신의 버전을 서버에 등록"""
     try:
@@ -2993,13 +3179,13 @@ def update_client_version(user_id: str, version: str) -> dict:
         return {'success': False}
 
 
-@eel.expose
+@expose
 def report_error(user_id: str, error_type: str, error_message: str, stack_trace: str = '') -> dict:
     """JS/Python 오류를 DB에 저장"""
     try:
         user_name = ''
         try:
-            user = auth_manager.get_user(user_id)
+            user = auth_manager.get_principal(user_id)
             if user:
                 user_name = user.get('full_name', '')
         except Exception:
@@ -3012,11 +3198,11 @@ def report_error(user_id: str, error_type: str, error_message: str, stack_trace:
         return {'success': False}
 
 
-@eel.expose
+@expose(coalesce=True)
 def admin_get_user_status(admin_id: str = '') -> list:
     """전체 사용자 + 버전 + 마지막 접속 (관리자 전용)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return []
         rows = db.execute_query(
@@ -3042,24 +3228,51 @@ def admin_get_user_status(admin_id: str = '') -> list:
         return []
 
 
-@eel.expose
-def admin_get_error_reports(limit: int = 50, admin_id: str = '') -> list:
-    """미해결 오류 리포트 목록 (관리자 전용)"""
+@expose
+def admin_get_error_reports(limit: int = 50, admin_id: str = '', include_archive: bool = False) -> list:
+    """미해결 오류 리포트 목록 (관리자 전용, include_archive면 보관된 리포트 포함)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return []
-        return db.get_error_reports(limit)
+        return db.get_error_reports(limit, include_archive=bool(include_archive))
     except Exception as e:
         logger.error(f"오류 리포트 조회 실패: {e}")
         return []
 
 
-@eel.expose
+@expose
+def admin_get_error_issues(limit: int = 50, admin_id: str = '') -> list:
+    """같은 원인으로 묶은 오류 목록 — 횟수·최초/최근 발생·영향 사용자·버전 (관리자 전용)"""
+    try:
+        user = auth_manager.get_principal(admin_id)
+        if not user or user.get('role') != 'admin':
+            return []
+        return db.get_error_issues(limit)
+    except Exception as e:
+        logger.error(f"오류 묶음 조회 실패: {e}")
+        return []
+
+
+@expose
+def admin_mark_error_issue_read(fingerprint: str, admin_id: str = '') -> dict:
+    """오류 묶음을 읽음 처리 (관리자 전용)"""
+    try:
+        user = auth_manager.get_principal(admin_id)
+        if not user or user.get('role') != 'admin':
+            return {'success': False}
+        ok = db.mark_error_issue_read(fingerprint)
+        return {'success': ok}
+    except Exception as e:
+        logger.error(f"오류 묶음 읽음 처리 실패: {e}")
+        return {'success': False}
+
+
+@expose
 def admin_mark_error_read(error_id: int, admin_id: str = '') -> dict:
     """오류 리포트를 읽음 처리 (관리자 전용)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False}
         ok = db.mark_error_report_read(error_id)
@@ -3069,11 +3282,11 @@ def admin_mark_error_read(error_id: int, admin_id: str = '') -> dict:
         return {'success': False}
 
 
-@eel.expose
+@expose(coalesce=True)
 def admin_get_realtime_summary(admin_id: str = '') -> Dict[str, Any]:
     """관리자 실시간 현황 요약: 현재 접속, 오늘 작업률, 미결 오류 (관리자 전용)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False}
 
@@ -3096,9 +3309,9 @@ def admin_get_realtime_summary(admin_id: str = '') -> Dict[str, Any]:
         )
         today_filled = today_rows[0][0] if today_rows else 0
 
-        # 미결 오류 리포트 수
+        # 미결 오류 묶음 수
         error_rows = db.execute_query(
-            "SELECT COUNT(*) FROM error_reports WHERE is_read = 0",
+            "SELECT COUNT(*) FROM error_issues WHERE is_read = 0",
             ()
         )
         error_count = error_rows[0][0] if error_rows else 0
@@ -3115,7 +3328,7 @@ def admin_get_realtime_summary(admin_id: str = '') -> Dict[str, Any]:
         return {'success': False}
 
 
-@eel.expose
+@expose(coalesce=True)
 def load_monthly_report(year: int, month: int) -> Dict[str, Any]:
     """월간 보고서 데이터 로드"""
     try:
@@ -3179,7 +3392,7 @@ def load_monthly_report(year: int, month: int) -> Dict[str, Any]:
         }
 
 
-@eel.expose
+@expose
 def export_to_excel(date: str) -> Dict[str, Any]:
     """Excel로 내보내기"""
     try:
@@ -3202,7 +3415,7 @@ def export_to_excel(date: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def export_daily_report(date: str) -> Dict[str, Any]:
     """일일 보고서 Excel 내보내기"""
     try:
@@ -3324,8 +3537,18 @@ def export_daily_report(date: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def export_monthly_report(year: int, month: int) -> Dict[str, Any]:
+    """월간 보고서 Excel 내보내기 (백그라운드 작업 → job_id 반환)"""
+    try:
+        return _submit_job('export_monthly_report', _do_export_monthly_report, year, month,
+                           priority=PRIORITY_LOW)
+    except Exception as e:
+        logger.error(f"월간 보고서 내보내기 오류: {e}")
+        return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
+
+
+def _do_export_monthly_report(year: int, month: int) -> Dict[str, Any]:
     """월간 보고서 Excel 내보내기"""
     try:
         from pathlib import Path
@@ -3412,7 +3635,7 @@ def export_monthly_report(year: int, month: int) -> Dict[str, Any]:
 # 클라우드 동기화
 # ============================================================================
 
-@eel.expose
+@expose
 def sync_to_cloud() -> Dict[str, Any]:
     """클라우드로 동기화"""
     try:
@@ -3429,13 +3652,19 @@ def sync_to_cloud() -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
-def sync_from_cloud() -> Dict[str, Any]:
-    """클라우드에서 동기화"""
+@expose
+def sync_from_cloud(only_if_changed: bool = False) -> Dict[str, Any]:
+    """클라우드에서 동기화
+
+    only_if_changed=True이면 마지막 동기화 이후 클라우드 DB 파일이 바뀐 경우에만 pull한다.
+    """
     try:
         if not cloud_sync.enabled:
             return {'success': False, 'message': '클라우드 동기화가 비활성화되어 있습니다.'}
-        
+
+        if only_if_changed and not cloud_sync.cloud_changed_since_last_sync():
+            return {'success': True, 'changed': False, 'message': '클라우드 변경 없음'}
+
         success = cloud_sync.sync_from_cloud()
         return {
             'success': success,
@@ -3446,7 +3675,7 @@ def sync_from_cloud() -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def get_sync_status() -> Dict[str, Any]:
     """동기화 상태 조회"""
     try:
@@ -3456,7 +3685,7 @@ def get_sync_status() -> Dict[str, Any]:
         return {}
 
 
-@eel.expose
+@expose(inline=True)
 def get_cloud_sync_mode() -> str:
     """현재 sync_mode 반환: 'company' | 'external' | 'standalone'"""
     try:
@@ -3466,7 +3695,16 @@ def get_cloud_sync_mode() -> str:
         return 'standalone'
 
 
-@eel.expose
+def _do_connect_to_cloud_external(cloud_path: str) -> Dict[str, Any]:
+    result = cloud_sync.connect_external(cloud_path)
+    if result.get('success'):
+        # db 싱글톤은 per-request 연결 방식이므로 재연결 불필요
+        # (다음 쿼리부터 교체된 DB 파일을 자동으로 사용)
+        logger.info("외부 PC 클라우드 연결 완료 — 다음 DB 접근부터 클라우드 DB 사용")
+    return result
+
+
+@expose
 def connect_to_cloud_external(cloud_path: str) -> Dict[str, Any]:
     """
     외부 PC에서 클라우드에 연결 (관리자 전용)
@@ -3474,18 +3712,14 @@ def connect_to_cloud_external(cloud_path: str) -> Dict[str, Any]:
     """
     try:
         logger.info(f"외부 PC 클라우드 연결 요청: {cloud_path}")
-        result = cloud_sync.connect_external(cloud_path)
-        if result.get('success'):
-            # db 싱글톤은 per-request 연결 방식이므로 재연결 불필요
-            # (다음 쿼리부터 교체된 DB 파일을 자동으로 사용)
-            logger.info("외부 PC 클라우드 연결 완료 — 다음 DB 접근부터 클라우드 DB 사용")
-        return result
+        return _submit_job('connect_cloud_external', _do_connect_to_cloud_external, cloud_path,
+                           heavy=True)
     except Exception as e:
         logger.error(f"외부 PC 클라우드 연결 오류: {e}")
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def disconnect_from_cloud() -> Dict[str, Any]:
     """
     외부 PC 클라우드 연결 해제 (관리자 전용)
@@ -3493,7 +3727,7 @@ def disconnect_from_cloud() -> Dict[str, Any]:
     """
     try:
         logger.info("외부 PC 클라우드 연결 해제 요청")
-        return cloud_sync.disconnect_external()
+        return _submit_job('disconnect_cloud_external', cloud_sync.disconnect_external, heavy=True)
     except Exception as e:
         logger.error(f"외부 PC 클라우드 연결 해제 오류: {e}")
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
@@ -3503,7 +3737,7 @@ def disconnect_from_cloud() -> Dict[str, Any]:
 # 앱 정보
 # ============================================================================
 
-@eel.expose
+@expose(inline=True)
 def get_app_info() -> Dict[str, Any]:
     """앱 정보 조회"""
     try:
@@ -3520,11 +3754,12 @@ def get_app_info() -> Dict[str, Any]:
     }
 
 
-@eel.expose
-def get_activity_logs(limit: int = 100, user_filter: str = '') -> List[Dict[str, Any]]:
-    """활동 로그 조회 (관리자)"""
+@expose(coalesce=True)
+def get_activity_logs(limit: int = 100, user_filter: str = '', include_archive: bool = False) -> List[Dict[str, Any]]:
+    """활동 로그 조회 (관리자, include_archive면 연도별 보관 로그 포함)"""
     try:
-        logs = db.get_activity_logs(limit=limit, user=user_filter or None)
+        logs = db.get_activity_logs(limit=limit, user=user_filter or None,
+                                    include_archive=bool(include_archive))
         return [log.to_dict() for log in logs]
     except Exception as e:
         logger.error(f"활동 로그 조회 오류: {e}")
@@ -3535,9 +3770,67 @@ def get_activity_logs(limit: int = 100, user_filter: str = '') -> List[Dict[str,
 # 대시보드 - 간트 차트
 # ============================================================================
 
-@eel.expose
-def get_gantt_data(year: int, month: int) -> List[Dict[str, Any]]:
-    """간트 차트용 프로젝트 데이터 조회 (해당 월과 겹치는 모든 프로젝트)"""
+def _load_gantt_projects(range_start: str, range_end: str) -> List[Dict[str, Any]]:
+    """기간과 겹치는 계약별 프로젝트 + 기간 안의 작업일 집합('_dates')
+
+    작업일은 계약번호 IN 목록 없이 기간 조건 한 번으로 읽으므로 계약 수 제한이 없다.
+    """
+    query = '''
+        SELECT contract_number, company, ship_name, engine_model, work_content,
+               MIN(date) as start_date, MAX(date) as end_date,
+               COUNT(DISTINCT date) as work_days,
+               ROUND(SUM(manpower), 1) as total_manpower
+        FROM work_records
+        WHERE contract_number != '' AND contract_number IS NOT NULL
+        GROUP BY contract_number
+        HAVING end_date >= ? AND start_date <= ?
+        ORDER BY start_date
+    '''
+    rows = db.execute_query(query, (range_start, range_end))
+    if not rows:
+        return []
+
+    work_dates_map: Dict[str, List[str]] = {}
+    date_rows = db.execute_query(
+        '''
+        SELECT DISTINCT contract_number, date FROM work_records
+        WHERE contract_number != '' AND contract_number IS NOT NULL AND date >= ? AND date <= ?
+        ORDER BY contract_number, date
+        ''',
+        (range_start, range_end)
+    )
+    for cn, d in (date_rows or []):
+        work_dates_map.setdefault(cn, []).append(d)
+
+    statuses = project_status_resolver.snapshot()
+    projects = []
+    for row in rows:
+        contract_number = row[0] or ''
+        start_date = row[5] or ''
+        end_date = row[6] or ''
+        projects.append({
+            'contractNumber': contract_number,
+            'company': row[1] or '',
+            'shipName': row[2] or '',
+            'engineModel': row[3] or '',
+            'workContent': row[4] or '',
+            'startDate': start_date,
+            'endDate': end_date,
+            # M/D 형식으로 변환 (잘못된 날짜 형식 → 빈 문자열)
+            'startMD': _date_to_md(start_date),
+            'endMD': _date_to_md(end_date),
+            'workDays': row[7] or 0,
+            'totalManpower': row[8] or 0,
+            'status': statuses.resolve(contract_number, end_date),
+            '_dates': work_dates_map.get(contract_number, []),
+        })
+    return projects
+
+
+@expose(coalesce=True)
+def get_gantt_data(year: int, month: int, columnar: bool = False) -> Any:
+    """간트 차트용 프로젝트 데이터 조회 (해당 월과 겹치는 모든 프로젝트)
+    columnar=True이면 프로젝트 목록을 컬럼형 payload로 반환"""
     try:
         import calendar
         last_day = calendar.monthrange(year, month)[1]
@@ -3546,63 +3839,12 @@ def get_gantt_data(year: int, month: int) -> List[Dict[str, Any]]:
 
         logger.info(f"간트 데이터 조회: {month_start} ~ {month_end}")
 
-        # 해당 월과 기간이 겹치는 프로젝트 조회
-        query = '''
-            SELECT contract_number, company, ship_name, engine_model, work_content,
-                   MIN(date) as start_date, MAX(date) as end_date,
-                   COUNT(DISTINCT date) as work_days,
-                   ROUND(SUM(manpower), 1) as total_manpower
-            FROM work_records
-            WHERE contract_number != '' AND contract_number IS NOT NULL
-            GROUP BY contract_number
-            HAVING end_date >= ? AND start_date <= ?
-            ORDER BY start_date
-        '''
-        rows = db.execute_query(query, (month_start, month_end))
-
-        # N+1 방지: 모든 계약번호의 해당 월 작업일을 단일 쿼리로 조회
-        work_dates_map = {}
-        if rows:
-            all_cns = [row[0] for row in rows if row[0]][:500]
-            if all_cns:
-                placeholders = ','.join('?' * len(all_cns))
-                date_rows_batch = db.execute_query(
-                    f'SELECT contract_number, date FROM work_records '
-                    f'WHERE contract_number IN ({placeholders}) AND date >= ? AND date <= ? '
-                    f'ORDER BY contract_number, date',
-                    all_cns + [month_start, month_end]
-                )
-                for cn, d in (date_rows_batch or []):
-                    work_dates_map.setdefault(cn, []).append(d)
-
-        projects = []
-        for row in rows:
-            contract_number = row[0] or ''
-            work_dates = work_dates_map.get(contract_number, [])
-
-            start_date = row[5] or ''
-            end_date = row[6] or ''
-            # M/D 형식으로 변환 (잘못된 날짜 형식 → 빈 문자열)
-            start_md = _date_to_md(start_date)
-            end_md = _date_to_md(end_date)
-
-            projects.append({
-                'contractNumber': contract_number,
-                'company': row[1] or '',
-                'shipName': row[2] or '',
-                'engineModel': row[3] or '',
-                'workContent': row[4] or '',
-                'startDate': start_date,
-                'endDate': end_date,
-                'startMD': start_md,
-                'endMD': end_md,
-                'workDays': row[7] or 0,
-                'totalManpower': row[8] or 0,
-                'workDates': work_dates
-            })
+        projects = _load_gantt_projects(month_start, month_end)
+        for project in projects:
+            project['workDates'] = project.pop('_dates')
 
         logger.info(f"간트 데이터: {len(projects)}개 프로젝트")
-        return projects
+        return encode_columnar(projects) if columnar else projects
 
     except Exception as e:
         logger.error(f"간트 데이터 조회 오류: {e}")
@@ -3611,11 +3853,42 @@ def get_gantt_data(year: int, month: int) -> List[Dict[str, Any]]:
         return []
 
 
+@expose(coalesce=True)
+def get_gantt_range(year: int, month: int, months: int = 12, columnar: bool = False) -> Dict[str, Any]:
+    """여러 달(최대 24개월) 간트 데이터를 한 번에 조회 — 작업일은 기간 시작일 기준 비트맵
+    (workOffset: 첫 작업일의 start 대비 일수, workBitmap: base64, JS decodeDayBitmap()으로 복원)"""
+    try:
+        import calendar
+        from datetime import date
+        months = max(1, min(24, int(months or 1)))
+        end_index = year * 12 + (month - 1) + months - 1
+        end_year, end_month = divmod(end_index, 12)
+        end_month += 1
+        origin = date(year, month, 1)
+        range_start = origin.isoformat()
+        range_end = f'{end_year}-{end_month:02d}-{calendar.monthrange(end_year, end_month)[1]:02d}'
+
+        projects = _load_gantt_projects(range_start, range_end)
+        for project in projects:
+            project['workOffset'], project['workBitmap'] = encode_day_bitmap(project.pop('_dates'), origin)
+
+        logger.info(f"간트 데이터 조회: {range_start} ~ {range_end}, {len(projects)}개 프로젝트")
+        return {
+            'success': True,
+            'start': range_start,
+            'end': range_end,
+            'projects': encode_columnar(projects) if columnar else projects,
+        }
+    except Exception as e:
+        logger.error(f"간트 기간 데이터 조회 오류: {e}")
+        return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.', 'projects': []}
+
+
 # ============================================================================
 # 대시보드 - 칸반 보드
 # ============================================================================
 
-@eel.expose
+@expose
 def set_project_status(contract_number: str, status: str) -> Dict[str, Any]:
     """프로젝트 상태 수동 변경 (접수/착수/준공/auto)"""
     try:
@@ -3623,7 +3896,7 @@ def set_project_status(contract_number: str, status: str) -> Dict[str, Any]:
         success = db.set_project_status(contract_number, status, username)
         if success:
             # 착공·준공 이벤트 텔레그램 알림 (비동기)
-            if status in ('착수', '준공'):
+            if normalize_status(status) in ('착수', '준공'):
                 ship_name = telegram_notifier._get_ship_name(contract_number, None)
                 _start_tracked_thread(
                     target=telegram_notifier.send_project_event,
@@ -3636,7 +3909,7 @@ def set_project_status(contract_number: str, status: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def create_board_project(data: Dict) -> Dict[str, Any]:
     """보드 프로젝트 생성 (접수 단계)"""
     try:
@@ -3650,7 +3923,7 @@ def create_board_project(data: Dict) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def update_board_project(project_id: int, data: Dict) -> Dict[str, Any]:
     """보드 프로젝트 업데이트"""
     try:
@@ -3664,7 +3937,7 @@ def update_board_project(project_id: int, data: Dict) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def update_project_milestones(project_id: int, target_start: str, target_end: str, actual_end: str) -> Dict[str, Any]:
     """프로젝트 마일스톤 날짜 업데이트"""
     try:
@@ -3682,7 +3955,7 @@ def update_project_milestones(project_id: int, target_start: str, target_end: st
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def delete_board_project(project_id: int) -> Dict[str, Any]:
     """보드 프로젝트 삭제"""
     try:
@@ -3696,7 +3969,7 @@ def delete_board_project(project_id: int) -> Dict[str, Any]:
 
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_employee_profile(name: str, year: int = 0) -> Dict[str, Any]:
     """직원별 연간 공수·프로젝트·연차 현황 조회"""
     try:
@@ -3762,65 +4035,47 @@ def get_employee_profile(name: str, year: int = 0) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(coalesce=True)
 def estimate_completion(engine_model: str, work_content: str, target_start: str = '') -> Dict[str, Any]:
-    """과거 유사 작업 기간 기반 완료일 예측"""
+    """과거 유사 작업 기간 기반 완료일 예측 — 엔진 모델·작업 내용별 미리 계산한 중앙값·P80 (completion_stats)"""
     try:
-        from datetime import datetime as _dt, timedelta as _td
-        rows = db.execute_query(
-            "SELECT target_start_date, actual_end_date FROM board_projects "
-            "WHERE actual_end_date != '' AND target_start_date != '' "
-            "AND (engine_model = ? OR work_content LIKE ?) "
-            "ORDER BY id DESC LIMIT 30",
-            (engine_model or '', f'%{(work_content or "")[:10]}%')
-        )
-        durations = []
-        for row in (rows or []):
-            try:
-                s = row[0]; e = row[1]
-                d = (_dt.strptime(e, '%Y-%m-%d') - _dt.strptime(s, '%Y-%m-%d')).days
-                if 1 <= d <= 365:
-                    durations.append(d)
-            except Exception:
-                pass
+        stats = completion_stats.estimate(engine_model, work_content)
+        if not stats:
+            return {'success': True, 'medianDays': None, 'p80Days': None, 'sampleCount': 0,
+                    'suggestionEndDate': '', 'p80EndDate': ''}
 
-        if not durations:
-            return {'success': True, 'avgDays': None, 'sampleCount': 0, 'suggestionEndDate': ''}
-
-        avg_days = round(sum(durations) / len(durations))
-        suggestion_end = ''
+        suggestion_end = p80_end = ''
         if target_start:
             try:
-                end_dt = _dt.strptime(target_start, '%Y-%m-%d') + _td(days=avg_days)
-                suggestion_end = end_dt.strftime('%Y-%m-%d')
-            except Exception:
+                start_dt = datetime.strptime(target_start, '%Y-%m-%d')
+                suggestion_end = (start_dt + timedelta(days=stats['medianDays'])).strftime('%Y-%m-%d')
+                p80_end = (start_dt + timedelta(days=stats['p80Days'])).strftime('%Y-%m-%d')
+            except ValueError:
                 pass
 
         return {
             'success': True,
-            'avgDays': avg_days,
-            'sampleCount': len(durations),
+            **stats,
             'suggestionEndDate': suggestion_end,
+            'p80EndDate': p80_end,
         }
     except Exception as e:
         logger.error(f"완료 예측 오류: {e}")
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
-def get_kanban_data() -> Dict[str, Any]:
-    """칸반 보드용 프로젝트 데이터 (접수/착수/준공/아카이브 4단계)"""
+@expose(coalesce=True)
+def get_kanban_data(columnar: bool = False) -> Dict[str, Any]:
+    """칸반 보드용 프로젝트 데이터 (접수/착수/준공/아카이브 4단계)
+    columnar=True이면 단계별 목록을 각각 컬럼형 payload로 반환"""
     try:
-        from datetime import datetime, timedelta
-
         now = datetime.now()
-        cutoff = (now - timedelta(days=7)).strftime('%Y-%m-%d')
         current_month_start = now.strftime('%Y-%m-01')
 
         # 1. 접수 단계 프로젝트 (board_projects 테이블에서)
-        reception_projects = db.get_board_projects('접수')
+        statuses = project_status_resolver.snapshot()
         reception = []
-        for bp in reception_projects:
+        for bp in statuses.reception_projects():
             reception.append({
                 'id': bp['id'],
                 'contractNumber': bp.get('contract_number', ''),
@@ -3841,7 +4096,7 @@ def get_kanban_data() -> Dict[str, Any]:
                 'actualEndDate':   bp.get('actual_end_date', ''),
             })
 
-        # 2. 착수/준공 - work_records 기반 + board_projects 수동 상태
+        # 2. 착수/준공 - work_records 기반, 상태는 ProjectStatusResolver (수동 > 보드 > 자동)
         query = '''
             SELECT contract_number, company, ship_name, engine_model, work_content,
                    MIN(date) as start_date, MAX(date) as end_date,
@@ -3854,13 +4109,6 @@ def get_kanban_data() -> Dict[str, Any]:
         '''
         rows = db.execute_query(query)
 
-        # 수동 상태 조회 (project_status 테이블)
-        manual_statuses = db.get_project_statuses()
-
-        # board_projects에서 착수/준공 상태인 것도 조회
-        board_started = {bp['contract_number']: bp for bp in db.get_board_projects('착수') if bp.get('contract_number')}
-        board_done = {bp['contract_number']: bp for bp in db.get_board_projects('준공') if bp.get('contract_number')}
-
         started = []
         done = []
         archive = []
@@ -3870,38 +4118,9 @@ def get_kanban_data() -> Dict[str, Any]:
             end_date = row[6] or ''
             start_date = row[5] or ''
 
-            # M/D 형식 (잘못된 날짜 형식 → 빈 문자열)
-            start_md = _date_to_md(start_date)
-            end_md = _date_to_md(end_date)
-
-            # 상태 판단: 수동 > 자동
-            manual_status = manual_statuses.get(contract_number, '')
-            board_status = ''
-            if contract_number in board_started:
-                board_status = '착수'
-            elif contract_number in board_done:
-                board_status = '준공'
-
-            # 우선순위: project_status > board_projects > 자동
-            if manual_status and manual_status != 'auto':
-                # 기존 project_status의 값 매핑
-                if manual_status in ('inProgress', '착수'):
-                    final_status = '착수'
-                elif manual_status in ('completed', '준공'):
-                    final_status = '준공'
-                else:
-                    final_status = manual_status
-            elif board_status:
-                final_status = board_status
-            else:
-                # 자동 판단
-                if end_date >= cutoff:
-                    final_status = '착수'
-                else:
-                    final_status = '준공'
-
+            final_status = statuses.resolve(contract_number, end_date, today=now)
             # 마일스톤 데이터 — board_projects에서 계약번호로 매칭
-            bp_data = board_started.get(contract_number) or board_done.get(contract_number) or {}
+            bp_data = statuses.board_project(contract_number)
             project = {
                 'contractNumber': contract_number,
                 'company': row[1] or '',
@@ -3910,12 +4129,12 @@ def get_kanban_data() -> Dict[str, Any]:
                 'workContent': row[4] or '',
                 'startDate': start_date,
                 'endDate': end_date,
-                'startMD': start_md,
-                'endMD': end_md,
+                'startMD': _date_to_md(start_date),
+                'endMD': _date_to_md(end_date),
                 'workDays': row[7] or 0,
                 'totalManpower': row[8] or 0,
                 'status': final_status,
-                'manualStatus': manual_status,
+                'manualStatus': statuses.manual_status(contract_number),
                 'source': 'records',
                 'boardProjectId': bp_data.get('id', None),
                 'targetStartDate': bp_data.get('target_start_date', ''),
@@ -3934,12 +4153,15 @@ def get_kanban_data() -> Dict[str, Any]:
                     done.append(project)
 
         logger.info(f"칸반 데이터: 접수 {len(reception)}건, 착수 {len(started)}건, 준공 {len(done)}건, 아카이브 {len(archive)}건")
-        return {
+        result = {
             'reception': reception,
             'started': started,
             'done': done,
             'archive': archive
         }
+        if columnar:
+            return {stage: encode_columnar(items) for stage, items in result.items()}
+        return result
 
     except Exception as e:
         logger.error(f"칸반 데이터 조회 오류: {e}")
@@ -3948,7 +4170,7 @@ def get_kanban_data() -> Dict[str, Any]:
         return {'reception': [], 'started': [], 'done': [], 'archive': []}
 
 
-@eel.expose
+@expose
 def get_or_create_board_project(contract_number: str) -> Dict[str, Any]:
     """착수 직접 등록 프로젝트 — board_projects 항목이 없으면 자동 생성 후 ID 반환.
     마일스톤 편집 버튼 클릭 시 boardProjectId 없는 카드에서 호출."""
@@ -3986,6 +4208,7 @@ def get_or_create_board_project(contract_number: str) -> Dict[str, Any]:
             )
             new_id = cursor.lastrowid
         logger.info(f"board_projects 자동 생성: {cn} → id={new_id}")
+        change_bus.publish(TOPIC_BOARD, f'bp:{new_id}')
         return {'success': True, 'projectId': new_id}
     except Exception as e:
         logger.error(f"board_projects 생성 오류: {e}")
@@ -3996,13 +4219,13 @@ def get_or_create_board_project(contract_number: str) -> Dict[str, Any]:
 # 댓글 시스템
 # ============================================================================
 
-@eel.expose
+@expose
 def add_project_comment(contract_number: str, content: str, parent_id: int = None, board_project_id: int = None) -> Dict[str, Any]:
     """프로젝트 댓글 추가 (add_project_comment_with_user로 위임)"""
     return add_project_comment_with_user(contract_number, content, '', '', parent_id, board_project_id)
 
 
-@eel.expose
+@expose
 def add_project_comment_with_user(contract_number, content, user_id, user_name, parent_id=None, board_project_id=None) -> Dict[str, Any]:
     """프로젝트 댓글 추가 (사용자 정보 포함)"""
     try:
@@ -4044,7 +4267,7 @@ def add_project_comment_with_user(contract_number, content, user_id, user_name,
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_project_comments(contract_number=None, board_project_id=None) -> Dict[str, Any]:
     """프로젝트 댓글 조회"""
     try:
@@ -4075,7 +4298,7 @@ def get_project_comments(contract_number=None, board_project_id=None) -> Dict[st
         return {'success': False, 'comments': []}
 
 
-@eel.expose
+@expose
 def delete_project_comment(comment_id: int, user_id: str) -> Dict[str, Any]:
     """프로젝트 댓글 삭제"""
     try:
@@ -4092,196 +4315,153 @@ def delete_project_comment(comment_id: int, user_id: str) -> Dict[str, Any]:
 # 엑셀 불러오기
 # ============================================================================
 
-@eel.expose
+def _run_excel_import_job(job, file_bytes: bytes, username: str) -> Dict[str, Any]:
+    """엑셀 불러오기 백그라운드 작업 — 행 단위로 파싱하며 단일 트랜잭션으로 저장.
+    취소 시 JobCancelled가 트랜잭션 안에서 발생하므로 저장 내용은 모두 롤백된다."""
+    from ..business.excel_import import open_excel_rows, iter_excel_work_records
+
+    stats = {'rows': 0, 'skipped': 0}
+    try:
+        total_rows, rows = open_excel_rows(file_bytes)
+    except ImportError:
+        return {'success': False, 'message': 'xlrd 패키지가 필요합니다. 터미널에서 [pip install xlrd] 를 실행해 주세요.'}
+    except Exception as e:
+        logger.error(f"엑셀 파일 열기 오류: {e}")
+        return {'success': False, 'message': '엑셀 불러오기 실패 — 파일 형식을 확인하세요.'}
+    job.update(total_rows=total_rows)
+
+    def _on_progress(date_counts: Dict[str, int]) -> None:
+        job.check_cancelled()
+        job.update(
+            progress=min(99, int(stats['rows'] * 100 / total_rows)) if total_rows else 0,
+            processed_rows=stats['rows'],
+            skipped=stats['skipped'],
+            total_dates=len(date_counts),
+            total_records=sum(date_counts.values()),
+        )
+
+    date_counts = db.import_work_records(
+        iter_excel_work_records(rows, stats), username, progress_callback=_on_progress
+    )
+    total_records = sum(date_counts.values())
+    logger.info(f"엑셀 불러오기 완료: {len(date_counts)}일, {total_records}건 (건너뜀 {stats['skipped']})")
+    return {
+        'success': True,
+        'total_dates': len(date_counts),
+        'total_records': total_records,
+        'skipped': stats['skipped'],
+        'date_counts': dict(sorted(date_counts.items())),
+    }
+
+
+@expose
 def import_excel_data(base64_data: str, username: str = 'admin') -> Dict[str, Any]:
-    """엑셀 파일 데이터를 DB로 일괄 업로드"""
+    """엑셀 파일 데이터를 DB로 일괄 업로드 (백그라운드 작업 → job_id 반환)"""
     try:
-        user = auth_manager.get_user(username) if username else None
+        user = auth_manager.get_principal(username)
         if not user or user.get('role') != 'admin':
             return {'success': False, 'message': '관리자 권한 필요'}
 
         import base64
-        import io
-        from openpyxl import load_workbook
-        from ..database.models import WorkRecord
-        from ..business.calculations import calculate_record_manpower
 
-        logger.info(f"엑셀 불러오기 시작 by {username}")
-
-        # 셀 값 추출 헬퍼 (기울임체 감지 포함)
-        def get_cell_value(cell, wrap_italic=False):
-            """셀 값을 문자열로 추출. wrap_italic=True이면 기울임체 셀에 *이름* 형태로 반환"""
-            if cell is None or cell.value is None:
-                return ''
-            val = str(cell.value).strip()
-            if not val:
-                return ''
-            if wrap_italic and cell.font and cell.font.italic:
-                return f'*{val}*'
-            return val
-
-        # base64 디코딩
         file_bytes = base64.b64decode(base64_data)
+        job = job_runner.submit('excel_import', _run_excel_import_job, file_bytes, username,
+                                created_by=username, heavy=True)
+        logger.info(f"엑셀 불러오기 시작 by {username} (job={job.job_id}, {len(file_bytes)} bytes)")
+        return {'success': True, 'queued': True, 'job_id': job.job_id}
 
-        # 파일 형식 감지: OLE2 magic bytes = .xls, ZIP header = .xlsx
-        XLS_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
-        is_xls = file_bytes[:8] == XLS_MAGIC
-
-        if is_xls:
-            # .xls (Excel 97-2003) → xlrd 사용 (이탤릭 감지 불가)
-            try:
-                import xlrd
-            except ImportError:
-                return {'success': False, 'message': 'xlrd 패키지가 필요합니다. 터미널에서 [pip install xlrd] 를 실행해 주세요.'}
-            wb_xls = xlrd.open_workbook(file_contents=file_bytes)
-            ws_xls = wb_xls.sheet_by_index(0)
-            # 날짜 타입 셀(type 3)을 "날짜 : YYYY.MM.DD." 텍스트로 변환하여
-            # 날짜 감지 정규식이 float 값을 놓치지 않도록 처리
-            rows_raw = []
-            for i in range(ws_xls.nrows):
-                vals = list(ws_xls.row_values(i))
-                types = ws_xls.row_types(i)
-                for j, (v, t) in enumerate(zip(vals, types)):
-                    if t == 3:  # XL_CELL_DATE
-                        try:
-                            dt = xlrd.xldate.xldate_as_datetime(v, wb_xls.datemode)
-                            vals[j] = f"날짜 : {dt.strftime('%Y.%m.%d')}."
-                        except Exception:
-                            pass
-                rows_raw.append(vals)
-            logger.info(f"xls 파일 감지: {ws_xls.nrows}행")
-        else:
-            # .xlsx (Office Open XML) → openpyxl 사용
-            wb = load_workbook(filename=io.BytesIO(file_bytes), data_only=True)
-            ws = wb.active
-            rows_raw = [[c.value for c in row] for row in ws.iter_rows()]
-            wb.close()
-            logger.info(f"xlsx 파일 감지: {len(rows_raw)}행")
-
-        # 날짜별 레코드 그룹핑
-        date_records = {}  # { 'YYYY-MM-DD': [WorkRecord, ...] }
-        skipped = 0
-        total_records = 0
-
-        import re
-        current_date = None
-
-        for row_values in rows_raw:
-            # row_values: list of cell values (str/float/None)
-            row_text = ' '.join(str(v or '') for v in row_values)
-
-            # 날짜 헤더 행 감지: "날짜 : YYYY.MM.DD" 형식 (구분자 유연화)
-            date_match = re.search(
-                r'날짜\s*[:\：]?\s*(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})',
-                row_text
-            )
-            if not date_match:
-                # "날짜 :" 없이 YYYY.MM.DD 단독 셀인 경우
-                date_match = re.search(
-                    r'^\s*(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})\s*$',
-                    row_text.strip()
-                )
-            if date_match:
-                y, m, d = date_match.groups()
-                current_date = f'{y}-{int(m):02d}-{int(d):02d}'
-                continue
+    except Exception as e:
+        logger.error(f"엑셀 불러오기 시작 오류: {e}")
+        return {
+            'success': False,
+            'message': '엑셀 불러오기 실패 — 파일 형식을 확인하세요.'
+        }
 
-            # 컬럼 헤더 행 스킵 (계약번호, 선사/선명 포함 행)
-            if '계약번호' in row_text or ('선사' in row_text and '선명' in row_text):
-                continue
 
-            # 날짜가 아직 설정되지 않은 경우 건너뜀
-            if current_date is None:
-                continue
+# ============================================================================
+# 백그라운드 작업 상태
+# ============================================================================
 
-            # B열(인덱스 1) 이상이어야 데이터 행으로 처리
-            if len(row_values) < 2:
-                skipped += 1
-                continue
+@expose(inline=True)
+def get_job_status(job_id: str) -> Dict[str, Any]:
+    """백그라운드 작업 진행 상황 조회 (JS 폴링용).
+    status: queued/running/completed/failed/cancelled, 완료 시 result에 작업 결과
+    메모리의 작업은 루프에서 바로 답하고, 메모리에서 밀려난 작업의 DB 이력 조회만 스레드에서 실행한다."""
+    status = job_runner.get_status(job_id, include_history=False)
+    if status is None:
+        status = run_blocking(job_runner.get_status, job_id)
+    if status is None:
+        return {'success': False, 'message': '작업을 찾을 수 없습니다.'}
+    return {'success': True, **status}
+
+
+@expose
+def cancel_job(job_id: str, user_id: str = '') -> Dict[str, Any]:
+    """백그라운드 작업 취소 요청 (요청자 본인 또는 관리자)"""
+    status = job_runner.get_status(job_id, include_history=False)
+    if status is None:
+        return {'success': False, 'message': '작업을 찾을 수 없습니다.'}
+    if status.get('created_by') and status['created_by'] != user_id and not _get_admin_user(user_id):
+        return {'success': False, 'message': '취소 권한이 없습니다.'}
+    if not job_runner.cancel(job_id):
+        return {'success': False, 'message': '이미 종료된 작업입니다.'}
+    return {'success': True, 'message': '취소 요청되었습니다.'}
+
+
+@expose
+def admin_get_job_history(limit: int = 50, admin_id: str = '') -> Dict[str, Any]:
+    """백그라운드 작업 이력 + 현재 실행 현황 (관리자)"""
+    if not _get_admin_user(admin_id):
+        return {'success': False, 'message': '관리자 권한이 필요합니다.'}
+    return {
+        'success': True,
+        'active': [j for j in job_runner.list_jobs() if j['status'] in ('queued', 'running')],
+        'history': db.get_job_history(int(limit or 50)),
+        'metrics': job_runner.get_metrics(),
+        # eel 요청 DB 스레드 풀 대기열 (queued가 자주 쌓이면 server.db_threads 증가 검토)
+        'dispatch': db_dispatcher.metrics(),
+        'coalesce': single_flight.metrics(),
+    }
 
-            def _cell_str(val):
-                """셀 값을 문자열로 변환 (None/숫자 안전)"""
-                if val is None:
-                    return ''
-                # xlrd가 숫자형으로 반환하는 경우 정수 변환
-                if isinstance(val, float) and val == int(val):
-                    return str(int(val))
-                return str(val).strip()
-
-            # B~I열 매핑 (실제 엑셀 형식)
-            # B(1)=계약번호, C(2)=선사, D(3)=선명, E(4)=엔진/모델
-            # F(5)=작업내용/장소, G(6)=작업자, H(7)=인원(무시), I(8)=동반자
-            contract_number = _cell_str(row_values[1]) if len(row_values) > 1 else ''
-            company         = _cell_str(row_values[2]) if len(row_values) > 2 else ''
-            ship_name       = _cell_str(row_values[3]).upper() if len(row_values) > 3 else ''
-            engine_model    = _cell_str(row_values[4]).upper() if len(row_values) > 4 else ''
-            work_content    = _cell_str(row_values[5]) if len(row_values) > 5 else ''
-            leader_raw      = _cell_str(row_values[6]) if len(row_values) > 6 else ''
-            leader          = leader_raw  # xls/xlsx 공통: 이탤릭 감지는 xlsx만 가능
-            # H열(인덱스 7): 인원 수 — 자동 계산으로 대체, 건너뜀
-            teammates       = _cell_str(row_values[8]) if len(row_values) > 8 else ''
-
-            # 유효 데이터 확인 (빈 행 제외)
-            if not any([contract_number, company, ship_name, work_content]):
-                skipped += 1
-                continue
 
-            # 인원 계산
-            manpower = calculate_record_manpower(leader, teammates)
-
-            # 날짜별 그룹핑
-            if current_date not in date_records:
-                date_records[current_date] = []
-
-            record = WorkRecord(
-                date=current_date,
-                record_number=len(date_records[current_date]) + 1,
-                contract_number=contract_number,
-                company=company,
-                ship_name=ship_name,
-                engine_model=engine_model,
-                work_content=work_content,
-                location='',
-                leader=leader,
-                teammates=teammates,
-                manpower=manpower
-            )
-            date_records[current_date].append(record)
-            total_records += 1
-
-        # DB에 날짜별로 저장
-        saved_dates = 0
-        for date_str, records in date_records.items():
-            success = db.save_work_records(date_str, records, username)
-            if success:
-                saved_dates += 1
-            else:
-                logger.error(f"날짜 {date_str} 저장 실패")
+# ============================================================================
+# 변경 알림 (롱폴링)
+# ============================================================================
 
-        logger.info(f"엑셀 불러오기 완료: {saved_dates}일, {total_records}건")
+@expose(inline=True)
+def wait_for_changes(since_seq=None, timeout: float = 25) -> Dict[str, Any]:
+    """since_seq 이후 데이터 변경 이벤트가 생길 때까지 대기 후 반환 (최대 timeout초).
 
-        return {
-            'success': True,
-            'total_dates': saved_dates,
-            'total_records': total_records,
-            'skipped': skipped
-        }
+    since_seq가 없으면 현재 seq만 즉시 반환한다 (구독 시작용).
+    대기 중에는 메모리의 seq를 보고, 다른 PC·클라우드 동기화의 쓰기는 DB의 데이터 세대 카운터를
+    모든 대기 클라이언트를 통틀어 2초에 한 번만 스레드 풀에서 읽어 감지한다.
+    eel 요청 처리 greenlet을 막지 않도록 gevent.sleep으로 양보한다.
+    """
+    def read_generation():
+        return run_blocking(db.get_data_generation)
 
+    try:
+        if since_seq is None or since_seq == 'null':
+            change_bus.check_external(db.db_path, read_generation, min_interval=0)
+            return {'success': True, 'seq': change_bus.latest_seq, 'events': []}
+        since_seq = int(since_seq)
+        deadline = time.monotonic() + max(0.0, min(float(timeout or 0), 60.0))
+        while True:
+            change_bus.check_external(db.db_path, read_generation)
+            result = change_bus.since(since_seq)
+            if result['events'] or time.monotonic() >= deadline:
+                return {'success': True, **result}
+            gevent.sleep(0.25)
     except Exception as e:
-        logger.error(f"엑셀 불러오기 오류: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return {
-            'success': False,
-            'message': '엑셀 불러오기 실패 — 파일 형식을 확인하세요.'
-        }
+        logger.error(f"변경 알림 대기 오류: {e}")
+        return {'success': False, 'seq': since_seq, 'events': []}
 
 
 # ============================================================================
 # 업데이트
 # ============================================================================
 
-@eel.expose
+@expose(inline=True)
 def get_startup_patch_result() -> Dict[str, Any]:
     """앱 시작 시 자동 적용된 패치 결과 반환 (로그인 후 JS에서 호출)"""
     try:
@@ -4313,7 +4493,45 @@ def get_startup_patch_result() -> Dict[str, Any]:
         return {'needs_restart': False, 'applied_count': 0, 'current_version': config.version}
 
 
-@eel.expose
+@expose(inline=True)
+def report_startup_ready(page_ms: float = None) -> Dict[str, Any]:
+    """스플래시 첫 화면 표시 시 호출 — 시작 타임라인을 마감해 logs/startup.log에 기록하고 반환"""
+    try:
+        from ..utils.startup_trace import startup_trace
+        first = not startup_trace.finished
+        startup_trace.mark('first_page')
+        budget_ms = float(config.get('startup.budget_ms', 3000))
+        timeline = startup_trace.finish(version=config.version, page_ms=page_ms, budget_ms=budget_ms)
+        if first:
+            phases = ', '.join(f"{p['name']}={p['ms']:.0f}" for p in timeline['phases'])
+            first_page = timeline['marks'].get('first_page', timeline['total_ms'])
+            if first_page > budget_ms:
+                logger.warning(f"시작 시간 예산 초과: 첫 화면 {first_page:.0f}ms > {budget_ms:.0f}ms ({phases})")
+            else:
+                logger.info(f"시작 타임라인: 첫 화면 {first_page:.0f}ms ({phases})")
+        return {'success': True, 'budget_ms': budget_ms, **timeline}
+    except Exception as e:
+        logger.error(f"시작 타임라인 기록 오류: {e}")
+        return {'success': False, 'phases': [], 'marks': {}}
+
+
+@expose(inline=True)
+def get_staged_update() -> Dict[str, Any]:
+    """백그라운드에서 받아 둔(다음 시작 시 적용될) 패치 정보 반환 — 네트워크 호출 없음"""
+    try:
+        result = update_manager.last_stage_result or {}
+        return {
+            'success': True,
+            'staged_count': result.get('staged_count', 0),
+            'versions': result.get('versions', []),
+            'checked_at': result.get('checked_at', ''),
+        }
+    except Exception as e:
+        logger.error(f"준비된 패치 조회 오류: {e}")
+        return {'success': False, 'staged_count': 0, 'versions': []}
+
+
+@expose
 def check_for_updates(force: bool = False) -> Dict[str, Any]:
     """업데이트 확인"""
     try:
@@ -4327,12 +4545,12 @@ def check_for_updates(force: bool = False) -> Dict[str, Any]:
         }
 
 
-@eel.expose
+@expose
 def download_and_apply_patches() -> Dict[str, Any]:
-    """패치 ZIP 다운로드 및 적용"""
+    """패치 ZIP 다운로드 및 적용 (백그라운드 작업 → job_id 반환)"""
     try:
-        result = update_manager.download_and_apply_patches()
-        return result
+        return _submit_job('download_patches', update_manager.download_and_apply_patches,
+                           unique=True)
     except Exception as e:
         logger.error(f"패치 적용 오류: {e}")
         return {
@@ -4341,9 +4559,9 @@ def download_and_apply_patches() -> Dict[str, Any]:
         }
 
 
-@eel.expose
+@expose(inline=True)
 def restart_app_after_update() -> Dict[str, Any]:
-    """수동 패치 적용 후 앱을 재시작."""
+    """수동 패치 적용 후 앱을 재시작 (준비된 패치는 재시작 시 main.py가 적용)."""
     try:
         import os
         import subprocess
@@ -4363,7 +4581,7 @@ def restart_app_after_update() -> Dict[str, Any]:
         return {'success': False, 'message': '재시작 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def get_release_notes_for_version(version_tag: str) -> Dict[str, Any]:
     """특정 버전의 릴리즈 노트 조회"""
     try:
@@ -4427,7 +4645,7 @@ def _extract_compact_patch_note_lines(body: str) -> List[str]:
     return summary_lines
 
 
-@eel.expose
+@expose
 def get_compact_patch_notes(from_version: str, to_version: str = '') -> Dict[str, Any]:
     """버전 범위의 릴리즈 노트를 간략 요약으로 반환"""
     try:
@@ -4514,7 +4732,7 @@ def get_compact_patch_notes(from_version: str, to_version: str = '') -> Dict[str
 # 공휴일 데이터
 # ============================================================================
 
-@eel.expose
+@expose
 def get_holidays() -> Dict[str, str]:
     """공휴일 데이터 로드 (config/holidays.json)"""
     try:
@@ -4528,11 +4746,11 @@ def get_holidays() -> Dict[str, str]:
         return {}
 
 
-@eel.expose
+@expose
 def refresh_holidays(service_key: str, admin_id: str = '') -> Dict[str, Any]:
     """공공데이터포털 API로 공휴일 갱신 (관리자)"""
     try:
-        user = auth_manager.get_user(admin_id) if admin_id else None
+        user = auth_manager.get_principal(admin_id)
         if not user or user.get('role') != 'admin':
             return {'success': False, 'message': '관리자 권한 필요'}
 
@@ -4564,7 +4782,7 @@ def refresh_holidays(service_key: str, admin_id: str = '') -> Dict[str, Any]:
 # 텔레그램 알림 설정
 # ============================================================================
 
-@eel.expose
+@expose
 def generate_telegram_link_code(user_id: str) -> Dict[str, Any]:
     """텔레그램 연결 코드 생성"""
     try:
@@ -4588,7 +4806,7 @@ def generate_telegram_link_code(user_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def unlink_telegram(user_id: str) -> Dict[str, Any]:
     """텔레그램 연결 해제"""
     try:
@@ -4599,7 +4817,7 @@ def unlink_telegram(user_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def get_telegram_status(user_id: str) -> Dict[str, Any]:
     """텔레그램 연결 상태 조회"""
     try:
@@ -4609,7 +4827,7 @@ def get_telegram_status(user_id: str) -> Dict[str, Any]:
         return {'linked': False}
 
 
-@eel.expose
+@expose
 def get_user_tray_mode(user_id: str) -> Dict[str, Any]:
     """사용자 트레이 모드 설정 조회"""
     try:
@@ -4619,7 +4837,7 @@ def get_user_tray_mode(user_id: str) -> Dict[str, Any]:
         return {'success': False}
 
 
-@eel.expose
+@expose
 def save_user_tray_mode(user_id: str, enabled: bool) -> Dict[str, Any]:
     """사용자 트레이 모드 설정 저장 + Python 전역 동기화"""
     try:
@@ -4636,7 +4854,7 @@ def save_user_tray_mode(user_id: str, enabled: bool) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(coalesce=True)
 def get_all_leave_monthly_report(year: int) -> Dict[str, Any]:
     """모든 직원의 연차 월별 현황 조회 (연차 월별 보고 탭)"""
     try:
@@ -4647,7 +4865,7 @@ def get_all_leave_monthly_report(year: int) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def save_employee_leave_order(names_json: str) -> Dict[str, Any]:
     """직원 연차 보고 표시 순서 저장 (app_settings)"""
     try:
@@ -4662,7 +4880,7 @@ def save_employee_leave_order(names_json: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def get_employee_leave_order() -> Dict[str, Any]:
     """저장된 직원 연차 보고 순서 반환"""
     try:
@@ -4676,7 +4894,7 @@ def get_employee_leave_order() -> Dict[str, Any]:
         return {'success': True, 'order': None}
 
 
-@eel.expose
+@expose
 def set_employee_leave_excluded(names_json: str) -> Dict[str, Any]:
     """직원 연차 보고 제외 목록 저장 (app_settings)"""
     try:
@@ -4691,7 +4909,7 @@ def set_employee_leave_excluded(names_json: str) -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def get_employee_leave_excluded() -> Dict[str, Any]:
     """제외된 직원 이름 목록 반환 (JSON 배열 문자열)"""
     try:
@@ -4705,15 +4923,11 @@ def get_employee_leave_excluded() -> Dict[str, Any]:
         return {'success': True, 'excluded': '[]'}
 
 
-@eel.expose
+@expose
 def set_leave_report_edit(user_id: str, enabled: bool, admin_id: str) -> Dict[str, Any]:
     """연차 월별 보고 편집 권한 설정 (관리자 전용)"""
     try:
-        with auth_manager.get_connection() as conn:
-            row = conn.execute(
-                'SELECT role FROM auth_users WHERE user_id = ?', (admin_id,)
-            ).fetchone()
-        if not row or row['role'] != 'admin':
+        if not auth_manager.is_admin(admin_id):
             return {'success': False, 'message': '관리자 권한 필요'}
         ok = auth_manager.set_leave_report_edit(user_id, bool(enabled))
         if not ok:
@@ -4724,15 +4938,11 @@ def set_leave_report_edit(user_id: str, enabled: bool, admin_id: str) -> Dict[st
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_set_write_permission(user_id: str, enabled: bool, admin_id: str) -> Dict[str, Any]:
     """일일 작업 쓰기 권한 부여/해제 (관리자 전용)"""
     try:
-        with auth_manager.get_connection() as conn:
-            row = conn.execute(
-                'SELECT role FROM auth_users WHERE user_id = ?', (admin_id,)
-            ).fetchone()
-        if not row or row['role'] != 'admin':
+        if not auth_manager.is_admin(admin_id):
             return {'success': False, 'message': '관리자 권한 필요'}
         ok = auth_manager.set_can_write(user_id, bool(enabled))
         if not ok:
@@ -4745,15 +4955,11 @@ def admin_set_write_permission(user_id: str, enabled: bool, admin_id: str) -> Di
         return {'success': False, 'message': '쓰기 권한 설정 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def admin_set_erp_input(user_id: str, enabled: bool, admin_id: str) -> Dict[str, Any]:
     """ERP 입력 자동화 권한 부여/해제 (관리자 전용)"""
     try:
-        with auth_manager.get_connection() as conn:
-            row = conn.execute(
-                'SELECT role FROM auth_users WHERE user_id = ?', (admin_id,)
-            ).fetchone()
-        if not row or row['role'] != 'admin':
+        if not auth_manager.is_admin(admin_id):
             return {'success': False, 'message': '관리자 권한 필요'}
         ok = auth_manager.set_erp_input(user_id, bool(enabled))
         if not ok:
@@ -4771,14 +4977,9 @@ def _check_erp_permission(user_id: str) -> Optional[str]:
     통과하면 None 반환, 실패하면 오류 메시지 문자열 반환.
     erp_input 컬럼이 없는 구버전 DB도 안전하게 처리."""
     try:
-        with auth_manager.get_connection() as conn:
-            row = conn.execute(
-                'SELECT * FROM auth_users WHERE user_id = ? AND status = ?',
-                (user_id, 'active')
-            ).fetchone()
-        if not row:
+        user = auth_manager.get_principal(user_id)
+        if not user or user.get('status') != 'active':
             return '유효하지 않은 사용자입니다.'
-        user = dict(row)
         if user.get('role') == 'admin':
             return None  # admin 무조건 허용
         if not bool(user.get('erp_input', 0)):
@@ -4789,9 +4990,11 @@ def _check_erp_permission(user_id: str) -> Optional[str]:
         return '권한 검증 중 오류가 발생했습니다.'
 
 
-@eel.expose
-def get_records_for_erp(start_date: str, end_date: str, user_id: str) -> Dict[str, Any]:
-    """날짜 범위 내 작업 레코드를 날짜별로 그룹화하여 반환 (ERP 입력용)"""
+@expose(coalesce=True)
+def get_records_for_erp(start_date: str, end_date: str, user_id: str,
+                        columnar: bool = False) -> Dict[str, Any]:
+    """날짜 범위 내 작업 레코드를 날짜별로 그룹화하여 반환 (ERP 입력용)
+    columnar=True이면 날짜별 그룹 대신 date 컬럼을 포함한 컬럼형 records를 반환"""
     try:
         err = _check_erp_permission(user_id)
         if err:
@@ -4811,6 +5014,16 @@ def get_records_for_erp(start_date: str, end_date: str, user_id: str) -> Dict[st
                 ORDER BY date ASC, record_number ASC
             ''', (start_date, end_date)).fetchall()
 
+        if columnar:
+            return {'success': True, 'records': encode_columnar([{
+                'date': row['date'],
+                'recordNumber': row['record_number'],
+                'contractNumber': row['contract_number'] or '',
+                'workContent': row['work_content'] or '',
+                'leader': row['leader'] or '',
+                'teammates': row['teammates'] or '',
+            } for row in rows])}
+
         # 날짜별 그룹핑
         from collections import defaultdict
         grouped: dict = defaultdict(list)
@@ -4830,9 +5043,10 @@ def get_records_for_erp(start_date: str, end_date: str, user_id: str) -> Dict[st
         return {'success': False, 'message': '레코드 조회 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def start_erp_macro(records_json: str, user_id: str) -> Dict[str, Any]:
     """백그라운드 스레드에서 ERP 매크로 시작"""
+    from ..utils.erp_macro import erp_macro
     try:
         import json as _json
         err = _check_erp_permission(user_id)
@@ -4850,9 +5064,10 @@ def start_erp_macro(records_json: str, user_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': 'ERP 매크로 시작 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def stop_erp_macro(user_id: str) -> Dict[str, Any]:
     """실행 중인 ERP 매크로 중단"""
+    from ..utils.erp_macro import erp_macro
     try:
         err = _check_erp_permission(user_id)
         if err:
@@ -4865,7 +5080,7 @@ def stop_erp_macro(user_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': 'ERP 매크로 중단 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def install_erp_deps(user_id: str) -> Dict[str, Any]:
     """pyautogui, pywin32, pyperclip 자동 설치 (ERP 권한 필요)"""
     try:
@@ -4905,7 +5120,7 @@ def _find_browser() -> str:
     return ''
 
 
-@eel.expose
+@expose(inline=True)
 def open_erp_input_window(dates_json: str, user_id: str = '') -> Dict[str, Any]:
     """ERP 입력 팝업 창 열기 (Chrome --app 모드)"""
     global _erp_popup_context
@@ -4942,15 +5157,16 @@ def open_erp_input_window(dates_json: str, user_id: str = '') -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def get_erp_popup_context() -> Dict[str, Any]:
     """팝업 창 로드 시 날짜/레코드 정보 반환"""
     return {'success': True, **_erp_popup_context}
 
 
-@eel.expose
+@expose(inline=True)
 def start_erp_macro_inline(user_id: str = '') -> Dict[str, Any]:
     """팝업 [입력 시작] 클릭 → 캐시된 dates_records로 매크로 실행"""
+    from ..utils.erp_macro import erp_macro
     try:
         err = _check_erp_permission(user_id)
         if err:
@@ -4973,7 +5189,7 @@ def start_erp_macro_inline(user_id: str = '') -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def get_window_list() -> Dict[str, Any]:
     """현재 열린 가시 창 목록 반환 [{hwnd, title}]"""
     try:
@@ -4991,9 +5207,10 @@ def get_window_list() -> Dict[str, Any]:
         return {'success': False, 'windows': [], 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def set_erp_target_hwnd(hwnd: int, user_id: str = '') -> Dict[str, Any]:
     """사용자가 선택한 창 HWND를 ERPMacro에 지정"""
+    from ..utils.erp_macro import erp_macro
     try:
         err = _check_erp_permission(user_id)
         if err:
@@ -5005,9 +5222,10 @@ def set_erp_target_hwnd(hwnd: int, user_id: str = '') -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose(inline=True)
 def get_erp_macro_status(user_id: str) -> Dict[str, Any]:
     """매크로 진행 상태 조회"""
+    from ..utils.erp_macro import erp_macro
     try:
         err = _check_erp_permission(user_id)
         if err:
@@ -5020,9 +5238,10 @@ def get_erp_macro_status(user_id: str) -> Dict[str, Any]:
         return {'success': False, 'message': '상태 조회 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def diagnose_erp_controls(user_id: str = '') -> Dict[str, Any]:
     """ERP 창의 자식 컨트롤 목록 반환 (달력 컨트롤 탐색 진단용)"""
+    from ..utils.erp_macro import erp_macro
     try:
         err = _check_erp_permission(user_id)
         if err:
@@ -5079,7 +5298,7 @@ def diagnose_erp_controls(user_id: str = '') -> Dict[str, Any]:
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def get_telegram_bot_enabled() -> Dict[str, Any]:
     """텔레그램 봇 활성화 상태 조회"""
     try:
@@ -5103,7 +5322,7 @@ def get_telegram_bot_enabled() -> Dict[str, Any]:
         return {'success': False, 'enabled': False, 'hasToken': False}
 
 
-@eel.expose
+@expose
 def admin_save_telegram_settings(bot_token: str, enabled: bool, admin_id: str) -> Dict[str, Any]:
     """텔레그램 봇 설정 저장 (관리자)"""
     try:
@@ -5144,7 +5363,7 @@ def admin_save_telegram_settings(bot_token: str, enabled: bool, admin_id: str) -
         return {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'}
 
 
-@eel.expose
+@expose
 def save_auto_capture_image(base64_data: str, date_str: str) -> Dict[str, Any]:
     """자동 캡처 이미지를 DB 폴더에 저장 (스케줄러 17:00 호출)"""
     try:
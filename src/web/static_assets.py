@@ -0,0 +1,96 @@
+# src/web/static_assets.py - 정적 파일 제공 (버전 URL + 장기 캐시)
+# HTML 페이지를 내려줄 때 로컬 js/·assets/ 참조에 파일 내용 해시(?v=)를 붙이고,
+# 해시가 붙은 요청에는 1년 immutable 캐시 헤더를 준다. 패치로 파일이 바뀌면 해시가 바뀌어
+# 새 URL이 되므로 캐시를 지울 필요가 없고, 바뀌지 않은 파일은 재실행 시 디스크 캐시에서 바로 읽힌다.
+# eel 기본 라우트(/eel.js, /eel 웹소켓, 그 외 경로)는 eel.start가 같은 앱에 등록한다.
+
+import hashlib
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+import bottle
+
+from ..utils.logger import logger
+
+WEB_ROOT = Path(__file__).parent.parent.parent / "web"
+
+# 버전 해시를 붙일 HTML 페이지 (eel.start가 여는 /index.html, ERP 팝업)
+_PAGES = ('index.html', 'erp_popup.html')
+# src="js/app.js?v=1.0.8" · href="/assets/app.css" 형태의 로컬 참조
+_LOCAL_REF = re.compile(r'''((?:src|href)=["'])(/?)((?:js|assets)/[^"'?#]+)(?:\?v=[^"'#]*)?(["'])''')
+
+_IMMUTABLE = 'public, max-age=31536000, immutable'
+_REVALIDATE = 'no-cache'
+
+_version_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_version_lock = threading.Lock()
+
+
+def asset_version(rel_path: str) -> str:
+    """web/ 기준 파일의 내용 해시 앞 10자리 (mtime·크기가 같으면 캐시 사용, 없으면 '')"""
+    path = WEB_ROOT / rel_path
+    try:
+        st = path.stat()
+    except OSError:
+        return ''
+    key = (st.st_mtime_ns, st.st_size)
+    with _version_lock:
+        cached = _version_cache.get(rel_path)
+        if cached and cached[0] == key:
+            return cached[1]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:10]
+    with _version_lock:
+        _version_cache[rel_path] = (key, digest)
+    return digest
+
+
+def stamp_versions(html: str) -> str:
+    """HTML의 로컬 js/·assets/ 참조에 ?v=<내용 해시> 부착 (없는 파일은 그대로)"""
+    def _replace(m):
+        prefix, slash, rel, quote = m.groups()
+        version = asset_version(rel)
+        if not version:
+            return m.group(0)
+        return f'{prefix}{slash}{rel}?v={version}{quote}'
+    return _LOCAL_REF.sub(_replace, html)
+
+
+def _serve_page(name: str, dev_mode: bool):
+    try:
+        html = (WEB_ROOT / name).read_text(encoding='utf-8')
+    except OSError:
+        return bottle.HTTPError(404, 'Not found')
+    response = bottle.HTTPResponse(stamp_versions(html))
+    response.set_header('Content-Type', 'text/html; charset=UTF-8')
+    # 페이지 자체는 항상 재검증 — 새 해시 URL을 바로 반영
+    response.set_header('Cache-Control', 'no-store' if dev_mode else _REVALIDATE)
+    return response
+
+
+def _serve_static(path: str, dev_mode: bool):
+    response = bottle.static_file(path, root=str(WEB_ROOT))
+    if dev_mode:
+        response.set_header('Cache-Control', 'no-store')
+    elif response.status_code == 200 and bottle.request.query.get('v'):
+        # ?v=가 현재 내용 해시와 같을 때만 장기 캐시 (오래된 해시로 받은 응답이 굳지 않도록)
+        rel = path.lstrip('/')
+        if bottle.request.query.get('v') == asset_version(rel):
+            response.set_header('Cache-Control', _IMMUTABLE)
+        else:
+            response.set_header('Cache-Control', _REVALIDATE)
+    else:
+        response.set_header('Cache-Control', _REVALIDATE)
+    return response
+
+
+def create_app(dev_mode: bool = False) -> bottle.Bottle:
+    """페이지·정적 파일 라우트를 등록한 bottle 앱 (eel.start(app=...)에 전달)"""
+    app = bottle.Bottle()
+    for page in _PAGES:
+        app.route(f'/{page}', callback=lambda page=page: _serve_page(page, dev_mode))
+    app.route('/js/<path:path>', callback=lambda path: _serve_static(f'js/{path}', dev_mode))
+    app.route('/assets/<path:path>', callback=lambda path: _serve_static(f'assets/{path}', dev_mode))
+    logger.info(f"정적 파일 라우트 등록 (캐시 {'비활성' if dev_mode else '버전 URL 장기 캐시'})")
+    return app
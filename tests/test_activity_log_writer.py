@@ -0,0 +1,88 @@
+from src.database.db_manager import DatabaseManager
+
+
+def test_activity_logs_are_batched_and_repeats_coalesced(tmp_path):
+    store = DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    writes = []
+    sink = store._write_activity_logs
+    store._activity_writer._sink = lambda entries, window: (writes.append(len(entries)), sink(entries, window))
+
+    for _ in range(3):
+        assert store.add_activity_log('홍길동', 'autosave', '2024-01-05', '작업 4건')
+    store.add_activity_log('홍길동', 'login')
+    assert writes == []  # submit은 DB에 쓰지 않음
+
+    store.flush_activity_logs()
+    assert writes == [2]
+    logs = {l.action: l for l in store.get_activity_logs()}
+    assert logs['autosave'].repeat_count == 3
+    assert logs['login'].repeat_count == 1
+
+    # 다음 배치의 같은 내용은 기존 행의 횟수만 증가
+    store.add_activity_log('홍길동', 'autosave', '2024-01-05', '작업 4건')
+    store.flush_activity_logs(stop=True)
+    logs = store.get_activity_logs()
+    assert len(logs) == 2
+    assert {l.action: l.repeat_count for l in logs}['autosave'] == 4
+
+
+def test_flush_pending_writes_skips_uncreated_db(tmp_path, monkeypatch):
+    import src.web.api as api
+    from src.utils.startup_trace import LazySingleton
+
+    lazy = LazySingleton(lambda: DatabaseManager(db_path=str(tmp_path / 'work.db')), 'db')
+    monkeypatch.setattr(api, 'db', lazy)
+    api.flush_pending_writes()
+    assert not lazy.initialized  # DB를 쓰지 않았으면 만들지 않음
+
+    lazy.add_activity_log('홍길동', 'save', '2024-01-05')
+    api.flush_pending_writes()
+    assert lazy._activity_writer.pending_count == 0
+    assert [l.action for l in lazy.get_activity_logs()] == ['save']
+
+
+def test_exit_cleanup_flushes_queued_logs_before_cloud_sync(tmp_path, monkeypatch):
+    import ctypes
+    import importlib
+    import importlib.util
+    import sqlite3
+    import sys
+    import types
+    import src.web.api as api
+    from src.sync.cloud_sync import CloudSync
+    from src.utils.startup_trace import LazySingleton
+
+    # src.main import 시 관리자 권한 확인·트레이 패키지 자동 설치를 건너뛰도록
+    shell32 = types.SimpleNamespace(IsUserAnAdmin=lambda: 1)
+    monkeypatch.setattr(ctypes, 'windll', types.SimpleNamespace(shell32=shell32), raising=False)
+    if importlib.util.find_spec('pystray') is None:
+        monkeypatch.setitem(sys.modules, 'pystray', types.ModuleType('pystray'))
+    if importlib.util.find_spec('PIL') is None:
+        pil = types.ModuleType('PIL')
+        pil.Image = types.ModuleType('PIL.Image')
+        monkeypatch.setitem(sys.modules, 'PIL', pil)
+        monkeypatch.setitem(sys.modules, 'PIL.Image', pil.Image)
+    main = importlib.import_module('src.main')
+
+    db_path = tmp_path / 'work.db'
+    store = LazySingleton(lambda: DatabaseManager(db_path=str(db_path)), 'db')
+    monkeypatch.setattr(api, 'db', store)
+    store.add_activity_log('홍길동', 'save', '2024-01-05')
+    assert store._activity_writer.pending_count == 1
+
+    # 종료 동기화 시점에 DB 파일에 이미 기록돼 있어야 클라우드로 함께 올라간다
+    synced = []
+
+    def sync_to_cloud():
+        with sqlite3.connect(str(db_path)) as conn:
+            synced.append([r[0] for r in conn.execute('SELECT action FROM activity_logs')])
+        return True
+
+    monkeypatch.setattr(CloudSync, 'sync_mode', property(lambda self: 'company'))
+    monkeypatch.setattr(main.cloud_sync, 'enabled', True)
+    monkeypatch.setattr(main.cloud_sync, 'sync_to_cloud', sync_to_cloud)
+    monkeypatch.setattr(main.os, '_exit', lambda code=0: (_ for _ in ()).throw(SystemExit(code)))
+
+    main._do_full_cleanup()
+
+    assert synced == [['save']]
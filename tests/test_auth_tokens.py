@@ -0,0 +1,48 @@
+import json
+from datetime import datetime, timedelta
+
+from src.database.auth_manager import AuthManager
+
+
+def _store(tmp_path):
+    return AuthManager(db_path=str(tmp_path / 'auth.db'), token_db_path=str(tmp_path / 'data' / 'auth_tokens.db'))
+
+
+def test_remember_token_roundtrip_and_logout(tmp_path):
+    store = _store(tmp_path)
+    token = store.create_remember_token('ha_admin')
+
+    user = store.validate_remember_token(token)
+    assert user['user_id'] == 'ha_admin' and user['can_write']
+    assert store.get_token_days_remaining(token) >= 29
+    assert store.validate_remember_token('unknown') is None
+
+    store.clear_remember_token(token)
+    assert store.validate_remember_token(token) is None
+    assert store.get_token_days_remaining(token) == 0
+
+
+def test_legacy_token_file_is_migrated_and_expired_tokens_swept(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    now = datetime.now()
+    valid_hash = AuthManager._token_hash('valid-token')
+    (data_dir / 'remember_tokens.json').write_text(json.dumps({
+        valid_hash: {'user_id': 'ha_admin', 'created_at': now.isoformat(),
+                     'expires_at': (now + timedelta(days=3)).isoformat(), 'is_active': True},
+        AuthManager._token_hash('old-token'): {'user_id': 'ha_admin', 'created_at': now.isoformat(),
+                                              'expires_at': (now - timedelta(days=1)).isoformat(),
+                                              'is_active': True},
+    }), encoding='utf-8')
+
+    store = _store(tmp_path)
+    assert not (data_dir / 'remember_tokens.json').exists()
+    assert store.validate_remember_token('valid-token')['user_id'] == 'ha_admin'
+    assert store.validate_remember_token('old-token') is None
+
+    # 만료 시각이 지난 토큰은 정리 대상
+    with store._token_connection(attach_auth=False) as conn:
+        conn.execute('UPDATE auth_tokens SET expires_at = ?', ((now - timedelta(seconds=1)).isoformat(),))
+    assert store.sweep_expired_tokens(force=True) == 1
+    with store._token_connection(attach_auth=False) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM auth_tokens').fetchone()[0] == 0
@@ -0,0 +1,59 @@
+from src.utils.change_bus import ChangeBus, TOPIC_ALL
+
+
+def test_since_returns_events_after_seq():
+    bus = ChangeBus()
+    start = bus.latest_seq
+    bus.publish('comments', 'cn:C-1')
+    bus.publish('work_records', '2024-01-05:day')
+
+    result = bus.since(start)
+
+    assert result['seq'] == start + 2
+    assert [(e['topic'], e['key']) for e in result['events']] == [
+        ('comments', 'cn:C-1'), ('work_records', '2024-01-05:day')
+    ]
+    assert bus.since(result['seq'])['events'] == []
+
+
+def test_since_falls_back_to_all_when_client_is_out_of_range():
+    bus = ChangeBus(max_events=2)
+    for i in range(5):
+        bus.publish('board', f'bp:{i}')
+
+    assert [e['topic'] for e in bus.since(0)['events']] == [TOPIC_ALL]
+    # 앱 재시작 등으로 클라이언트 seq가 서버보다 큰 경우
+    assert [e['topic'] for e in bus.since(99)['events']] == [TOPIC_ALL]
+    assert len(bus.since(3)['events']) == 2
+
+
+def test_external_generation_change_publishes_all(tmp_path):
+    import sqlite3
+    from src.database.db_manager import DatabaseManager
+
+    store = DatabaseManager(str(tmp_path / 'work.db'))
+    bus = ChangeBus()
+    assert not bus.check_external(store.db_path, store.get_data_generation, min_interval=0)  # 처음은 기준만 기록
+    start = bus.latest_seq
+
+    # 관리용 테이블 쓰기는 카운터를 올리지 않음
+    before = store.get_data_generation()
+    store.set_setting('some.key', '1')
+    assert store.get_data_generation() == before
+
+    # 이 프로세스의 데이터 커밋은 외부 변경으로 보지 않음
+    with store.get_connection() as conn:
+        conn.execute("INSERT INTO project_status (contract_number, status) VALUES ('C-1', '착수')")
+    assert store.get_data_generation() == before + 1
+    bus.note_local_generation(store.db_path, store.get_data_generation())
+    assert not bus.check_external(store.db_path, store.get_data_generation, min_interval=0)
+
+    # 다른 PC가 공유 DB에 데이터를 씀
+    other = sqlite3.connect(str(store.db_path))
+    other.execute("UPDATE project_status SET status = '준공' WHERE contract_number = 'C-1'")
+    other.commit()
+    other.close()
+    assert not bus.check_external(store.db_path, store.get_data_generation, min_interval=60)  # 확인 간격 내에는 읽지 않음
+    assert bus.check_external(store.db_path, store.get_data_generation, min_interval=0)
+    assert [e['topic'] for e in bus.since(start)['events']] == [TOPIC_ALL]
+    assert not bus.check_external(store.db_path, store.get_data_generation, min_interval=0)
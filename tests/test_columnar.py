@@ -0,0 +1,49 @@
+import json
+from datetime import date, timedelta
+
+from src.utils.columnar import encode_columnar, decode_columnar, encode_day_bitmap, decode_day_bitmap
+
+
+def test_roundtrip_restores_aliases_and_sparse_fields():
+    records = [
+        {'date': '2024-01-0%d' % (i % 3 + 1), 'contractNumber': 'C-1', 'contract_number': 'C-1',
+         'shipName': 'SHIP A', 'manpower': 1.5 + i}
+        for i in range(6)
+    ]
+    records.append({'date': '2024-01-09', 'contractNumber': 'C-2', 'contract_number': 'C-2',
+                    'shipName': 'SHIP B', 'manpower': 0.0, 'holidayLabel': '토'})
+
+    payload = encode_columnar(records, {'contract_number': 'contractNumber'})
+
+    assert 'contract_number' not in payload['fields']
+    assert payload['dicts']['shipName'] == ['SHIP A', 'SHIP B']
+    assert 'manpower' not in payload['dicts']
+    assert payload['sparse'] == {'holidayLabel': [0, 1, 2, 3, 4, 5]}
+    assert decode_columnar(payload) == records
+
+
+def test_roundtrip_keeps_explicit_none_apart_from_missing_keys():
+    records = [{'date': '2024-01-01', 'endTime': None, 'note': 'a'},
+               {'date': '2024-01-02', 'endTime': '18:00'},
+               {'date': '2024-01-03', 'note': None}]
+    payload = encode_columnar(records)
+    assert payload['sparse'] == {'endTime': [2], 'note': [1]}
+    assert decode_columnar(payload) == records
+
+
+def test_columnar_payload_is_smaller_for_repetitive_rows():
+    records = [{'company': 'OWNER CO', 'shipName': 'SHIP A', 'ship_name': 'SHIP A',
+                'recordNumber': i} for i in range(200)]
+    payload = encode_columnar(records, {'ship_name': 'shipName'})
+    assert len(json.dumps(payload)) * 3 < len(json.dumps(records))
+    assert decode_columnar([1, 2]) == [1, 2]
+
+
+def test_day_bitmap_roundtrip_is_compact_for_a_full_year():
+    origin = date(2024, 1, 1)
+    dates = [(origin + timedelta(days=i)).isoformat() for i in range(3, 366, 2)]
+    offset, bitmap = encode_day_bitmap(dates + ['bad-date'], origin)
+    assert offset == 3
+    assert decode_day_bitmap(offset, bitmap, origin) == dates
+    assert len(bitmap) < len(json.dumps(dates)) / 20
+    assert encode_day_bitmap([], origin) == (0, '')
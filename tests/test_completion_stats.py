@@ -0,0 +1,45 @@
+from datetime import date, timedelta
+
+from src.business.completion_stats import CompletionStats, engine_key, work_key, percentile
+from src.business.project_status import ProjectStatusResolver
+from src.database.db_manager import DatabaseManager
+
+
+def test_keys_and_percentile():
+    assert engine_key('6S50MC-C') == engine_key('6s50 mcc') == '6S50MCC'
+    assert work_key('M/E 오버홀 #2') == work_key('ME 오버홀') == 'ME오버홀'
+    assert percentile([10, 20, 30, 40, 50], 0.5) == 30
+    assert percentile([10, 20, 30, 40, 50], 0.8) == 42
+
+
+def test_stats_from_milestones_and_finished_contracts_refresh_incrementally(tmp_path):
+    store = DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    for i, days in enumerate([10, 12, 14, 30]):
+        pid = store.create_board_project({'contract_number': f'B-{i}', 'engine_model': '6S50MC-C',
+                                          'work_content': 'M/E 오버홀'})
+        start = date(2024, 1, 1)
+        store.update_board_project(pid, {'target_start_date': start.isoformat(),
+                                         'actual_end_date': (start + timedelta(days=days)).isoformat()})
+    # 보드 마일스톤이 없는 준공 계약 (작업 기간 20일)
+    with store.get_connection() as conn:
+        for d in ('2024-02-01', '2024-02-21'):
+            conn.execute("INSERT INTO work_records (date, record_number, contract_number, engine_model, "
+                         "work_content, work_type) VALUES (?, 1, 'R-1', '6S50MCC', '발전기 점검', 'day')", (d,))
+
+    stats = CompletionStats(store, ProjectStatusResolver(store))
+    assert stats.refresh() > 0
+    result = stats.estimate('6s50 mcc', 'ME 오버홀 #1')
+    assert result == {'basis': '모델+작업', 'sampleCount': 4, 'medianDays': 13, 'p80Days': 20}
+    assert stats.estimate('6S50MC-C', '기타')['sampleCount'] == 5  # 엔진 모델 기준으로 확장
+    assert stats.estimate('', '발전기 점검') == {'basis': '작업 내용', 'sampleCount': 1,
+                                                'medianDays': 20, 'p80Days': 20}
+    assert stats.estimate('UNKNOWN', '') is None
+
+    # 변경 없으면 재계산 없음, 표본 하나가 바뀌면 관련 키만 재계산
+    assert stats.refresh() == 0
+    store.update_board_project(1, {'actual_end_date': '2024-01-31'})
+    # 조회는 통계 테이블만 읽음 — 직전 갱신 직후라 백그라운드 갱신도 요청하지 않음
+    assert stats.estimate('6S50MC-C', 'M/E 오버홀')['medianDays'] == 13
+    assert not stats.request_refresh()
+    assert stats.refresh() == 3
+    assert stats.estimate('6S50MC-C', 'M/E 오버홀')['medianDays'] == 22
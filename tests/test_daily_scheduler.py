@@ -0,0 +1,60 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from src.utils.daily_scheduler import DailyScheduler, ScheduledJob, parse_weekdays
+
+
+class _SettingsStore:
+    def __init__(self):
+        self.values = {}
+
+    def get_setting(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set_setting(self, key, value):
+        self.values[key] = value
+        return True
+
+
+def test_parse_weekdays_supports_cron_like_rules():
+    assert parse_weekdays('*') == frozenset(range(1, 8))
+    assert parse_weekdays('mon-fri') == parse_weekdays('1-5') == frozenset({1, 2, 3, 4, 5})
+    assert parse_weekdays('fri,0') == frozenset({5, 7})
+    assert parse_weekdays('sat-mon') == frozenset({6, 7, 1})
+
+
+def test_next_after_skips_days_outside_rule():
+    job = ScheduledJob('summary', '9:30', '1-5', lambda date: None)
+    friday_evening = datetime(2024, 1, 5, 18, 0)
+    assert job.next_after(friday_evening) == datetime(2024, 1, 8, 9, 30)
+    assert job.last_at_or_before(datetime(2024, 1, 7, 12, 0)) == datetime(2024, 1, 5, 9, 30)
+
+
+def test_missed_run_is_caught_up_once_and_recorded():
+    store = _SettingsStore()
+    ran = threading.Event()
+    dates = []
+    due = datetime.now() - timedelta(minutes=30)
+    job = ScheduledJob('backup', due.strftime('%H:%M'), '*',
+                       lambda date: (dates.append(date), ran.set()), catch_up_sec=3600)
+
+    scheduler = DailyScheduler(store=store)
+    scheduler.start(jobs=[job])
+    try:
+        assert ran.wait(3)
+        time.sleep(0.1)
+        assert dates == [due.strftime('%Y-%m-%d')]
+        assert store.values['scheduler.last_run.backup'] == due.strftime('%Y-%m-%dT%H:%M')
+        # 다음 회차는 내일로 예약
+        assert scheduler.get_schedule()[0]['next_run'] == (due + timedelta(days=1)).strftime('%Y-%m-%dT%H:%M')
+    finally:
+        scheduler.stop()
+
+    # 재시작해도 이미 실행한 회차는 다시 실행하지 않는다
+    again = DailyScheduler(store=store)
+    again.start(jobs=[job])
+    try:
+        assert again.get_schedule()[0]['next_run'] == (due + timedelta(days=1)).strftime('%Y-%m-%dT%H:%M')
+    finally:
+        again.stop()
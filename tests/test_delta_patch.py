@@ -0,0 +1,60 @@
+import json
+
+from src.utils.delta_patch import DELTA_SUFFIX, apply_delta, make_delta, sha256_bytes
+from src.utils.patch_system import PatchSystem
+
+
+BASE = b''.join(f'line {i}\r\n'.encode() for i in range(2000))
+TARGET = BASE.replace(b'line 10\r\n', b'line 10 changed\r\n').replace(b'line 1500\r\n', b'') + b'tail\r\n'
+
+
+def test_delta_roundtrip_is_small():
+    delta = make_delta(BASE, TARGET)
+    assert apply_delta(BASE, delta) == TARGET
+    assert len(delta) < 100
+    assert apply_delta(b'', make_delta(b'', b'new file')) == b'new file'
+
+
+def _patch_system(tmp_path) -> PatchSystem:
+    ps = PatchSystem()
+    ps.current_version = "1.1.0"
+    ps.app_root = tmp_path
+    ps.patches_dir = tmp_path / "patches"
+    ps.applied_patches_file = tmp_path / "data" / "applied_patches.json"
+    ps.patches_dir.mkdir(parents=True)
+    ps.applied_patches_file.parent.mkdir(parents=True)
+    ps._sync_config_version = lambda new_ver: None  # type: ignore[assignment]
+    return ps
+
+
+def _write_delta_patch(ps: PatchSystem, base: bytes) -> dict:
+    patch_dir = ps.patches_dir / "patch_v1.1.1"
+    (patch_dir / "src").mkdir(parents=True)
+    (patch_dir / "src" / ("app.py" + DELTA_SUFFIX)).write_bytes(make_delta(base, TARGET))
+    info = {"id": "patch_v1.1.1", "version": "1.1.1", "files": [{
+        "source": "src/app.py" + DELTA_SUFFIX, "target": "src/app.py", "type": "delta",
+        "base_sha256": sha256_bytes(base), "sha256": sha256_bytes(TARGET)}]}
+    (patch_dir / "patch.json").write_text(json.dumps(info), encoding="utf-8")
+    return dict(info, path=patch_dir)
+
+
+def test_apply_patch_applies_delta_after_hash_checks(tmp_path):
+    ps = _patch_system(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_bytes(BASE)
+
+    assert ps.apply_patch(_write_delta_patch(ps, BASE))
+    assert (tmp_path / "src" / "app.py").read_bytes() == TARGET
+    assert ps.get_applied_patches() == ["patch_v1.1.1"]
+
+
+def test_apply_patch_refuses_delta_on_modified_base(tmp_path):
+    ps = _patch_system(tmp_path)
+    (tmp_path / "src").mkdir()
+    modified = BASE + b'local edit\r\n'
+    (tmp_path / "src" / "app.py").write_bytes(modified)
+
+    assert not ps.apply_patch(_write_delta_patch(ps, BASE))
+    assert (tmp_path / "src" / "app.py").read_bytes() == modified
+    assert ps.needs_full_patch == {"patch_v1.1.1"}
+    assert ps.get_applied_patches() == []
@@ -0,0 +1,83 @@
+import sqlite3
+
+from src.database import db_manager
+from src.database.db_manager import DatabaseManager
+from src.utils.error_fingerprint import error_fingerprint
+
+_STACK = '''TypeError: Cannot read properties of undefined (reading 'ship')
+    at renderRow (http://localhost:8000/js/app.js?v={v}:{line}:17)
+    at async loadRecords (http://localhost:8000/js/app.js?v={v}:900:5)'''
+
+
+def test_fingerprint_ignores_ids_and_line_numbers():
+    a = error_fingerprint('js_runtime', 'record 12 not found', _STACK.format(v='aaa', line=120))
+    b = error_fingerprint('js_runtime', 'record 345 not found', _STACK.format(v='bbb', line=133))
+    c = error_fingerprint('js_runtime', 'record 12 not found', _STACK.replace('renderRow', 'renderCell'))
+    assert a == b
+    assert a != c
+
+
+def test_repeated_errors_are_grouped_with_bounded_samples(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_manager, '_ERROR_SAMPLES_PER_ISSUE', 3)
+    store = DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    for i in range(10):
+        store.add_error_report(f'user{i % 2}', f'사용자{i % 2}', '1.0.' + str(i % 3), 'js_runtime',
+                               f'record {i} not found', _STACK.format(v='x', line=100 + i))
+    store.add_error_report('user0', '사용자0', '1.0.0', 'python', 'KeyError: 3')
+
+    issues = {i['error_type']: i for i in store.get_error_issues()}
+    assert issues['python']['count'] == 1
+    grouped = issues['js_runtime']
+    assert grouped['count'] == 10
+    assert sorted(grouped['users']) == ['사용자0', '사용자1']
+    assert sorted(grouped['versions']) == ['1.0.0', '1.0.1', '1.0.2']
+    assert grouped['sample_message'] == 'record 9 not found'
+    assert len(store.get_error_reports()) == 4  # 묶음당 최근 3건 + 1건
+
+    assert store.mark_error_issue_read(grouped['fingerprint'])
+    assert [i['error_type'] for i in store.get_error_issues()] == ['python', 'js_runtime']  # 읽지 않은 것 먼저
+    # 다시 발생하면 읽지 않음으로
+    store.add_error_report('user1', '사용자1', '1.0.3', 'js_runtime', 'record 77 not found',
+                           _STACK.format(v='y', line=1))
+    assert sorted(i['count'] for i in store.get_error_issues() if not i['is_read']) == [1, 11]
+
+
+def test_existing_reports_are_backfilled_into_issues(tmp_path):
+    path = tmp_path / 'work.db'
+    DatabaseManager(db_path=str(path))
+    conn = sqlite3.connect(str(path))
+    conn.executemany('INSERT INTO error_reports (user_name, app_version, error_type, error_message, timestamp) '
+                     'VALUES (?, ?, ?, ?, ?)',
+                     [('홍길동', '1.0.0', 'python', f'timeout after {n}s', f'2024-01-0{n} 00:00:00')
+                      for n in range(1, 9)])
+    conn.commit()
+    conn.close()
+
+    store = DatabaseManager(db_path=str(path))
+    issues = store.get_error_issues()
+    assert len(issues) == 1
+    assert issues[0]['count'] == 8
+    assert issues[0]['first_seen'] == '2024-01-01 00:00:00'
+    assert issues[0]['last_seen'] == '2024-01-08 00:00:00'
+    assert len(store.get_error_reports()) == 5
+
+
+def test_concurrent_reports_keep_every_user(tmp_path):
+    import threading
+    store = DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    barrier = threading.Barrier(8)
+
+    def report(i):
+        barrier.wait()
+        assert store.add_error_report(f'u{i}', f'user{i}', f'1.0.{i}', 'js_runtime', 'boom', '')
+
+    threads = [threading.Thread(target=report, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    issue = store.get_error_issues()[0]
+    assert issue['count'] == 8
+    assert sorted(issue['users']) == sorted(f'user{i}' for i in range(8))
+    assert len(issue['versions']) == 8
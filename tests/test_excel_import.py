@@ -0,0 +1,33 @@
+from src.business.excel_import import iter_excel_work_records
+
+
+def test_iter_excel_work_records_groups_by_date_and_counts_skips():
+    rows = [
+        ['날짜 : 2024.01.05.'],
+        [None, '계약번호', '선사', '선명', '엔진', '작업내용', '작업자', '인원', '동반자'],
+        [None, 'C-1', 'OWNER', 'ship a', 'b&w', '정비', '대리 홍길동', 2, '박명수'],
+        [None, '', '', '', '', '', '', None, ''],
+        ['2024-01-06'],
+        [None, 'C-2', 'OWNER', 'ship b', '', '점검', '*대리 김철수*', None, ''],
+        [None, 12345.0, 'OWNER', 'ship c', '', '점검', '', None, ''],
+    ]
+    stats = {}
+
+    records = list(iter_excel_work_records(iter(rows), stats))
+
+    assert [(r.date, r.record_number) for r in records] == [
+        ('2024-01-05', 1), ('2024-01-06', 1), ('2024-01-06', 2)
+    ]
+    assert records[0].ship_name == 'SHIP A'
+    assert records[0].engine_model == 'B&W'
+    assert records[0].manpower == 2.0
+    assert records[1].manpower == 0.5
+    assert records[2].contract_number == '12345'
+    assert stats == {'rows': 7, 'skipped': 1}
+
+
+def test_iter_excel_work_records_ignores_rows_before_first_date():
+    stats = {}
+    records = list(iter_excel_work_records(iter([[None, 'C-1', 'OWNER']]), stats))
+    assert records == []
+    assert stats['skipped'] == 0
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from src.utils.job_runner import JobRunner, PRIORITY_HIGH, PRIORITY_LOW
+
+
+def _runner(**kwargs) -> JobRunner:
+    runner = JobRunner(**kwargs)
+    runner.persist_history = False
+    return runner
+
+
+def _wait_done(runner: JobRunner, job_id: str, timeout: float = 5.0) -> dict:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = runner.get_status(job_id)
+        if status['status'] not in ('queued', 'running'):
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f'job {job_id} did not finish')
+
+
+def test_submit_runs_job_and_reports_result_and_progress():
+    runner = _runner(max_workers=2)
+
+    def work(job, a, b):
+        job.update(progress=50, step='half')
+        return {'success': True, 'sum': a + b}
+
+    job = runner.submit('add', work, 1, 2)
+    status = _wait_done(runner, job.job_id)
+
+    assert status['status'] == 'completed'
+    assert status['progress'] == 100
+    assert status['data'] == {'step': 'half'}
+    assert status['result'] == {'success': True, 'sum': 3}
+    runner.shutdown()
+
+
+def test_failed_result_dict_marks_job_failed():
+    runner = _runner(max_workers=1)
+    job = runner.submit('fail', lambda job: {'success': False, 'message': 'nope'})
+    status = _wait_done(runner, job.job_id)
+    assert status['status'] == 'failed'
+    assert status['message'] == 'nope'
+    runner.shutdown()
+
+
+def test_cancel_running_job_is_cooperative():
+    runner = _runner(max_workers=1)
+    started = threading.Event()
+
+    def loop(job):
+        started.set()
+        while True:
+            job.check_cancelled()
+            time.sleep(0.01)
+
+    job = runner.submit('loop', loop)
+    assert started.wait(2)
+    assert runner.cancel(job.job_id)
+    assert _wait_done(runner, job.job_id)['status'] == 'cancelled'
+    runner.shutdown()
+
+
+def test_priority_order_and_unique_queued_jobs():
+    runner = _runner(max_workers=1)
+    gate = threading.Event()
+    order = []
+
+    runner.submit('block', lambda job: gate.wait(2))
+    low = runner.submit('low', lambda job: order.append('low'), priority=PRIORITY_LOW)
+    high = runner.submit('high', lambda job: order.append('high'), priority=PRIORITY_HIGH)
+    dup = runner.submit('low', lambda job: order.append('dup'), priority=PRIORITY_LOW, unique=True)
+    gate.set()
+
+    _wait_done(runner, low.job_id)
+    _wait_done(runner, high.job_id)
+    assert dup.job_id == low.job_id
+    assert order == ['high', 'low']
+    runner.shutdown()
+
+
+def test_job_history_keeps_only_recent_entries(tmp_path, monkeypatch):
+    from src.database import db_manager
+    store = db_manager.DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    original_get = db_manager.config.get
+    monkeypatch.setattr(db_manager.config, 'get',
+                        lambda key, default=None: 2 if key == 'jobs.history_keep' else original_get(key, default))
+
+    for i in range(4):
+        store.save_job_history({'job_id': f'job-{i}', 'name': 'backup', 'status': 'completed',
+                                'created_at': f'2024-01-0{i + 1}T00:00:00'})
+
+    assert [j['job_id'] for j in store.get_job_history()] == ['job-3', 'job-2']
+    assert store.get_job_history_entry('job-0') is None
+
+
+def test_queued_heavy_job_does_not_park_the_other_worker():
+    runner = _runner(max_workers=2)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def heavy(job):
+        started.set()
+        gate.wait(5)
+
+    first = runner.submit('import', heavy, heavy=True)
+    assert started.wait(2)
+    second = runner.submit('merge', lambda job: 'merged', heavy=True)
+    light = runner.submit('cloud_sync_after_save', lambda job: 'synced')
+
+    # heavy 작업이 하나 실행 중이어도 가벼운 작업은 다른 워커에서 바로 처리
+    assert _wait_done(runner, light.job_id, timeout=2)['status'] == 'completed'
+    assert runner.get_status(second.job_id)['status'] == 'queued'
+
+    gate.set()
+    assert _wait_done(runner, first.job_id)['status'] == 'completed'
+    assert _wait_done(runner, second.job_id)['result'] == 'merged'
+    runner.shutdown()
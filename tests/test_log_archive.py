@@ -0,0 +1,40 @@
+import sqlite3
+
+from src.database.db_manager import DatabaseManager
+
+
+def test_old_rows_move_to_yearly_archive_and_union_view_reads_them(tmp_path):
+    store = DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    with store.get_connection() as conn:
+        conn.executemany(
+            'INSERT INTO activity_logs (user, action, target, details, timestamp) VALUES (?, ?, ?, ?, ?)',
+            [('홍길동', 'save', '2022-03-01', '작업 ' * 50, '2022-03-01 09:00:00'),
+             ('홍길동', 'save', '2023-07-01', '작업 2건', '2023-07-01 09:00:00'),
+             ('김철수', 'login', '', '', '2023-08-01 09:00:00')])
+        conn.executemany(
+            'INSERT INTO error_reports (error_message, timestamp, is_read) VALUES (?, ?, ?)',
+            [('읽은 오류', '2023-01-01 00:00:00', 1), ('미확인 오류', '2023-01-02 00:00:00', 0)])
+    store.add_activity_log('홍길동', 'save', 'today', '최근')
+
+    result = store.log_archive.archive(keep_days=30)
+    assert result['success']
+    assert result['moved'] == {'activity_logs': 3, 'error_reports': 1}
+    assert store.log_archive.archive_years() == ['2023', '2022']
+
+    # 메인 DB에는 최근 로그와 미확인 오류 리포트만 남는다
+    assert [l.target for l in store.get_activity_logs()] == ['today']
+    assert [r['error_message'] for r in store.get_error_reports()] == ['미확인 오류']
+
+    # 보관 DB의 상세 내용은 압축 저장
+    raw = sqlite3.connect(str(store.log_archive.archive_path('2022')))
+    assert isinstance(raw.execute('SELECT details FROM activity_logs').fetchone()[0], bytes)
+    raw.close()
+
+    logs = store.get_activity_logs(user='홍길동', include_archive=True)
+    assert [l.target for l in logs] == ['today', '2023-07-01', '2022-03-01']
+    assert logs[2].details == '작업 ' * 50
+    reports = store.get_error_reports(include_archive=True)
+    assert [r['error_message'] for r in reports] == ['미확인 오류', '읽은 오류']
+
+    # 다시 실행해도 옮길 행이 없으면 그대로
+    assert store.log_archive.archive(keep_days=30)['moved'] == {}
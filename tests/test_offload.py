@@ -0,0 +1,78 @@
+import time
+
+import gevent
+
+from src.utils.offload import run_blocking
+
+
+def test_run_blocking_in_greenlet_keeps_loop_responsive():
+    ticks = []
+
+    def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            gevent.sleep(0.02)
+
+    start = time.monotonic()
+    worker = gevent.spawn(run_blocking, time.sleep, 0.2)
+    tick = gevent.spawn(ticker)
+    gevent.joinall([worker, tick])
+
+    # 블로킹 sleep이 OS 스레드에서 실행되는 동안 다른 greenlet이 계속 돈다
+    assert len(ticks) == 5 and ticks[-1] - start < 0.2
+    assert run_blocking(lambda a, b=0: a + b, 1, b=2) == 3
+
+
+def test_dispatcher_runs_calls_concurrently_within_pool_bound():
+    from src.utils.offload import DbDispatcher
+    dispatcher = DbDispatcher(size=2)
+    running = []
+    peak = []
+
+    def slow_query(n):
+        running.append(n)
+        peak.append(len(running))
+        time.sleep(0.1)
+        running.remove(n)
+        return n * 2
+
+    start = time.monotonic()
+    calls = [gevent.spawn(dispatcher.run, 'slow_query', slow_query, (n,), {}) for n in range(4)]
+    gevent.joinall(calls)
+
+    assert [g.value for g in calls] == [0, 2, 4, 6]
+    assert max(peak) == 2                       # 풀 크기만큼만 동시에 실행
+    assert time.monotonic() - start < 0.35      # 직렬(0.4초)보다 빠름
+    metrics = dispatcher.metrics()
+    assert metrics['completed'] == 4 and metrics['peak_depth'] == 4
+    assert metrics['queued'] == 0 and metrics['active'] == 0
+    assert metrics['slowest'][0]['name'] == 'slow_query'
+
+
+def test_single_flight_shares_concurrent_identical_calls():
+    from src.utils.change_bus import change_bus
+    from src.utils.offload import SingleFlight
+    flight = SingleFlight()
+    computed = []
+
+    def get_gantt_data(year, month):
+        computed.append((year, month))
+        gevent.sleep(0.05)
+        return {'year': year, 'month': month, 'n': len(computed)}
+
+    calls = [gevent.spawn(flight.do, 'get_gantt_data', get_gantt_data, (2026, m), {}) for m in (3, 3, 3, 4)]
+    gevent.joinall(calls)
+    assert computed == [(2026, 3), (2026, 4)]
+    assert calls[0].value is calls[1].value is calls[2].value
+
+    # 변경 이벤트 이후 호출은 진행 중인 (변경 전) 계산에 합류하지 않는다
+    first = gevent.spawn(flight.do, 'get_gantt_data', get_gantt_data, (2026, 5), {})
+    gevent.sleep(0)
+    change_bus.publish('board')
+    second = gevent.spawn(flight.do, 'get_gantt_data', get_gantt_data, (2026, 5), {})
+    gevent.joinall([first, second])
+    assert computed.count((2026, 5)) == 2
+
+    metrics = flight.metrics()
+    assert metrics['coalesced_total'] == 2 and metrics['in_flight'] == 0
+    assert metrics['by_name']['get_gantt_data'] == {'calls': 6, 'coalesced': 2}
@@ -0,0 +1,45 @@
+import hashlib
+
+from src.database.auth_manager import AuthManager, LOGIN_MAX_FAILURES
+
+
+def _store(tmp_path):
+    return AuthManager(db_path=str(tmp_path / 'auth.db'), token_db_path=str(tmp_path / 'tokens.db'))
+
+
+def _stored_hash(store, user_id):
+    with store.get_connection() as conn:
+        return conn.execute('SELECT password_hash FROM auth_users WHERE user_id = ?', (user_id,)).fetchone()[0]
+
+
+def test_hashes_are_rehashed_to_configured_cost_on_login(tmp_path, monkeypatch):
+    store = _store(tmp_path)
+    assert store.register_request('worker1', 'pw1234', '홍길동')
+    store.approve_user('worker1', 'ha_admin')
+    assert _stored_hash(store, 'worker1').startswith(f'pbkdf2${store.pbkdf2_iterations}$')
+
+    # 반복 횟수가 없는 구형 PBKDF2 형식(260000회)
+    salt = bytes(32)
+    dk = hashlib.pbkdf2_hmac('sha256', b'pw1234', salt, 260000)
+    legacy = f'pbkdf2${salt.hex()}${dk.hex()}'
+    with store.get_connection() as conn:
+        conn.execute('UPDATE auth_users SET password_hash = ? WHERE user_id = ?', (legacy, 'worker1'))
+    assert store.authenticate('worker1', 'pw1234')['user_id'] == 'worker1'
+    assert _stored_hash(store, 'worker1') == legacy   # 같은 비용이면 그대로
+
+    # 설정 비용이 바뀌면 로그인 성공 시 새 비용으로 재해시
+    monkeypatch.setattr(AuthManager, 'pbkdf2_iterations', property(lambda self: 120000))
+    assert store.authenticate('worker1', 'pw1234')['user_id'] == 'worker1'
+    assert _stored_hash(store, 'worker1').startswith('pbkdf2$120000$')
+    assert store.authenticate('worker1', 'pw1234')['user_id'] == 'worker1'
+
+
+def test_repeated_failures_lock_login(tmp_path):
+    store = _store(tmp_path)
+    for _ in range(LOGIN_MAX_FAILURES):
+        assert store.authenticate('ha_admin', 'wrong')['error'] == 'WRONG_PASSWORD'
+    locked = store.authenticate('ha_admin', '44448901')
+    assert '너무 많습니다' in locked['error']
+
+    store._reset_login_failures('ha_admin')
+    assert store.authenticate('ha_admin', '44448901')['user_id'] == 'ha_admin'
@@ -0,0 +1,30 @@
+from src.database.auth_manager import AuthManager
+
+
+def _store(tmp_path):
+    return AuthManager(db_path=str(tmp_path / 'auth.db'), token_db_path=str(tmp_path / 'tokens.db'))
+
+
+def test_permission_checks_hit_cache_and_invalidate_on_change(tmp_path):
+    store = _store(tmp_path)
+    assert store.register_request('worker1', 'pw1234', '홍길동')
+    store.approve_user('worker1', 'ha_admin')
+
+    assert store.is_admin('ha_admin')
+    assert not store.get_can_write_by_fullname('홍길동')
+    assert store.get_principal('worker1')['erp_input'] is False
+
+    # 캐시된 권한은 DB 연결 없이 응답
+    store.get_connection = None
+    assert not store.get_can_write_by_fullname('홍길동')
+    assert store.get_principal('worker1')['role'] == 'user'
+    del store.get_connection
+
+    store.set_can_write('worker1', True)
+    store.set_erp_input('worker1', True)
+    assert store.get_can_write_by_fullname('홍길동')
+    assert store.get_principal('worker1')['erp_input'] is True
+
+    store.delete_user('worker1', 'ha_admin')
+    assert store.get_principal('worker1')['status'] == 'retired'
+    assert not store.get_can_write_by_fullname('홍길동')
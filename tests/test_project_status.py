@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from src.business.project_status import ProjectStatusResolver
+from src.database.db_manager import DatabaseManager
+
+
+def test_status_priority_and_snapshot_reuse(tmp_path):
+    store = DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    store.create_board_project({'contract_number': 'C-1', 'ship_name': 'A호', 'status': '준공'})
+    store.create_board_project({'contract_number': 'C-2', 'ship_name': 'B호', 'status': '착수'})
+    store.create_board_project({'ship_name': 'C호'})
+    store.set_project_status('C-1', 'inProgress')
+
+    resolver = ProjectStatusResolver(store)
+    snap = resolver.snapshot()
+    today = datetime(2024, 6, 20)
+    assert snap.resolve('C-1', '2024-01-01', today=today) == '착수'  # 수동(구버전 값) 우선
+    assert snap.resolve('C-2', '2024-01-01', today=today) == '착수'  # 보드 상태
+    assert snap.resolve('C-3', '2024-06-15', today=today) == '착수'  # 자동: 최근 작업
+    assert snap.resolve('C-3', '2024-06-01', today=today) == '준공'  # 자동: 7일 경과
+    assert [bp['ship_name'] for bp in snap.reception_projects()] == ['C호']
+    assert snap.board_project(ship_name='A호')['contract_number'] == 'C-1'
+
+    # 같은 데이터 세대에서는 다시 조회하지 않음 (관리용 테이블 쓰기도 세대를 바꾸지 않음)
+    calls = []
+    original = store.get_project_board_state
+    store.get_project_board_state = lambda: calls.append(1) or original()
+    store.set_setting('some.key', '1')
+    assert resolver.snapshot() is snap
+    assert calls == []
+
+    # 상태 변경 후에는 새 스냅샷
+    store.set_project_status('C-1', 'auto')
+    assert resolver.snapshot().resolve('C-1', '2024-01-01', today=today) == '준공'
+    assert calls == [1]
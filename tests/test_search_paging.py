@@ -0,0 +1,46 @@
+from datetime import date, timedelta
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.web import api
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = DatabaseManager(db_path=str(tmp_path / 'work.db'))
+    store._init_database()  # 새 DB는 UNIQUE 재생성 뒤 end_time 컬럼이 두 번째 초기화에서 추가됨
+    monkeypatch.setattr(api, 'db', store)
+    with store.get_connection() as conn:
+        day = date(2024, 1, 1)
+        for i in range(40):
+            conn.execute("INSERT INTO work_records (date, record_number, contract_number, ship_name, work_type) "
+                         "VALUES (?, ?, 'C-1', 'OCEAN', ?)",
+                         ((day + timedelta(days=i // 3)).isoformat(), i % 3 + 1, 'night' if i % 2 else 'day'))
+        friday = date(2024, 1, 5)
+        for week in range(4):
+            for seq in (1, 2):
+                conn.execute("INSERT INTO holiday_work_entries (period_key, seq, name, fri_work, sat_work, "
+                             "sun_work, contract_number, ship_name) VALUES (?, ?, '홍길동', 'O', 'O', '-', "
+                             "'C-1', 'OCEAN')", ((friday + timedelta(weeks=week)).isoformat(), seq))
+    return store
+
+
+@pytest.mark.parametrize('descending', [False, True])
+def test_keyset_pages_match_full_result(store, descending):
+    full = api.search_records_with_ot('contract', 'C-1', descending=descending)['records']
+    assert len(full) == 40 + 16
+
+    paged, cursor, summary = [], None, None
+    while True:
+        page = api.search_records_with_ot('contract', 'C-1', page_size=7, cursor=cursor, descending=descending)
+        assert ('summary' in page) == (cursor is None)  # 요약은 첫 페이지에만
+        summary = summary or page['summary']
+        paged.extend(page['records'])
+        if not page['hasMore']:
+            break
+        cursor = page['nextCursor']
+
+    key = api._search_sort_key
+    assert [key(r) for r in paged] == [key(r) for r in full]
+    assert summary['totalRecords'] == 56 and summary['holidayOt'] == 128.0
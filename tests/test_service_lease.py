@@ -0,0 +1,38 @@
+import time
+
+from src.database.auth_manager import AuthManager
+
+
+def test_lease_is_exclusive_until_released_or_expired(tmp_path):
+    store = AuthManager(db_path=str(tmp_path / 'auth.db'), token_db_path=str(tmp_path / 'tokens.db'))
+
+    assert store.acquire_lease('telegram_poller', 'pc-a', ttl_sec=60)
+    assert not store.acquire_lease('telegram_poller', 'pc-b', ttl_sec=60)
+    # 보유자는 갱신 가능
+    assert store.acquire_lease('telegram_poller', 'pc-a', ttl_sec=60)
+    assert store.get_lease_holder('telegram_poller') == 'pc-a'
+
+    store.release_lease('telegram_poller', 'pc-a')
+    assert store.acquire_lease('telegram_poller', 'pc-b', ttl_sec=-1)
+    # 만료된 리스는 다른 PC가 가져간다
+    assert store.get_lease_holder('telegram_poller') is None
+    assert store.acquire_lease('telegram_poller', 'pc-a', ttl_sec=60)
+
+
+def test_lease_is_renewed_only_after_half_ttl(tmp_path):
+    am = AuthManager(db_path=str(tmp_path / 'auth.db'), token_db_path=str(tmp_path / 'tokens.db'))
+
+    def expires():
+        with am.get_connection() as conn:
+            return conn.execute("SELECT expires_at FROM service_leases WHERE name = 'poll'").fetchone()[0]
+
+    assert am.acquire_lease('poll', 'pc-a', 60)
+    first = expires()
+    # 남은 시간이 충분하면 다시 쓰지 않는다
+    assert am.acquire_lease('poll', 'pc-a', 60)
+    assert expires() == first
+
+    with am.get_connection() as conn:
+        conn.execute("UPDATE service_leases SET expires_at = ? WHERE name = 'poll'", (time.time() + 10,))
+    assert am.acquire_lease('poll', 'pc-a', 60)
+    assert expires() > time.time() + 50
@@ -0,0 +1,55 @@
+import json
+import threading
+
+from src.utils.startup_trace import LazySingleton, StartupTrace, startup_trace
+
+
+def test_trace_records_phases_and_writes_one_line_per_launch(tmp_path):
+    log_path = tmp_path / 'startup.log'
+    trace = StartupTrace(log_path=log_path)
+    with trace.phase('import:app'):
+        pass
+    try:
+        with trace.phase('patch_apply'):
+            raise RuntimeError('boom')
+    except RuntimeError:
+        pass
+    trace.mark('first_page')
+    trace.mark('first_page')  # 처음 값 유지
+
+    timeline = trace.finish(version='9.9.9')
+    assert [p['name'] for p in timeline['phases']] == ['import:app', 'patch_apply']
+    assert 'first_page' in timeline['marks']
+
+    # 마감 후 기록은 무시되고 같은 타임라인을 반환
+    with trace.phase('late'):
+        pass
+    assert trace.finish() == timeline
+
+    history = StartupTrace.read_history(log_path)
+    assert len(history) == 1 and history[0]['version'] == '9.9.9'
+    assert json.loads(log_path.read_text(encoding='utf-8').strip())['phases'][1]['name'] == 'patch_apply'
+
+
+def test_lazy_singleton_constructs_once_on_first_use():
+    created = []
+
+    class _Service:
+        def __init__(self):
+            created.append(1)
+            self.value = 1
+
+    proxy = LazySingleton(_Service, 'svc')
+    assert not proxy.initialized and created == []
+
+    threads = [threading.Thread(target=lambda: proxy.value) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert created == [1]
+
+    proxy.value = 5
+    assert proxy.value == 5 and proxy.initialized
+    if not startup_trace.finished:
+        assert 'init:svc' in [p['name'] for p in startup_trace.timeline()['phases']]
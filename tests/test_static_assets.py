@@ -0,0 +1,85 @@
+import io
+from wsgiref.util import setup_testing_defaults
+
+from src.web import static_assets
+
+
+def _get(app, path, query=''):
+    environ = {'PATH_INFO': path, 'QUERY_STRING': query, 'REQUEST_METHOD': 'GET',
+               'wsgi.input': io.BytesIO()}
+    setup_testing_defaults(environ)
+    captured = {}
+
+    def start_response(status, headers, exc_info=None):
+        captured['status'] = int(status.split()[0])
+        captured['headers'] = dict(headers)
+
+    body = b''.join(app(environ, start_response))
+    return captured['status'], captured['headers'], body
+
+
+def test_pages_get_content_hash_urls_and_assets_long_cache(tmp_path, monkeypatch):
+    (tmp_path / 'js').mkdir()
+    (tmp_path / 'js' / 'app.js').write_text('console.log(1);', encoding='utf-8')
+    (tmp_path / 'index.html').write_text(
+        '<link href="/assets/app.css"><script src="js/app.js?v=1.0.8"></script>'
+        '<script src="https://cdn.example/x.js"></script>', encoding='utf-8')
+    monkeypatch.setattr(static_assets, 'WEB_ROOT', tmp_path)
+    static_assets._version_cache.clear()
+
+    app = static_assets.create_app()
+    version = static_assets.asset_version('js/app.js')
+    assert len(version) == 10
+
+    status, headers, body = _get(app, '/index.html')
+    html = body.decode('utf-8')
+    assert status == 200 and headers['Cache-Control'] == 'no-cache'
+    assert f'src="js/app.js?v={version}"' in html
+    # 없는 파일·외부 URL은 그대로
+    assert 'href="/assets/app.css"' in html and 'https://cdn.example/x.js"' in html
+
+    status, headers, _ = _get(app, '/js/app.js', f'v={version}')
+    assert status == 200 and 'immutable' in headers['Cache-Control']
+
+    status, headers, _ = _get(app, '/js/app.js', 'v=stale')
+    assert headers['Cache-Control'] == 'no-cache'
+
+    # 내용이 바뀌면 새 해시 URL
+    (tmp_path / 'js' / 'app.js').write_text('console.log(22);', encoding='utf-8')
+    assert static_assets.asset_version('js/app.js') != version
+
+    assert _get(static_assets.create_app(dev_mode=True), '/js/app.js', f'v={version}')[1]['Cache-Control'] == 'no-store'
+
+
+def test_asset_check_is_enforced_once_assets_are_adopted(tmp_path, monkeypatch):
+    import hashlib
+    import json
+    import sys
+    from pathlib import Path
+    import build_assets
+
+    vendor_dir = tmp_path / 'assets' / 'vendor'
+    lock = tmp_path / 'vendor.json'
+    lock.write_text(json.dumps({'packages': [{'name': 'chart.js', 'file': 'chart.js', 'sha256': ''}]}))
+    monkeypatch.setattr(build_assets, 'ROOT', tmp_path)
+    monkeypatch.setattr(build_assets, 'CSS_OUTPUT', tmp_path / 'assets' / 'app.css')
+    monkeypatch.setattr(build_assets, 'VENDOR_DIR', vendor_dir)
+    monkeypatch.setattr(build_assets, 'VENDOR_LOCK', lock)
+    assert len(build_assets.check_assets()) == 3  # CSS 없음 + 미고정 + 파일 없음
+    # 아직 도입 전이면 --check는 경고만 하고 배포를 막지 않음
+    assert not build_assets.assets_adopted()
+    monkeypatch.setattr(sys, 'argv', ['build_assets.py', '--check'])
+    assert build_assets.main() == 0
+
+    vendor_dir.mkdir(parents=True)
+    (tmp_path / 'assets' / 'app.css').write_text('.p-2{padding:.5rem}')
+    (vendor_dir / 'chart.js').write_bytes(b'chart')
+    lock.write_text(json.dumps({'packages': [
+        {'name': 'chart.js', 'file': 'chart.js', 'sha256': hashlib.sha256(b'chart').hexdigest()}]}))
+    assert build_assets.check_assets() == []
+
+    (vendor_dir / 'chart.js').write_bytes(b'tampered')
+    assert build_assets.check_assets() == [f"{Path('assets', 'vendor', 'chart.js')} 해시 불일치"]
+    # 도입 후에는 실패를 그대로 알림
+    assert build_assets.assets_adopted()
+    assert build_assets.main() == 1
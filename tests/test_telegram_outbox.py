@@ -0,0 +1,75 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.database.auth_manager import AuthManager
+from src.utils.telegram_outbox import TelegramOutbox
+
+
+class _FakeBotApi(BaseHTTPRequestHandler):
+    """chat_id별로 정해진 응답을 돌려주는 가짜 Bot API"""
+    responses = {}
+    received = []
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        chat_id = body['chat_id']
+        with self.lock:
+            self.received.append(chat_id)
+            message_id = len(self.received)
+        status, payload = self.responses.get(chat_id, (200, None))
+        if payload is None:
+            payload = {'ok': True, 'result': {'message_id': 1000 + message_id}}
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def _outbox_rows(store):
+    with store.get_connection() as conn:
+        return {row['chat_id']: dict(row) for row in conn.execute('SELECT * FROM telegram_outbox')}
+
+
+def test_outbox_delivers_retries_and_records_status(tmp_path):
+    _FakeBotApi.responses = {
+        2: (500, {'ok': False, 'description': 'Internal Server Error'}),
+        3: (403, {'ok': False, 'description': 'Forbidden: bot was blocked by the user'}),
+        4: (429, {'ok': False, 'parameters': {'retry_after': 30}}),
+    }
+    _FakeBotApi.received = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeBotApi)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    store = AuthManager(db_path=str(tmp_path / 'auth.db'), token_db_path=str(tmp_path / 'tokens.db'))
+    outbox = TelegramOutbox(store=store, api_base=f'http://127.0.0.1:{server.server_port}',
+                            rate_per_second=30, per_chat_interval=0)
+    try:
+        assert outbox.enqueue([1, 2, 3, 4, 5, 6], 'hello', kind='comment', contract_number='C-1') == 6
+        outbox.start('TOKEN')
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            rows = _outbox_rows(store)
+            if all(r['status'] != 'sending' for r in rows.values()) and len(_FakeBotApi.received) == 6:
+                break
+            time.sleep(0.05)
+    finally:
+        outbox.stop()
+        server.shutdown()
+
+    rows = _outbox_rows(store)
+    assert sorted(_FakeBotApi.received) == [1, 2, 3, 4, 5, 6]
+    assert rows[1]['status'] == 'sent' and rows[1]['telegram_message_id'] > 1000
+    assert rows[2]['status'] == 'pending' and rows[2]['attempts'] == 1
+    assert rows[2]['next_attempt_at'] > rows[2]['created_at']
+    assert rows[3]['status'] == 'failed'
+    assert rows[4]['status'] == 'pending' and rows[4]['attempts'] == 0
+    # 댓글 알림은 답장 연동용 매핑이 저장된다
+    assert store.get_project_by_reply(rows[5]['telegram_message_id'], 5)['contract_number'] == 'C-1'
@@ -0,0 +1,175 @@
+import hashlib
+import io
+import json
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.utils.update_manager import UpdateManager, PATCH_MANIFEST_NAME
+
+
+def _patch_zip_bytes() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
+        zf.writestr('patch_v9.0.1/patch.json', json.dumps({'version': '9.0.1', 'files': []}))
+        # 압축되지 않는 내용으로 이어받기 구간이 생기도록 충분히 크게
+        zf.writestr('patch_v9.0.1/blob.bin', bytes(range(256)) * 2048)
+    return buf.getvalue()
+
+
+class _FakeGitHub(BaseHTTPRequestHandler):
+    """릴리스 목록(ETag) · 에셋 다운로드(Range) · 매니페스트를 흉내 내는 로컬 서버"""
+    zip_bytes = b''
+    manifest = {}
+    releases = []
+    requests_seen = []
+    drop_first_download = True
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests_seen.append((self.path, self.headers.get('Range'), self.headers.get('If-None-Match')))
+        if self.path.startswith('/repos/o/r/releases?'):
+            if self.headers.get('If-None-Match') == '"v1"':
+                self._send(304)
+            else:
+                self._send(200, json.dumps(cls.releases).encode(), {'ETag': '"v1"'})
+        elif self.path == '/dl/manifest':
+            self._send(200, json.dumps(cls.manifest).encode())
+        elif self.path == '/dl/patch.zip':
+            data = cls.zip_bytes
+            rng = self.headers.get('Range')
+            if rng:
+                start = int(rng.split('=')[1].rstrip('-'))
+                self._send(206, data[start:], {'Content-Range': f'bytes {start}-{len(data) - 1}/{len(data)}'})
+            elif cls.drop_first_download:
+                # 절반만 보내고 연결 끊기
+                cls.drop_first_download = False
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data[:len(data) // 2])
+                self.wfile.flush()
+                self.close_connection = True
+            else:
+                self._send(200, data)
+        else:
+            self._send(404)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_release_listing_etag_and_resumable_verified_download(tmp_path):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    zip_bytes = _patch_zip_bytes()
+    _FakeGitHub.zip_bytes = zip_bytes
+    _FakeGitHub.manifest = {'assets': {'patch_v9.0.1.zip': {
+        'sha256': hashlib.sha256(zip_bytes).hexdigest(), 'size': len(zip_bytes)}}}
+    _FakeGitHub.releases = [{'tag_name': 'v9.0.1', 'assets': [
+        {'id': 1, 'name': 'patch_v9.0.1.zip', 'size': len(zip_bytes),
+         'browser_download_url': f'{base}/dl/patch.zip'},
+        {'id': 2, 'name': PATCH_MANIFEST_NAME, 'size': 10,
+         'browser_download_url': f'{base}/dl/manifest'},
+    ]}]
+    _FakeGitHub.requests_seen = []
+
+    um = UpdateManager()
+    um.api_base_url = base
+    um.github_repo_owner, um.github_repo_name = 'o', 'r'
+    um.github_token = ''
+    um.data_dir = tmp_path / 'data'
+    um.data_dir.mkdir()
+    um.patches_dir = tmp_path / 'patches'
+    um.patches_dir.mkdir()
+    um.downloaded_patches_file = um.data_dir / 'downloaded_patches.json'
+    um.release_etag_cache_file = um.data_dir / 'release_etag_cache.json'
+    um.download_dir = tmp_path / 'downloads'
+    um._refresh_runtime_state = lambda: None
+    um.current_version = '9.0.0'
+
+    try:
+        patches = um._find_new_patch_assets()
+        assert [p['name'] for p in patches] == ['patch_v9.0.1.zip']
+        assert patches[0]['sha256'] == hashlib.sha256(zip_bytes).hexdigest()
+
+        # 두 번째 목록 조회는 If-None-Match → 304 → 캐시 본문 사용
+        assert um._get_all_releases(page=1, per_page=50) == _FakeGitHub.releases
+        assert ('"v1"' in [h for _, _, h in _FakeGitHub.requests_seen])
+
+        zip_path = um._download_patch_zip(patches[0])
+        assert zip_path is not None and zip_path.read_bytes() == zip_bytes
+        ranges = [r for path, r, _ in _FakeGitHub.requests_seen if path == '/dl/patch.zip']
+        assert ranges[0] is None and ranges[1].startswith('bytes=')
+
+        # 해시가 다르면 완료 처리하지 않는다
+        zip_path.unlink()
+        bad = dict(patches[0], sha256='0' * 64)
+        assert um._download_patch_zip(bad) is None
+        assert not (um.download_dir / 'patch_v9.0.1.zip').exists()
+    finally:
+        server.shutdown()
+
+
+def test_stage_patches_prepares_without_applying(tmp_path, monkeypatch):
+    from src.utils.patch_system import patch_system
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    zip_bytes = _patch_zip_bytes()
+    _FakeGitHub.zip_bytes = zip_bytes
+    _FakeGitHub.drop_first_download = False
+    _FakeGitHub.manifest = {'assets': {'patch_v9.0.1.zip': {
+        'sha256': hashlib.sha256(zip_bytes).hexdigest(), 'size': len(zip_bytes)}}}
+    _FakeGitHub.releases = [{'tag_name': 'v9.0.1', 'assets': [
+        {'id': 1, 'name': 'patch_v9.0.1.zip', 'size': len(zip_bytes),
+         'browser_download_url': f'{base}/dl/patch.zip'},
+        {'id': 2, 'name': PATCH_MANIFEST_NAME, 'size': 10,
+         'browser_download_url': f'{base}/dl/manifest'},
+    ]}]
+    _FakeGitHub.requests_seen = []
+
+    um = UpdateManager()
+    um.api_base_url = base
+    um.github_repo_owner, um.github_repo_name = 'o', 'r'
+    um.github_token = ''
+    um.data_dir = tmp_path / 'data'
+    um.data_dir.mkdir()
+    um.patches_dir = tmp_path / 'patches'
+    um.patches_dir.mkdir()
+    um.downloaded_patches_file = um.data_dir / 'downloaded_patches.json'
+    um.release_etag_cache_file = um.data_dir / 'release_etag_cache.json'
+    um.download_dir = tmp_path / 'downloads'
+    um._refresh_runtime_state = lambda: None
+    um.current_version = '9.0.0'
+
+    monkeypatch.setattr(patch_system, 'patches_dir', um.patches_dir)
+    monkeypatch.setattr(patch_system, 'applied_patches_file', um.data_dir / 'applied_patches.json')
+    monkeypatch.setattr(patch_system, 'current_version', '9.0.0')
+    monkeypatch.setattr(patch_system, 'needs_full_patch', set())
+    try:
+        result = um.stage_patches()
+        assert result['success'] and result['staged_count'] == 1
+        assert result['versions'] == ['9.0.1']
+        assert (um.patches_dir / 'patch_v9.0.1' / 'patch.json').exists()
+        # 적용은 하지 않는다
+        assert patch_system.get_applied_patches() == []
+
+        # 이미 준비된 패치는 다시 받지 않는다
+        downloads = sum(1 for path, _, _ in _FakeGitHub.requests_seen if path == '/dl/patch.zip')
+        assert um.stage_patches()['staged_count'] == 1
+        assert sum(1 for path, _, _ in _FakeGitHub.requests_seen if path == '/dl/patch.zip') == downloads
+    finally:
+        server.shutdown()
@@ -0,0 +1,18 @@
+// tools/assets/tailwind.config.js - build_assets.py가 사용하는 Tailwind 설정
+// 저장소 루트 기준 경로. JS 문자열 조합으로 만드는 클래스는 safelist에 추가한다.
+module.exports = {
+  content: [
+    './web/**/*.html',
+    './web/js/**/*.js',
+  ],
+  safelist: [
+    // auth.js 사용자 상태 배지: bg-${statusColor}-200 / text-${statusColor}-800
+    { pattern: /^(bg|text)-(slate|green|yellow|red)-(200|800)$/ },
+    // auth.js 오류 보고 유형 배지: bg-${color}-100 / text-${color}-700
+    { pattern: /^(bg|text)-(slate|orange|red)-(100|700)$/ },
+  ],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+};
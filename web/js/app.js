@@ -12,7 +12,7 @@ let nightIsDirty = false;
 let _isSaving = false;  // 중복 저장 방지 플래그
 let _autoSaveTimer = null;  // 자동 저장 타이머 핸들
 let _dateLoadedAt = null; // 현재 날짜 데이터 로드 시각 (충돌 감지용)
-let _searchSortState = { records: [], container: null, term: '', type: '', key: 'date', dir: -1, summary: null }; // 검색 결과 정렬 상태
+let _searchSortState = { records: [], container: null, term: '', type: '', key: 'date', dir: -1, summary: null, loading: false }; // 검색 결과 정렬 상태
 
 // 아카이브 달 네비게이션 상태
 let _archiveAllData = [];
@@ -86,6 +86,11 @@ function showView(view) {
     } else if (view === 'daily') {
         btnDaily.className = 'px-4 py-2 rounded-lg bg-blue-600 text-white';
         dailyView.classList.remove('hidden');
+        // 다른 화면에 있는 동안 현재 날짜 데이터가 변경되었으면 다시 조회
+        if (_dailyStale && !_hasUnsavedChanges('any')) {
+            _dailyStale = false;
+            loadWorkRecords();
+        }
     } else if (view === 'report') {
         btnReport.className = 'px-4 py-2 rounded-lg bg-blue-600 text-white';
         reportView.classList.remove('hidden');
@@ -264,7 +269,7 @@ function showSearchTab(tab) {
 
 async function loadCompanyNameList() {
     try {
-        const names = await eel.get_outsource_company_names()();
+        const names = await eelFetch('get_outsource_company_names');
         const datalist = document.getElementById('companyNameList');
         if (!datalist) return;
         datalist.innerHTML = names.map(n => `<option value="${escapeHtml(n)}">`).join('');
@@ -349,18 +354,19 @@ function showDashboardTab(tab) {
         b.classList.add('bg-slate-200');
     });
 
+    // 탭 재진입 시에는 변경 알림으로 stale 표시된 경우에만 다시 조회
     if (tab === 'chart') {
         chartTab && chartTab.classList.remove('hidden');
         if (btnChart) { btnChart.classList.remove('bg-slate-200'); btnChart.classList.add('bg-blue-600', 'text-white'); }
-        loadGanttChart();
+        if (_dashboardStale.chart) { _dashboardStale.chart = false; loadGanttChart(); }
     } else if (tab === 'board') {
         boardTab && boardTab.classList.remove('hidden');
         if (btnBoard) { btnBoard.classList.remove('bg-slate-200'); btnBoard.classList.add('bg-blue-600', 'text-white'); }
-        loadKanbanBoard();
+        if (_dashboardStale.board) { _dashboardStale.board = false; loadKanbanBoard(); }
     } else if (tab === 'stats') {
         statsTab && statsTab.classList.remove('hidden');
         if (btnStats) { btnStats.classList.remove('bg-slate-200'); btnStats.classList.add('bg-blue-600', 'text-white'); }
-        loadStatsData();
+        if (_dashboardStale.stats) { _dashboardStale.stats = false; loadStatsData(); }
     }
 }
 
@@ -372,7 +378,7 @@ let KOREAN_HOLIDAYS = {};
 
 async function loadHolidays() {
     try {
-        const data = await eelWithTimeout(eel.get_holidays()(), 5000);
+        const data = await eelWithTimeout(eelFetch('get_holidays'), 5000);
         if (data && typeof data === 'object') {
             KOREAN_HOLIDAYS = data;
         }
@@ -419,661 +425,10 @@ async function loadHolidayKeyStatus() {
     } catch (_) { /* 무시 */ }
 }
 
-// ============================================================================
-// 간트 차트
-// ============================================================================
-
-let ganttYear = new Date().getFullYear();
-let ganttMonth = new Date().getMonth() + 1;
-let ganttDualView = false;
-
-// 간트 차트용 색상 팔레트 (프로젝트별 로테이션)
-const GANTT_COLORS = [
-    { bar: 'bg-blue-400', light: 'bg-blue-100' },
-    { bar: 'bg-emerald-400', light: 'bg-emerald-100' },
-    { bar: 'bg-amber-400', light: 'bg-amber-100' },
-    { bar: 'bg-purple-400', light: 'bg-purple-100' },
-    { bar: 'bg-rose-400', light: 'bg-rose-100' }
-];
-
-function changeGanttMonth(delta) {
-    ganttMonth += delta;
-    if (ganttMonth < 1) { ganttMonth = 12; ganttYear--; }
-    if (ganttMonth > 12) { ganttMonth = 1; ganttYear++; }
-    loadGanttChart();
-}
-
-function toggleGanttDualView() {
-    ganttDualView = !ganttDualView;
-    const btn = document.getElementById('ganttDualBtn');
-    if (btn) btn.textContent = ganttDualView ? '1개월 뷰' : '2개월 뷰';
-    loadGanttChart();
-}
-
-function buildGanttTableHTML(projects, year, month) {
-    const daysInMonth = new Date(year, month, 0).getDate();
-    const weekdays = ['일', '월', '화', '수', '목', '금', '토'];
-
-    let html = '<table class="w-full border-collapse text-sm"><thead>';
-
-    // 1행: 날짜
-    html += '<tr class="bg-slate-50">';
-    html += '<th rowspan="2" class="border p-2 text-center bg-slate-100 sticky left-0 z-10 min-w-32">선사/선명</th>';
-    html += '<th rowspan="2" class="border p-2 text-center bg-slate-100 min-w-28">작업내용</th>';
-    html += '<th rowspan="2" class="border p-2 text-center bg-slate-100 min-w-20">기간</th>';
-
-    for (let day = 1; day <= daysInMonth; day++) {
-        const date = new Date(year, month - 1, day);
-        const dow = date.getDay();
-        const dateStr = `${year}-${String(month).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
-        const isHoliday = KOREAN_HOLIDAYS[dateStr];
-        const isSunday = dow === 0;
-        const isSaturday = dow === 6;
-
-        let cellClass = 'border p-1 text-center text-xs min-w-7';
-        if (isSunday || isHoliday) {
-            cellClass += ' bg-red-100 text-red-600';
-        } else if (isSaturday) {
-            cellClass += ' bg-blue-100 text-blue-600';
-        }
-
-        html += `<th class="${cellClass}" title="${isHoliday || ''}">${day}</th>`;
-    }
-    html += '</tr>';
-
-    // 2행: 요일
-    html += '<tr class="bg-slate-50">';
-    for (let day = 1; day <= daysInMonth; day++) {
-        const date = new Date(year, month - 1, day);
-        const dow = date.getDay();
-        const dateStr = `${year}-${String(month).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
-        const isHoliday = KOREAN_HOLIDAYS[dateStr];
-        const isSunday = dow === 0;
-        const isSaturday = dow === 6;
-
-        let cellClass = 'border p-0 text-center text-xs';
-        if (isSunday || isHoliday) {
-            cellClass += ' bg-red-100 text-red-600 font-bold';
-        } else if (isSaturday) {
-            cellClass += ' bg-blue-100 text-blue-600 font-bold';
-        } else {
-            cellClass += ' text-slate-400';
-        }
-
-        let label = weekdays[dow];
-        if (isHoliday && !isSunday && !isSaturday) {
-            label = isHoliday.charAt(0);
-        }
-
-        html += `<th class="${cellClass}" title="${isHoliday || ''}">${label}</th>`;
-    }
-    html += '</tr></thead>';
-
-    // 프로젝트 행
-    html += '<tbody>';
-    projects.forEach((project, idx) => {
-        const color = GANTT_COLORS[idx % GANTT_COLORS.length];
-        const workDatesSet = new Set(project.workDates || []);
-        const safeCn = escapeHtml(project.contractNumber || '');
-
-        html += `<tr class="hover:bg-slate-50 cursor-pointer" data-gantt-cn="${safeCn}">`;
-        html += `<td class="border p-2 text-xs sticky left-0 bg-white z-10 whitespace-nowrap">
-            <div class="font-semibold">${escapeHtml(project.company || '')}</div>
-            <div class="text-slate-500">${escapeHtml(project.shipName || '')}</div>
-        </td>`;
-
-        let workDesc = '';
-        if (project.engineModel && project.workContent) {
-            workDesc = `${project.engineModel} ${project.workContent}`;
-        } else {
-            workDesc = project.engineModel || project.workContent || '';
-        }
-        html += `<td class="border p-2 text-xs">${escapeHtml(workDesc)}</td>`;
-        html += `<td class="border p-2 text-xs text-center whitespace-nowrap">${project.startMD}~${project.endMD}</td>`;
-
-        for (let day = 1; day <= daysInMonth; day++) {
-            const dateStr = `${year}-${String(month).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
-            const isWorkDate = workDatesSet.has(dateStr);
-            const isInRange = dateStr >= project.startDate && dateStr <= project.endDate;
-
-            let cellClass = 'border p-0';
-            if (isWorkDate) {
-                cellClass += ` ${color.bar}`;
-            } else if (isInRange) {
-                cellClass += ` ${color.light}`;
-            }
-
-            html += `<td class="${cellClass}"></td>`;
-        }
-        html += '</tr>';
-    });
-    html += '</tbody></table>';
-    return html;
-}
-
-async function loadGanttChart() {
-    try {
-        const display   = document.getElementById('ganttMonthDisplay');
-        const container = document.getElementById('ganttContainer');
-
-        // 최초 1회만 이벤트 위임 등록 (ondblclick 인라인 핸들러 대체)
-        if (container && !container._ganttDblClickAttached) {
-            container.addEventListener('dblclick', e => {
-                const row = e.target.closest('[data-gantt-cn]');
-                if (row) navigateToSearch(row.dataset.ganttCn);
-            });
-            container._ganttDblClickAttached = true;
-        }
-        const emptyDiv  = document.getElementById('ganttEmpty');
-
-        if (ganttDualView) {
-            let prevMonth = ganttMonth - 1, prevYear = ganttYear;
-            if (prevMonth < 1) { prevMonth = 12; prevYear--; }
-
-            if (display)
-                display.textContent = `${prevYear}년 ${prevMonth}월 ~ ${ganttYear}년 ${ganttMonth}월`;
-
-            const [prevProjects, currProjects] = await Promise.all([
-                eel.get_gantt_data(prevYear, prevMonth)(),
-                eel.get_gantt_data(ganttYear, ganttMonth)()
-            ]);
-
-            const hasData = (prevProjects && prevProjects.length > 0)
-                         || (currProjects && currProjects.length > 0);
-            if (!hasData) {
-                if (container) container.innerHTML = '';
-                if (emptyDiv) emptyDiv.classList.remove('hidden');
-                return;
-            }
-            if (emptyDiv) emptyDiv.classList.add('hidden');
-
-            if (container) container.innerHTML =
-                `<div class="text-sm font-bold text-slate-500 mb-1 px-1">${prevYear}년 ${prevMonth}월</div>
-                 <div class="overflow-x-auto">
-                     ${prevProjects && prevProjects.length > 0
-                         ? buildGanttTableHTML(prevProjects, prevYear, prevMonth)
-                         : '<p class="text-slate-400 text-sm py-4 text-center">해당 월 작업 없음</p>'}
-                 </div>
-                 <div class="border-t-2 border-slate-300 my-5"></div>
-                 <div class="text-sm font-bold text-slate-500 mb-1 px-1">${ganttYear}년 ${ganttMonth}월</div>
-                 <div class="overflow-x-auto">
-                     ${currProjects && currProjects.length > 0
-                         ? buildGanttTableHTML(currProjects, ganttYear, ganttMonth)
-                         : '<p class="text-slate-400 text-sm py-4 text-center">해당 월 작업 없음</p>'}
-                 </div>`;
-        } else {
-            if (display) display.textContent = `${ganttYear}년 ${ganttMonth}월`;
-
-            const projects = await eel.get_gantt_data(ganttYear, ganttMonth)();
-
-            if (!projects || projects.length === 0) {
-                if (container) container.innerHTML = '';
-                if (emptyDiv) emptyDiv.classList.remove('hidden');
-                return;
-            }
-            if (emptyDiv) emptyDiv.classList.add('hidden');
-
-            if (container) container.innerHTML =
-                `<div class="overflow-x-auto">${buildGanttTableHTML(projects, ganttYear, ganttMonth)}</div>`;
-        }
-    } catch (error) {
-        console.error('간트 차트 로드 실패:', error);
-        showCustomAlert('오류', '간트 차트 로드에 실패했습니다.', 'error');
-    }
-}
-
-// ============================================================================
-// 칸반 보드
-// ============================================================================
-
-async function loadKanbanBoard() {
-    try {
-        const data = await eel.get_kanban_data()();
-        // #12 — 칸반 카드 더블클릭 이벤트 위임 (ondblclick 인라인 핸들러 대체, 최초 1회만 등록)
-        const _kc = document.getElementById('kanbanContainer');
-        if (_kc && !_kc._dblClickAttached) {
-            _kc.addEventListener('dblclick', e => {
-                const card = e.target.closest('[data-kanban-cn]');
-                if (card) navigateToSearch(card.dataset.kanbanCn);
-            });
-            _kc._dblClickAttached = true;
-        }
-
-        const receptionCards = document.getElementById('receptionCards');
-        const startedCards = document.getElementById('startedCards');
-        const doneCards = document.getElementById('doneCards');
-        const receptionCount = document.getElementById('receptionCount');
-        const startedCount = document.getElementById('startedCount');
-        const doneCount = document.getElementById('doneCount');
-
-        if (!receptionCards || !startedCards || !doneCards) return;
-
-        receptionCards.innerHTML = '';
-        startedCards.innerHTML = '';
-        doneCards.innerHTML = '';
-
-        if (receptionCount) receptionCount.textContent = (data.reception || []).length;
-        if (startedCount) startedCount.textContent = (data.started || []).length;
-        if (doneCount) doneCount.textContent = (data.done || []).length;
-
-        // 접수 / 착수 / 준공 — #5: innerHTML += 루프 → map().join() 한 번 대입 (O(n²)→O(n))
-        receptionCards.innerHTML = (data.reception || []).map(p => renderReceptionCard(p)).join('');
-        startedCards.innerHTML   = (data.started   || []).map(p => renderCard(p, 'border-blue-500')).join('');
-        doneCards.innerHTML      = (data.done       || []).map(p => renderCard(p, 'border-green-500')).join('');
-        // 아카이브: 전체 데이터 저장 후 달 필터링으로 렌더링
-        _archiveAllData = data.archive || [];
-        if (_archiveYear === null) {
-            const d = new Date();
-            d.setMonth(d.getMonth() - 1);
-            _archiveYear  = d.getFullYear();
-            _archiveMonth = d.getMonth() + 1;
-        }
-        renderArchiveForMonth();
-
-        // 빈 상태 표시
-        if ((data.reception || []).length === 0) {
-            receptionCards.innerHTML = '<p class="text-center text-slate-400 text-sm py-4">접수된 프로젝트가 없습니다.</p>';
-        }
-        if ((data.started || []).length === 0) {
-            startedCards.innerHTML = '<p class="text-center text-slate-400 text-sm py-4">착수된 프로젝트가 없습니다.</p>';
-        }
-        if ((data.done || []).length === 0) {
-            doneCards.innerHTML = '<p class="text-center text-slate-400 text-sm py-4">준공된 프로젝트가 없습니다.</p>';
-        }
-
-    } catch (error) {
-        console.error('칸반 보드 로드 실패:', error);
-        showCustomAlert('오류', '칸반 보드 로드에 실패했습니다.', 'error');
-    }
-}
-
-// ============================================================================
-// 칸반 카드 렌더링 (전역 — loadKanbanBoard + renderArchiveForMonth 공유)
-// ============================================================================
-
-function renderReceptionCard(project) {
-    let workDesc = '';
-    if (project.engineModel && project.workContent) {
-        workDesc = `${project.engineModel} ${project.workContent}`;
-    } else {
-        workDesc = project.engineModel || project.workContent || '';
-    }
-    const safeCompany  = escapeHtml(project.company  || '');
-    const safeShipName = escapeHtml(project.shipName || '');
-    const safeCn       = escapeHtml(project.contractNumber || '');
-    const jsTitle      = escapeJs(`${project.company || ''} ${project.shipName || ''}`);
-    return `
-        <div class="bg-white rounded-lg shadow-sm p-3 border-l-4 border-yellow-400 hover:shadow-md transition-shadow">
-            <div class="flex justify-between items-start">
-                <div class="font-bold text-sm">${safeCompany} ${safeShipName}</div>
-                <div class="flex gap-1">
-                    <button onclick="promptStartProject(${project.id})" class="text-xs px-2 py-0.5 bg-blue-100 text-blue-700 rounded hover:bg-blue-200" title="착수 전환">착수 ▶</button>
-                    <button onclick="deleteBoardProject(${project.id})" class="text-xs px-1 py-0.5 bg-red-100 text-red-600 rounded hover:bg-red-200" title="삭제">✕</button>
-                </div>
-            </div>
-            ${safeCn ? `<div class="text-xs text-slate-400 mt-0.5">${safeCn}</div>` : ''}
-            <div class="text-xs mt-1 text-slate-700">${escapeHtml(workDesc)}</div>
-            ${_renderMilestoneBadges(project)}
-            <div class="flex justify-between items-center mt-1">
-                <div class="flex gap-1 items-center">
-                    <div class="text-xs text-slate-400">접수 대기</div>
-                    <button onclick="event.stopPropagation(); openMilestoneModal(${project.id}, '${escapeJs(project.targetStartDate||'')}', '${escapeJs(project.targetEndDate||'')}', '${escapeJs(project.actualEndDate||'')}', '${escapeJs(project.engineModel||'')}', '${escapeJs(project.workContent||'')}')"
-                            class="text-xs px-1.5 py-0.5 bg-slate-100 text-slate-500 rounded hover:bg-slate-200" title="마일스톤 편집">📅</button>
-                </div>
-                <button onclick="event.stopPropagation(); openCommentModal('', ${project.id}, '${jsTitle}')" class="text-slate-400 hover:text-blue-500 text-sm" title="댓글">💬</button>
-            </div>
-        </div>
-    `;
-}
-
-function renderCard(project, borderColor) {
-    let workDesc = '';
-    if (project.engineModel && project.workContent) {
-        workDesc = `${project.engineModel} ${project.workContent}`;
-    } else {
-        workDesc = project.engineModel || project.workContent || '';
-    }
-    const cn            = project.contractNumber || '';
-    const safeCn        = escapeHtml(cn);
-    const jsCn          = escapeJs(cn);
-    const currentStatus = project.status || '';
-    const safeCompany   = escapeHtml(project.company  || '');
-    const safeShipName  = escapeHtml(project.shipName || '');
-    const jsTitle       = escapeJs(`${project.company || ''} ${project.shipName || ''}`);
-
-    let statusSelect = '';
-    if (currentStatus !== '아카이브') {
-        statusSelect = `
-            <select onchange="changeKanbanStatus('${jsCn}', this.value)" class="text-xs border rounded px-1 py-0.5 bg-slate-50">
-                <option value="착수" ${currentStatus === '착수' ? 'selected' : ''}>착수</option>
-                <option value="준공" ${currentStatus === '준공' ? 'selected' : ''}>준공</option>
-            </select>`;
-    } else {
-        // 아카이브 카드: manualStatus가 '준공'이면 처리됨 표시, 아니면 버튼
-        if (project.manualStatus === '준공') {
-            statusSelect = `<span class="text-xs px-2 py-0.5 bg-emerald-50 text-emerald-600 rounded border border-emerald-200 cursor-default">✓ 준공처리됨</span>`;
-        } else {
-            statusSelect = `<button onclick="changeKanbanStatus('${jsCn}', '준공')"
-                class="text-xs px-2 py-0.5 bg-emerald-100 text-emerald-700 rounded hover:bg-emerald-200"
-                title="월간 보고에 준공 날짜 반영">준공처리</button>`;
-        }
-    }
-
-    return `
-        <div class="bg-white rounded-lg shadow-sm p-3 border-l-4 ${borderColor} hover:shadow-md transition-shadow cursor-pointer"
-             data-kanban-cn="${escapeHtml(cn)}">
-            <div class="flex justify-between items-start">
-                <div class="font-bold text-sm">${safeCompany} ${safeShipName}</div>
-                ${statusSelect}
-            </div>
-            <div class="text-xs text-slate-500 mt-0.5">${safeCn}</div>
-            <div class="text-xs mt-1 text-slate-700">${escapeHtml(workDesc)}</div>
-            ${_renderMilestoneBadges(project)}
-            <div class="flex justify-between mt-2 text-xs text-slate-500">
-                <span>${escapeHtml(project.startMD || '')} ~ ${escapeHtml(project.endMD || '')}</span>
-                <span class="font-semibold text-blue-600">${project.totalManpower || 0}공</span>
-            </div>
-            <div class="flex justify-between items-center mt-1">
-                <div class="flex gap-1 items-center">
-                    <div class="text-xs text-slate-400">${project.workDays || 0}일 작업</div>
-                    ${project.boardProjectId
-                        ? `<button onclick="event.stopPropagation(); openMilestoneModal(${project.boardProjectId}, '${escapeJs(project.targetStartDate||'')}', '${escapeJs(project.targetEndDate||'')}', '${escapeJs(project.actualEndDate||'')}', '${escapeJs(project.engineModel||'')}', '${escapeJs(project.workContent||'')}')" class="text-xs px-1.5 py-0.5 bg-slate-100 text-slate-500 rounded hover:bg-slate-200" title="마일스톤 편집">📅</button>`
-                        : `<button onclick="event.stopPropagation(); _openMilestoneForNew('${jsCn}', '${escapeJs(project.engineModel||'')}', '${escapeJs(project.workContent||'')}')" class="text-xs px-1.5 py-0.5 bg-slate-100 text-slate-500 rounded hover:bg-slate-200" title="마일스톤 편집">📅</button>`}
-                </div>
-                <button onclick="event.stopPropagation(); openCommentModal(this.dataset.cn, null, this.dataset.title)" data-cn="${escapeHtml(cn)}" data-title="${escapeHtml(project.company || '')} ${escapeHtml(project.shipName || '')}" class="text-slate-400 hover:text-blue-500 text-sm" title="댓글">💬</button>
-            </div>
-        </div>
-    `;
-}
-
-// ============================================================================
-// 마일스톤 UI 헬퍼
-// ============================================================================
-
-function _renderMilestoneBadges(project) {
-    const ts = project.targetStartDate || '';
-    const te = project.targetEndDate   || '';
-    const ae = project.actualEndDate   || '';
-    const parts = [];
-    if (ts) parts.push(`<span class="text-slate-400">착수 ${escapeHtml(ts)}</span>`);
-    if (te) parts.push(`<span class="text-orange-500">완료예정 ${escapeHtml(te)}</span>`);
-    if (ae) parts.push(`<span class="text-green-600">완료 ✅ ${escapeHtml(ae)}</span>`);
-    return parts.length ? `<div class="flex flex-wrap gap-1 mt-1 text-xs">${parts.join('')}</div>` : '';
-}
-
-// boardProjectId 없는 카드(착수 직접 등록)에서 📅 클릭 시 호출
-// board_projects 행을 자동 생성 후 마일스톤 모달 열기
-async function _openMilestoneForNew(contractNumber, engineModel, workContent) {
-    try {
-        const res = await eel.get_or_create_board_project(contractNumber)();
-        if (res && res.success) {
-            openMilestoneModal(res.projectId, '', '', '', engineModel, workContent);
-        } else {
-            showToast(res?.message || '마일스톤 생성 중 오류가 발생했습니다.', 'error');
-        }
-    } catch(e) {
-        showToast('마일스톤 생성 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-function openMilestoneModal(projectId, targetStart, targetEnd, actualEnd, engineModel, workContent) {
-    // 기존 모달이 있으면 제거
-    const old = document.getElementById('milestoneModal');
-    if (old) old.remove();
-
-    const m = document.createElement('div');
-    m.id = 'milestoneModal';
-    m.className = 'fixed inset-0 bg-black bg-opacity-40 flex items-center justify-center z-50';
-    m.innerHTML = `
-        <div class="bg-white rounded-xl shadow-xl p-6 w-80">
-            <h3 class="font-bold text-base mb-4">📅 마일스톤 편집</h3>
-            <label class="block text-xs text-slate-500 mb-1">착수 예정일</label>
-            <input id="msTargetStart" type="date" value="${escapeHtml(targetStart || '')}"
-                   class="w-full border rounded px-2 py-1 text-sm mb-3"
-                   oninput="_fetchEtaSuggestion()">
-            <label class="block text-xs text-slate-500 mb-1">완료 예정일</label>
-            <input id="msTargetEnd" type="date" value="${escapeHtml(targetEnd || '')}"
-                   class="w-full border rounded px-2 py-1 text-sm mb-1">
-            <!-- ETA 제안 -->
-            <div id="msEtaHint" class="text-xs text-blue-600 mb-3 min-h-[1rem]"></div>
-            <label class="block text-xs text-slate-500 mb-1">실제 완료일</label>
-            <input id="msActualEnd" type="date" value="${escapeHtml(actualEnd || '')}"
-                   class="w-full border rounded px-2 py-1 text-sm mb-4">
-            <div class="flex justify-end gap-2">
-                <button onclick="document.getElementById('milestoneModal').remove()"
-                        class="px-3 py-1.5 text-sm border rounded text-slate-600 hover:bg-slate-50">취소</button>
-                <button onclick="saveMilestone(${projectId})"
-                        class="px-3 py-1.5 text-sm bg-blue-600 text-white rounded hover:bg-blue-700">저장</button>
-            </div>
-        </div>
-    `;
-    document.body.appendChild(m);
-    m.addEventListener('click', e => { if (e.target === m) m.remove(); });
-
-    // 모달 열릴 때 자동 ETA 조회
-    m._engineModel  = engineModel  || '';
-    m._workContent  = workContent  || '';
-    _fetchEtaSuggestion();
-}
-
-async function _fetchEtaSuggestion() {
-    const modal = document.getElementById('milestoneModal');
-    if (!modal) return;
-    const hint   = document.getElementById('msEtaHint');
-    const tsVal  = document.getElementById('msTargetStart')?.value || '';
-    if (!hint) return;
-    try {
-        const r = await eel.estimate_completion(modal._engineModel || '', modal._workContent || '', tsVal)();
-        if (r.success && r.avgDays) {
-            hint.innerHTML = `📊 과거 평균: <strong>${r.avgDays}일</strong> (${r.sampleCount}건 기준)
-                ${r.suggestionEndDate ? ` &nbsp;<button onclick="document.getElementById('msTargetEnd').value='${escapeJs(r.suggestionEndDate)}'"
-                    class="underline text-blue-700 hover:text-blue-900">적용 (${escapeHtml(r.suggestionEndDate)})</button>` : ''}`;
-        } else {
-            hint.textContent = '(과거 유사 작업 데이터 없음)';
-        }
-    } catch (_) {
-        hint.textContent = '';
-    }
-}
-
-async function saveMilestone(projectId) {
-    const ts = document.getElementById('msTargetStart')?.value || '';
-    const te = document.getElementById('msTargetEnd')?.value   || '';
-    const ae = document.getElementById('msActualEnd')?.value   || '';
-    try {
-        const result = await eel.update_project_milestones(projectId, ts, te, ae)();
-        if (result.success) {
-            showToast('마일스톤이 저장되었습니다.', 'success');
-            document.getElementById('milestoneModal')?.remove();
-            loadKanbanBoard();
-        } else {
-            showToast(result.message || '저장 실패', 'error');
-        }
-    } catch (e) {
-        showToast('마일스톤 저장 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-// ============================================================================
-// 아카이브 달 네비게이션
-// ============================================================================
-
-function renderArchiveForMonth() {
-    const archiveCards      = document.getElementById('archiveCards');
-    const archiveCount      = document.getElementById('archiveCount');
-    const archiveMonthLabel = document.getElementById('archiveMonthLabel');
-    const archiveNextBtn    = document.getElementById('archiveNextBtn');
-    if (!archiveCards) return;
-
-    if (archiveMonthLabel)
-        archiveMonthLabel.textContent = `${_archiveYear}년 ${_archiveMonth}월`;
-
-    const monthStr = `${_archiveYear}-${String(_archiveMonth).padStart(2, '0')}`;
-    const filtered = _archiveAllData.filter(p => p.endDate && p.endDate.startsWith(monthStr));
-
-    // 다음 달 버튼: 이전 달(오늘 기준)을 초과하면 비활성화
-    if (archiveNextBtn) {
-        const now  = new Date();
-        const prevY = now.getMonth() === 0 ? now.getFullYear() - 1 : now.getFullYear();
-        const prevM = now.getMonth() === 0 ? 12 : now.getMonth();
-        const atLatest = _archiveYear > prevY || (_archiveYear === prevY && _archiveMonth >= prevM);
-        archiveNextBtn.disabled     = atLatest;
-        archiveNextBtn.style.opacity = atLatest ? '0.3' : '';
-    }
-
-    archiveCards.innerHTML = filtered.length === 0
-        ? '<p class="text-center text-slate-400 text-sm py-4 col-span-3">해당 월 아카이브가 없습니다.</p>'
-        : filtered.map(p => renderCard(p, 'border-slate-400')).join('');
-
-    if (archiveCount) archiveCount.textContent = filtered.length;
-}
-
-function archiveChangeMonth(delta) {
-    if (_archiveYear === null || _archiveMonth === null) return; // #7 — 초기화 전 호출 방어
-    let m = _archiveMonth + delta, y = _archiveYear;
-    if (m < 1)  { m = 12; y--; }
-    if (m > 12) { m = 1;  y++; }
-    _archiveYear  = y;
-    _archiveMonth = m;
-    renderArchiveForMonth();
-}
-
-// 아카이브 토글
-function toggleArchive() {
-    const panel = document.getElementById('archivePanel');
-    const btn = document.getElementById('archiveToggleBtn');
-    if (panel) {
-        panel.classList.toggle('hidden');
-        if (btn) btn.textContent = panel.classList.contains('hidden') ? '아카이브 ▼' : '아카이브 ▲';
-    }
-}
-
-// 칸반 상태 변경 (드롭다운)
-async function changeKanbanStatus(contractNumber, newStatus) {
-    try {
-        const result = await eel.set_project_status(contractNumber, newStatus)();
-        if (result.success) {
-            if (newStatus === '준공') {
-                showToast('준공처리 완료. 월간 보고에 반영됩니다.');
-            }
-            loadKanbanBoard();
-        }
-    } catch (error) {
-        console.error('상태 변경 실패:', error);
-        showCustomAlert('오류', '상태 변경에 실패했습니다.', 'error');
-    }
-}
-
-function showToast(msg, type = 'default', duration = 2500) {
-    const t = document.createElement('div');
-    const colorMap = {
-        'error':   'bg-red-600',
-        'warning': 'bg-yellow-500',
-        'success': 'bg-green-600',
-        'default': 'bg-slate-800'
-    };
-    const color = colorMap[type] || colorMap['default'];
-    t.className = `fixed bottom-6 left-1/2 -translate-x-1/2 ${color} text-white text-sm px-4 py-2 rounded-lg shadow-lg z-50`;
-    t.textContent = msg;
-    document.body.appendChild(t);
-    setTimeout(() => t.remove(), duration);
-}
-
-// 새 프로젝트 접수 모달
-function showNewProjectModal() {
-    document.getElementById('npCompany').value = '';
-    document.getElementById('npShipName').value = '';
-    document.getElementById('npEngineModel').value = '';
-    document.getElementById('npWorkContent').value = '';
-    document.getElementById('newProjectModal').classList.remove('hidden');
-}
-
-function closeNewProjectModal() {
-    document.getElementById('newProjectModal').classList.add('hidden');
-}
-
-async function submitNewProject() {
-    const data = {
-        company: document.getElementById('npCompany').value.trim(),
-        ship_name: document.getElementById('npShipName').value.trim().toUpperCase(),
-        engine_model: document.getElementById('npEngineModel').value.trim(),
-        work_content: document.getElementById('npWorkContent').value.trim(),
-        username: currentUser ? currentUser.full_name : ''
-    };
-    if (!data.ship_name) {
-        showCustomAlert('알림', '선명을 입력해주세요.', 'info');
-        return;
-    }
-    try {
-        const result = await eel.create_board_project(data)();
-        if (result.success) {
-            closeNewProjectModal();
-            loadKanbanBoard();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('프로젝트 접수 실패:', error);
-        showCustomAlert('오류', '프로젝트 접수에 실패했습니다.', 'error');
-    }
-}
-
-// 착수 전환 모달 (계약번호 입력)
-function promptStartProject(projectId) {
-    document.getElementById('spProjectId').value = projectId;
-    const now = new Date();
-    document.getElementById('spContractYear').value = now.getFullYear();
-    document.getElementById('spContractSeq').value = '001';
-    document.getElementById('startProjectModal').classList.remove('hidden');
-}
-
-function closeStartProjectModal() {
-    document.getElementById('startProjectModal').classList.add('hidden');
-}
-
-async function confirmStartProject() {
-    const projectId = parseInt(document.getElementById('spProjectId').value);
-    const year = document.getElementById('spContractYear').value.trim();
-    const seq = document.getElementById('spContractSeq').value.trim().padStart(3, '0');
-    const contractNumber = `SH-${year}-${seq}-T`;
-
-    try {
-        const result = await eel.update_board_project(projectId, {
-            contract_number: contractNumber,
-            status: '착수'
-        })();
-        if (result.success) {
-            closeStartProjectModal();
-            loadKanbanBoard();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('착수 전환 실패:', error);
-        showCustomAlert('오류', '착수 전환에 실패했습니다.', 'error');
-    }
-}
-
-// 보드 프로젝트 삭제
-async function deleteBoardProject(projectId) {
-    if (!confirm('이 접수 프로젝트를 삭제하시겠습니까?')) return;
-    try {
-        const result = await eel.delete_board_project(projectId)();
-        if (result.success) {
-            loadKanbanBoard();
-        }
-    } catch (error) {
-        console.error('프로젝트 삭제 실패:', error);
-        showCustomAlert('오류', '프로젝트 삭제에 실패했습니다.', 'error');
-    }
-}
-
 // ============================================================================
 // 댓글 시스템
 // ============================================================================
 
-let _commentPollTimer = null;
-
 function openCommentModal(contractNumber, boardProjectId, title) {
     document.getElementById('commentContractNumber').value = contractNumber || '';
     document.getElementById('commentBoardProjectId').value = boardProjectId || '';
@@ -1095,18 +450,13 @@ function openCommentModal(contractNumber, boardProjectId, title) {
         textarea._commentKeydownBound = true;
     }
 
-    // T2c: 자동 폴링 시작 (10초 주기)
-    clearInterval(_commentPollTimer);
-    _commentPollTimer = setInterval(async () => {
-        try { await loadComments(); } catch(e) { console.warn('댓글 자동 갱신 실패:', e); }
-    }, 10000);
-
-    // 클라우드 pull 후 댓글 로드 (실패해도 로컬 DB로 계속)
+    // 새 댓글은 변경 알림(_handleChangeEvents)으로 갱신 — 주기 폴링 없음
+    // 클라우드 DB가 마지막 동기화 이후 바뀐 경우에만 pull 후 댓글 로드 (실패해도 로컬 DB로 계속)
     (async () => {
         try {
-            const syncMode = await eel.get_cloud_sync_mode()();
+            const syncMode = await eelFetch('get_cloud_sync_mode');
             if (syncMode && syncMode !== 'standalone') {
-                await eel.sync_from_cloud()();
+                await eel.sync_from_cloud(true)();
             }
         } catch (e) {
             console.warn('댓글 모달 sync_from_cloud 실패:', e);
@@ -1116,9 +466,6 @@ function openCommentModal(contractNumber, boardProjectId, title) {
 }
 
 function closeCommentModal() {
-    // T2c: 폴링 해제
-    clearInterval(_commentPollTimer);
-    _commentPollTimer = null;
     document.getElementById('commentModal').classList.add('hidden');
 }
 
@@ -1131,7 +478,7 @@ async function loadComments() {
     try {
         let result;
         if (cn) {
-            result = await eel.get_project_comments(cn, 0)();
+            result = await eelFetch('get_project_comments', cn, 0);
         } else if (bpId) {
             result = await eel.get_project_comments('', parseInt(bpId))();
         } else {
@@ -1275,7 +622,7 @@ async function submitComment() {
             // 즉시 클라우드 push (백그라운드, 실패해도 댓글은 이미 등록됨)
             (async () => {
                 try {
-                    const syncMode = await eel.get_cloud_sync_mode()();
+                    const syncMode = await eelFetch('get_cloud_sync_mode');
                     if (syncMode && syncMode !== 'standalone') {
                         await eel.sync_to_cloud()();
                     }
@@ -1569,7 +916,7 @@ async function forceSaveWorkRecords() {
     if (_isSaving) return;
     try {
         const dateStr = formatDateForInput(currentDate);
-        const info = await eel.get_date_save_info(dateStr)();
+        const info = await eelFetch('get_date_save_info', dateStr);
 
         if (info.has_records && _dateLoadedAt && info.updated_at > _dateLoadedAt) {
             // 내가 로드한 이후 다른 사람이 저장함 → 덮어쓰기 확인
@@ -1618,7 +965,7 @@ async function _autoSaveWorkRecords() {
 
     // 충돌 감지 — 서버의 최신 저장 시각과 비교
     try {
-        const info = await eel.get_date_save_info(dateStr, 'day')();
+        const info = await eelFetch('get_date_save_info', dateStr, 'day');
         if (info && info.has_records && _dateLoadedAt && info.updated_at > _dateLoadedAt) {
             const who = info.updated_by || '다른 사용자';
             const when = info.updated_at ? info.updated_at.replace('T', ' ').substring(11, 16) : '';
@@ -2129,7 +1476,7 @@ async function autoExpandContractNumber(index, input) {
     if (!cn) return;
 
     try {
-        const result = await eel.get_latest_record_by_contract(cn)();
+        const result = await eelFetch('get_latest_record_by_contract', cn);
         if (!result || !result.found) return;
 
         const records = _getActiveRecords();
@@ -2339,6 +1686,197 @@ function showLoading(show, message = '처리 중...') {
     }
 }
 
+function showToast(msg, type = 'default', duration = 2500) {
+    const t = document.createElement('div');
+    const colorMap = {
+        'error':   'bg-red-600',
+        'warning': 'bg-yellow-500',
+        'success': 'bg-green-600',
+        'default': 'bg-slate-800'
+    };
+    const color = colorMap[type] || colorMap['default'];
+    t.className = `fixed bottom-6 left-1/2 -translate-x-1/2 ${color} text-white text-sm px-4 py-2 rounded-lg shadow-lg z-50`;
+    t.textContent = msg;
+    document.body.appendChild(t);
+    setTimeout(() => t.remove(), duration);
+}
+
+// ============================================================================
+// 데이터 변경 알림 (서버 롱폴링)
+// ============================================================================
+
+let _changeSeq = null;
+let _changeListenerRunning = false;
+let _dailyStale = false;
+const _dashboardStale = { chart: true, board: true, stats: true };
+
+/**
+ * 로그인 후 1회 시작 — wait_for_changes 롱폴링으로 서버 변경 이벤트를 받아
+ * 현재 보고 있는 화면(댓글·칸반·일일 작업)만 갱신한다. 로그아웃 시 종료.
+ */
+async function startChangeListener() {
+    if (_changeListenerRunning) return;
+    _changeListenerRunning = true;
+    while (currentUser) {
+        try {
+            const res = await eel.wait_for_changes(_changeSeq, 25)();
+            if (res && res.success) {
+                const first = _changeSeq === null;
+                _changeSeq = res.seq;
+                if (!first && res.events && res.events.length) _handleChangeEvents(res.events);
+            } else {
+                await new Promise(resolve => setTimeout(resolve, 3000));
+            }
+        } catch (e) {
+            console.warn('변경 알림 수신 실패:', e);
+            await new Promise(resolve => setTimeout(resolve, 5000));
+        }
+    }
+    _changeListenerRunning = false;
+}
+
+function _handleChangeEvents(events) {
+    const topics = new Set(events.map(e => e.topic));
+    const all = topics.has('all');
+    const has = topic => all || topics.has(topic);
+
+    // 변경 전 데이터로 진행 중인 조회에 새 요청이 합류하지 않도록
+    invalidateEelFetch();
+    if (has('work_records') || has('board') || has('comments')) {
+        Object.keys(_dashboardStale).forEach(k => { _dashboardStale[k] = true; });
+        _refreshVisibleDashboardTab();
+    }
+    if (has('comments')) _refreshOpenComments(events, all);
+    if (has('work_records') || has('vacation')) _refreshDailyOnChange(events);
+    if (topics.has('update') && typeof checkStagedUpdate === 'function') checkStagedUpdate();
+}
+
+function _refreshVisibleDashboardTab() {
+    const dashboardView = document.getElementById('dashboardView');
+    if (!dashboardView || dashboardView.classList.contains('hidden')) return;
+    const visible = [['chart', 'chartTab'], ['board', 'boardTab'], ['stats', 'statsTab']]
+        .find(([, id]) => { const el = document.getElementById(id); return el && !el.classList.contains('hidden'); });
+    if (visible) showDashboardTab(visible[0]);
+}
+
+function _refreshOpenComments(events, all) {
+    const modal = document.getElementById('commentModal');
+    if (!modal || modal.classList.contains('hidden')) return;
+    const cn = document.getElementById('commentContractNumber').value;
+    const bpId = document.getElementById('commentBoardProjectId').value;
+    const key = cn ? `cn:${cn}` : `bp:${bpId}`;
+    if (all || events.some(e => e.topic === 'comments' && e.key === key)) loadComments();
+}
+
+function _refreshDailyOnChange(events) {
+    if (_isSaving || !currentDate) return;
+    const dateStr = formatDateForInput(currentDate);
+    const tab = currentWorkTab === 'night' ? 'night' : 'day';
+    const loadedAt = tab === 'night' ? _nightDateLoadedAt : _dateLoadedAt;
+    // 이 화면이 마지막으로 조회/저장한 뒤에 발생한 현재 날짜 변경만 반영
+    const hit = events.some(e => {
+        if (loadedAt && new Date(e.ts * 1000).toISOString() <= loadedAt) return false;
+        if (e.topic === 'all') return true;
+        if (e.topic === 'work_records') return !e.key || e.key.startsWith(`${dateStr}:`);
+        if (e.topic === 'vacation') return e.key === dateStr;
+        return false;
+    });
+    if (!hit) return;
+
+    const dailyView = document.getElementById('dailyView');
+    if (!dailyView || dailyView.classList.contains('hidden')) {
+        _dailyStale = true;
+        return;
+    }
+    if (_hasUnsavedChanges('any')) {
+        showToast('다른 곳에서 이 날짜의 작업 내용이 변경되었습니다. 저장 전 확인하세요.', 'warning', 4000);
+        return;
+    }
+    if (tab === 'night') loadNightRecords(); else loadWorkRecords();
+}
+
+/**
+ * 컬럼형 응답(src/utils/columnar.py encode_columnar) → 객체 배열 복원.
+ * 컬럼형이 아니면 그대로 반환하므로 기존 배열 응답에도 안전하게 사용할 수 있다.
+ */
+function decodeColumnar(payload) {
+    if (!payload || payload.format !== 'columnar') return payload;
+    const { fields = [], columns = [], length = 0 } = payload;
+    const dicts = payload.dicts || {};
+    // sparse: {필드: 키가 없는 행 번호 목록} — 값이 null인 키와 구분해 그 행에서만 키를 뺀다
+    const missing = {};
+    for (const [field, rows] of Object.entries(payload.sparse || {})) missing[field] = new Set(rows);
+    const aliases = Object.entries(payload.aliases || {});
+    const records = new Array(length);
+    for (let i = 0; i < length; i++) {
+        const rec = {};
+        for (let f = 0; f < fields.length; f++) {
+            const field = fields[f];
+            if (missing[field] && missing[field].has(i)) continue;
+            let v = columns[f][i];
+            if (dicts[field]) v = dicts[field][v];
+            rec[field] = v;
+        }
+        for (const [alias, src] of aliases) {
+            if (src in rec) rec[alias] = rec[src];
+        }
+        records[i] = rec;
+    }
+    return records;
+}
+
+/**
+ * 작업일 비트맵(src/utils/columnar.py encode_day_bitmap) → 'YYYY-MM-DD' 배열.
+ * origin('YYYY-MM-DD') + offset일부터 비트 i(바이트 i>>3의 하위 비트부터)가 하루.
+ */
+function decodeDayBitmap(origin, offset, bitmap) {
+    if (!bitmap) return [];
+    const [y, m, d] = origin.split('-').map(Number);
+    const base = Date.UTC(y, m - 1, d) + offset * 86400000;
+    const bytes = atob(bitmap);
+    const dates = [];
+    for (let i = 0; i < bytes.length; i++) {
+        const byte = bytes.charCodeAt(i);
+        if (!byte) continue;
+        for (let bit = 0; bit < 8; bit++) {
+            if (byte & (1 << bit)) {
+                dates.push(new Date(base + (i * 8 + bit) * 86400000).toISOString().slice(0, 10));
+            }
+        }
+    }
+    return dates;
+}
+
+/**
+ * 백그라운드 작업(get_job_status) 완료까지 폴링.
+ * onProgress(status)로 진행 상황 전달, 완료 시 최종 상태 객체 반환.
+ */
+async function waitForJob(jobId, onProgress = null, intervalMs = 700) {
+    while (true) {
+        const status = await eel.get_job_status(jobId)();
+        if (!status || !status.success) {
+            return { status: 'failed', message: status?.message || '작업을 찾을 수 없습니다.' };
+        }
+        if (status.status !== 'queued' && status.status !== 'running') return status;
+        if (onProgress) onProgress(status);
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+}
+
+/**
+ * job_id를 반환하는 API 응답이면 작업 완료를 기다려 원래 API 결과(dict)를 반환.
+ * 일반 응답은 그대로 반환하므로 기존 호출부를 감싸기만 하면 된다.
+ */
+async function awaitJobResult(response, onProgress = null) {
+    if (!response || !response.job_id) return response;
+    const job = await waitForJob(response.job_id, onProgress);
+    if (job.result && typeof job.result === 'object') return job.result;
+    return {
+        success: job.status === 'completed',
+        message: job.message || (job.status === 'cancelled' ? '작업이 취소되었습니다.' : '작업 중 오류가 발생했습니다.')
+    };
+}
+
 function showCustomAlert(title, message, type = 'success') {
     const alertEl = document.getElementById('customAlert');
     const titleEl = document.getElementById('alertTitle');
@@ -2424,12 +1962,51 @@ document.addEventListener('DOMContentLoaded', function() {
     setupContractWheelNavigation();
 });
 
-async function searchRecordsWithOt(searchType, query) {
-    return await eel.search_records_with_ot(searchType, query)();
+const _SEARCH_PAGE_SIZE = 300;
+let _searchRequestSeq = 0; // 새 조회 시작 시 이전 조회의 이어받기 중단용
+
+async function searchRecordsWithOt(searchType, query, pageSize = 0, cursor = null, descending = false) {
+    const result = await eel.search_records_with_ot(searchType, query, true, pageSize, cursor, descending)();
+    if (result && result.records) result.records = decodeColumnar(result.records);
+    return result;
 }
 
-async function searchByContract() {
-    const resultDiv = document.getElementById('statusSearchResult');
+/**
+ * 최신순 키셋 페이지 조회 — 첫 페이지를 즉시 렌더링하고 나머지 페이지는 이어서 받아 누적한다.
+ * summary(총 건수·인원·OT)는 서버 SQL 집계값이라 첫 페이지부터 전체 기준으로 표시된다.
+ */
+async function _runPagedSearch(searchType, query, resultDiv, label) {
+    const requestSeq = ++_searchRequestSeq;
+    showLoading(true, '조회 중...');
+    let result;
+    try {
+        result = await searchRecordsWithOt(searchType, query, _SEARCH_PAGE_SIZE, null, true);
+    } finally {
+        showLoading(false);
+    }
+    if (!result || !result.success) {
+        showCustomAlert('오류', result?.message || '조회 중 오류가 발생했습니다.', 'error');
+        return;
+    }
+    let cursor = result.hasMore ? result.nextCursor : null;
+    _searchSortState.loading = !!cursor;
+    renderSearchResults(result.records || [], resultDiv, query, label, result.summary || null);
+    while (cursor && requestSeq === _searchRequestSeq) {
+        const page = await searchRecordsWithOt(searchType, query, _SEARCH_PAGE_SIZE, cursor, true);
+        if (requestSeq !== _searchRequestSeq) return;
+        if (!page || !page.success) break;
+        cursor = page.hasMore ? page.nextCursor : null;
+        _searchSortState.loading = !!cursor;
+        _appendSearchPage(page.records || []);
+    }
+    if (requestSeq === _searchRequestSeq && _searchSortState.loading) {
+        _searchSortState.loading = false;
+        _updateSearchHeader();
+    }
+}
+
+async function searchByContract() {
+    const resultDiv = document.getElementById('statusSearchResult');
     if (!resultDiv) return;
 
     const contractNumber = getContractNumber();
@@ -2439,14 +2016,7 @@ async function searchByContract() {
     }
 
     try {
-        showLoading(true, '조회 중...');
-        const result = await searchRecordsWithOt('contract', contractNumber);
-        showLoading(false);
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '조회 중 오류가 발생했습니다.', 'error');
-            return;
-        }
-        renderSearchResults(result.records || [], resultDiv, contractNumber, '계약번호', result.summary || null);
+        await _runPagedSearch('contract', contractNumber, resultDiv, '계약번호');
     } catch (error) {
         console.error('현황 조회 오류:', error);
         showLoading(false);
@@ -2470,14 +2040,7 @@ async function searchByShipName() {
     }
 
     try {
-        showLoading(true, '조회 중...');
-        const result = await searchRecordsWithOt('ship', shipName);
-        showLoading(false);
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '조회 중 오류가 발생했습니다.', 'error');
-            return;
-        }
-        renderSearchResults(result.records || [], resultDiv, shipName, '선명', result.summary || null);
+        await _runPagedSearch('ship', shipName, resultDiv, '선명');
     } catch (error) {
         console.error('작업별 조회 오류:', error);
         showLoading(false);
@@ -2780,27 +2343,12 @@ function sortSearchBy(key) {
     _renderSortedSearch();
 }
 
-function _renderSortedSearch() {
-    const { records, container, term, type, key, dir, summary } = _searchSortState;
-    if (!container) return;
-
-    if (!records || records.length === 0) {
-        container.innerHTML = `<p class="text-slate-500">${escapeHtml(type)} "${escapeHtml(term)}"에 대한 작업 내역이 없습니다.</p>`;
-        return;
-    }
-
-    // 정렬
-    const sorted = [...records].sort((a, b) => {
-        const av = a[key] ?? '';
-        const bv = b[key] ?? '';
-        if (key === 'manpower' || key === 'ot') return ((parseFloat(av) || 0) - (parseFloat(bv) || 0)) * dir;
-        return String(av).localeCompare(String(bv), 'ko') * dir;
-    });
-
-    // 정렬 표시 헬퍼
-    const si = (k) => key === k ? (dir === -1 ? ' ▼' : ' ▲') : '';
-    const thCls = 'border p-2 text-center cursor-pointer hover:bg-indigo-200 select-none';
+const _SEARCH_VIRTUAL_MIN_ROWS = 200;   // 이 건수 이상이면 보이는 구간만 렌더링
+const _SEARCH_VIRTUAL_OVERSCAN = 30;    // 화면 위/아래로 미리 그려 둘 행 수
 
+/** 검색 결과 상단 요약·외주 공수 (페이지를 이어 받을 때는 이 부분만 다시 그린다) */
+function _searchHeaderHtml() {
+    const { records, term, type, summary, loading } = _searchSortState;
     const totalManpower = summary?.totalManpower || 0;
     const totalOt = summary?.totalOt || 0;
     const nightOt = summary?.nightOt || 0;
@@ -2833,18 +2381,92 @@ function _renderSortedSearch() {
         </div>`;
     }
 
-    let html = `
+    return `
         <div class="mb-1 text-sm text-slate-600">
             <span class="font-semibold">${escapeHtml(type)}: ${escapeHtml(term)}</span> |
-            총 <span class="font-semibold text-blue-600">${summary?.totalRecords ?? sorted.length}</span>건 |
+            총 <span class="font-semibold text-blue-600">${summary?.totalRecords ?? records.length}</span>건 |
             총 인원 <span class="font-semibold text-blue-600">${totalManpower.toFixed(1)}</span>공 |
             총 OT <span class="font-semibold text-orange-500">${totalOt.toFixed(1)}</span>h
             <span class="text-xs text-slate-400">(야간 ${nightOt.toFixed(1)}h / 휴일 ${holidayOt.toFixed(1)}h)</span>
+            ${loading ? `<span class="text-xs text-slate-400 ml-2">불러오는 중 ${records.length}/${summary?.totalRecords ?? '?'}건...</span>` : ''}
         </div>
-        ${outsourceHtml}
-        <div class="overflow-x-auto">
+        ${outsourceHtml}`;
+}
+
+function _updateSearchHeader() {
+    const header = _searchSortState.container?.querySelector('[data-search-header]');
+    if (header) header.innerHTML = _searchHeaderHtml();
+}
+
+function _searchComparator(key, dir) {
+    return (a, b) => {
+        const av = a[key] ?? '';
+        const bv = b[key] ?? '';
+        if (key === 'manpower' || key === 'ot') return ((parseFloat(av) || 0) - (parseFloat(bv) || 0)) * dir;
+        return String(av).localeCompare(String(bv), 'ko') * dir;
+    };
+}
+
+/**
+ * 이어 받은 검색 페이지 반영 — 전체를 다시 정렬·렌더링하지 않고 새 행만 정렬해 기존 순서에 병합한 뒤,
+ * 요약 영역과 (가상 스크롤이면) 보이는 구간만 다시 그린다. 최신순 기본 정렬에서는 새 행이 끝에 붙는다.
+ */
+function _appendSearchPage(rows) {
+    const st = _searchSortState;
+    if (!rows.length) { _updateSearchHeader(); return; }
+    st.records = st.records.concat(rows);
+    if (!st.sorted || !st.sorted.length || !st.tbody || !st.tbody.isConnected) {
+        _renderSortedSearch(true);
+        return;
+    }
+
+    const cmp = _searchComparator(st.key, st.dir);
+    const page = [...rows].sort(cmp);
+    const prev = st.sorted;
+    const atEnd = cmp(prev[prev.length - 1], page[0]) <= 0;
+    if (atEnd) {
+        st.sorted = prev.concat(page);
+    } else {
+        const merged = [];
+        let i = 0, j = 0;
+        while (i < prev.length && j < page.length) merged.push(cmp(prev[i], page[j]) <= 0 ? prev[i++] : page[j++]);
+        st.sorted = merged.concat(prev.slice(i), page.slice(j));
+    }
+    _updateSearchHeader();
+
+    if (atEnd && st.window && st.sorted.length < _SEARCH_VIRTUAL_MIN_ROWS) {
+        st.tbody.insertAdjacentHTML('beforeend', page.map(_searchRowHtml).join(''));
+        st.window = [0, st.sorted.length];
+    } else {
+        st.window = null;  // 가상 스크롤: 여백 높이·보이는 구간만 다시 계산
+        _renderSearchWindow();
+    }
+}
+
+function _renderSortedSearch(preserveScroll = false) {
+    const { records, container, term, type, key, dir } = _searchSortState;
+    if (!container) return;
+
+    if (!records || records.length === 0) {
+        container.innerHTML = `<p class="text-slate-500">${escapeHtml(type)} "${escapeHtml(term)}"에 대한 작업 내역이 없습니다.</p>`;
+        return;
+    }
+
+    const prevScroller = container.querySelector('[data-search-scroll]');
+    const prevScrollTop = preserveScroll && prevScroller ? prevScroller.scrollTop : 0;
+
+    // 정렬
+    const sorted = [...records].sort(_searchComparator(key, dir));
+
+    // 정렬 표시 헬퍼
+    const si = (k) => key === k ? (dir === -1 ? ' ▼' : ' ▲') : '';
+    const thCls = 'border p-2 text-center cursor-pointer hover:bg-indigo-200 select-none';
+
+    let html = `
+        <div data-search-header>${_searchHeaderHtml()}</div>
+        <div class="overflow-auto" style="max-height: 70vh" data-search-scroll>
         <table class="w-full border-collapse border">
-            <thead><tr class="bg-indigo-100">
+            <thead class="sticky top-0 z-10"><tr class="bg-indigo-100">
                 <th class="${thCls} w-24" onclick="sortSearchBy('date')">작업일${si('date')}</th>
                 <th class="${thCls} w-20" onclick="sortSearchBy('company')">선사${si('company')}</th>
                 <th class="${thCls} w-20" onclick="sortSearchBy('ship_name')">선명${si('ship_name')}</th>
@@ -2857,39 +2479,86 @@ function _renderSortedSearch() {
             </tr></thead>
             <tbody>`;
 
-    sorted.forEach(record => {
-        let dateDisplay = record.date || '';
-        if (dateDisplay) {
-            const d = new Date(dateDisplay + 'T00:00:00');
-            dateDisplay = `${d.getMonth() + 1}/${d.getDate()}`;
-        }
-        const workType = record.workType || record.work_type || 'day';
-        const badge = workType === 'night'
-            ? '<span class="text-xs bg-purple-100 text-purple-700 rounded px-1 ml-1">야간</span>'
-            : workType === 'holiday'
-                ? '<span class="text-xs bg-amber-100 text-amber-700 rounded px-1 ml-1">휴일 OT</span>'
-                : '';
-        const leader    = escapeHtml((record.leader    || '-').replace(/<i>/g, '').replace(/<\/i>/g, ''));
-        const teammates = escapeHtml((record.teammates || '-').replace(/<i>/g, '').replace(/<\/i>/g, ''));
-        const otDisplay = (parseFloat(record.ot) || 0) > 0
-            ? `<span class="font-semibold text-orange-500">+${(parseFloat(record.ot) || 0).toFixed(1)}h</span>`
-            : '';
-        const rowClass = record.isSynthetic ? 'bg-amber-50 hover:bg-amber-100' : 'hover:bg-blue-50';
-        html += `<tr class="${rowClass}">
-            <td class="border p-2 text-center">${escapeHtml(dateDisplay)}${badge}</td>
-            <td class="border p-2 text-center">${escapeHtml(record.company || '-')}</td>
-            <td class="border p-2 text-center">${escapeHtml(record.ship_name || '-')}</td>
-            <td class="border p-2 text-center">${escapeHtml(record.engine_model || '-')}</td>
-            <td class="border p-2">${escapeHtml(record.work_content || '-')}</td>
-            <td class="border p-2 text-center">${leader}</td>
-            <td class="border p-2 text-center font-semibold text-blue-600">${record.manpower > 0 ? record.manpower : ''}</td>
-            <td class="border p-2 text-center">${otDisplay}</td>
-            <td class="border p-2">${teammates}</td>
-        </tr>`;
-    });
-
     html += '</tbody></table></div>';
     container.innerHTML = html;
+
+    const scroller = container.querySelector('[data-search-scroll]');
+    _searchSortState.sorted = sorted;
+    _searchSortState.scroller = scroller;
+    _searchSortState.tbody = scroller.querySelector('tbody');
+    _searchSortState.window = null;
+    scroller.scrollTop = prevScrollTop;
+    scroller.addEventListener('scroll', () => {
+        if (_searchSortState._scrollRaf) return;
+        _searchSortState._scrollRaf = requestAnimationFrame(() => {
+            _searchSortState._scrollRaf = null;
+            _renderSearchWindow();
+        });
+    });
+    _renderSearchWindow();
+}
+
+/** 검색 결과 가상 스크롤 — 스크롤 위치 주변 행만 DOM에 두고 나머지는 높이만 차지하는 여백 행으로 대체 */
+function _renderSearchWindow() {
+    const { sorted, scroller, tbody } = _searchSortState;
+    if (!sorted || !scroller || !tbody || !tbody.isConnected) return;
+
+    if (sorted.length < _SEARCH_VIRTUAL_MIN_ROWS) {
+        if (!_searchSortState.window) tbody.innerHTML = sorted.map(_searchRowHtml).join('');
+        _searchSortState.window = [0, sorted.length];
+        return;
+    }
+
+    const rowHeight = _searchSortState.rowHeight || 41;
+    const first = Math.max(0, Math.floor(scroller.scrollTop / rowHeight) - _SEARCH_VIRTUAL_OVERSCAN);
+    const last = Math.min(sorted.length,
+        first + Math.ceil(scroller.clientHeight / rowHeight) + _SEARCH_VIRTUAL_OVERSCAN * 2);
+    const win = _searchSortState.window;
+    if (win && win[0] === first && win[1] === last) return;
+    _searchSortState.window = [first, last];
+
+    const spacer = h => h > 0 ? `<tr aria-hidden="true"><td colspan="9" style="height:${h}px;padding:0;border:0"></td></tr>` : '';
+    tbody.innerHTML = spacer(first * rowHeight)
+        + sorted.slice(first, last).map(_searchRowHtml).join('')
+        + spacer((sorted.length - last) * rowHeight);
+
+    // 실제 렌더링된 행 높이로 추정치 보정 (작업내용 줄바꿈 등으로 행 높이가 다를 수 있음)
+    const rendered = Array.from(tbody.rows).filter(tr => !tr.hasAttribute('aria-hidden'));
+    if (rendered.length) {
+        const avg = rendered.reduce((sum, tr) => sum + tr.offsetHeight, 0) / rendered.length;
+        if (avg > 0 && Math.abs(avg - rowHeight) > 1) _searchSortState.rowHeight = avg;
+    }
+}
+
+function _searchRowHtml(record) {
+    let dateDisplay = record.date || '';
+    if (dateDisplay) {
+        const d = new Date(dateDisplay + 'T00:00:00');
+        dateDisplay = `${d.getMonth() + 1}/${d.getDate()}`;
+    }
+    const workType = record.workType || record.work_type || 'day';
+    const badge = workType === 'night'
+        ? '<span class="text-xs bg-purple-100 text-purple-700 rounded px-1 ml-1">야간</span>'
+        : workType === 'holiday'
+            ? '<span class="text-xs bg-amber-100 text-amber-700 rounded px-1 ml-1">휴일 OT</span>'
+            : '';
+    const leader    = escapeHtml((record.leader    || '-').replace(/<i>/g, '').replace(/<\/i>/g, ''));
+    const teammates = escapeHtml((record.teammates || '-').replace(/<i>/g, '').replace(/<\/i>/g, ''));
+    const otDisplay = (parseFloat(record.ot) || 0) > 0
+        ? `<span class="font-semibold text-orange-500">+${(parseFloat(record.ot) || 0).toFixed(1)}h</span>`
+        : '';
+    const rowClass = record.isSynthetic ? 'bg-amber-50 hover:bg-amber-100' : 'hover:bg-blue-50';
+    return `<tr class="${rowClass}">
+        <td class="border p-2 text-center">${escapeHtml(dateDisplay)}${badge}</td>
+        <td class="border p-2 text-center">${escapeHtml(record.company || '-')}</td>
+        <td class="border p-2 text-center">${escapeHtml(record.ship_name || '-')}</td>
+        <td class="border p-2 text-center">${escapeHtml(record.engine_model || '-')}</td>
+        <td class="border p-2">${escapeHtml(record.work_content || '-')}</td>
+        <td class="border p-2 text-center">${leader}</td>
+        <td class="border p-2 text-center font-semibold text-blue-600">${record.manpower > 0 ? record.manpower : ''}</td>
+        <td class="border p-2 text-center">${otDisplay}</td>
+        <td class="border p-2">${teammates}</td>
+    </tr>`;
 }
 
 // ============================================================================
@@ -3017,7 +2686,7 @@ async function loadTelegramStatus() {
 
     // 봇이 활성화되어 있는지 확인
     try {
-        const botStatus = await eel.get_telegram_bot_enabled()();
+        const botStatus = await eelFetch('get_telegram_bot_enabled');
         const botDisabledDiv = document.getElementById('telegramBotDisabled');
         const linkedDiv = document.getElementById('telegramLinked');
         const notLinkedDiv = document.getElementById('telegramNotLinked');
@@ -3033,7 +2702,7 @@ async function loadTelegramStatus() {
 
         botDisabledDiv.classList.add('hidden');
 
-        const result = await eel.get_telegram_status(currentUser.user_id)();
+        const result = await eelFetch('get_telegram_status', currentUser.user_id);
         if (result.linked) {
             linkedDiv.classList.remove('hidden');
             notLinkedDiv.classList.add('hidden');
@@ -3230,1350 +2899,115 @@ async function saveUserSettings() {
 }
 
 // ============================================================================
-// 직원 관리 - 연차 관리
+// 설정 하위 탭
 // ============================================================================
 
-// 어드민 페이지 → 직원 관리 탭으로 전환 (mainApp 임시 사용)
-function showEmployeeFromAdmin() {
-    document.getElementById('adminApp').classList.add('hidden');
-    document.getElementById('mainApp').classList.remove('hidden');
-    const bar = document.getElementById('adminReturnBar');
-    if (bar) bar.classList.remove('hidden');
-    showView('employee');
-}
-
-// 직원 관리에서 어드민 페이지로 복귀
-function returnToAdminPanel() {
-    const bar = document.getElementById('adminReturnBar');
-    if (bar) bar.classList.add('hidden');
-    document.getElementById('mainApp').classList.add('hidden');
-    document.getElementById('adminApp').classList.remove('hidden');
-}
-
-function showEmployeeTab(tab) {
-    const tabMap = {
-        directory:  document.getElementById('employeeDirectoryTab'),
-        leave:      document.getElementById('employeeLeaveTab'),
-        leaveReport: document.getElementById('employeeLeaveReportTab'),
-        workhours:  document.getElementById('employeeWorkHoursTab')
-    };
-    const btnMap = {
-        directory:  document.getElementById('btnEmployeeDirectory'),
-        leave:      document.getElementById('btnEmployeeLeave'),
-        leaveReport: document.getElementById('btnEmployeeLeaveReport'),
-        workhours:  document.getElementById('btnEmployeeWorkHours')
-    };
-    // 모든 탭 패널 숨김
-    Object.values(tabMap).forEach(t => t && t.classList.add('hidden'));
-    // 버튼 스타일 업데이트
-    Object.keys(btnMap).forEach(key => {
-        const b = btnMap[key];
-        if (!b) return;
-        b.classList.remove('bg-blue-600', 'text-white', 'bg-slate-200',
-                           'bg-white', 'text-slate-600', 'border', 'border-slate-300', 'hover:bg-slate-50');
-        if (key === tab) {
-            b.classList.add('bg-blue-600', 'text-white');
-        } else {
-            b.classList.add('bg-white', 'text-slate-600', 'border', 'border-slate-300', 'hover:bg-slate-50');
-        }
-    });
-    if (tabMap[tab]) tabMap[tab].classList.remove('hidden');
-    if (tab === 'directory') loadEmployeeDirectory();
-    if (tab === 'leaveReport') loadLeaveMonthlyReport();
-    if (tab === 'workhours') _initWorkHoursSelectors();
-}
-
-function _normalizeEmployeeDirectoryExternalHeaders(headers = []) {
-    const normalized = Array.isArray(headers)
-        ? headers.map((header, index) => {
-            const value = String(header ?? '').trim();
-            return value || `외부계정${index + 1}`;
-        })
-        : [];
-    return normalized.length ? normalized : ['외부계정1', '외부계정2'];
-}
-
-function _normalizeEmployeeDirectoryExternalAccounts(accounts = [], headerCount = _employeeDirectoryExternalHeaders.length, fallback = []) {
-    const source = Array.isArray(accounts) ? accounts : [];
-    const result = [];
-    for (let i = 0; i < headerCount; i++) {
-        result.push(String(source[i] ?? fallback[i] ?? ''));
-    }
-    return result;
-}
-
-function _getEmployeeDirectoryColumnCount() {
-    return 8 + _employeeDirectoryExternalHeaders.length;
-}
+function showSettingsTab(tab) {
+    const userTab = document.getElementById('userSettingsTab');
+    const logTab  = document.getElementById('activityLogTab');
+    const erpTab  = document.getElementById('erpInputTab');
+    const btnUser = document.getElementById('btnSettingsUser');
+    const btnLog  = document.getElementById('btnSettingsLog');
+    const btnErp  = document.getElementById('btnSettingsErp');
 
-function _createEmptyEmployeeDirectoryRow(overrides = {}) {
-    const row = {
-        id: null,
-        department: '',
-        name: '',
-        rank: '',
-        phone: '',
-        address: '',
-        healthCheck: '',
-        ...overrides
-    };
-    row.externalAccounts = _normalizeEmployeeDirectoryExternalAccounts(
-        row.externalAccounts,
-        _employeeDirectoryExternalHeaders.length,
-        [row.externalAccount1 || '', row.externalAccount2 || '']
-    );
-    return row;
-}
-
-function _renderEmployeeDirectoryHeader() {
-    const headerRow = document.getElementById('employeeDirectoryHeaderRow');
-    if (!headerRow) return;
-
-    headerRow.innerHTML = `
-        <th class="border border-slate-200 px-3 py-3 text-center w-16">순번</th>
-        <th class="border border-slate-200 px-3 py-3 text-center w-32">부서</th>
-        <th class="border border-slate-200 px-3 py-3 text-center w-28">이름</th>
-        <th class="border border-slate-200 px-3 py-3 text-center w-24">직책</th>
-        <th class="border border-slate-200 px-3 py-3 text-center w-40">전화번호</th>
-        <th class="border border-slate-200 px-3 py-3 text-center" style="width: 28rem; min-width: 28rem;">주소</th>
-        ${_employeeDirectoryExternalHeaders.map((header, index) => `
-            <th class="border border-slate-200 px-2 py-2 text-center" style="min-width: 11rem; width: 11rem;">
-                <input type="text"
-                       value="${escapeHtml(header || '')}"
-                       class="w-full px-2 py-1.5 border border-slate-200 rounded bg-white text-center font-semibold text-sm focus:bg-blue-50"
-                       placeholder="외부계정${index + 1}"
-                       oninput="updateEmployeeDirectoryExternalHeader(${index}, this.value)">
-            </th>
-        `).join('')}
-        <th class="border border-slate-200 px-3 py-3 text-center w-36">건강검진</th>
-        <th class="border border-slate-200 px-3 py-3 text-center w-24">편집</th>
-    `;
+    const activeClass   = 'px-6 py-2 rounded-lg bg-blue-600 text-white font-semibold';
+    const inactiveClass = 'px-6 py-2 rounded-lg bg-slate-200 font-semibold';
 
-    const tableEl = document.getElementById('employeeDirectoryTableElement');
-    if (tableEl) {
-        tableEl.style.minWidth = `${1280 + Math.max(0, _employeeDirectoryExternalHeaders.length - 2) * 176}px`;
-    }
-}
+    // 모든 탭 숨기기
+    [userTab, logTab, erpTab].forEach(t => t?.classList.add('hidden'));
+    [btnUser, btnLog, btnErp].forEach(b => { if (b) b.className = inactiveClass; });
 
-async function loadEmployeeDirectory() {
-    const tbody = document.getElementById('employeeDirectoryTable');
-    if (!tbody) return;
-    _renderEmployeeDirectoryHeader();
-    tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-slate-400">불러오는 중...</td></tr>`;
-    try {
-        const result = await eel.get_employee_directory()();
-        if (!result?.success) {
-            tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-red-500">${escapeHtml(result?.message || '직원 명부를 불러오지 못했습니다.')}</td></tr>`;
-            return;
-        }
-        _employeeDirectoryExternalHeaders = _normalizeEmployeeDirectoryExternalHeaders(result.externalHeaders || []);
-        _employeeDirectoryData = (result.employees || []).map(row => _createEmptyEmployeeDirectoryRow(row));
-        if (_employeeDirectoryData.length === 0) {
-            _employeeDirectoryData = [_createEmptyEmployeeDirectoryRow()];
-        }
-        renderEmployeeDirectoryTable();
-    } catch (e) {
-        console.error('직원 명부 로드 실패:', e);
-        tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-red-500">직원 명부를 불러오지 못했습니다.</td></tr>`;
-    }
-    return;
-    tbody.innerHTML = '<tr><td colspan="10" class="px-4 py-8 text-center text-slate-400">불러오는 중...</td></tr>';
-    try {
-        const result = await eel.get_employee_directory()();
-        if (!result?.success) {
-            tbody.innerHTML = `<tr><td colspan="10" class="px-4 py-8 text-center text-red-500">${escapeHtml(result?.message || '직원 명부를 불러오지 못했습니다.')}</td></tr>`;
-            return;
-        }
-        _employeeDirectoryData = (result.employees || []).map(row => _createEmptyEmployeeDirectoryRow(row));
-        if (_employeeDirectoryData.length === 0) {
-            _employeeDirectoryData = [_createEmptyEmployeeDirectoryRow()];
+    if (tab === 'activityLog') {
+        if (logTab)  logTab.classList.remove('hidden');
+        if (btnLog)  btnLog.className = activeClass;
+        loadActivityLog(50);
+    } else if (tab === 'erpInput') {
+        if (erpTab)  erpTab.classList.remove('hidden');
+        if (btnErp)  btnErp.className = activeClass;
+        // 관리자이면 권한 관리 섹션 표시 + 목록 로드
+        const adminSec = document.getElementById('erpAdminSection');
+        if (adminSec) {
+            const isAdmin = currentUser?.role === 'admin';
+            adminSec.classList.toggle('hidden', !isAdmin);
+            if (isAdmin) loadErpPermList();
         }
-        renderEmployeeDirectoryTable();
-    } catch (e) {
-        console.error('직원 명부 로드 실패:', e);
-        tbody.innerHTML = '<tr><td colspan="10" class="px-4 py-8 text-center text-red-500">직원 명부를 불러오지 못했습니다.</td></tr>';
-    }
-}
-
-function renderEmployeeDirectoryTable() {
-    const tbody = document.getElementById('employeeDirectoryTable');
-    if (!tbody) return;
-    _renderEmployeeDirectoryHeader();
-    if (!_employeeDirectoryData.length) {
-        tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-slate-400">등록된 직원이 없습니다. 행 추가 버튼으로 시작해 주세요.</td></tr>`;
-        return;
-    }
-
-    tbody.innerHTML = _employeeDirectoryData.map((row, index) => `
-        <tr class="${index % 2 === 0 ? 'bg-white' : 'bg-slate-50'}">
-            <td class="border border-slate-200 px-2 py-2 text-center font-semibold text-slate-500">${index + 1}</td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.department || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'department', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.name || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center font-medium focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'name', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.rank || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'rank', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.phone || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'phone', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.address || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-left focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'address', this.value)">
-            </td>
-            ${(row.externalAccounts || []).map((value, accountIndex) => `
-                <td class="border border-slate-200 p-1">
-                    <input type="text" value="${escapeHtml(value || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                           oninput="updateEmployeeDirectoryExternalAccount(${index}, ${accountIndex}, this.value)">
-                </td>
-            `).join('')}
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.healthCheck || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'healthCheck', this.value)">
-            </td>
-            <td class="border border-slate-200 px-2 py-2 text-center">
-                <button onclick="removeEmployeeDirectoryRow(${index})" class="px-3 py-1.5 bg-red-50 text-red-600 rounded-lg text-xs font-semibold hover:bg-red-100">
-                    삭제
-                </button>
-            </td>
-        </tr>
-    `).join('');
-    return;
-    if (!_employeeDirectoryData.length) {
-        tbody.innerHTML = '<tr><td colspan="10" class="px-4 py-8 text-center text-slate-400">등록된 직원이 없습니다. 행 추가 버튼으로 시작해 주세요.</td></tr>';
-        return;
-    }
-
-    tbody.innerHTML = _employeeDirectoryData.map((row, index) => `
-        <tr class="${index % 2 === 0 ? 'bg-white' : 'bg-slate-50'}">
-            <td class="border border-slate-200 px-2 py-2 text-center font-semibold text-slate-500">${index + 1}</td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.department || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'department', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.name || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center font-medium focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'name', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.rank || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'rank', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.phone || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'phone', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.address || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-left focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'address', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.externalAccount1 || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'externalAccount1', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.externalAccount2 || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'externalAccount2', this.value)">
-            </td>
-            <td class="border border-slate-200 p-1">
-                <input type="text" value="${escapeHtml(row.healthCheck || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
-                       oninput="updateEmployeeDirectoryField(${index}, 'healthCheck', this.value)">
-            </td>
-            <td class="border border-slate-200 px-2 py-2 text-center">
-                <button onclick="removeEmployeeDirectoryRow(${index})" class="px-3 py-1.5 bg-red-50 text-red-600 rounded-lg text-xs font-semibold hover:bg-red-100">
-                    삭제
-                </button>
-            </td>
-        </tr>
-    `).join('');
-}
-
-function updateEmployeeDirectoryField(index, field, value) {
-    if (!_employeeDirectoryData[index]) return;
-    _employeeDirectoryData[index][field] = value;
-}
-
-function updateEmployeeDirectoryExternalHeader(index, value) {
-    if (index < 0 || index >= _employeeDirectoryExternalHeaders.length) return;
-    _employeeDirectoryExternalHeaders[index] = value;
-}
-
-function updateEmployeeDirectoryExternalAccount(rowIndex, accountIndex, value) {
-    if (!_employeeDirectoryData[rowIndex]) return;
-    if (!Array.isArray(_employeeDirectoryData[rowIndex].externalAccounts)) {
-        _employeeDirectoryData[rowIndex].externalAccounts = _normalizeEmployeeDirectoryExternalAccounts();
+    } else {
+        if (userTab) userTab.classList.remove('hidden');
+        if (btnUser) btnUser.className = activeClass;
     }
-    _employeeDirectoryData[rowIndex].externalAccounts[accountIndex] = value;
-}
-
-function addEmployeeDirectoryExternalColumn() {
-    _employeeDirectoryExternalHeaders.push(`외부계정${_employeeDirectoryExternalHeaders.length + 1}`);
-    _employeeDirectoryData = _employeeDirectoryData.map(row => _createEmptyEmployeeDirectoryRow(row));
-    renderEmployeeDirectoryTable();
 }
 
-function addEmployeeDirectoryRow() {
-    _employeeDirectoryData.push(_createEmptyEmployeeDirectoryRow());
-    renderEmployeeDirectoryTable();
-}
+// ============================================================================
+// 활동 로그
+// ============================================================================
 
-function removeEmployeeDirectoryRow(index) {
-    if (!_employeeDirectoryData[index]) return;
-    _employeeDirectoryData.splice(index, 1);
-    if (_employeeDirectoryData.length === 0) {
-        _employeeDirectoryData.push(_createEmptyEmployeeDirectoryRow());
-    }
-    renderEmployeeDirectoryTable();
-}
-
-async function saveEmployeeDirectory() {
-    {
-    const rows = _employeeDirectoryData.map(row => ({
-        id: row.id || null,
-        department: (row.department || '').trim(),
-        name: (row.name || '').trim(),
-        rank: (row.rank || '').trim(),
-        phone: (row.phone || '').trim(),
-        address: (row.address || '').trim(),
-        externalAccounts: _normalizeEmployeeDirectoryExternalAccounts(row.externalAccounts).map(value => String(value || '').trim()),
-        healthCheck: (row.healthCheck || '').trim()
-    }));
-    const externalHeaders = _normalizeEmployeeDirectoryExternalHeaders(_employeeDirectoryExternalHeaders).map(header => header.trim());
-    const invalidRow = rows.findIndex(row => !row.name && (
-        row.department || row.rank || row.phone || row.address || row.healthCheck ||
-        (row.externalAccounts || []).some(value => value)
-    ));
-    if (invalidRow >= 0) {
-        showCustomAlert('알림', `${invalidRow + 1}번 행의 이름을 입력해 주세요.`, 'warning');
-        return;
-    }
-    try {
-        const result = await eel.save_employee_directory(JSON.stringify({
-            externalHeaders,
-            rows
-        }))();
-        if (!result?.success) {
-            showToast(result?.message || '직원 명부 저장에 실패했습니다.', 'error');
-            return;
-        }
-        showToast('직원 명부가 저장되었습니다.', 'success');
-        await Promise.all([
-            loadEmployeeDirectory(),
-            loadLeaveEmployeeList()
-        ]);
-    } catch (e) {
-        console.error('직원 명부 저장 실패:', e);
-        showToast('직원 명부 저장 중 오류가 발생했습니다.', 'error');
-    }
-    return;
-    }
-    const rows = _employeeDirectoryData.map(row => ({
-        id: row.id || null,
-        department: (row.department || '').trim(),
-        name: (row.name || '').trim(),
-        rank: (row.rank || '').trim(),
-        phone: (row.phone || '').trim(),
-        address: (row.address || '').trim(),
-        externalAccount1: (row.externalAccount1 || '').trim(),
-        externalAccount2: (row.externalAccount2 || '').trim(),
-        healthCheck: (row.healthCheck || '').trim()
-    }));
-    const invalidRow = rows.findIndex(row => !row.name && (row.department || row.rank || row.phone || row.address || row.externalAccount1 || row.externalAccount2 || row.healthCheck));
-    if (invalidRow >= 0) {
-        showCustomAlert('알림', `${invalidRow + 1}번 행의 이름을 입력해 주세요.`, 'warning');
-        return;
-    }
+async function loadActivityLog(limit = 50, containerId = 'activityLogContent') {
+    const container = document.getElementById(containerId);
+    if (!container) return;
+    container.innerHTML = '<p class="text-slate-400">불러오는 중...</p>';
     try {
-        const result = await eel.save_employee_directory(JSON.stringify(rows))();
-        if (!result?.success) {
-            showToast(result?.message || '직원 명부 저장에 실패했습니다.', 'error');
+        const logs = await eelFetch('get_activity_logs', limit);
+        if (!logs || logs.length === 0) {
+            container.innerHTML = '<p class="text-slate-400">활동 로그가 없습니다.</p>';
             return;
         }
-        showToast('직원 명부가 저장되었습니다.', 'success');
-        await Promise.all([
-            loadEmployeeDirectory(),
-            loadLeaveEmployeeList()
-        ]);
+        const actionLabel = { save: '저장', load: '조회', delete: '삭제', export: '내보내기', import: '가져오기' };
+        const actionColor = {
+            save:   'bg-blue-100 text-blue-700',
+            load:   'bg-slate-100 text-slate-600',
+            delete: 'bg-red-100 text-red-700',
+            export: 'bg-green-100 text-green-700',
+            import: 'bg-orange-100 text-orange-700'
+        };
+        let html = `<div class="overflow-x-auto">
+            <table class="w-full border-collapse border text-sm">
+                <thead><tr class="bg-slate-100">
+                    <th class="border p-2 text-center w-36">시각</th>
+                    <th class="border p-2 text-center w-24">사용자</th>
+                    <th class="border p-2 text-center w-20">작업</th>
+                    <th class="border p-2 text-center w-28">대상</th>
+                    <th class="border p-2 text-left">상세</th>
+                </tr></thead><tbody>`;
+        logs.forEach(log => {
+            const ts = log.timestamp ? log.timestamp.replace('T', ' ').substring(0, 16) : '';
+            const label = actionLabel[log.action] || log.action;
+            const colorClass = actionColor[log.action] || 'bg-slate-100 text-slate-600';
+            html += `<tr class="hover:bg-slate-50">
+                <td class="border p-2 text-center text-slate-500">${escapeHtml(ts)}</td>
+                <td class="border p-2 text-center font-medium">${escapeHtml(log.user || '')}</td>
+                <td class="border p-2 text-center"><span class="px-2 py-0.5 rounded text-xs font-semibold ${colorClass}">${escapeHtml(label)}</span>${log.repeat_count > 1 ? ` <span class="text-xs text-slate-400">×${log.repeat_count}</span>` : ''}</td>
+                <td class="border p-2 text-center text-slate-600">${escapeHtml(log.target || '')}</td>
+                <td class="border p-2 text-slate-600">${escapeHtml(log.details || '')}</td>
+            </tr>`;
+        });
+        html += `</tbody></table></div>
+            <p class="text-xs text-slate-400 mt-2 text-right">총 ${logs.length}건</p>`;
+        container.innerHTML = html;
     } catch (e) {
-        console.error('직원 명부 저장 실패:', e);
-        showToast('직원 명부 저장 중 오류가 발생했습니다.', 'error');
+        console.error('활동 로그 로드 오류:', e);
+        container.innerHTML = '<p class="text-red-400">로그 로드 실패</p>';
     }
 }
 
 // ============================================================================
-// 연차 월별 보고
+// J: 알림 센터
 // ============================================================================
 
-let _leaveReportData = [];  // T3: 현재 표시 중인 직원 데이터 (순서 변경용)
-let _leaveExcluded = [];    // 제외된 직원 이름 목록
-let _leaveReportYear = 0;   // T3: 현재 조회 연도
-
-async function loadLeaveMonthlyReport() {
-    const sel = document.getElementById('leaveReportYear');
-    if (!sel) return;
-    // 연도 셀렉터 초기화 (처음 호출 시)
-    if (!sel.options.length) {
-        const curYear = new Date().getFullYear();
-        for (let y = curYear; y >= curYear - 2; y--) {
-            const opt = document.createElement('option');
-            opt.value = y;
-            opt.textContent = y + '년';
-            sel.appendChild(opt);
-        }
-    }
-    const year = parseInt(sel.value) || new Date().getFullYear();
-    const container = document.getElementById('leaveReportTableContainer');
-    if (!container) return;
-    container.innerHTML = '<p class="text-slate-400 text-sm">불러오는 중...</p>';
-    try {
-        // T3: 저장된 순서 먼저 로드
-        const [result, orderResult, excludedResult] = await Promise.all([
-            eel.get_all_leave_monthly_report(year)(),
-            eel.get_employee_leave_order()(),
-            eel.get_employee_leave_excluded()()
-        ]);
-        // 제외 목록 파싱
-        _leaveExcluded = [];
-        if (excludedResult && excludedResult.excluded) {
-            try { _leaveExcluded = JSON.parse(excludedResult.excluded); } catch(e) { console.warn('연차 제외자 파싱 실패:', e); }
-        }
-        if (result && result.success) {
-            let data = result.data || [];
-            // 제외된 직원 필터링
-            data = data.filter(emp => !_leaveExcluded.includes(emp.name));
-            // T3: 저장된 순서가 있으면 적용
-            if (orderResult && orderResult.order) {
-                try {
-                    const savedOrder = JSON.parse(orderResult.order);
-                    data = _applyLeaveOrder(data, savedOrder);
-                } catch(e) { console.warn('직원 순서 파싱 실패:', e); }
-            }
-            renderLeaveMonthlyReport(data, year);
-        } else {
-            container.innerHTML = '<p class="text-red-500 text-sm">데이터 조회 실패</p>';
-        }
-    } catch (e) {
-        container.innerHTML = '<p class="text-red-500 text-sm">오류: ' + escapeHtml(String(e)) + '</p>';
-    }
-}
-
-// T3: 저장된 이름 순서대로 data 배열 재정렬 (저장된 이름 없는 항목은 뒤에 추가)
-function _applyLeaveOrder(data, savedOrder) {
-    const orderMap = {};
-    savedOrder.forEach((name, idx) => { orderMap[name] = idx; });
-    return [...data].sort((a, b) => {
-        const ia = orderMap[a.name] ?? 9999;
-        const ib = orderMap[b.name] ?? 9999;
-        return ia - ib;
-    });
-}
+let _notifData = [];
 
-// T3: 직원 행 이동
-function moveLeaveRow(idx, dir) {
-    const newIdx = idx + dir;
-    if (newIdx < 0 || newIdx >= _leaveReportData.length) return;
-    [_leaveReportData[idx], _leaveReportData[newIdx]] = [_leaveReportData[newIdx], _leaveReportData[idx]];
-    renderLeaveMonthlyReport(_leaveReportData, _leaveReportYear);
-}
+async function loadNotifications() {
+    _notifData = [];
 
-// T3: 현재 순서 DB에 저장
-async function saveLeaveOrder() {
-    const names = _leaveReportData.map(e => e.name);
+    // 1) 업데이트 확인 (캐시 사용)
     try {
-        const r = await eel.save_employee_leave_order(JSON.stringify(names))();
-        if (r && r.success) {
-            showToast('직원 순서가 저장되었습니다.', 'success');
-        } else {
-            showToast('순서 저장 실패', 'error');
-        }
-    } catch(e) {
-        showToast('순서 저장 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-// 직원 제거 — 제외 목록에 추가 후 테이블에서 숨김
-async function removeLeaveEmployee(idx) {
-    const emp = _leaveReportData[idx];
-    if (!emp) return;
-    const name = emp.name;
-    if (!confirm(`"${name}"을(를) 보고서에서 제거하시겠습니까?\n하단 목록에서 복원할 수 있습니다.`)) return;
-    _leaveExcluded.push(name);
-    _leaveReportData.splice(idx, 1);
-    try {
-        await Promise.all([
-            eel.set_employee_leave_excluded(JSON.stringify(_leaveExcluded))(),
-            eel.save_employee_leave_order(JSON.stringify(_leaveReportData.map(e => e.name)))()
-        ]);
-        showToast(`${escapeHtml(name)}이(가) 보고서에서 제거되었습니다.`, 'success');
-        renderLeaveMonthlyReport(_leaveReportData, _leaveReportYear);
-    } catch(e) {
-        showToast('제거 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-// 제외된 직원 복원
-async function restoreLeaveEmployee(name) {
-    _leaveExcluded = _leaveExcluded.filter(n => n !== name);
-    try {
-        await eel.set_employee_leave_excluded(JSON.stringify(_leaveExcluded))();
-        showToast(`${escapeHtml(name)}이(가) 복원되었습니다.`, 'success');
-        loadLeaveMonthlyReport();
-    } catch(e) {
-        showToast('복원 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-function renderLeaveMonthlyReport(data, year) {
-    const container = document.getElementById('leaveReportTableContainer');
-    if (!container) return;
-    if (!data || data.length === 0) {
-        container.innerHTML = '<p class="text-slate-400 text-sm">연차 데이터가 없습니다.</p>';
-        return;
-    }
-
-    // T3: 모듈 변수 업데이트
-    _leaveReportData = data;
-    _leaveReportYear = year;
-
-    const curYear = new Date().getFullYear();
-    const maxMonth = (year === curYear) ? new Date().getMonth() + 1 : 12;
-    const monthNames = ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'];
-
-    let html = `<div id="leaveReportPrintArea">
-        <h3 class="text-lg font-bold text-center mb-3 hidden" id="leaveReportPrintTitle">${escapeHtml(String(year))}년 연차 현황</h3>
-        <div class="mb-2 no-print flex items-center gap-2">
-            <span class="text-xs text-slate-500">↑↓ 버튼으로 순서를 조정하고</span>
-            <button onclick="saveLeaveOrder()" class="px-3 py-1 bg-slate-600 text-white rounded text-xs font-semibold hover:bg-slate-700">💾 순서 저장</button>
-        </div>
-        <table class="w-full border-collapse text-sm">
-            <thead>
-                <tr class="bg-blue-50">
-                    <th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap no-print">순서</th>
-                    <th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">순번</th>
-                    <th class="border border-gray-400 px-3 py-2 text-center whitespace-nowrap">이름</th>`;
-    for (let m = 1; m <= maxMonth; m++) {
-        html += `<th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">${monthNames[m-1]}</th>`;
-    }
-    html += `<th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">연차 생성일</th>
-                    <th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">잔여 연차</th>
-                    <th class="border border-gray-400 px-4 py-2 text-center whitespace-nowrap">서명</th>
-                </tr>
-            </thead>
-            <tbody>`;
-
-    data.forEach((emp, idx) => {
-        html += `<tr class="${idx % 2 === 0 ? 'bg-white' : 'bg-slate-50'}">
-            <td class="border border-gray-400 px-1 py-1 text-center no-print whitespace-nowrap">
-                <button onclick="moveLeaveRow(${idx}, -1)" class="px-1 text-slate-500 hover:text-blue-600 disabled:opacity-30 text-xs" ${idx === 0 ? 'disabled' : ''}>▲</button>
-                <button onclick="moveLeaveRow(${idx}, 1)" class="px-1 text-slate-500 hover:text-blue-600 disabled:opacity-30 text-xs" ${idx === data.length - 1 ? 'disabled' : ''}>▼</button>
-                <button onclick="removeLeaveEmployee(${idx})" class="px-1 text-red-400 hover:text-red-600 text-xs ml-1" title="보고서에서 제거">✕</button>
-            </td>
-            <td class="border border-gray-400 px-2 py-2 text-center">${idx + 1}</td>
-            <td class="border border-gray-400 px-3 py-2 text-center font-medium">${escapeHtml(emp.name)}</td>`;
-        for (let m = 1; m <= maxMonth; m++) {
-            const used = emp.monthly[m];
-            html += `<td class="border border-gray-400 px-2 py-2 text-center">${used != null ? formatLeaveDays(used) : '-'}</td>`;
-        }
-        const remaining = emp.remaining;
-        const remColor = remaining < 0 ? 'text-red-600 font-bold' : remaining === 0 ? 'text-slate-500' : 'text-green-700 font-semibold';
-        html += `<td class="border border-gray-400 px-2 py-2 text-center">${emp.generation_month}월 ${emp.generation_day || 1}일</td>
-            <td class="border border-gray-400 px-2 py-2 text-center ${remColor}">${formatLeaveDays(remaining)}</td>
-            <td class="border border-gray-400 px-4 py-2 text-center">&nbsp;</td>
-        </tr>`;
-    });
-
-    html += `</tbody></table>`;
-
-    // 제외된 직원 복원 영역 (인쇄 제외)
-    if (_leaveExcluded.length > 0) {
-        html += `<div class="mt-3 no-print p-3 bg-slate-50 rounded border border-slate-200">
-            <p class="text-xs text-slate-500 font-semibold mb-2">🚫 제외된 직원 — 클릭하면 복원됩니다</p>
-            <div class="flex flex-wrap gap-2">`;
-        _leaveExcluded.forEach(name => {
-            html += `<button onclick="restoreLeaveEmployee(this.dataset.name)" data-name="${escapeHtml(name)}"
-                class="px-2 py-1 bg-white border border-slate-300 rounded text-xs text-slate-600 hover:bg-blue-50 hover:border-blue-400 hover:text-blue-700">
-                ↩ ${escapeHtml(name)}</button>`;
-        });
-        html += `</div></div>`;
-    }
-
-    html += `</div>`;
-    container.innerHTML = html;
-}
-
-function printLeaveReport() {
-    // 인쇄 전 타이틀 임시 표시
-    const title = document.getElementById('leaveReportPrintTitle');
-    if (title) title.classList.remove('hidden');
-    window.print();
-    if (title) title.classList.add('hidden');
-}
-
-function showAddLeaveRowModal() {
-    const modal = document.getElementById('addLeaveRowModal');
-    const nameEl = document.getElementById('addLeaveRowName');
-    const dayEl = document.getElementById('addLeaveRowDay');
-    if (!modal) return;
-    if (nameEl) nameEl.value = '';
-    if (dayEl) dayEl.value = '1';
-    modal.classList.remove('hidden');
-    if (nameEl) nameEl.focus();
-}
-
-async function confirmAddLeaveRow() {
-    const nameEl = document.getElementById('addLeaveRowName');
-    const monthEl = document.getElementById('addLeaveRowMonth');
-    const dayEl = document.getElementById('addLeaveRowDay');
-    const name = nameEl ? nameEl.value.trim() : '';
-    const month = parseInt(monthEl ? monthEl.value : '1') || 1;
-    const day = parseInt(dayEl ? dayEl.value : '1') || 1;
-    if (!name) { showToast('직원명을 입력해주세요.', 'error'); return; }
-    try {
-        const r = await eel.save_employee_annual_config(name, month, '', day)();
-        document.getElementById('addLeaveRowModal').classList.add('hidden');
-        if (r && r.success) {
-            showToast(escapeHtml(name) + ' 추가 완료');
-            loadLeaveMonthlyReport();
-        } else {
-            showToast('추가 실패', 'error');
-        }
-    } catch(e) {
-        showToast('오류: ' + String(e), 'error');
-    }
-}
-
-async function toggleLeaveReportEdit(userId, enabled) {
-    if (!currentUser) return;
-    const btn = document.querySelector(`button[onclick*="toggleLeaveReportEdit('${userId}'"]`);
-    if (btn) { btn.disabled = true; btn.textContent = '처리중...'; }
-    try {
-        const r = await eel.set_leave_report_edit(userId, enabled, currentUser.user_id)();
-        if (r && r.success) {
-            showToast(enabled ? '월보편집 권한이 부여되었습니다.' : '월보편집 권한이 해제되었습니다.', 'success');
-            if (typeof loadAllUsers === 'function') loadAllUsers();
-        } else {
-            showToast('권한 설정 실패: ' + escapeHtml(r?.message || ''), 'error');
-            if (btn) { btn.disabled = false; btn.textContent = '월보편집'; }
-        }
-    } catch(e) {
-        showToast('오류가 발생했습니다.', 'error');
-        if (btn) { btn.disabled = false; btn.textContent = '월보편집'; }
-    } finally {
-        // loadAllUsers 완료 후 버튼이 재렌더링되지 않았을 때 대비
-        if (btn && btn.isConnected && btn.disabled) {
-            btn.disabled = false;
-            btn.textContent = '월보편집';
-        }
-    }
-}
-
-async function toggleWritePermission(userId, enabled) {
-    if (!currentUser) return;
-    const btn = document.querySelector(`button[onclick*="toggleWritePermission('${userId}'"]`);
-    if (btn) { btn.disabled = true; btn.textContent = '처리중...'; }
-    try {
-        const r = await eel.admin_set_write_permission(userId, enabled, currentUser.user_id)();
-        if (r && r.success) {
-            showToast(enabled ? '쓰기 권한이 부여되었습니다.' : '쓰기 권한이 해제되었습니다.', 'success');
-            if (typeof loadAllUsers === 'function') loadAllUsers();
-        } else {
-            showToast('쓰기 권한 설정 실패: ' + escapeHtml(r?.message || ''), 'error');
-            if (btn) { btn.disabled = false; btn.textContent = '쓰기'; }
-        }
-    } catch(e) {
-        showToast('오류가 발생했습니다.', 'error');
-        if (btn) { btn.disabled = false; btn.textContent = '쓰기'; }
-    } finally {
-        // loadAllUsers 완료 후 버튼이 재렌더링되지 않았을 때 대비
-        if (btn && btn.isConnected && btn.disabled) {
-            btn.disabled = false;
-            btn.textContent = '쓰기';
-        }
-    }
-}
-
-async function loadErpPermList() {
-    const listEl = document.getElementById('erpPermList');
-    if (!listEl) return;
-    try {
-        const res = await eel.admin_get_all_users(currentUser?.user_id || '')();
-        const users = Array.isArray(res) ? res : (res?.users || []);
-        if (!users.length) { listEl.innerHTML = '<p class="text-slate-400 text-xs">사용자 없음</p>'; return; }
-        listEl.innerHTML = users
-            .filter(u => u.user_id !== 'guest')
-            .map(u => `
-                <div class="flex items-center justify-between py-1 px-2 rounded hover:bg-purple-100">
-                    <span class="text-slate-700">${escapeHtml(u.full_name)} <span class="text-xs text-slate-400">(${escapeHtml(u.user_id)})</span></span>
-                    <button onclick="toggleErpInput('${escapeJs(u.user_id)}', ${!u.erp_input})"
-                            class="px-3 py-0.5 text-xs rounded font-semibold ${u.erp_input
-                                ? 'bg-purple-600 text-white hover:bg-purple-700'
-                                : 'bg-slate-200 text-slate-600 hover:bg-slate-300'}">
-                        ${u.erp_input ? 'ERP ✓' : 'ERP 권한 없음'}
-                    </button>
-                </div>`).join('');
-    } catch(e) {
-        listEl.innerHTML = '<p class="text-red-400 text-xs">목록 로드 실패</p>';
-    }
-}
-
-async function toggleErpInput(userId, enabled) {
-    if (!currentUser) return;
-    const btn = document.querySelector(`button[onclick*="toggleErpInput('${userId}'"]`);
-    if (btn) { btn.disabled = true; btn.textContent = '처리중...'; }
-    try {
-        const r = await eel.admin_set_erp_input(userId, enabled, currentUser.user_id)();
-        if (r && r.success) {
-            showToast(enabled ? 'ERP입력 권한이 부여되었습니다.' : 'ERP입력 권한이 해제되었습니다.', 'success');
-            if (typeof loadAllUsers === 'function') loadAllUsers();
-            if (typeof loadErpPermList === 'function') loadErpPermList();
-        } else {
-            showToast('ERP입력 권한 설정 실패: ' + escapeHtml(r?.message || ''), 'error');
-            if (btn) { btn.disabled = false; btn.textContent = 'ERP입력'; }
-        }
-    } catch(e) {
-        showToast('오류가 발생했습니다.', 'error');
-        if (btn) { btn.disabled = false; btn.textContent = 'ERP입력'; }
-    } finally {
-        if (btn && btn.isConnected && btn.disabled) {
-            btn.disabled = false;
-            btn.textContent = 'ERP입력';
-        }
-    }
-}
-
-let _leaveEmployeeNames = [];
-let _leaveEmployeeDropdownIndex = -1;
-
-async function loadLeaveEmployeeList() {
-    try {
-        const names = await eel.get_employee_names_for_leave()();
-        _leaveEmployeeNames = Array.isArray(names) ? names : [];
-        const datalist = document.getElementById('leaveEmployeeList');
-        const workHoursSelect = document.getElementById('workHoursEmployeeInput');
-        if (!datalist) return;
-        datalist.innerHTML = '';
-        _leaveEmployeeNames.forEach(name => {
-            const opt = document.createElement('option');
-            opt.value = name;
-            datalist.appendChild(opt);
-        });
-        if (workHoursSelect) {
-            const currentValue = workHoursSelect.value;
-            workHoursSelect.innerHTML = '<option value="">직원 선택</option>';
-            _leaveEmployeeNames.forEach(name => {
-                const opt = document.createElement('option');
-                opt.value = name;
-                opt.textContent = name;
-                workHoursSelect.appendChild(opt);
-            });
-            if (_leaveEmployeeNames.includes(currentValue)) {
-                workHoursSelect.value = currentValue;
-            }
-        }
-        renderLeaveEmployeeDropdown(document.getElementById('leaveEmployeeInput')?.value || '');
-    } catch (e) {
-        console.error('직원 목록 로드 실패:', e);
-    }
-}
-
-function _getLeaveEmployeeDisplayNames(query = '') {
-    const normalizedQuery = String(query || '').trim().toLowerCase();
-    if (!normalizedQuery) return _leaveEmployeeNames;
-    const matches = [];
-    const others = [];
-    _leaveEmployeeNames.forEach(name => {
-        const text = String(name || '');
-        if (text.toLowerCase().includes(normalizedQuery)) {
-            matches.push(name);
-        } else {
-            others.push(name);
-        }
-    });
-    return [...matches, ...others];
-}
-
-function showLeaveEmployeeDropdown() {
-    renderLeaveEmployeeDropdown(document.getElementById('leaveEmployeeInput')?.value || '');
-    const dropdown = document.getElementById('leaveEmployeeDropdown');
-    if (dropdown && _leaveEmployeeNames.length > 0) dropdown.classList.remove('hidden');
-    _bindLeaveEmployeeDropdownClose();
-}
-
-function hideLeaveEmployeeDropdown() {
-    const dropdown = document.getElementById('leaveEmployeeDropdown');
-    if (dropdown) dropdown.classList.add('hidden');
-    _leaveEmployeeDropdownIndex = -1;
-}
-
-function _bindLeaveEmployeeDropdownClose() {
-    if (window._leaveEmployeeDropdownCloseBound) return;
-    window._leaveEmployeeDropdownCloseBound = true;
-    document.addEventListener('mousedown', event => {
-        const input = document.getElementById('leaveEmployeeInput');
-        const dropdown = document.getElementById('leaveEmployeeDropdown');
-        if (!input || !dropdown) return;
-        if (event.target === input || dropdown.contains(event.target)) return;
-        hideLeaveEmployeeDropdown();
-    });
-}
-
-function renderLeaveEmployeeDropdown(query = '') {
-    const dropdown = document.getElementById('leaveEmployeeDropdown');
-    if (!dropdown) return;
-    const names = _getLeaveEmployeeDisplayNames(query);
-    _leaveEmployeeDropdownIndex = -1;
-    if (!names.length) {
-        dropdown.innerHTML = '<div class="px-3 py-2 text-slate-400">등록된 직원이 없습니다.</div>';
-        return;
-    }
-    dropdown.innerHTML = names.map((name, index) => `
-        <button type="button"
-                class="leave-employee-option block w-full text-left px-3 py-2 hover:bg-blue-50 focus:bg-blue-50 focus:outline-none ${index === 0 ? 'rounded-t-lg' : ''}"
-                data-name="${escapeHtml(name)}"
-                onclick="selectLeaveEmployeeName('${escapeJs(name)}')"
-                onmousedown="event.preventDefault()">
-            ${escapeHtml(name)}
-        </button>
-    `).join('');
-    dropdown.classList.remove('hidden');
-}
-
-function selectLeaveEmployeeName(name) {
-    const input = document.getElementById('leaveEmployeeInput');
-    if (!input || !name) return;
-    input.value = name;
-    hideLeaveEmployeeDropdown();
-    searchEmployeeLeave();
-}
-
-function handleLeaveEmployeeInputKeydown(event) {
-    const dropdown = document.getElementById('leaveEmployeeDropdown');
-    const options = dropdown ? Array.from(dropdown.querySelectorAll('.leave-employee-option')) : [];
-    if (event.key === 'ArrowDown' && options.length) {
-        event.preventDefault();
-        _leaveEmployeeDropdownIndex = Math.min(_leaveEmployeeDropdownIndex + 1, options.length - 1);
-        options[_leaveEmployeeDropdownIndex].focus();
-        return;
-    }
-    if (event.key === 'Escape') {
-        hideLeaveEmployeeDropdown();
-        return;
-    }
-    if (event.key === 'Enter') {
-        hideLeaveEmployeeDropdown();
-        searchEmployeeLeave();
-    }
-}
-
-async function searchEmployeeLeave() {
-    const input = document.getElementById('leaveEmployeeInput');
-    const name = input ? input.value.trim() : '';
-    if (!name) {
-        showCustomAlert('알림', '직원명을 입력하세요.', 'warning');
-        return;
-    }
-    hideLeaveEmployeeDropdown();
-    const resultDiv = document.getElementById('leaveResult');
-    if (resultDiv) resultDiv.innerHTML = '<p class="text-slate-400">조회 중...</p>';
-    try {
-        const info = await eel.get_employee_leave_info(name)();
-        renderLeaveResult(info, name);
-    } catch (e) {
-        if (resultDiv) resultDiv.innerHTML = '<p class="text-red-500">조회 실패: ' + escapeHtml(e.message) + '</p>';
-    }
-}
-
-// ----------------------------------------------------------------------------
-// 직원 개인 프로필 모달
-// ----------------------------------------------------------------------------
-
-let _empProfileChart = null;
-
-async function openEmployeeProfile(name) {
-    if (!name) return;
-    const year = new Date().getFullYear();
-    try {
-        const result = await eel.get_employee_profile(name, year)();
-        if (!result.success) { showToast('프로필 조회 실패', 'error'); return; }
-        _showEmployeeProfileModal(result);
-    } catch (e) {
-        console.error('직원 프로필 오류:', e);
-        showToast('프로필 조회 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-function _showEmployeeProfileModal(data) {
-    const old = document.getElementById('empProfileModal');
-    if (old) old.remove();
-    if (_empProfileChart) { _empProfileChart.destroy(); _empProfileChart = null; }
-
-    const leave = data.leaveBalance;
-    const leaveHtml = leave
-        ? `<div class="flex gap-4 text-sm text-center mt-2">
-            <div class="flex-1 bg-blue-50 rounded p-2"><div class="text-xs text-slate-500">총 부여</div><div class="font-bold text-blue-700">${leave.total}</div></div>
-            <div class="flex-1 bg-amber-50 rounded p-2"><div class="text-xs text-slate-500">사용</div><div class="font-bold text-amber-600">${leave.used}</div></div>
-            <div class="flex-1 bg-emerald-50 rounded p-2"><div class="text-xs text-slate-500">잔여</div><div class="font-bold text-emerald-600">${leave.remaining}</div></div>
-           </div>`
-        : '<p class="text-xs text-slate-400 mt-2">연차 데이터 없음</p>';
-
-    const modal = document.createElement('div');
-    modal.id = 'empProfileModal';
-    modal.className = 'fixed inset-0 bg-black bg-opacity-40 flex items-center justify-center z-50';
-    modal.innerHTML = `
-      <div class="bg-white rounded-xl shadow-xl p-6 w-96 max-h-[90vh] overflow-y-auto">
-        <div class="flex justify-between items-center mb-4">
-          <h3 class="font-bold text-lg">👤 ${escapeHtml(data.name)} (${data.year}년)</h3>
-          <button onclick="document.getElementById('empProfileModal').remove()"
-                  class="text-slate-400 hover:text-slate-600 text-xl leading-none">✕</button>
-        </div>
-        <!-- 요약 카드 -->
-        <div class="grid grid-cols-2 gap-3 mb-4">
-          <div class="bg-blue-50 rounded-lg p-3 text-center">
-            <div class="text-xs text-slate-500 mb-1">총 공수</div>
-            <div class="text-2xl font-bold text-blue-700">${data.totalManpower.toFixed(1)}</div>
-          </div>
-          <div class="bg-slate-50 rounded-lg p-3 text-center">
-            <div class="text-xs text-slate-500 mb-1">참여 프로젝트</div>
-            <div class="text-2xl font-bold text-slate-700">${data.projectCount}</div>
-          </div>
-        </div>
-        <!-- 월별 공수 차트 -->
-        <div class="mb-4">
-          <div class="text-xs text-slate-500 mb-1 font-semibold">월별 공수</div>
-          <canvas id="empMonthlyChart" height="80"></canvas>
-        </div>
-        <!-- 연차 -->
-        <div class="mb-4">
-          <div class="text-xs text-slate-500 font-semibold mb-1">연차 현황</div>
-          ${leaveHtml}
-        </div>
-        <!-- 최근 프로젝트 -->
-        ${data.projects.length ? `
-        <div>
-          <div class="text-xs text-slate-500 font-semibold mb-1">참여 계약 (최대 10건)</div>
-          <div class="flex flex-wrap gap-1">
-            ${data.projects.map(p => `<span class="text-xs bg-slate-100 rounded px-2 py-0.5">${escapeHtml(p)}</span>`).join('')}
-          </div>
-        </div>` : ''}
-      </div>`;
-    document.body.appendChild(modal);
-    modal.addEventListener('click', e => { if (e.target === modal) modal.remove(); });
-
-    // 차트 렌더링
-    const canvas = document.getElementById('empMonthlyChart');
-    if (canvas) {
-        const months = ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'];
-        _empProfileChart = new Chart(canvas, {
-            type: 'bar',
-            data: {
-                labels: months,
-                datasets: [{ label: '공수', data: data.monthlyManpower, backgroundColor: 'rgba(59,130,246,0.6)' }]
-            },
-            options: {
-                responsive: true,
-                plugins: { legend: { display: false } },
-                scales: { y: { beginAtZero: true } }
-            }
-        });
-    }
-}
-
-function formatLeaveDays(value) {
-    const num = Number(value || 0);
-    if (!Number.isFinite(num)) return '0';
-    return num.toFixed(2).replace(/\.?0+$/, '');
-}
-
-function renderLeaveResult(info, name) {
-    const resultDiv = document.getElementById('leaveResult');
-    if (!resultDiv) return;
-
-    const cfg = info.config || {};
-    const grants = info.grants || [];
-    const usageThisYear = info.usage_this_year || [];
-    const allUsageCount = info.all_usage_count || 0;
-    const summary = info.summary || { total_granted: 0, total_used: 0, remaining: 0 };
-
-    const currentYear = new Date().getFullYear();
-
-    // ── 섹션 1: 잔여 연차 요약 ──
-    const remainingColor = summary.remaining < 0 ? 'text-red-600' : 'text-emerald-600';
-    let html = `
-    <div class="space-y-6">
-      <!-- 프로필 버튼 -->
-      <div class="flex justify-end">
-        <button onclick="openEmployeeProfile('${escapeJs(name)}')"
-                class="text-xs px-3 py-1.5 bg-blue-50 text-blue-700 rounded-lg hover:bg-blue-100 border border-blue-200">
-          📊 ${escapeHtml(name)} 공수 프로필 보기
-        </button>
-      </div>
-      <!-- 요약 박스 -->
-      <div class="grid grid-cols-3 gap-4">
-        <div class="bg-slate-50 border border-slate-200 rounded-xl p-4 text-center">
-          <p class="text-sm text-slate-500 mb-1">총 부여</p>
-          <p class="text-3xl font-bold text-blue-600">${formatLeaveDays(summary.total_granted)}</p>
-        </div>
-        <div class="bg-slate-50 border border-slate-200 rounded-xl p-4 text-center">
-          <p class="text-sm text-slate-500 mb-1">총 사용</p>
-          <p class="text-3xl font-bold text-amber-500">${formatLeaveDays(summary.total_used)}</p>
-        </div>
-        <div class="bg-slate-50 border border-slate-200 rounded-xl p-4 text-center">
-          <p class="text-sm text-slate-500 mb-1">잔여</p>
-          <p class="text-3xl font-bold ${remainingColor}">${formatLeaveDays(summary.remaining)}</p>
-        </div>
-      </div>
-
-      <!-- 섹션 2: 연차 설정 (생성월) -->
-      <div class="bg-white border border-slate-200 rounded-xl p-5">
-        <h3 class="text-lg font-semibold text-slate-700 mb-4">⚙️ 연차 설정</h3>
-        <div class="flex gap-3 items-center flex-wrap">
-          <label class="text-sm text-slate-600 font-medium">연차 생성 월/일:</label>
-          <select id="leaveGenMonth" class="border border-slate-300 rounded-lg px-3 py-2 text-sm">
-            ${Array.from({length:12},(_,i)=>`<option value="${i+1}" ${cfg.generation_month===(i+1)?'selected':''}>${i+1}월</option>`).join('')}
-          </select>
-          <select id="leaveGenDay" class="border border-slate-300 rounded-lg px-3 py-2 text-sm">
-            ${Array.from({length:31},(_,i)=>`<option value="${i+1}" ${(cfg.generation_day||1)===(i+1)?'selected':''}>${i+1}일</option>`).join('')}
-          </select>
-          <label class="text-sm text-slate-600 font-medium ml-2">메모:</label>
-          <input type="text" id="leaveConfigNote" value="${escapeHtml(cfg.note||'')}"
-                 class="border border-slate-300 rounded-lg px-3 py-2 text-sm w-48" placeholder="메모 (선택)">
-          <button onclick="saveLeaveConfig('${escapeJs(name)}')"
-                  class="px-4 py-2 bg-blue-600 text-white rounded-lg text-sm font-semibold hover:bg-blue-700">저장</button>
-        </div>
-      </div>
-
-      <!-- 섹션 3: 연차 부여 이력 -->
-      <div class="bg-white border border-slate-200 rounded-xl p-5">
-        <h3 class="text-lg font-semibold text-slate-700 mb-4">📋 연차 부여 이력 (전체)</h3>
-        <div class="overflow-x-auto">
-          <table class="w-full text-sm border-collapse">
-            <thead>
-              <tr class="bg-slate-100">
-                <th class="px-3 py-2 text-left border border-slate-200">연도</th>
-                <th class="px-3 py-2 text-left border border-slate-200">월</th>
-                <th class="px-3 py-2 text-right border border-slate-200">일수</th>
-                <th class="px-3 py-2 text-left border border-slate-200">메모</th>
-                <th class="px-3 py-2 text-center border border-slate-200">삭제</th>
-              </tr>
-            </thead>
-            <tbody>`;
-
-    if (grants.length === 0) {
-        html += `<tr><td colspan="5" class="px-3 py-3 text-center text-slate-400">부여 이력이 없습니다.</td></tr>`;
-    } else {
-        grants.forEach(g => {
-            html += `
-              <tr class="hover:bg-slate-50">
-                <td class="px-3 py-2 border border-slate-100">${g.grant_year}년</td>
-                <td class="px-3 py-2 border border-slate-100">${g.grant_month}월</td>
-                <td class="px-3 py-2 border border-slate-100 text-right font-medium">${g.days}일</td>
-                <td class="px-3 py-2 border border-slate-100 text-slate-500">${escapeHtml(g.note||'')}</td>
-                <td class="px-3 py-2 border border-slate-100 text-center">
-                  <button onclick="deleteLeaveGrant(${g.id},'${escapeJs(name)}')"
-                          class="px-2 py-1 bg-red-100 text-red-600 rounded hover:bg-red-200 text-xs">삭제</button>
-                </td>
-              </tr>`;
-        });
-    }
-
-    html += `
-            </tbody>
-          </table>
-        </div>
-        <!-- 부여 추가 폼 -->
-        <div class="flex gap-2 mt-4 items-center flex-wrap">
-          <span class="text-sm font-medium text-slate-600">추가:</span>
-          <input type="number" id="grantYear" value="${currentYear}"
-                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-20" placeholder="연도">
-          <select id="grantMonth" class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm">
-            ${Array.from({length:12},(_,i)=>`<option value="${i+1}">${i+1}월</option>`).join('')}
-          </select>
-          <input type="number" id="grantDays" value="15" step="0.5"
-                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-16" placeholder="일수">
-          <input type="text" id="grantNote"
-                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-36" placeholder="메모 (선택)">
-          <button onclick="addLeaveGrant('${escapeJs(name)}')"
-                  class="px-4 py-1.5 bg-green-600 text-white rounded-lg text-sm font-semibold hover:bg-green-700">추가</button>
-        </div>
-      </div>
-
-      <!-- 섹션 4: 연차 사용 내역 (올해) -->
-      <div class="bg-white border border-slate-200 rounded-xl p-5">
-        <h3 class="text-lg font-semibold text-slate-700 mb-1">📅 연차 사용 내역 (${currentYear}년)</h3>
-        <p class="text-xs text-slate-400 mb-4">전체 사용 건수: ${allUsageCount}건 (이전 연도 포함)</p>
-        <div class="overflow-x-auto">
-          <table class="w-full text-sm border-collapse">
-            <thead>
-              <tr class="bg-slate-100">
-                <th class="px-3 py-2 text-left border border-slate-200">날짜</th>
-                <th class="px-3 py-2 text-center border border-slate-200">종류</th>
-                <th class="px-3 py-2 text-right border border-slate-200">차감</th>
-                <th class="px-3 py-2 text-left border border-slate-200">메모</th>
-                <th class="px-3 py-2 text-center border border-slate-200">삭제</th>
-              </tr>
-            </thead>
-            <tbody>`;
-
-    if (usageThisYear.length === 0) {
-        html += `<tr><td colspan="5" class="px-3 py-3 text-center text-slate-400">올해 사용 내역이 없습니다.</td></tr>`;
-    } else {
-        usageThisYear.forEach(u => {
-            const isAuto = u.created_by === 'auto_vacation';
-            const deductLabel = u.leave_type === '공가' ? '<span class="text-slate-400">-</span>' :
-                `<span class="font-medium text-amber-600">${u.days}</span>`;
-            const typeBadge = u.leave_type === '연차' ? 'bg-blue-100 text-blue-700' :
-                              u.leave_type === '반차' ? 'bg-purple-100 text-purple-700' :
-                              u.leave_type === '반반차' ? 'bg-fuchsia-100 text-fuchsia-700' :
-                              'bg-slate-100 text-slate-600';
-            const noteDisplay = isAuto
-                ? `<span class="text-slate-400 text-xs">일일작업현황</span>${u.note && u.note !== '일일작업현황 자동' ? ' ' + escapeHtml(u.note) : ''}`
-                : escapeHtml(u.note || '');
-            const deleteBtn = isAuto
-                ? `<span class="text-xs text-slate-300">자동</span>`
-                : `<button onclick="deleteLeaveUsage(${u.id},'${escapeJs(name)}')"
-                           class="px-2 py-1 bg-red-100 text-red-600 rounded hover:bg-red-200 text-xs">삭제</button>`;
-            html += `
-              <tr class="${isAuto ? 'bg-slate-50/60' : 'hover:bg-slate-50'}">
-                <td class="px-3 py-2 border border-slate-100">${u.use_date}</td>
-                <td class="px-3 py-2 border border-slate-100 text-center">
-                  <span class="px-2 py-0.5 rounded text-xs font-semibold ${typeBadge}">${u.leave_type}</span>
-                </td>
-                <td class="px-3 py-2 border border-slate-100 text-right">${deductLabel}</td>
-                <td class="px-3 py-2 border border-slate-100 text-slate-500">${noteDisplay}</td>
-                <td class="px-3 py-2 border border-slate-100 text-center">${deleteBtn}</td>
-              </tr>`;
-        });
-    }
-
-    html += `
-            </tbody>
-          </table>
-        </div>
-        <!-- 사용 내역 추가 폼 -->
-        <div class="flex gap-2 mt-4 items-center flex-wrap">
-          <span class="text-sm font-medium text-slate-600">추가:</span>
-          <input type="date" id="usageDate" value="${new Date().toISOString().slice(0,10)}"
-                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm">
-          <select id="usageType" class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm">
-            <option value="연차">연차 (1공)</option>
-            <option value="반차">반차 (0.5공)</option>
-            <option value="반반차">반반차 (0.25공)</option>
-            <option value="공가">공가 (차감없음)</option>
-          </select>
-          <input type="text" id="usageNote"
-                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-36" placeholder="메모 (선택)">
-          <button onclick="addLeaveUsage('${escapeJs(name)}')"
-                  class="px-4 py-1.5 bg-green-600 text-white rounded-lg text-sm font-semibold hover:bg-green-700">추가</button>
-        </div>
-      </div>
-    </div>`;
-
-    resultDiv.innerHTML = html;
-}
-
-async function saveLeaveConfig(name) {
-    const genMonth = parseInt(document.getElementById('leaveGenMonth').value);
-    const genDay = parseInt(document.getElementById('leaveGenDay').value);
-    const note = document.getElementById('leaveConfigNote').value.trim();
-    try {
-        const result = await eel.save_employee_annual_config(name, genMonth, note, genDay)();
-        if (result && result.success) {
-            showCustomAlert('성공', '연차 설정이 저장되었습니다.', 'success');
-        } else {
-            showCustomAlert('오류', (result && result.error) || '저장 실패', 'error');
-        }
-    } catch (e) {
-        showCustomAlert('오류', '저장 중 오류: ' + e.message, 'error');
-    }
-}
-
-async function addLeaveGrant(name) {
-    const year  = parseInt(document.getElementById('grantYear').value);
-    const month = parseInt(document.getElementById('grantMonth').value);
-    const days  = parseFloat(document.getElementById('grantDays').value);
-    const note  = document.getElementById('grantNote').value.trim();
-    if (!year || !month || isNaN(days) || days === 0) {
-        showCustomAlert('알림', '연도, 월, 일수를 올바르게 입력하세요. 일수는 음수도 입력할 수 있지만 0은 사용할 수 없습니다.', 'warning');
-        return;
-    }
-    try {
-        const result = await eel.add_leave_grant(name, year, month, days, note)();
-        if (result && result.success) {
-            await searchEmployeeLeave();
-        } else {
-            showCustomAlert('오류', (result && result.error) || '추가 실패', 'error');
-        }
-    } catch (e) {
-        showCustomAlert('오류', '추가 중 오류: ' + e.message, 'error');
-    }
-}
-
-async function deleteLeaveGrant(id, employeeName) {
-    if (!confirm('이 부여 이력을 삭제하시겠습니까?')) return;
-    try {
-        const result = await eel.delete_leave_grant(id)();
-        if (result && result.success) {
-            document.getElementById('leaveEmployeeInput').value = employeeName;
-            await searchEmployeeLeave();
-        } else {
-            showCustomAlert('오류', (result && result.error) || '삭제 실패', 'error');
-        }
-    } catch (e) {
-        showCustomAlert('오류', '삭제 중 오류: ' + e.message, 'error');
-    }
-}
-
-async function addLeaveUsage(name) {
-    const useDate   = document.getElementById('usageDate').value;
-    const leaveType = document.getElementById('usageType').value;
-    const note      = document.getElementById('usageNote').value.trim();
-    if (!useDate) {
-        showCustomAlert('알림', '날짜를 입력하세요.', 'warning');
-        return;
-    }
-    try {
-        const result = await eel.add_leave_usage(name, useDate, leaveType, note)();
-        if (result && result.success) {
-            await searchEmployeeLeave();
-        } else {
-            showCustomAlert('오류', (result && result.error) || '추가 실패', 'error');
-        }
-    } catch (e) {
-        showCustomAlert('오류', '추가 중 오류: ' + e.message, 'error');
-    }
-}
-
-async function deleteLeaveUsage(id, employeeName) {
-    if (!confirm('이 사용 내역을 삭제하시겠습니까?')) return;
-    try {
-        const result = await eel.delete_leave_usage(id)();
-        if (result && result.success) {
-            document.getElementById('leaveEmployeeInput').value = employeeName;
-            await searchEmployeeLeave();
-        } else {
-            showCustomAlert('오류', (result && result.error) || '삭제 실패', 'error');
-        }
-    } catch (e) {
-        showCustomAlert('오류', '삭제 중 오류: ' + e.message, 'error');
-    }
-}
-
-// ============================================================================
-// 설정 하위 탭
-// ============================================================================
-
-function showSettingsTab(tab) {
-    const userTab = document.getElementById('userSettingsTab');
-    const logTab  = document.getElementById('activityLogTab');
-    const erpTab  = document.getElementById('erpInputTab');
-    const btnUser = document.getElementById('btnSettingsUser');
-    const btnLog  = document.getElementById('btnSettingsLog');
-    const btnErp  = document.getElementById('btnSettingsErp');
-
-    const activeClass   = 'px-6 py-2 rounded-lg bg-blue-600 text-white font-semibold';
-    const inactiveClass = 'px-6 py-2 rounded-lg bg-slate-200 font-semibold';
-
-    // 모든 탭 숨기기
-    [userTab, logTab, erpTab].forEach(t => t?.classList.add('hidden'));
-    [btnUser, btnLog, btnErp].forEach(b => { if (b) b.className = inactiveClass; });
-
-    if (tab === 'activityLog') {
-        if (logTab)  logTab.classList.remove('hidden');
-        if (btnLog)  btnLog.className = activeClass;
-        loadActivityLog(50);
-    } else if (tab === 'erpInput') {
-        if (erpTab)  erpTab.classList.remove('hidden');
-        if (btnErp)  btnErp.className = activeClass;
-        // 관리자이면 권한 관리 섹션 표시 + 목록 로드
-        const adminSec = document.getElementById('erpAdminSection');
-        if (adminSec) {
-            const isAdmin = currentUser?.role === 'admin';
-            adminSec.classList.toggle('hidden', !isAdmin);
-            if (isAdmin) loadErpPermList();
-        }
-    } else {
-        if (userTab) userTab.classList.remove('hidden');
-        if (btnUser) btnUser.className = activeClass;
-    }
-}
-
-// ============================================================================
-// 활동 로그
-// ============================================================================
-
-async function loadActivityLog(limit = 50, containerId = 'activityLogContent') {
-    const container = document.getElementById(containerId);
-    if (!container) return;
-    container.innerHTML = '<p class="text-slate-400">불러오는 중...</p>';
-    try {
-        const logs = await eel.get_activity_logs(limit)();
-        if (!logs || logs.length === 0) {
-            container.innerHTML = '<p class="text-slate-400">활동 로그가 없습니다.</p>';
-            return;
-        }
-        const actionLabel = { save: '저장', load: '조회', delete: '삭제', export: '내보내기', import: '가져오기' };
-        const actionColor = {
-            save:   'bg-blue-100 text-blue-700',
-            load:   'bg-slate-100 text-slate-600',
-            delete: 'bg-red-100 text-red-700',
-            export: 'bg-green-100 text-green-700',
-            import: 'bg-orange-100 text-orange-700'
-        };
-        let html = `<div class="overflow-x-auto">
-            <table class="w-full border-collapse border text-sm">
-                <thead><tr class="bg-slate-100">
-                    <th class="border p-2 text-center w-36">시각</th>
-                    <th class="border p-2 text-center w-24">사용자</th>
-                    <th class="border p-2 text-center w-20">작업</th>
-                    <th class="border p-2 text-center w-28">대상</th>
-                    <th class="border p-2 text-left">상세</th>
-                </tr></thead><tbody>`;
-        logs.forEach(log => {
-            const ts = log.timestamp ? log.timestamp.replace('T', ' ').substring(0, 16) : '';
-            const label = actionLabel[log.action] || log.action;
-            const colorClass = actionColor[log.action] || 'bg-slate-100 text-slate-600';
-            html += `<tr class="hover:bg-slate-50">
-                <td class="border p-2 text-center text-slate-500">${escapeHtml(ts)}</td>
-                <td class="border p-2 text-center font-medium">${escapeHtml(log.user || '')}</td>
-                <td class="border p-2 text-center"><span class="px-2 py-0.5 rounded text-xs font-semibold ${colorClass}">${escapeHtml(label)}</span></td>
-                <td class="border p-2 text-center text-slate-600">${escapeHtml(log.target || '')}</td>
-                <td class="border p-2 text-slate-600">${escapeHtml(log.details || '')}</td>
-            </tr>`;
-        });
-        html += `</tbody></table></div>
-            <p class="text-xs text-slate-400 mt-2 text-right">총 ${logs.length}건</p>`;
-        container.innerHTML = html;
-    } catch (e) {
-        console.error('활동 로그 로드 오류:', e);
-        container.innerHTML = '<p class="text-red-400">로그 로드 실패</p>';
-    }
-}
-
-// ============================================================================
-// J: 알림 센터
-// ============================================================================
-
-let _notifData = [];
-
-async function loadNotifications() {
-    _notifData = [];
-
-    // 1) 업데이트 확인 (캐시 사용)
-    try {
-        const upd = await eel.check_for_updates(false)();
-        if (upd && upd.update_available) {
-            _notifData.push({
-                icon:   '🆕',
-                title:  `v${upd.latest_version} 업데이트 있음`,
-                body:   upd.release_name || '',
-                action: () => { if (typeof showUpdateModal === 'function') showUpdateModal(); }
-            });
+        const upd = await eel.check_for_updates(false)();
+        if (upd && upd.update_available) {
+            _notifData.push({
+                icon:   '🆕',
+                title:  `v${upd.latest_version} 업데이트 있음`,
+                body:   upd.release_name || '',
+                action: () => { if (typeof showUpdateModal === 'function') showUpdateModal(); }
+            });
         }
     } catch (_) { console.warn('알림: 업데이트 확인 실패'); }
 
@@ -4646,699 +3080,3 @@ function _closeNotifPanel(e) {
         document.getElementById('notifPanel')?.classList.add('hidden');
     }
 }
-
-// ============================================================================
-// E: 통계 대시보드
-// ============================================================================
-
-let _statsYear = new Date().getFullYear();
-let _manpowerChart = null;
-let _projectCountChart = null;
-let _manpowerRatioChart = null;
-
-async function loadStatsData() {
-    const label = document.getElementById('statsYearLabel');
-    if (label) label.textContent = `${_statsYear}년`;
-
-    let data;
-    try {
-        data = await eel.get_analytics_data(_statsYear)();
-    } catch (e) {
-        console.error('통계 데이터 로드 오류:', e);
-        return;
-    }
-    if (!data || !data.success) return;
-
-    // ── 월별 공수 누적 막대 차트 (본공 / 외주) ──────────────────────
-    const ctx = document.getElementById('manpowerChart');
-    if (ctx) {
-        if (_manpowerChart) { _manpowerChart.destroy(); _manpowerChart = null; }
-        _manpowerChart = new Chart(ctx, {
-            type: 'bar',
-            data: {
-                labels: ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'],
-                datasets: [
-                    {
-                        label: '본공',
-                        data: data.inHouseMonthly || data.monthly,
-                        backgroundColor: 'rgba(59,130,246,0.75)',
-                        borderRadius: 3,
-                        stack: 'total'
-                    },
-                    {
-                        label: '외주',
-                        data: data.outsourcedMonthly || [],
-                        backgroundColor: 'rgba(234,88,12,0.75)',
-                        borderRadius: 3,
-                        stack: 'total'
-                    }
-                ]
-            },
-            options: {
-                responsive: true,
-                plugins: {
-                    legend: { display: true, position: 'top' },
-                    tooltip: {
-                        mode: 'nearest',
-                        intersect: true,
-                        callbacks: {
-                            beforeBody: (items) => {
-                                if (!items.length) return '';
-                                const item = items[0];
-                                const dataIndex = item.dataIndex;
-                                const total = item.chart.data.datasets.reduce(
-                                    (s, ds) => s + (parseFloat(ds.data[dataIndex]) || 0), 0
-                                );
-                                return `합계: ${total.toFixed(1)}공`;
-                            }
-                        }
-                    }
-                },
-                scales: {
-                    x: { stacked: true },
-                    y: { stacked: true, beginAtZero: true }
-                }
-            }
-        });
-    }
-
-    // ── 공수 요약 (본공 / 외주 / 전체) ────────────────────────────────
-    const totalLabel   = document.getElementById('totalManpowerLabel');
-    const inHouseLabel = document.getElementById('inHouseLabel');
-    const outLabel     = document.getElementById('outsourcedLabel');
-    if (totalLabel && data.inHouseTotal !== undefined) {
-        totalLabel.textContent   = ((data.inHouseTotal || 0) + (data.outsourcedTotal || 0)).toFixed(1);
-        inHouseLabel.textContent = (data.inHouseTotal || 0).toFixed(1);
-        outLabel.textContent     = (data.outsourcedTotal || 0).toFixed(1);
-        document.getElementById('manpowerSummary')?.classList.remove('hidden');
-    }
-
-    // ── KPI 카드 ─────────────────────────────────────────────────────
-    const kpiCards = document.getElementById('kpiCards');
-    if (kpiCards && data.totalProjects !== undefined) {
-        const grandTotal = (data.inHouseTotal || 0) + (data.outsourcedTotal || 0);
-        document.getElementById('kpiTotalProjects').textContent  = data.totalProjects;
-        document.getElementById('kpiAsRate').textContent         = (data.asRate ?? 0).toFixed(1);
-        document.getElementById('kpiOutsourcedRate').textContent = (data.outsourcedRate ?? 0).toFixed(1);
-        document.getElementById('kpiTotalManpower').textContent  = grandTotal.toFixed(1);
-        const cRate = Math.min(data.asRate ?? 0, 100);
-        const oRate = Math.min(data.outsourcedRate ?? 0, 100);
-        document.getElementById('kpiAsBar').style.width          = `${cRate}%`;
-        document.getElementById('kpiOutsourcedBar').style.width  = `${oRate}%`;
-        kpiCards.classList.remove('hidden');
-    }
-
-    // ── 본공/외주 도넛 차트 + 월별 작업 건수 꺾은선 차트 ─────────────
-    const ratioBox = document.getElementById('ratioAndCountChartBox');
-    const ratioCtx = document.getElementById('manpowerRatioChart');
-    const pcCtx    = document.getElementById('projectCountChart');
-    const hasRatio = data.inHouseTotal !== undefined && (data.inHouseTotal + data.outsourcedTotal) > 0;
-    const hasCount = data.monthlyProjectCount;
-    if (ratioBox && (hasRatio || hasCount)) ratioBox.classList.remove('hidden');
-
-    if (ratioCtx && hasRatio) {
-        if (_manpowerRatioChart) { _manpowerRatioChart.destroy(); _manpowerRatioChart = null; }
-        _manpowerRatioChart = new Chart(ratioCtx, {
-            type: 'doughnut',
-            data: {
-                labels: ['본공', '외주'],
-                datasets: [{
-                    data: [data.inHouseTotal || 0, data.outsourcedTotal || 0],
-                    backgroundColor: ['rgba(59,130,246,0.8)', 'rgba(234,88,12,0.8)'],
-                    borderWidth: 1
-                }]
-            },
-            options: {
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {
-                    legend: { position: 'bottom' },
-                    tooltip: {
-                        callbacks: {
-                            label: (item) => {
-                                const total = item.dataset.data.reduce((a, b) => a + b, 0);
-                                const pct = total > 0 ? (item.raw / total * 100).toFixed(1) : 0;
-                                return ` ${item.label}: ${item.raw}공 (${pct}%)`;
-                            }
-                        }
-                    }
-                }
-            }
-        });
-    }
-
-    if (pcCtx && hasCount) {
-        if (_projectCountChart) { _projectCountChart.destroy(); _projectCountChart = null; }
-        _projectCountChart = new Chart(pcCtx, {
-            type: 'line',
-            data: {
-                labels: ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'],
-                datasets: [{
-                    label: '작업 건수',
-                    data: data.monthlyProjectCount,
-                    borderColor: 'rgba(99,102,241,0.9)',
-                    backgroundColor: 'rgba(99,102,241,0.12)',
-                    tension: 0.3,
-                    pointRadius: 4,
-                    fill: true
-                }]
-            },
-            options: {
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: { legend: { display: false } },
-                scales: { y: { beginAtZero: true, ticks: { stepSize: 1 } } }
-            }
-        });
-    }
-
-    // ── 회사별 상위 10 ────────────────────────────────────────────────
-    const compEl = document.getElementById('companyStatsList');
-    if (compEl) {
-        if (!data.companies || data.companies.length === 0) {
-            compEl.innerHTML = '<p class="text-sm text-slate-400 py-4 text-center">데이터 없음</p>';
-        } else {
-            const maxC = Math.max(...data.companies.map(c => c.total), 1);
-            compEl.innerHTML = data.companies.map(c => `
-                <div class="flex items-center gap-2 mb-2">
-                    <div class="text-xs w-24 truncate text-slate-600" title="${escapeHtml(c.name)}">${escapeHtml(c.name)}</div>
-                    <div class="flex-1 bg-slate-200 rounded-full h-3">
-                        <div class="bg-blue-500 h-3 rounded-full" style="width:${(c.total/maxC*100).toFixed(1)}%"></div>
-                    </div>
-                    <div class="text-xs w-10 text-right font-semibold text-slate-700">${c.total}</div>
-                </div>`).join('');
-        }
-    }
-
-    // ── 계약별 상위 10 ────────────────────────────────────────────────
-    const contEl = document.getElementById('contractStatsList');
-    if (contEl) {
-        if (!data.contracts || data.contracts.length === 0) {
-            contEl.innerHTML = '<p class="text-sm text-slate-400 py-4 text-center">데이터 없음</p>';
-        } else {
-            const maxR = Math.max(...data.contracts.map(r => r.total), 1);
-            contEl.innerHTML = data.contracts.map(r => `
-                <div class="flex items-center gap-2 mb-2">
-                    <div class="text-xs w-24 truncate text-slate-600" title="${escapeHtml(r.cn)}">${escapeHtml(r.ship || r.cn)}</div>
-                    <div class="flex-1 bg-slate-200 rounded-full h-3">
-                        <div class="bg-emerald-500 h-3 rounded-full" style="width:${(r.total/maxR*100).toFixed(1)}%"></div>
-                    </div>
-                    <div class="text-xs w-10 text-right font-semibold text-slate-700">${r.total}</div>
-                </div>`).join('');
-        }
-    }
-}
-
-function statsChangeYear(delta) {
-    _statsYear += delta;
-    loadStatsData();
-}
-
-// ============================================================================
-// ERP 입력 자동화
-// ============================================================================
-
-let _erpPollInterval = null;
-
-async function loadErpRecords() {
-    const startDate = document.getElementById('erpStartDate')?.value;
-    const endDate   = document.getElementById('erpEndDate')?.value;
-    const listEl    = document.getElementById('erpRecordList');
-    if (!startDate || !endDate) {
-        showToast('시작일과 종료일을 입력하세요.', 'warning'); return;
-    }
-    if (!listEl) return;
-    listEl.innerHTML = '<p class="text-slate-400 text-sm">조회 중...</p>';
-    try {
-        const res = await eel.get_records_for_erp(startDate, endDate, currentUser?.user_id || '')();
-        if (!res.success) {
-            listEl.innerHTML = `<p class="text-red-500 text-sm">${escapeHtml(res.message)}</p>`; return;
-        }
-        if (!res.dates || res.dates.length === 0) {
-            listEl.innerHTML = '<p class="text-slate-400 text-sm">해당 기간에 입력된 작업 레코드가 없습니다.</p>'; return;
-        }
-        renderErpRecordList(res.dates);
-    } catch (e) {
-        listEl.innerHTML = `<p class="text-red-500 text-sm">조회 실패: ${escapeHtml(e.message || '')}</p>`;
-    }
-}
-
-function renderErpRecordList(dates) {
-    const listEl = document.getElementById('erpRecordList');
-    if (!listEl) return;
-    listEl.innerHTML = dates.map(day => `
-        <div class="border border-slate-200 rounded-lg p-3">
-            <div class="flex items-center gap-2 mb-2">
-                <input type="checkbox" id="erpDay_${escapeHtml(day.date)}" checked
-                       class="w-4 h-4 accent-blue-600 erpDayCheck" data-date="${escapeHtml(day.date)}">
-                <label for="erpDay_${escapeHtml(day.date)}" class="font-semibold text-sm cursor-pointer">
-                    ${escapeHtml(day.date)} (${day.records.length}건)
-                </label>
-            </div>
-            <ul class="text-xs text-slate-600 ml-6 space-y-0.5">
-                ${day.records.map(r => `
-                    <li class="truncate">・ ${escapeHtml(r.contractNumber)} ${escapeHtml(r.workContent)}</li>
-                `).join('')}
-            </ul>
-        </div>
-    `).join('');
-}
-
-async function openErpInputWindow() {
-    const checks = document.querySelectorAll('.erpDayCheck:checked');
-    if (checks.length === 0) {
-        showToast('입력할 날짜를 선택하세요.', 'warning'); return;
-    }
-    const startDate = document.getElementById('erpStartDate')?.value;
-    const endDate   = document.getElementById('erpEndDate')?.value;
-    try {
-        const res = await eel.get_records_for_erp(startDate, endDate, currentUser?.user_id || '')();
-        if (!res.success) { showToast(res.message || '레코드 조회 실패', 'error'); return; }
-
-        const selectedDates = new Set(Array.from(checks).map(c => c.dataset.date));
-        const filtered = (res.dates || []).filter(d => selectedDates.has(d.date));
-        if (filtered.length === 0) { showToast('선택된 날짜에 레코드가 없습니다.', 'warning'); return; }
-
-        const r = await eel.open_erp_input_window(JSON.stringify(filtered), currentUser?.user_id || '')();
-        if (!r.success) { showToast(r.message || '실행 실패', 'error'); return; }
-        showToast('ERP 입력 창이 열립니다. 잠시 후 새 창을 확인하세요.', 'success');
-    } catch (e) {
-        showToast('오류가 발생했습니다.', 'error');
-    }
-}
-
-async function startErpMacro() {
-    // 체크된 날짜의 레코드만 수집
-    const checks = document.querySelectorAll('.erpDayCheck:checked');
-    if (checks.length === 0) {
-        showToast('입력할 날짜를 선택하세요.', 'warning'); return;
-    }
-    const listEl = document.getElementById('erpRecordList');
-    const startDate = document.getElementById('erpStartDate')?.value;
-    const endDate   = document.getElementById('erpEndDate')?.value;
-
-    // 선택된 날짜 목록 재조회
-    try {
-        const res = await eel.get_records_for_erp(startDate, endDate, currentUser?.user_id || '')();
-        if (!res.success) { showToast(res.message, 'error'); return; }
-
-        const selectedDates = new Set(Array.from(checks).map(c => c.dataset.date));
-        const filtered = (res.dates || []).filter(d => selectedDates.has(d.date));
-        if (filtered.length === 0) { showToast('선택된 날짜에 레코드가 없습니다.', 'warning'); return; }
-
-        const startRes = await eel.start_erp_macro(JSON.stringify(filtered), currentUser?.user_id || '')();
-        if (!startRes.success) { showToast(startRes.message, 'error'); return; }
-
-        document.getElementById('btnErpStart')?.classList.add('hidden');
-        document.getElementById('btnErpStop')?.classList.remove('hidden');
-        document.getElementById('erpProgressBar')?.classList.remove('hidden');
-        document.getElementById('erpLog')?.classList.remove('hidden');
-        showToast('ERP 입력 매크로를 시작합니다.', 'success');
-        _erpPollInterval = setInterval(pollErpStatus, 1000);
-    } catch (e) {
-        showToast('매크로 시작 중 오류: ' + escapeHtml(e.message || ''), 'error');
-    }
-}
-
-async function stopErpMacro() {
-    try {
-        const res = await eel.stop_erp_macro(currentUser?.user_id || '')();
-        showToast(res.success ? '중단 요청이 전송되었습니다.' : res.message,
-                  res.success ? 'warning' : 'error');
-    } catch (e) {
-        showToast('중단 요청 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function pollErpStatus() {
-    try {
-        const res = await eel.get_erp_macro_status(currentUser?.user_id || '')();
-        if (!res.success) return;
-
-        // 진행 바
-        const fill = document.getElementById('erpProgressFill');
-        const text = document.getElementById('erpProgressText');
-        if (fill && res.total > 0) {
-            const pct = Math.round(res.progress / res.total * 100);
-            fill.style.width = pct + '%';
-            if (text) text.textContent = `${res.progress} / ${res.total} (${pct}%) — ${res.current || ''}`;
-        }
-
-        // 로그
-        const logEl = document.getElementById('erpLog');
-        if (logEl && res.log) {
-            logEl.textContent = res.log.join('\n');
-            logEl.scrollTop = logEl.scrollHeight;
-        }
-
-        // 라이브러리 누락 감지 → 설치 버튼 표시
-        if (res.log && res.log.some(l => l.includes('필수 라이브러리 누락'))) {
-            document.getElementById('btnInstallErpDeps')?.classList.remove('hidden');
-        }
-
-        // 완료 감지
-        if (!res.running) {
-            clearInterval(_erpPollInterval);
-            _erpPollInterval = null;
-            document.getElementById('btnErpStart')?.classList.remove('hidden');
-            document.getElementById('btnErpStop')?.classList.add('hidden');
-            // 오류/완료/종료 구분
-            const _hasErr = res.log && res.log.some(l =>
-                l.includes('찾을 수 없습니다') || l.includes('라이브러리 누락') || l.includes('오류 발생'));
-            if (_hasErr) {
-                showToast('ERP 입력 중 오류가 발생했습니다. 로그를 확인하세요.', 'error');
-            } else if (res.progress > 0) {
-                showToast('ERP 입력이 완료되었습니다.', 'success');
-            } else {
-                showToast('ERP 매크로가 종료되었습니다.', 'warning');
-            }
-        }
-    } catch (e) {
-        // 일시적 통신 오류 — 조용히 무시
-    }
-}
-
-async function diagnoseErpControls() {
-    const el = document.getElementById('erpDiagResult');
-    if (!el) return;
-    el.classList.remove('hidden');
-    el.textContent = '진단 중...';
-    try {
-        const res = await eel.diagnose_erp_controls(currentUser?.user_id || '')();
-        if (res && res.success) {
-            const cands = res.calendar_candidates || [];
-            const calInfo = cands.length
-                ? '✅ 달력 컨트롤 발견: ' + cands.map(c => c.cls).join(', ')
-                : '⚠️ 달력 컨트롤 미발견 (Win32 직접 설정 불가 — 좌표 폴백 사용)';
-            const lines = [
-                `ERP 창: "${escapeHtml(res.erp_title || '')}" (hwnd=${res.erp_hwnd})`,
-                calInfo,
-                `전체 자식 컨트롤: ${(res.controls || []).length}개`,
-                '',
-                ...(res.controls || []).slice(0, 25).map(c =>
-                    `[${c.hwnd}] ${escapeHtml(c.cls)} "${escapeHtml(c.text || '')}" rect=${JSON.stringify(c.rect)}`)
-            ];
-            el.textContent = lines.join('\n');
-        } else {
-            let msg = res?.message || '진단 실패';
-            if (res?.open_windows?.length) {
-                msg += '\n현재 열린 창: ' + res.open_windows.map(w => escapeHtml(w)).join(', ');
-            }
-            el.textContent = msg;
-        }
-    } catch(e) {
-        el.textContent = '진단 오류: ' + escapeHtml(e?.message || String(e));
-    }
-}
-
-async function installErpDeps() {
-    const btn = document.getElementById('btnInstallErpDeps');
-    if (btn) { btn.disabled = true; btn.textContent = '설치 중...'; }
-    try {
-        const res = await eel.install_erp_deps(currentUser?.user_id || '')();
-        if (res?.success) {
-            showToast(res.message, 'success');
-            if (btn) btn.classList.add('hidden');
-        } else {
-            showToast('설치 실패: ' + escapeHtml(res?.message || ''), 'error');
-            if (btn) { btn.disabled = false; btn.textContent = '📦 필수 라이브러리 설치'; }
-        }
-    } catch(e) {
-        showToast('오류가 발생했습니다.', 'error');
-        if (btn) { btn.disabled = false; btn.textContent = '📦 필수 라이브러리 설치'; }
-    }
-}
-
-// ============================================================================
-// 근로 시간 관리
-// ============================================================================
-
-function _initWorkHoursSelectors() {
-    const employeeSel = document.getElementById('workHoursEmployeeInput');
-    const yearSel = document.getElementById('workHoursYear');
-    const monthSel = document.getElementById('workHoursMonth');
-    if (!employeeSel || !yearSel || !monthSel) return;
-    if (!yearSel.options.length) {
-        const curYear = new Date().getFullYear();
-        for (let y = curYear; y >= curYear - 3; y--) {
-            const opt = document.createElement('option');
-            opt.value = y; opt.textContent = y + '년';
-            yearSel.appendChild(opt);
-        }
-    }
-    if (!monthSel.options.length) {
-        for (let m = 1; m <= 12; m++) {
-            const opt = document.createElement('option');
-            opt.value = m; opt.textContent = m + '월';
-            monthSel.appendChild(opt);
-        }
-        monthSel.value = new Date().getMonth() + 1;
-    }
-    if (!employeeSel.dataset.autoSearchBound) {
-        [employeeSel, yearSel, monthSel].forEach(el => {
-            el.addEventListener('change', () => { triggerWorkHoursSearch(); });
-        });
-        employeeSel.dataset.autoSearchBound = 'true';
-    }
-}
-
-function triggerWorkHoursSearch() {
-    const name = document.getElementById('workHoursEmployeeInput')?.value?.trim();
-    const year = parseInt(document.getElementById('workHoursYear')?.value || 0);
-    const month = parseInt(document.getElementById('workHoursMonth')?.value || 0);
-    if (!name || !year || !month) return false;
-    return searchWorkHours({ silent: true });
-}
-
-async function searchWorkHours(options = {}) {
-    const name  = document.getElementById('workHoursEmployeeInput')?.value?.trim();
-    const year  = parseInt(document.getElementById('workHoursYear')?.value || 0);
-    const month = parseInt(document.getElementById('workHoursMonth')?.value || 0);
-    const resultDiv = document.getElementById('workHoursResult');
-    const silent = !!options.silent;
-
-    if (!name) {
-        if (!silent) showCustomAlert('알림', '직원명을 선택하세요.', 'info');
-        return false;
-    }
-    if (!year || !month) {
-        if (!silent) showCustomAlert('알림', '연도와 월을 선택하세요.', 'info');
-        return false;
-    }
-    if (resultDiv) resultDiv.innerHTML = '<p class="text-slate-400">조회 중...</p>';
-
-    try {
-        // 항상 meal_deduct=false로 원본 OT 조회, 석식 공제는 클라이언트 per-day 적용
-        const res = await eel.get_work_hours_by_month(name, year, month, false)();
-        if (!res || !res.success) {
-            if (resultDiv) resultDiv.innerHTML = `<p class="text-red-500">${escapeHtml(res?.message || '조회 실패')}</p>`;
-            return;
-        }
-        // 새 조회 시 석식 공제 초기화
-        if (resultDiv) resultDiv._mealDeductDays = new Set();
-        renderWorkHoursCalendar(res, resultDiv);
-        return true;
-    } catch (e) {
-        console.error('근로 시간 조회 오류:', e);
-        if (resultDiv) resultDiv.innerHTML = '<p class="text-red-500">오류가 발생했습니다.</p>';
-        return false;
-    }
-}
-
-function _toggleMealDeduct(dateStr, containerId) {
-    const container = document.getElementById(containerId);
-    if (!container || !container._whData) return;
-    if (!container._mealDeductDays) container._mealDeductDays = new Set();
-    if (container._mealDeductDays.has(dateStr)) {
-        container._mealDeductDays.delete(dateStr);
-    } else {
-        container._mealDeductDays.add(dateStr);
-    }
-    renderWorkHoursCalendar(container._whData, container);
-}
-
-async function editWorkHoursOt(dateStr, containerId) {
-    const container = document.getElementById(containerId);
-    const dayData = container?._whData?.days?.[dateStr] || {};
-    if (!container || dayData.is_future) return;
-
-    const name = document.getElementById('workHoursEmployeeInput')?.value?.trim();
-    if (!name) {
-        showToast('직원명을 먼저 선택하세요.', 'warning');
-        return;
-    }
-
-    const currentStart = dayData.ot_start_time || '17:00';
-    const currentEnd = dayData.ot_end_time || '';
-    const startInput = prompt(`${dateStr} 연장근로 시작 시간을 입력하세요.\n예: 1700 또는 17:00\n비우고 저장하면 이 날짜의 수동 수정값을 지웁니다.`, currentStart);
-    if (startInput === null) return;
-    const endInput = prompt(`${dateStr} 연장근로 종료 시간을 입력하세요.\n예: 2100 또는 21:00\n비우고 저장하면 이 날짜의 수동 수정값을 지웁니다.`, currentEnd);
-    if (endInput === null) return;
-
-    const start = normalizeEndTimeValue(startInput);
-    const end = normalizeEndTimeValue(endInput);
-    if ((startInput.trim() || endInput.trim()) && (!start || !end)) {
-        showCustomAlert('입력 오류', '시작 시간과 종료 시간을 1700 또는 17:00 형식으로 입력해 주세요.', 'warning');
-        return;
-    }
-
-    try {
-        const result = await eel.save_work_hours_ot_override(name, dateStr, start, end, '')();
-        if (!result || !result.success) {
-            showToast(result?.message || '연장근로 시간 저장 실패', 'error');
-            return;
-        }
-        showToast(start && end ? '연장근로 시간이 수정되었습니다.' : '연장근로 수동 수정값을 삭제했습니다.', 'success');
-        await searchWorkHours({ silent: true });
-    } catch (e) {
-        console.error('연장근로 시간 수정 오류:', e);
-        showToast('연장근로 시간 수정 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-function renderWorkHoursCalendar(data, container) {
-    if (!container) return;
-    // 데이터·상태 보존 (innerHTML 재렌더 후에도 유지)
-    container._whData = data;
-    if (!container._mealDeductDays) container._mealDeductDays = new Set();
-    const mealDeductDays = container._mealDeductDays;
-
-    const { days } = data;
-    const containerId = container.id || 'workHoursResult';
-
-    // per-day 석식 공제 적용 후 유효 OT 계산
-    let totalRegular = 0, totalOt = 0;
-    const effectiveDays = {};
-    for (const [dateStr, d] of Object.entries(days)) {
-        const isMealDeducted = mealDeductDays.has(dateStr);
-        const ot = isMealDeducted ? Math.max(0, (d.ot || 0) - 1) : (d.ot || 0);
-        effectiveDays[dateStr] = { ...d, ot, meal_deducted: isMealDeducted };
-        if (d.is_current_month) {
-            totalRegular += d.regular || 0;
-            totalOt += ot;
-        }
-    }
-    const dateEntries = Object.entries(effectiveDays).sort(([a], [b]) => a.localeCompare(b));
-
-    const leaveColors = {
-        '연차': 'bg-blue-100 text-blue-700',
-        '반차': 'bg-purple-100 text-purple-700',
-        '반반차': 'bg-fuchsia-100 text-fuchsia-700',
-        '공가': 'bg-slate-100 text-slate-500'
-    };
-    const dayLabels = ['일', '월', '화', '수', '목', '금', '토'];
-
-    let html = `
-    <div class="space-y-4">
-      <div class="grid grid-cols-3 gap-3">
-        <div class="bg-slate-50 border border-slate-200 rounded-xl p-3 text-center">
-          <p class="text-xs text-slate-500 mb-1">정규 근로시간</p>
-          <p class="text-2xl font-bold text-blue-600">${totalRegular.toFixed(1)}h</p>
-        </div>
-        <div class="bg-slate-50 border border-slate-200 rounded-xl p-3 text-center">
-          <p class="text-xs text-slate-500 mb-1">연장 근로시간</p>
-          <p class="text-2xl font-bold text-orange-500">${totalOt.toFixed(1)}h</p>
-        </div>
-        <div class="bg-slate-50 border border-slate-200 rounded-xl p-3 text-center">
-          <p class="text-xs text-slate-500 mb-1">총 근로시간</p>
-          <p class="text-2xl font-bold text-slate-700">${(totalRegular + totalOt).toFixed(1)}h</p>
-        </div>
-      </div>
-      <div class="overflow-x-auto">
-        <table class="w-full border-collapse text-sm">
-          <thead><tr>`;
-
-    dayLabels.forEach((lbl, i) => {
-        const cls = i === 0 ? 'text-red-600' : i === 6 ? 'text-blue-600' : 'text-slate-700';
-        html += `<th class="border border-slate-200 p-1 text-center text-xs font-semibold ${cls} bg-slate-50 w-14">${lbl}</th>`;
-    });
-    html += `<th class="border border-slate-200 p-1 text-center text-xs font-semibold text-slate-500 bg-slate-100 w-16">주 계</th>`;
-    html += `</tr></thead><tbody>`;
-
-    for (let rowStart = 0; rowStart < dateEntries.length; rowStart += 7) {
-        const weekEntries = dateEntries.slice(rowStart, rowStart + 7);
-        html += '<tr>';
-        let weekRegular = 0, weekOt = 0;
-
-        weekEntries.forEach(([dateStr, dayData], col) => {
-            const isWeekend = dayData.is_weekend || col === 0 || col === 6;
-            const isOutsideMonth = !dayData.is_current_month;
-            const lt = dayData.leave_type;
-            const leaveBadge = lt ? `<span class="inline-block mt-0.5 px-1 text-xs rounded ${leaveColors[lt] || 'bg-slate-100'}">${lt}</span>` : '';
-            const dayNum = parseInt(dateStr.slice(-2), 10);
-            const isFuture = !!dayData.is_future;
-
-            weekRegular += dayData.regular || 0;
-            weekOt += dayData.ot || 0;
-
-            const cellBg = isOutsideMonth
-                ? (isWeekend ? 'bg-slate-100' : 'bg-slate-50')
-                : isFuture
-                    ? 'bg-slate-50'
-                    : (isWeekend ? 'bg-slate-100 hover:bg-blue-50' : 'bg-white hover:bg-blue-50');
-            const dayNumColor = isOutsideMonth
-                ? (col === 0 ? 'text-red-400' : col === 6 ? 'text-blue-400' : 'text-slate-400')
-                : isFuture
-                    ? 'text-slate-300'
-                    : (col === 0 ? 'text-red-600' : col === 6 ? 'text-blue-600' : 'text-slate-700');
-            const regularDisplay = isFuture
-                ? '<span class="text-slate-200">&nbsp;</span>'
-                : dayData.regular > 0
-                ? `<span class="text-blue-700 font-medium">${dayData.regular.toFixed(1)}h</span>`
-                : '<span class="text-slate-300">-</span>';
-            const otDisplay = !isFuture && dayData.ot > 0
-                ? `<span class="text-orange-500 font-medium">+${dayData.ot.toFixed(1)}h</span>`
-                : '';
-            const otTimeDisplay = !isFuture && dayData.ot_start_time && dayData.ot_end_time
-                ? `<div class="text-[10px] text-slate-400 leading-tight">${escapeHtml(dayData.ot_start_time)}-${escapeHtml(dayData.ot_end_time)}</div>`
-                : '';
-            const overrideBadge = dayData.ot_overridden
-                ? `<div class="text-xs text-emerald-600 leading-tight">수정</div>` : '';
-            const mealBadge = dayData.meal_deducted
-                ? `<div class="text-xs text-amber-600 leading-tight">-석식</div>` : '';
-
-            // 야간 근무일(원본 OT > 0)에만 더블클릭 허용
-            const hasRawOt = (days[dateStr]?.ot || 0) > 0;
-            const dblAttr = (!isWeekend && hasRawOt && !isFuture)
-                ? `ondblclick="_toggleMealDeduct('${dateStr}','${containerId}')" style="cursor:pointer" title="더블클릭: 석식 공제 ${dayData.meal_deducted ? '해제' : '적용'}"`
-                : '';
-            const contextAttr = !isFuture
-                ? `oncontextmenu="event.preventDefault(); editWorkHoursOt('${dateStr}','${containerId}'); return false;" title="우클릭: 연장근로 시작/종료 시간 수정"`
-                : '';
-            const mealRing = dayData.meal_deducted ? ' ring-2 ring-inset ring-amber-300' : '';
-            const overrideRing = dayData.ot_overridden ? ' ring-2 ring-inset ring-emerald-300' : '';
-
-            html += `
-            <td class="border border-slate-200 p-1 align-top ${cellBg}${mealRing}${overrideRing} h-16 select-none" style="min-width:56px" ${dblAttr} ${contextAttr}>
-              <div class="text-xs font-semibold ${dayNumColor} mb-0.5">${dayNum}</div>
-              ${leaveBadge}
-              <div class="text-xs leading-tight">${regularDisplay}</div>
-              ${otDisplay ? `<div class="text-xs leading-tight">${otDisplay}</div>` : ''}
-              ${otTimeDisplay}
-              ${overrideBadge}
-              ${mealBadge}
-            </td>`;
-        });
-
-        // 주 계 열은 인접 월 표시분도 함께 합산
-        const weekTotal = weekRegular + weekOt;
-        html += `
-            <td class="border border-slate-200 p-1 align-middle bg-slate-50 h-16 text-center" style="min-width:56px">
-              <div class="text-xs font-bold text-slate-700">${weekTotal.toFixed(1)}h</div>
-              ${weekOt > 0 ? `<div class="text-xs text-orange-500 mt-0.5">+${weekOt.toFixed(1)}</div>` : ''}
-            </td>`;
-        html += '</tr>';
-    }
-
-    html += `
-        </tbody></table>
-      </div>
-      <p class="text-xs text-slate-400">* 오늘 이후 날짜는 근로시간을 표시하지 않습니다. &nbsp;|&nbsp; 야간 근무일 더블클릭 → 석식 공제(1h) 적용/해제 &nbsp;|&nbsp; 달력 우클릭 → 연장근로 시작/종료 시간 수정 &nbsp;|&nbsp; 초록 테두리 = 수동 수정</p>
-    </div>`;
-
-    container.innerHTML = html;
-    // innerHTML 이후 상태 복원
-    container._whData = data;
-    container._mealDeductDays = mealDeductDays;
-}
-
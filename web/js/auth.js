@@ -32,7 +32,7 @@ function showLoginForm() {
 
     // 로그인 화면 하단에 현재 버전 표시
     try {
-        eel.get_app_info()(function(info) {
+        eelFetch('get_app_info').then(function(info) {
             const el = document.getElementById('loginVersionText');
             if (el && info && info.version) {
                 el.textContent = 'v' + info.version;
@@ -61,7 +61,7 @@ function showMainApp() {
 
     // 헤더 버전 배지 업데이트
     try {
-        eel.get_app_info()(function(info) {
+        eelFetch('get_app_info').then(function(info) {
             const badge = document.getElementById('appVersionBadge');
             if (badge && info && info.version) badge.textContent = 'v' + info.version;
         });
@@ -78,6 +78,9 @@ function showMainApp() {
     currentUser.default_view = defaultView; // currentUser에도 저장
     applyDefaultView(defaultView);
 
+    // 서버 변경 알림 수신 시작 (댓글·칸반·일일 작업 자동 갱신)
+    if (typeof startChangeListener === 'function') startChangeListener();
+
     // 자동 로그인 만료 임박 알림
     _showAutoLoginExpiryBanner();
 }
@@ -114,7 +117,7 @@ function showAdminApp() {
 
     // 관리자 헤더 버전 배지 업데이트
     try {
-        eel.get_app_info()(function(info) {
+        eelFetch('get_app_info').then(function(info) {
             const badge = document.getElementById('adminVersionBadge');
             if (badge && info && info.version) badge.textContent = 'v' + info.version;
         });
@@ -342,24 +345,6 @@ function _clearLocalAutoLogin() {
     localStorage.removeItem('autoLoginTokenAt'); // #2
 }
 
-// ============================================================================
-// 관리자 기능
-// ============================================================================
-
-const _adminDbState = {
-    subtab: 'excel',
-    owners: [],
-    ownerSuggestions: [],
-    selectedOwner: '',
-    selectedOwners: new Set(),
-    selectedOwnerShips: new Set(),
-    vendors: [],
-    selectedVendor: '',
-    selectedVendorWorkers: new Set(),
-    canUndoMerge: false,
-    lastMergeUndoSummary: '',
-};
-
 function compareVersionText(left, right) {
     const leftParts = String(left || '').split('.').map(v => parseInt(v, 10) || 0);
     const rightParts = String(right || '').split('.').map(v => parseInt(v, 10) || 0);
@@ -373,1432 +358,6 @@ function compareVersionText(left, right) {
     return 0;
 }
 
-function encodeSuggestionPayload(names) {
-    return encodeURIComponent(JSON.stringify(Array.isArray(names) ? names : []));
-}
-
-function decodeSuggestionPayload(payload) {
-    try {
-        const parsed = JSON.parse(decodeURIComponent(String(payload || '')));
-        return Array.isArray(parsed) ? parsed.filter(Boolean) : [];
-    } catch (_) {
-        return [];
-    }
-}
-
-function renderMergeSuggestionButtons(suggestions, applyHandlerName, emptyMessage) {
-    if (!Array.isArray(suggestions) || suggestions.length === 0) {
-        return `<div class="text-xs text-slate-400">${escapeHtml(emptyMessage)}</div>`;
-    }
-    return suggestions.map(suggestion => {
-        const names = Array.isArray(suggestion?.names) ? suggestion.names.filter(Boolean) : [];
-        const payload = encodeSuggestionPayload(names);
-        const reason = suggestion?.reason ? `<div class="text-[11px] text-slate-500 mt-1">${escapeHtml(suggestion.reason)}</div>` : '';
-        return `
-            <button onclick="${applyHandlerName}('${escapeJs(payload)}')"
-                    class="w-full text-left rounded-lg border border-amber-200 bg-amber-50 hover:bg-amber-100 px-3 py-2 transition">
-                <div class="text-sm font-semibold text-amber-900">${escapeHtml(suggestion?.label || names.join(', '))}</div>
-                ${reason}
-            </button>
-        `;
-    }).join('');
-}
-
-function _buildMergePreviewText(title, preview) {
-    const lines = [title, '', preview?.message || '변경 대상이 없습니다.'];
-    if (preview?.details) lines.push('', preview.details);
-    lines.push('', '계속하시겠습니까?');
-    return lines.join('\n');
-}
-
-function updateAdminMergeUndoButtons() {
-    ['btnUndoOwnerMerge', 'btnUndoVendorMerge'].forEach(id => {
-        const button = document.getElementById(id);
-        if (!button) return;
-        button.classList.toggle('hidden', !_adminDbState.canUndoMerge);
-        button.disabled = !_adminDbState.canUndoMerge;
-        button.title = _adminDbState.canUndoMerge ? (_adminDbState.lastMergeUndoSummary || '최근 병합 되돌리기') : '';
-    });
-}
-
-async function refreshAdminMergeUndoState() {
-    try {
-        const result = await eel.admin_get_last_merge_undo(currentUser?.user_id || '')();
-        _adminDbState.canUndoMerge = !!(result && result.success && result.available);
-        _adminDbState.lastMergeUndoSummary = result?.summary || '';
-    } catch (error) {
-        console.warn('병합 되돌리기 상태 조회 실패:', error);
-        _adminDbState.canUndoMerge = false;
-        _adminDbState.lastMergeUndoSummary = '';
-    }
-    updateAdminMergeUndoButtons();
-}
-
-async function undoLastAdminMerge() {
-    if (!_adminDbState.canUndoMerge) {
-        showToast('되돌릴 최근 병합 내역이 없습니다.', 'warning');
-        return;
-    }
-    const summary = _adminDbState.lastMergeUndoSummary || '최근 병합';
-    if (!confirm(`최근 병합을 되돌릴까요?\n\n${summary}`)) return;
-
-    try {
-        const result = await eel.admin_undo_last_merge(currentUser?.user_id || '')();
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '병합 되돌리기에 실패했습니다.', 'error');
-            return;
-        }
-        showToast(result.message || '최근 병합을 되돌렸습니다.', 'success');
-        await Promise.all([
-            loadAdminOwnerCompanyCatalog(true),
-            loadAdminVendorCompanyCatalog(true),
-        ]);
-        await refreshAdminMergeUndoState();
-    } catch (error) {
-        console.error('병합 되돌리기 오류:', error);
-        showCustomAlert('오류', '병합 되돌리기 중 오류가 발생했습니다.', 'error');
-    }
-}
-window.undoLastAdminMerge = undoLastAdminMerge;
-
-function applyOwnerCompanySuggestion(payload) {
-    const names = decodeSuggestionPayload(payload);
-    if (names.length < 2) {
-        showToast('추천 후보가 충분하지 않습니다.', 'warning');
-        return;
-    }
-    _adminDbState.selectedOwner = names[0];
-    _adminDbState.selectedOwners = new Set(names);
-    _adminDbState.selectedOwnerShips = new Set();
-    renderAdminOwnerCompanyList();
-    promptMergeSelectedOwnerCompanies();
-}
-window.applyOwnerCompanySuggestion = applyOwnerCompanySuggestion;
-
-function applyOwnerShipSuggestion(payload) {
-    const names = decodeSuggestionPayload(payload);
-    if (names.length < 2) {
-        showToast('추천 후보가 충분하지 않습니다.', 'warning');
-        return;
-    }
-    _adminDbState.selectedOwnerShips = new Set(names);
-    renderAdminOwnerCompanyList();
-    promptMergeSelectedOwnerShips();
-}
-window.applyOwnerShipSuggestion = applyOwnerShipSuggestion;
-
-function applyVendorWorkerSuggestion(payload) {
-    const names = decodeSuggestionPayload(payload);
-    if (names.length < 2) {
-        showToast('추천 후보가 충분하지 않습니다.', 'warning');
-        return;
-    }
-    _adminDbState.selectedVendorWorkers = new Set(names);
-    renderAdminVendorCompanyList();
-    promptMergeSelectedVendorWorkers();
-}
-window.applyVendorWorkerSuggestion = applyVendorWorkerSuggestion;
-
-function showAdminTab(tab) {
-    const tabs = ['users', 'settings', 'db', 'telegram', 'status', 'activity'];
-    const activeClass = 'px-6 py-3 font-medium border-b-2 border-blue-600 text-blue-600';
-    const inactiveClass = 'px-6 py-3 font-medium text-slate-600 hover:text-slate-800';
-
-    tabs.forEach(t => {
-        const key = t.charAt(0).toUpperCase() + t.slice(1);
-        const btn = document.getElementById('tab' + key);
-        const panel = document.getElementById('admin' + key + 'Tab');
-        if (btn) btn.className = t === tab ? activeClass : inactiveClass;
-        if (panel) panel.classList.toggle('hidden', t !== tab);
-    });
-
-    if (tab === 'status') {
-        loadAdminStatusTab();
-    }
-    if (tab === 'activity') {
-        loadActivityLogTab();
-    }
-    if (tab === 'db') {
-        showAdminDbSubtab(_adminDbState.subtab || 'excel');
-    }
-}
-
-function showAdminDbSubtab(tab) {
-    _adminDbState.subtab = tab;
-    const config = {
-        excel: { btn: 'btnAdminDbExcel', panel: 'adminDbExcelSubtab' },
-        owners: { btn: 'btnAdminDbOwners', panel: 'adminDbOwnersSubtab' },
-        vendors: { btn: 'btnAdminDbVendors', panel: 'adminDbVendorsSubtab' },
-    };
-    Object.entries(config).forEach(([key, value]) => {
-        const btn = document.getElementById(value.btn);
-        const panel = document.getElementById(value.panel);
-        if (btn) {
-            btn.className = key === tab
-                ? 'px-4 py-2 rounded-t-lg bg-blue-600 text-white font-semibold'
-                : 'px-4 py-2 rounded-t-lg bg-slate-100 text-slate-600 font-semibold hover:bg-slate-200';
-        }
-        if (panel) panel.classList.toggle('hidden', key !== tab);
-    });
-    closeAdminOwnerCompanyContextMenu();
-    closeAdminOwnerShipContextMenu();
-    closeAdminVendorWorkerContextMenu();
-    refreshAdminMergeUndoState();
-    if (tab === 'owners') loadAdminOwnerCompanyCatalog();
-    if (tab === 'vendors') loadAdminVendorCompanyCatalog();
-}
-window.showAdminDbSubtab = showAdminDbSubtab;
-
-function _getSelectedOwnerEntry() {
-    return _adminDbState.owners.find(item => item.name === _adminDbState.selectedOwner) || _adminDbState.owners[0] || null;
-}
-
-function _syncSelectedOwnerShips() {
-    const owner = _getSelectedOwnerEntry();
-    const validNames = new Set((owner?.ships || []).map(ship => ship.shipName));
-    _adminDbState.selectedOwnerShips = new Set(
-        [..._adminDbState.selectedOwnerShips].filter(name => validNames.has(name))
-    );
-}
-
-async function loadAdminOwnerCompanyCatalog(force = false) {
-    if (!force && _adminDbState.owners.length > 0) {
-        renderAdminOwnerCompanyList();
-        return;
-    }
-    try {
-        const result = await eel.admin_get_owner_company_catalog(currentUser?.user_id || '')();
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '선사 목록을 불러오지 못했습니다.', 'error');
-            return;
-        }
-        _adminDbState.owners = result.owners || [];
-        _adminDbState.ownerSuggestions = result.ownerSuggestions || [];
-        if (!_adminDbState.selectedOwner && _adminDbState.owners.length > 0) {
-            _adminDbState.selectedOwner = _adminDbState.owners[0].name;
-        }
-        if (_adminDbState.selectedOwner && !_adminDbState.owners.some(o => o.name === _adminDbState.selectedOwner)) {
-            _adminDbState.selectedOwner = _adminDbState.owners[0]?.name || '';
-        }
-        _adminDbState.selectedOwners = new Set(
-            [..._adminDbState.selectedOwners].filter(name => _adminDbState.owners.some(o => o.name === name))
-        );
-        if (_adminDbState.selectedOwners.size === 0 && _adminDbState.selectedOwner) {
-            _adminDbState.selectedOwners = new Set([_adminDbState.selectedOwner]);
-        }
-        _syncSelectedOwnerShips();
-        renderAdminOwnerCompanyList();
-    } catch (error) {
-        console.error('선사 목록 로드 오류:', error);
-        showCustomAlert('오류', '선사 목록을 불러오지 못했습니다.', 'error');
-    }
-}
-window.loadAdminOwnerCompanyCatalog = loadAdminOwnerCompanyCatalog;
-
-function renderAdminOwnerCompanyList() {
-    const listEl = document.getElementById('adminOwnerCompanyList');
-    const suggestionsEl = document.getElementById('adminOwnerCompanySuggestions');
-    const detailEl = document.getElementById('adminOwnerCompanyDetail');
-    if (!listEl || !detailEl) return;
-
-    if (suggestionsEl) {
-        suggestionsEl.innerHTML = `
-            <div class="space-y-2">
-                <div class="text-xs font-semibold text-amber-700">중복 의심 선사</div>
-                ${renderMergeSuggestionButtons(_adminDbState.ownerSuggestions, 'applyOwnerCompanySuggestion', '추천 후보가 없습니다.')}
-            </div>
-        `;
-    }
-
-    if (_adminDbState.owners.length === 0) {
-        listEl.innerHTML = '<p class="text-sm text-slate-400 p-3">등록된 선사가 없습니다.</p>';
-        detailEl.innerHTML = '<p class="text-sm text-slate-400">선사를 선택하면 선박과 장비가 표시됩니다.</p>';
-        return;
-    }
-
-    listEl.innerHTML = _adminDbState.owners.map(owner => {
-        const active = owner.name === _adminDbState.selectedOwner;
-        const selected = _adminDbState.selectedOwners.has(owner.name);
-        return `
-            <button onclick="handleAdminOwnerCompanyClick('${escapeJs(owner.name)}', event)"
-                    oncontextmenu="handleAdminOwnerCompanyContextMenu('${escapeJs(owner.name)}', event)"
-                    class="w-full text-left rounded-lg border px-3 py-3 transition ${(active || selected) ? 'bg-blue-50 border-blue-300 text-blue-700' : 'bg-white hover:bg-slate-100 border-slate-200'}">
-                <div class="font-semibold">${escapeHtml(owner.name)}</div>
-                <div class="text-xs text-slate-500 mt-1">선박 ${owner.shipCount}척 · 작업 ${owner.workRecordCount + owner.holidayCount}건 · 등록 ${owner.projectCount}건</div>
-            </button>`;
-    }).join('');
-
-    const owner = _getSelectedOwnerEntry();
-    _adminDbState.selectedOwner = owner?.name || '';
-    _syncSelectedOwnerShips();
-    if (!owner) {
-        detailEl.innerHTML = '<p class="text-sm text-slate-400">선사를 선택하면 선박과 장비가 표시됩니다.</p>';
-        return;
-    }
-
-    detailEl.innerHTML = `
-        <div class="mb-4">
-            <div class="text-lg font-bold text-slate-800">${escapeHtml(owner.name)}</div>
-            <div class="text-sm text-slate-500 mt-1">선박 ${owner.shipCount}척 · 작업 ${owner.workRecordCount + owner.holidayCount}건 · 등록 ${owner.projectCount}건</div>
-            <div class="text-xs text-slate-400 mt-2">선박도 Ctrl 선택 후 우클릭으로 병합할 수 있습니다.</div>
-        </div>
-        <div class="mb-4 rounded-xl border border-amber-200 bg-amber-50 p-3">
-            <div class="text-xs font-semibold text-amber-700 mb-2">중복 의심 선박</div>
-            <div class="space-y-2">
-                ${renderMergeSuggestionButtons(owner.shipSuggestions || [], 'applyOwnerShipSuggestion', '추천 후보가 없습니다.')}
-            </div>
-        </div>
-        <div class="space-y-3">
-            ${owner.ships.map(ship => `
-                <button onclick="handleAdminOwnerShipClick('${escapeJs(ship.shipName)}', event)"
-                        oncontextmenu="handleAdminOwnerShipContextMenu('${escapeJs(ship.shipName)}', event)"
-                        class="w-full text-left border rounded-xl p-4 transition ${_adminDbState.selectedOwnerShips.has(ship.shipName) ? 'bg-blue-50 border-blue-300' : 'bg-slate-50 border-slate-200 hover:bg-slate-100'}">
-                    <div class="flex items-center justify-between gap-4 mb-2">
-                        <div class="font-semibold text-slate-800">${escapeHtml(ship.shipName)}</div>
-                        <div class="text-xs text-slate-500">작업 ${ship.workRecordCount + ship.holidayCount}건 · 등록 ${ship.projectCount}건</div>
-                    </div>
-                    <div class="flex flex-wrap gap-2">
-                        ${ship.engineModels.length > 0
-                            ? ship.engineModels.map(model => `<span class="px-2 py-1 bg-white border border-slate-200 rounded-full text-xs text-slate-700">${escapeHtml(model)}</span>`).join('')
-                            : '<span class="text-xs text-slate-400">등록된 장비 없음</span>'}
-                    </div>
-                </button>
-            `).join('')}
-        </div>`;
-}
-
-function selectAdminOwnerCompany(ownerName) {
-    _adminDbState.selectedOwner = ownerName;
-    _adminDbState.selectedOwners = new Set([ownerName]);
-    _adminDbState.selectedOwnerShips = new Set();
-    renderAdminOwnerCompanyList();
-}
-window.selectAdminOwnerCompany = selectAdminOwnerCompany;
-
-function handleAdminOwnerCompanyClick(ownerName, event) {
-    closeAdminOwnerCompanyContextMenu();
-    closeAdminOwnerShipContextMenu();
-    const multi = !!(event && (event.ctrlKey || event.metaKey));
-    _adminDbState.selectedOwner = ownerName;
-    if (multi) {
-        if (_adminDbState.selectedOwners.has(ownerName)) _adminDbState.selectedOwners.delete(ownerName);
-        else _adminDbState.selectedOwners.add(ownerName);
-        if (_adminDbState.selectedOwners.size === 0) {
-            _adminDbState.selectedOwners = new Set([ownerName]);
-        }
-    } else {
-        _adminDbState.selectedOwners = new Set([ownerName]);
-    }
-    _adminDbState.selectedOwnerShips = new Set();
-    renderAdminOwnerCompanyList();
-}
-window.handleAdminOwnerCompanyClick = handleAdminOwnerCompanyClick;
-
-function handleAdminOwnerCompanyContextMenu(ownerName, event) {
-    event.preventDefault();
-    _adminDbState.selectedOwner = ownerName;
-    if (!_adminDbState.selectedOwners.has(ownerName)) {
-        _adminDbState.selectedOwners = new Set([ownerName]);
-        renderAdminOwnerCompanyList();
-    }
-    if (_adminDbState.selectedOwners.size < 2) {
-        closeAdminOwnerCompanyContextMenu();
-        return;
-    }
-    const menu = document.getElementById('adminOwnerCompanyContextMenu');
-    if (!menu) return;
-    const parentRect = menu.parentElement?.getBoundingClientRect();
-    const offsetX = parentRect ? event.clientX - parentRect.left : event.clientX;
-    const offsetY = parentRect ? event.clientY - parentRect.top : event.clientY;
-    menu.style.left = `${offsetX}px`;
-    menu.style.top = `${offsetY}px`;
-    menu.classList.remove('hidden');
-}
-window.handleAdminOwnerCompanyContextMenu = handleAdminOwnerCompanyContextMenu;
-
-function closeAdminOwnerCompanyContextMenu() {
-    document.getElementById('adminOwnerCompanyContextMenu')?.classList.add('hidden');
-}
-window.closeAdminOwnerCompanyContextMenu = closeAdminOwnerCompanyContextMenu;
-
-async function promptMergeSelectedOwnerCompanies() {
-    closeAdminOwnerCompanyContextMenu();
-    const selected = [..._adminDbState.selectedOwners];
-    if (selected.length < 2) {
-        showToast('병합할 선사를 2개 이상 선택하세요.', 'warning');
-        return;
-    }
-    const targetName = prompt(
-        `대표 선사명을 입력하세요.\n\n선택: ${selected.join(', ')}`,
-        _adminDbState.selectedOwner || selected[0]
-    );
-    if (!targetName || !targetName.trim()) return;
-
-    try {
-        const preview = await eel.admin_preview_merge_owner_companies(
-            selected,
-            targetName.trim(),
-            currentUser?.user_id || ''
-        )();
-        if (!preview || !preview.success) {
-            showCustomAlert('오류', preview?.message || '선사 병합 미리보기를 불러오지 못했습니다.', 'error');
-            return;
-        }
-        const totalUpdates = (preview.workUpdates || 0) + (preview.projectUpdates || 0) + (preview.holidayUpdates || 0);
-        if (totalUpdates <= 0) {
-            showCustomAlert('변경 대상 없음', preview.message || '변경될 데이터가 없습니다.', 'warning');
-            return;
-        }
-        if (!confirm(_buildMergePreviewText(`"${selected.join(', ')}" 을(를) "${targetName.trim()}" 으로 병합합니다.`, preview))) return;
-
-        const result = await eel.admin_merge_owner_companies(
-            selected,
-            targetName.trim(),
-            currentUser?.user_id || ''
-        )();
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '선사 병합에 실패했습니다.', 'error');
-            return;
-        }
-        showToast(result.message || '선사 병합이 완료되었습니다.', 'success');
-        _adminDbState.selectedOwner = targetName.trim();
-        _adminDbState.selectedOwners = new Set([targetName.trim()]);
-        await loadAdminOwnerCompanyCatalog(true);
-        await refreshAdminMergeUndoState();
-    } catch (error) {
-        console.error('선사 병합 오류:', error);
-        showCustomAlert('오류', '선사 병합 중 오류가 발생했습니다.', 'error');
-    }
-}
-window.promptMergeSelectedOwnerCompanies = promptMergeSelectedOwnerCompanies;
-
-function handleAdminOwnerShipClick(shipName, event) {
-    closeAdminOwnerShipContextMenu();
-    const multi = !!(event && (event.ctrlKey || event.metaKey));
-    if (multi) {
-        if (_adminDbState.selectedOwnerShips.has(shipName)) _adminDbState.selectedOwnerShips.delete(shipName);
-        else _adminDbState.selectedOwnerShips.add(shipName);
-        if (_adminDbState.selectedOwnerShips.size === 0) {
-            _adminDbState.selectedOwnerShips = new Set([shipName]);
-        }
-    } else {
-        _adminDbState.selectedOwnerShips = new Set([shipName]);
-    }
-    renderAdminOwnerCompanyList();
-}
-window.handleAdminOwnerShipClick = handleAdminOwnerShipClick;
-
-function handleAdminOwnerShipContextMenu(shipName, event) {
-    event.preventDefault();
-    if (!_adminDbState.selectedOwnerShips.has(shipName)) {
-        _adminDbState.selectedOwnerShips = new Set([shipName]);
-        renderAdminOwnerCompanyList();
-    }
-    if (_adminDbState.selectedOwnerShips.size < 2) {
-        closeAdminOwnerShipContextMenu();
-        return;
-    }
-    const menu = document.getElementById('adminOwnerShipContextMenu');
-    if (!menu) return;
-    const parentRect = menu.parentElement?.getBoundingClientRect();
-    const offsetX = parentRect ? event.clientX - parentRect.left : event.clientX;
-    const offsetY = parentRect ? event.clientY - parentRect.top : event.clientY;
-    menu.style.left = `${offsetX}px`;
-    menu.style.top = `${offsetY}px`;
-    menu.classList.remove('hidden');
-}
-window.handleAdminOwnerShipContextMenu = handleAdminOwnerShipContextMenu;
-
-function closeAdminOwnerShipContextMenu() {
-    document.getElementById('adminOwnerShipContextMenu')?.classList.add('hidden');
-}
-window.closeAdminOwnerShipContextMenu = closeAdminOwnerShipContextMenu;
-
-async function promptMergeSelectedOwnerShips() {
-    closeAdminOwnerShipContextMenu();
-    const ownerName = _adminDbState.selectedOwner;
-    const selected = [..._adminDbState.selectedOwnerShips];
-    if (!ownerName) {
-        showToast('선사를 먼저 선택하세요.', 'warning');
-        return;
-    }
-    if (selected.length < 2) {
-        showToast('병합할 선박을 2개 이상 선택하세요.', 'warning');
-        return;
-    }
-
-    const targetName = prompt(
-        `대표 선박명을 입력하세요.\n\n선사: ${ownerName}\n선택: ${selected.join(', ')}`,
-        selected[0]
-    );
-    if (!targetName || !targetName.trim()) return;
-
-    try {
-        const preview = await eel.admin_preview_merge_owner_ships(
-            ownerName,
-            selected,
-            targetName.trim(),
-            currentUser?.user_id || ''
-        )();
-        if (!preview || !preview.success) {
-            showCustomAlert('오류', preview?.message || '선박 병합 미리보기를 불러오지 못했습니다.', 'error');
-            return;
-        }
-        const totalUpdates = (preview.workUpdates || 0) + (preview.projectUpdates || 0) + (preview.holidayUpdates || 0);
-        if (totalUpdates <= 0) {
-            showCustomAlert('변경 대상 없음', preview.message || '변경될 데이터가 없습니다.', 'warning');
-            return;
-        }
-        if (!confirm(_buildMergePreviewText(`"${selected.join(', ')}" 을(를) "${targetName.trim()}" 으로 병합합니다.`, preview))) return;
-
-        const result = await eel.admin_merge_owner_ships(
-            ownerName,
-            selected,
-            targetName.trim(),
-            currentUser?.user_id || ''
-        )();
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '선박 병합에 실패했습니다.', 'error');
-            return;
-        }
-        showToast(result.message || '선박 병합이 완료되었습니다.', 'success');
-        _adminDbState.selectedOwnerShips = new Set([targetName.trim()]);
-        await loadAdminOwnerCompanyCatalog(true);
-        await refreshAdminMergeUndoState();
-    } catch (error) {
-        console.error('선박 병합 오류:', error);
-        showCustomAlert('오류', '선박 병합 중 오류가 발생했습니다.', 'error');
-    }
-}
-window.promptMergeSelectedOwnerShips = promptMergeSelectedOwnerShips;
-
-async function loadAdminVendorCompanyCatalog(force = false) {
-    if (!force && _adminDbState.vendors.length > 0) {
-        renderAdminVendorCompanyList();
-        return;
-    }
-    try {
-        const result = await eel.admin_get_vendor_company_catalog(currentUser?.user_id || '')();
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '외주 목록을 불러오지 못했습니다.', 'error');
-            return;
-        }
-        _adminDbState.vendors = result.vendors || [];
-        if (!_adminDbState.selectedVendor && _adminDbState.vendors.length > 0) {
-            _adminDbState.selectedVendor = _adminDbState.vendors[0].name;
-        }
-        if (_adminDbState.selectedVendor && !_adminDbState.vendors.some(v => v.name === _adminDbState.selectedVendor)) {
-            _adminDbState.selectedVendor = _adminDbState.vendors[0]?.name || '';
-        }
-        _adminDbState.selectedVendorWorkers = new Set();
-        renderAdminVendorCompanyList();
-    } catch (error) {
-        console.error('외주 목록 로드 오류:', error);
-        showCustomAlert('오류', '외주 목록을 불러오지 못했습니다.', 'error');
-    }
-}
-window.loadAdminVendorCompanyCatalog = loadAdminVendorCompanyCatalog;
-
-function renderAdminVendorCompanyList() {
-    const listEl = document.getElementById('adminVendorCompanyList');
-    const detailEl = document.getElementById('adminVendorWorkerDetail');
-    if (!listEl || !detailEl) return;
-
-    if (_adminDbState.vendors.length === 0) {
-        listEl.innerHTML = '<p class="text-sm text-slate-400 p-3">등록된 외주 업체가 없습니다.</p>';
-        detailEl.innerHTML = '<p class="text-sm text-slate-400">외주 업체를 선택하면 소속 직원명이 표시됩니다.</p>';
-        return;
-    }
-
-    listEl.innerHTML = _adminDbState.vendors.map(vendor => {
-        const active = vendor.name === _adminDbState.selectedVendor;
-        return `
-            <button onclick="selectAdminVendorCompany('${escapeJs(vendor.name)}')"
-                    class="w-full text-left rounded-lg border px-3 py-3 transition ${active ? 'bg-blue-50 border-blue-300 text-blue-700' : 'bg-white hover:bg-slate-100 border-slate-200'}">
-                <div class="font-semibold">${escapeHtml(vendor.name)}</div>
-                <div class="text-xs text-slate-500 mt-1">직원 ${vendor.workerCount}명 · 작업 ${vendor.workRecordCount}건 · 휴일 ${vendor.holidayCount}건</div>
-            </button>`;
-    }).join('');
-
-    const vendor = _adminDbState.vendors.find(item => item.name === _adminDbState.selectedVendor) || _adminDbState.vendors[0];
-    _adminDbState.selectedVendor = vendor?.name || '';
-    if (!vendor) {
-        detailEl.innerHTML = '<p class="text-sm text-slate-400">외주 업체를 선택하면 소속 직원명이 표시됩니다.</p>';
-        return;
-    }
-
-    detailEl.innerHTML = `
-        <div class="mb-4 flex items-start justify-between gap-4">
-            <div>
-                <div class="text-lg font-bold text-slate-800">${escapeHtml(vendor.name)}</div>
-                <div class="text-sm text-slate-500 mt-1">직원 ${vendor.workerCount}명 · 작업 ${vendor.workRecordCount}건 · 휴일 ${vendor.holidayCount}건</div>
-            </div>
-            <div class="text-xs text-slate-400">Ctrl+클릭 선택 후 우클릭</div>
-        </div>
-        <div class="mb-4 rounded-xl border border-amber-200 bg-amber-50 p-3">
-            <div class="text-xs font-semibold text-amber-700 mb-2">중복 의심 직원</div>
-            <div class="space-y-2">
-                ${renderMergeSuggestionButtons(vendor.workerSuggestions || [], 'applyVendorWorkerSuggestion', '추천 후보가 없습니다.')}
-            </div>
-        </div>
-        <div class="flex flex-wrap gap-2">
-            ${vendor.workers.map(worker => {
-                const selected = _adminDbState.selectedVendorWorkers.has(worker.name);
-                return `
-                    <button
-                        onclick="handleAdminVendorWorkerClick('${escapeJs(worker.name)}', event)"
-                        oncontextmenu="handleAdminVendorWorkerContextMenu('${escapeJs(worker.name)}', event)"
-                        class="px-3 py-2 rounded-lg border text-left transition ${selected ? 'bg-blue-100 border-blue-300 text-blue-800' : 'bg-slate-50 border-slate-200 hover:bg-slate-100'}">
-                        <div class="font-semibold text-sm">${escapeHtml(worker.name)}</div>
-                        <div class="text-[11px] text-slate-500 mt-1">총 ${worker.totalCount} · 작업 ${worker.workCount} · 휴일 ${worker.holidayCount}</div>
-                    </button>`;
-            }).join('')}
-        </div>`;
-}
-
-function selectAdminVendorCompany(vendorName) {
-    _adminDbState.selectedVendor = vendorName;
-    _adminDbState.selectedVendorWorkers = new Set();
-    closeAdminVendorWorkerContextMenu();
-    renderAdminVendorCompanyList();
-}
-window.selectAdminVendorCompany = selectAdminVendorCompany;
-
-function handleAdminVendorWorkerClick(workerName, event) {
-    closeAdminVendorWorkerContextMenu();
-    const multi = !!(event && (event.ctrlKey || event.metaKey));
-    if (multi) {
-        if (_adminDbState.selectedVendorWorkers.has(workerName)) _adminDbState.selectedVendorWorkers.delete(workerName);
-        else _adminDbState.selectedVendorWorkers.add(workerName);
-    } else {
-        _adminDbState.selectedVendorWorkers = new Set([workerName]);
-    }
-    renderAdminVendorCompanyList();
-}
-window.handleAdminVendorWorkerClick = handleAdminVendorWorkerClick;
-
-function handleAdminVendorWorkerContextMenu(workerName, event) {
-    event.preventDefault();
-    if (!_adminDbState.selectedVendorWorkers.has(workerName)) {
-        _adminDbState.selectedVendorWorkers = new Set([workerName]);
-        renderAdminVendorCompanyList();
-    }
-    if (_adminDbState.selectedVendorWorkers.size < 2) {
-        closeAdminVendorWorkerContextMenu();
-        return;
-    }
-    const menu = document.getElementById('adminVendorWorkerContextMenu');
-    if (!menu) return;
-    const parentRect = menu.parentElement?.getBoundingClientRect();
-    const offsetX = parentRect ? event.clientX - parentRect.left : event.clientX;
-    const offsetY = parentRect ? event.clientY - parentRect.top : event.clientY;
-    menu.style.left = `${offsetX}px`;
-    menu.style.top = `${offsetY}px`;
-    menu.classList.remove('hidden');
-}
-window.handleAdminVendorWorkerContextMenu = handleAdminVendorWorkerContextMenu;
-
-function closeAdminVendorWorkerContextMenu() {
-    document.getElementById('adminVendorWorkerContextMenu')?.classList.add('hidden');
-}
-window.closeAdminVendorWorkerContextMenu = closeAdminVendorWorkerContextMenu;
-
-async function promptMergeSelectedVendorWorkers() {
-    closeAdminVendorWorkerContextMenu();
-    const selected = [..._adminDbState.selectedVendorWorkers];
-    if (!_adminDbState.selectedVendor || selected.length < 2) {
-        showToast('병합할 직원을 2명 이상 선택하세요.', 'warning');
-        return;
-    }
-    const targetName = prompt(
-        `대표 이름을 입력하세요.\n\n업체: ${_adminDbState.selectedVendor}\n선택: ${selected.join(', ')}`,
-        selected[0]
-    );
-    if (!targetName || !targetName.trim()) return;
-
-    try {
-        const preview = await eel.admin_preview_merge_vendor_workers(
-            _adminDbState.selectedVendor,
-            selected,
-            targetName.trim(),
-            currentUser?.user_id || ''
-        )();
-        if (!preview || !preview.success) {
-            showCustomAlert('오류', preview?.message || '직원 병합 미리보기를 불러오지 못했습니다.', 'error');
-            return;
-        }
-        const totalUpdates = (preview.workUpdates || 0) + (preview.holidayUpdates || 0);
-        if (totalUpdates <= 0) {
-            showCustomAlert('변경 대상 없음', preview.message || '변경될 데이터가 없습니다.', 'warning');
-            return;
-        }
-        if (!confirm(_buildMergePreviewText(`"${selected.join(', ')}" 을(를) "${targetName.trim()}" 으로 병합합니다.`, preview))) return;
-
-        const result = await eel.admin_merge_vendor_workers(
-            _adminDbState.selectedVendor,
-            selected,
-            targetName.trim(),
-            currentUser?.user_id || ''
-        )();
-        if (!result || !result.success) {
-            showCustomAlert('오류', result?.message || '병합에 실패했습니다.', 'error');
-            return;
-        }
-        showToast(result.message || '병합이 완료되었습니다.', 'success');
-        _adminDbState.selectedVendorWorkers = new Set();
-        await loadAdminVendorCompanyCatalog(true);
-        await refreshAdminMergeUndoState();
-    } catch (error) {
-        console.error('외주 직원 병합 오류:', error);
-        showCustomAlert('오류', '외주 직원 병합 중 오류가 발생했습니다.', 'error');
-    }
-}
-window.promptMergeSelectedVendorWorkers = promptMergeSelectedVendorWorkers;
-
-document.addEventListener('click', (event) => {
-    const ownerMenu = document.getElementById('adminOwnerCompanyContextMenu');
-    if (ownerMenu && !ownerMenu.classList.contains('hidden')) {
-        if (!ownerMenu.contains(event.target)) closeAdminOwnerCompanyContextMenu();
-    }
-    const ownerShipMenu = document.getElementById('adminOwnerShipContextMenu');
-    if (ownerShipMenu && !ownerShipMenu.classList.contains('hidden')) {
-        if (!ownerShipMenu.contains(event.target)) closeAdminOwnerShipContextMenu();
-    }
-    const menu = document.getElementById('adminVendorWorkerContextMenu');
-    if (!menu || menu.classList.contains('hidden')) return;
-    if (menu.contains(event.target)) return;
-    closeAdminVendorWorkerContextMenu();
-});
-
-document.addEventListener('keydown', (event) => {
-    if (event.key === 'Escape') {
-        closeAdminOwnerCompanyContextMenu();
-        closeAdminOwnerShipContextMenu();
-        closeAdminVendorWorkerContextMenu();
-    }
-});
-
-async function loadAdminData() {
-    await loadPendingUsers();
-    await loadAllUsers();
-    await loadAdminSettings();
-    await loadAdminStatusTab();
-    await loadActivityLogTab();
-}
-
-async function loadActivityLogTab() {
-    const userFilter = document.getElementById('activityUserFilter')?.value || '';
-    const limit = parseInt(document.getElementById('activityLimitFilter')?.value || '100');
-    const logs = await eel.get_activity_logs(limit, userFilter)();
-    const tbody = document.getElementById('activityLogTable');
-    if (!tbody) return;
-
-    // 사용자 필터 드롭다운 채우기 (최초 1회)
-    const sel = document.getElementById('activityUserFilter');
-    if (sel && sel.options.length <= 1 && logs.length > 0) {
-        const users = [...new Set(logs.map(l => l.user).filter(Boolean))].sort();
-        users.forEach(u => {
-            const opt = document.createElement('option');
-            opt.value = u; opt.textContent = u;
-            sel.appendChild(opt);
-        });
-        if (userFilter) sel.value = userFilter;
-    }
-
-    if (!logs.length) {
-        tbody.innerHTML = '<tr><td colspan="5" class="p-4 text-center text-slate-400">로그 없음</td></tr>';
-        return;
-    }
-    tbody.innerHTML = logs.map(l => {
-        const ts = l.timestamp ? escapeHtml(l.timestamp.replace('T', ' ').substring(0, 16)) : '-';
-        return `<tr class="border-b hover:bg-slate-50">
-            <td class="border p-2 text-xs text-slate-500">${ts}</td>
-            <td class="border p-2 font-medium">${escapeHtml(l.user || '')}</td>
-            <td class="border p-2">${escapeHtml(l.action || '')}</td>
-            <td class="border p-2 text-slate-600">${escapeHtml(l.target || '')}</td>
-            <td class="border p-2 text-xs text-slate-500">${escapeHtml(l.details || '')}</td>
-        </tr>`;
-    }).join('');
-}
-
-async function loadPendingUsers() {
-    try {
-        const requests = await eel.admin_get_pending_requests(currentUser?.user_id || '')();
-        const container = document.getElementById('pendingUsers');
-        
-        if (requests.length === 0) {
-            container.innerHTML = '<p class="text-slate-500">승인 대기 중인 요청이 없습니다.</p>';
-            return;
-        }
-        
-        container.innerHTML = requests.map(req => `
-            <div class="flex items-center justify-between p-4 bg-yellow-50 border border-yellow-200 rounded-lg">
-                <div>
-                    <div class="font-semibold">${escapeHtml(req.full_name)}</div>
-                    <div class="text-sm text-slate-600">아이디: ${escapeHtml(req.user_id)}</div>
-                    <div class="text-xs text-slate-500">요청일: ${escapeHtml(req.requested_at)}</div>
-                </div>
-                <div class="flex gap-2">
-                    <button onclick="approveUser('${escapeJs(req.user_id)}')"
-                            class="px-4 py-2 bg-green-600 text-white rounded hover:bg-green-700">
-                        승인
-                    </button>
-                    <button onclick="rejectUser('${escapeJs(req.user_id)}')"
-                            class="px-4 py-2 bg-red-600 text-white rounded hover:bg-red-700">
-                        거부
-                    </button>
-                </div>
-            </div>
-        `).join('');
-    } catch (error) {
-        console.error('승인 대기 목록 로드 오류:', error);
-    }
-}
-
-async function loadAllUsers() {
-    try {
-        const users = await eel.admin_get_all_users(currentUser?.user_id || '')();
-        const container = document.getElementById('allUsers');
-        
-        container.innerHTML = users.map(user => {
-            let statusColor = 'slate';
-            if (user.status === 'active') statusColor = 'green';
-            else if (user.status === 'pending') statusColor = 'yellow';
-            else if (user.status === 'rejected') statusColor = 'red';
-            else if (user.status === 'retired') statusColor = 'slate';
-
-            const statusLabel = {
-                active: '활성', pending: '대기', rejected: '거부',
-                inactive: '비활성', retired: '퇴사'
-            }[user.status] || escapeHtml(user.status);
-
-            return `
-                <div class="flex items-center justify-between p-4 bg-slate-50 border rounded-lg">
-                    <div class="flex-1">
-                        <div class="font-semibold">${escapeHtml(user.full_name)} ${user.role === 'admin' ? '👑' : ''}</div>
-                        <div class="text-sm text-slate-600">아이디: ${escapeHtml(user.user_id)}</div>
-                        <div class="text-xs text-slate-500">
-                            상태: <span class="px-2 py-1 bg-${statusColor}-200 text-${statusColor}-800 rounded">${statusLabel}</span>
-                            | 마지막 로그인: ${escapeHtml(user.last_login || '없음')}
-                        </div>
-                    </div>
-                    ${user.role !== 'admin' ? `
-                        <div class="flex gap-2 flex-wrap">
-                            ${user.status === 'active' ? `
-                                <button onclick="deactivateUser('${escapeJs(user.user_id)}')"
-                                        class="px-3 py-1 bg-orange-600 text-white text-sm rounded hover:bg-orange-700">
-                                    비활성화
-                                </button>
-                            ` : ''}
-                            ${user.status === 'inactive' ? `
-                                <button onclick="activateUser('${escapeJs(user.user_id)}')"
-                                        class="px-3 py-1 bg-green-600 text-white text-sm rounded hover:bg-green-700">
-                                    활성화
-                                </button>
-                            ` : ''}
-                            ${user.status !== 'retired' ? `
-                                <button onclick="deleteUser('${escapeJs(user.user_id)}')"
-                                        class="px-3 py-1 bg-red-600 text-white text-sm rounded hover:bg-red-700">
-                                    퇴사처리
-                                </button>
-                                <button onclick="toggleLeaveReportEdit('${escapeJs(user.user_id)}', ${!user.leave_report_edit})"
-                                        class="px-3 py-1 text-sm rounded ${user.leave_report_edit ? 'bg-green-100 text-green-700 border border-green-300 hover:bg-green-200' : 'bg-slate-100 text-slate-500 hover:bg-slate-200'}">
-                                    월보편집${user.leave_report_edit ? '✓' : ''}
-                                </button>
-                                <button onclick="toggleWritePermission('${escapeJs(user.user_id)}', ${!user.can_write})"
-                                        class="px-3 py-1 text-sm rounded ${user.can_write ? 'bg-blue-100 text-blue-700 border border-blue-300 hover:bg-blue-200' : 'bg-slate-100 text-slate-500 hover:bg-slate-200'}">
-                                    쓰기${user.can_write ? '✓' : ''}
-                                </button>
-                                <button onclick="toggleErpInput('${escapeJs(user.user_id)}', ${!user.erp_input})"
-                                        class="px-3 py-1 text-sm rounded ${user.erp_input ? 'bg-purple-100 text-purple-700 border border-purple-300 hover:bg-purple-200' : 'bg-slate-100 text-slate-500 hover:bg-slate-200'}">
-                                    ERP입력${user.erp_input ? '✓' : ''}
-                                </button>
-                            ` : ''}
-                        </div>
-                    ` : ''}
-                </div>
-            `;
-        }).join('');
-    } catch (error) {
-        console.error('사용자 목록 로드 오류:', error);
-    }
-}
-
-async function approveUser(userId) {
-    if (!confirm(`${userId} 사용자를 승인하시겠습니까?`)) return;
-    
-    try {
-        const result = await eel.admin_approve_user(userId, currentUser.user_id)();
-        if (result.success) {
-            showToast('사용자가 승인되었습니다.');
-            await loadAdminData();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('승인 오류:', error);
-        showCustomAlert('오류', '승인 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function rejectUser(userId) {
-    const note = prompt(`${userId} 사용자를 거부합니다. 거부 사유를 입력하세요 (선택사항):`);
-    if (note === null) return; // 취소
-    
-    try {
-        const result = await eel.admin_reject_user(userId, currentUser.user_id, note)();
-        if (result.success) {
-            showToast('사용자가 거부되었습니다.');
-            await loadAdminData();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('거부 오류:', error);
-        showCustomAlert('오류', '거부 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function deleteUser(userId) {
-    if (!confirm(`${userId} 사용자를 퇴사 처리하시겠습니까?\n계정은 비활성화되고 기록은 유지됩니다.`)) return;
-
-    try {
-        const result = await eel.admin_delete_user(userId, currentUser.user_id)();
-        if (result.success) {
-            showToast('퇴사 처리되었습니다.');
-            await loadAdminData();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('퇴사 처리 오류:', error);
-        showCustomAlert('오류', '퇴사 처리 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function activateUser(userId) {
-    try {
-        const result = await eel.admin_update_user_status(userId, 'active', currentUser.user_id)();
-        if (result.success) {
-            showToast('사용자가 활성화되었습니다.');
-            await loadAdminData();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('활성화 오류:', error);
-    }
-}
-
-async function deactivateUser(userId) {
-    if (!confirm(`${userId} 사용자를 비활성화하시겠습니까?`)) return;
-    
-    try {
-        const result = await eel.admin_update_user_status(userId, 'inactive', currentUser.user_id)();
-        if (result.success) {
-            showToast('사용자가 비활성화되었습니다.');
-            await loadAdminData();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('비활성화 오류:', error);
-    }
-}
-
-// ============================================================================
-// 텔레그램 봇 설정 (관리자)
-// ============================================================================
-
-async function loadTelegramBotSettings() {
-    try {
-        const result = await eel.get_telegram_bot_enabled()();
-        if (result.success) {
-            const enabledCheck = document.getElementById('telegramEnabled');
-            const statusSpan = document.getElementById('telegramBotStatus');
-
-            if (enabledCheck) enabledCheck.checked = result.enabled;
-            if (result.enabled && result.botUsername) {
-                statusSpan.textContent = `@${result.botUsername} 활성화됨`;
-                statusSpan.className = 'text-xs text-green-600 font-semibold';
-            } else if (result.hasToken) {
-                statusSpan.textContent = '비활성화됨';
-                statusSpan.className = 'text-xs text-orange-600';
-            } else {
-                statusSpan.textContent = '토큰 미설정';
-                statusSpan.className = 'text-xs text-slate-500';
-            }
-        }
-    } catch (error) {
-        console.error('텔레그램 봇 설정 로드 오류:', error);
-    }
-}
-
-async function saveTelegramBotToken() {
-    const tokenInput = document.getElementById('telegramBotToken');
-    const enabledCheck = document.getElementById('telegramEnabled');
-    const botToken = tokenInput ? tokenInput.value.trim() : '';
-    const enabled = enabledCheck ? enabledCheck.checked : false;
-
-    if (enabled && !botToken) {
-        showToast('활성화하려면 봇 토큰을 입력하세요.');
-        return;
-    }
-
-    try {
-        const result = await eel.admin_save_telegram_settings(botToken, enabled, currentUser.user_id)();
-        if (result.success) {
-            showToast(result.message);
-            loadTelegramBotSettings();
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('텔레그램 봇 설정 저장 오류:', error);
-        showCustomAlert('오류', '설정 저장 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-// ============================================================================
-// 사용자 현황 탭 (v1.8.6)
-// ============================================================================
-
-async function loadAdminStatusTab() {
-    try {
-        // 0) 실시간 현황 요약 카드
-        const summary = await eel.admin_get_realtime_summary(currentUser?.user_id || '')();
-        if (summary && summary.success) {
-            const elActive = document.getElementById('statActiveUsers');
-            const elToday = document.getElementById('statTodayRecords');
-            const elErrors = document.getElementById('statUnresolvedErrors');
-            const elTime = document.getElementById('statRefreshTime');
-            if (elActive) elActive.textContent = summary.activeUsers;
-            if (elToday) elToday.textContent = summary.todayFilledRecords + '건';
-            if (elErrors) elErrors.textContent = summary.unresolvedErrors;
-            if (elTime) elTime.textContent = '업데이트: ' + summary.timestamp;
-        }
-
-        // 1) 버전 현황 테이블
-        const users = await eel.admin_get_user_status(currentUser?.user_id || '')();
-        const tbody = document.getElementById('userStatusTable');
-        if (tbody) {
-            tbody.innerHTML = (users && users.length > 0) ? users.map(u => {
-                const versionBadge = u.client_version
-                    ? `<span class="px-2 py-0.5 bg-blue-100 text-blue-800 rounded text-xs font-mono">v${escapeHtml(u.client_version)}</span>`
-                    : '<span class="text-slate-400 text-xs">미접속</span>';
-                const lastSeen = u.last_seen
-                    ? escapeHtml(u.last_seen.replace('T', ' ').substring(0, 16))
-                    : '-';
-                const statusBadge = u.status === 'active'
-                    ? '<span class="px-1.5 py-0.5 bg-green-100 text-green-700 rounded text-xs">활성</span>'
-                    : `<span class="px-1.5 py-0.5 bg-slate-100 text-slate-600 rounded text-xs">${escapeHtml(u.status || '')}</span>`;
-                return `<tr class="border-b hover:bg-slate-50">
-                    <td class="border p-2 font-medium">${escapeHtml(u.full_name)}<br><span class="text-xs text-slate-400">${escapeHtml(u.user_id)}</span></td>
-                    <td class="border p-2">${escapeHtml(u.role)}</td>
-                    <td class="border p-2">${statusBadge}</td>
-                    <td class="border p-2 text-center">${versionBadge}</td>
-                    <td class="border p-2 text-center text-xs text-slate-600">${lastSeen}</td>
-                </tr>`;
-            }).join('') : '<tr><td colspan="5" class="p-4 text-center text-slate-400">사용자 없음</td></tr>';
-        }
-
-        // 2) 오류 리포트
-        const errors = await eel.admin_get_error_reports(50, currentUser?.user_id || '')();
-        const badge = document.getElementById('errorReportBadge');
-        const unread = (errors || []).filter(e => !e.is_read).length;
-        if (badge) {
-            if (unread > 0) { badge.textContent = `${unread}건`; badge.classList.remove('hidden'); }
-            else { badge.classList.add('hidden'); }
-        }
-
-        const listEl = document.getElementById('errorReportList');
-        if (!listEl) return;
-        if (!errors || !errors.length) {
-            listEl.innerHTML = '<p class="text-sm text-slate-400 py-4 text-center">오류 리포트 없음</p>';
-            return;
-        }
-        const typeColor = { js_runtime: 'orange', js_crash: 'red', startup: 'red', python: 'red' };
-        listEl.innerHTML = errors.map(r => {
-            const color = typeColor[r.error_type] || 'slate';
-            return `<div class="border rounded-lg p-3 ${r.is_read ? 'opacity-60' : 'border-red-200 bg-red-50'}">
-                <div class="flex justify-between items-start gap-2">
-                    <div class="flex-1 min-w-0">
-                        <div class="flex gap-2 items-center mb-1">
-                            <span class="text-xs px-1.5 py-0.5 bg-${color}-100 text-${color}-700 rounded font-mono">${escapeHtml(r.error_type)}</span>
-                            <span class="text-xs text-slate-500">${escapeHtml(r.timestamp ? r.timestamp.substring(0, 16) : '')}</span>
-                            <span class="text-xs text-slate-500">· ${escapeHtml(r.user_name || r.user_id || '')} · v${escapeHtml(r.app_version || '')}</span>
-                        </div>
-                        <div class="text-sm font-medium text-slate-800 truncate">${escapeHtml(r.error_message)}</div>
-                        ${r.stack_trace ? `<details class="mt-1"><summary class="text-xs text-slate-400 cursor-pointer">스택 트레이스</summary><pre class="text-xs bg-slate-100 rounded p-2 mt-1 overflow-x-auto whitespace-pre-wrap">${escapeHtml(r.stack_trace)}</pre></details>` : ''}
-                    </div>
-                    ${!r.is_read ? `<button onclick="markErrorRead(${r.id})" class="shrink-0 text-xs px-2 py-1 bg-slate-200 hover:bg-slate-300 rounded">읽음</button>` : ''}
-                </div>
-            </div>`;
-        }).join('');
-    } catch (e) {
-        console.error('사용자 현황 로드 오류:', e);
-    }
-}
-
-async function markErrorRead(errorId) {
-    await eel.admin_mark_error_read(errorId, currentUser?.user_id || '')();
-    await loadAdminStatusTab();
-}
-
-async function loadAdminSettings() {
-    try {
-        const result = await eel.admin_get_paths(currentUser?.user_id || '')();
-
-        if (result.success) {
-            const paths = result.paths;
-
-            // 현재 경로 표시
-            document.getElementById('currentDbPath').textContent = paths.local_db_path || '설정 안됨';
-            document.getElementById('currentCloudPath').textContent = paths.cloud_sync_path || '설정 안됨';
-            document.getElementById('currentBackupPath').textContent = paths.backup_path || '설정 안됨';
-
-            // 입력 필드 (비워두기)
-            document.getElementById('dbPath').value = '';
-            document.getElementById('cloudPath').value = '';
-            document.getElementById('backupPath').value = '';
-        }
-    } catch (error) {
-        console.error('경로 로드 오류:', error);
-    }
-
-    // 클라우드 동기화 상태 로드 (sync_mode 기반 UI 표시)
-    loadCloudStatus();
-
-    // 텔레그램 봇 설정 로드
-    loadTelegramBotSettings();
-
-    // 공휴일 API 키 저장 여부 표시
-    loadHolidayKeyStatus();
-}
-
-async function selectDbPath() {
-    try {
-        const result = await eel.select_folder_path()();
-        if (result.success && result.path) {
-            document.getElementById('dbPath').value = result.path + '\\work_management.db';
-        }
-    } catch (error) {
-        console.error('경로 선택 오류:', error);
-    }
-}
-
-async function selectCloudPath() {
-    try {
-        const result = await eel.select_folder_path()();
-        if (result.success && result.path) {
-            document.getElementById('cloudPath').value = result.path;
-        }
-    } catch (error) {
-        console.error('경로 선택 오류:', error);
-    }
-}
-
-async function selectBackupPath() {
-    try {
-        const result = await eel.select_folder_path()();
-        if (result.success && result.path) {
-            document.getElementById('backupPath').value = result.path;
-        }
-    } catch (error) {
-        console.error('경로 선택 오류:', error);
-    }
-}
-
-async function updateLocalDbPath() {
-    const newPath = document.getElementById('dbPath').value.trim();
-
-    if (!newPath) {
-        showToast('경로를 입력하세요.');
-        return;
-    }
-
-    if (!confirm('로컬 DB 경로를 변경하시겠습니까?\n\n' +
-                 '• 대상 경로에 DB 파일이 없으면: 현재 DB를 복사합니다.\n' +
-                 '• 대상 경로에 DB 파일이 있으면: 기존 DB를 그대로 사용합니다.\n\n' +
-                 '프로그램 재시작이 필요합니다.')) {
-        return;
-    }
-
-    try {
-        const result = await eel.admin_update_local_db_path(newPath, currentUser.user_id)();
-
-        if (result.success) {
-            if (result.used_existing) {
-                showCustomAlert('완료', '대상 경로에 기존 DB 파일이 있어 그대로 사용합니다.\n현재 PC의 데이터는 복사되지 않습니다.\n\n프로그램을 재시작하면 해당 DB로 연결됩니다.', 'info');
-            } else {
-                showCustomAlert('완료', 'DB 경로가 변경되었습니다.\n\n프로그램을 재시작해주세요.', 'info');
-            }
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('경로 변경 오류:', error);
-        showCustomAlert('오류', '경로 변경 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function updateBackupPath() {
-    const newPath = document.getElementById('backupPath').value.trim();
-
-    if (!newPath) {
-        showToast('경로를 입력하세요.');
-        return;
-    }
-
-    try {
-        const result = await eel.admin_update_backup_path(newPath, currentUser.user_id)();
-
-        if (result.success) {
-            showToast(result.message);
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('백업 경로 변경 오류:', error);
-        showCustomAlert('오류', '경로 변경 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function updateCloudPath() {
-    const newPath = document.getElementById('cloudPath').value.trim();
-
-    if (!newPath) {
-        showToast('경로를 입력하세요.');
-        return;
-    }
-
-    try {
-        const result = await eel.admin_update_cloud_path(newPath, currentUser.user_id)();
-
-        if (result.success) {
-            showToast(result.message);
-            loadCloudStatus();   // UI 갱신
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('클라우드 경로 변경 오류:', error);
-        showCustomAlert('오류', '경로 변경 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-// ─────────────────────────────────────────────
-// 클라우드 동기화 상태 / 외부 PC 연결
-// ─────────────────────────────────────────────
-
-async function loadCloudStatus() {
-    /**
-     * 관리자 패널 진입 시 현재 sync_mode에 따라 UI 패널 전환
-     * - company / standalone → cloudCompanyPanel 표시
-     * - external            → cloudExternalPanel 표시
-     */
-    try {
-        const status = await eel.get_sync_status()();
-        const mode   = (status && status.sync_mode) ? status.sync_mode : 'standalone';
-
-        const companyPanel  = document.getElementById('cloudCompanyPanel');
-        const externalPanel = document.getElementById('cloudExternalPanel');
-
-        if (mode === 'external') {
-            companyPanel.classList.add('hidden');
-            externalPanel.classList.remove('hidden');
-
-            // 연결 정보 표시
-            const pathEl     = document.getElementById('externalConnectedPath');
-            const lastSyncEl = document.getElementById('externalLastSync');
-            if (pathEl)     pathEl.textContent     = status.cloud_folder || '-';
-            if (lastSyncEl) lastSyncEl.textContent = status.last_sync
-                ? new Date(status.last_sync).toLocaleString('ko-KR')
-                : '없음';
-        } else {
-            companyPanel.classList.remove('hidden');
-            externalPanel.classList.add('hidden');
-        }
-    } catch (e) {
-        console.error('클라우드 상태 로드 오류:', e);
-    }
-}
-
-async function connectExternalCloud() {
-    /**
-     * 외부 PC에서 클라우드에 연결
-     * 클라우드 경로 입력 → connect_to_cloud_external 호출 → UI 갱신
-     */
-    const cloudPath = document.getElementById('externalCloudPath').value.trim();
-    if (!cloudPath) {
-        showToast('클라우드 경로를 입력하세요.');
-        return;
-    }
-
-    try {
-        const result = await eel.connect_to_cloud_external(cloudPath)();
-
-        if (!result.success) {
-            showCustomAlert('연결 실패', result.message, 'error');
-            return;
-        }
-
-        // 잠금 경고 먼저
-        if (result.warning) {
-            if (!confirm('⚠️ ' + result.warning + '\n\n계속 진행하시겠습니까?')) {
-                // 사용자가 취소했으므로 연결 해제 처리
-                await eel.disconnect_from_cloud()();
-                loadCloudStatus();
-                return;
-            }
-        }
-
-        showCustomAlert('연결 완료', result.message + '\n\n이제 외부 PC 모드로 동작합니다.', 'success');
-        loadCloudStatus();
-        // 페이지 전체 새로고침으로 DB 변경 반영
-        setTimeout(() => location.reload(), 500);
-
-    } catch (e) {
-        console.error('외부 PC 연결 오류:', e);
-        showCustomAlert('오류', '연결 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function disconnectFromCloud() {
-    /**
-     * 외부 PC 연결 해제
-     * push + 알림 생성 + 잠금 삭제 + sync_mode=standalone
-     */
-    if (!confirm('클라우드 연결을 해제하시겠습니까?\n\n현재 데이터가 클라우드에 저장되고 로컬 모드로 전환됩니다.')) {
-        return;
-    }
-
-    try {
-        const result = await eel.disconnect_from_cloud()();
-        if (result.success) {
-            showToast(result.message);
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-        loadCloudStatus();
-    } catch (e) {
-        console.error('연결 해제 오류:', e);
-        showCustomAlert('오류', '연결 해제 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function syncToCloudNow() {
-    /**
-     * 외부 PC에서 지금 동기화 버튼 (push + 알림)
-     */
-    try {
-        const result = await eel.sync_to_cloud()();
-        if (result.success) {
-            showToast('동기화 완료');
-            loadCloudStatus();
-        } else {
-            showCustomAlert('동기화 실패', result.message, 'error');
-        }
-    } catch (e) {
-        console.error('동기화 오류:', e);
-        showCustomAlert('오류', '동기화 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-async function createManualBackup() {
-    if (!confirm('현재 DB를 백업하시겠습니까?')) return;
-    
-    try {
-        const result = await eel.admin_create_backup(currentUser.user_id)();
-
-        if (result.success) {
-            showToast(result.message);
-        } else {
-            showCustomAlert('오류', result.message, 'error');
-        }
-    } catch (error) {
-        console.error('백업 생성 오류:', error);
-        showCustomAlert('오류', '백업 생성 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-// ============================================================================
-// 엑셀 불러오기 (관리자)
-// ============================================================================
-
-async function importExcelData() {
-    const fileInput = document.getElementById('excelFileInput');
-    const resultDiv = document.getElementById('importResult');
-
-    if (!fileInput || !fileInput.files || fileInput.files.length === 0) {
-        showCustomAlert('알림', '엑셀 파일을 선택해주세요.', 'info');
-        return;
-    }
-
-    const file = fileInput.files[0];
-    resultDiv.innerHTML = '<p class="text-amber-700 text-sm">파일 읽는 중...</p>';
-
-    try {
-        const arrayBuffer = await file.arrayBuffer();
-        const uint8Array = new Uint8Array(arrayBuffer);
-        let binary = '';
-        for (let i = 0; i < uint8Array.length; i++) {
-            binary += String.fromCharCode(uint8Array[i]);
-        }
-        const base64Data = btoa(binary);
-
-        showLoading(true, '엑셀 데이터 업로드 중...');
-        const result = await eel.import_excel_data(base64Data, currentUser.user_id)();
-        showLoading(false);
-
-        if (result.success) {
-            resultDiv.innerHTML = `
-                <div class="bg-green-100 text-green-800 p-3 rounded-lg text-sm">
-                    <p class="font-semibold">불러오기 성공</p>
-                    <p>총 ${result.total_dates || 0}일, ${result.total_records || 0}건 저장됨</p>
-                    ${result.skipped ? '<p class="text-xs text-green-600">빈 행 ' + result.skipped + '건 건너뜀</p>' : ''}
-                </div>`;
-            showCustomAlert('성공', `엑셀 데이터 ${result.total_records}건이 저장되었습니다.`, 'success');
-        } else {
-            if (resultDiv) resultDiv.innerHTML = `<p class="text-red-600 text-sm">오류: ${escapeHtml(result.message || '알 수 없는 오류')}</p>`;
-            showCustomAlert('실패', result.message || '불러오기 실패', 'error');
-        }
-    } catch (error) {
-        showLoading(false);
-        console.error('엑셀 불러오기 오류:', error);
-        if (resultDiv) resultDiv.innerHTML = `<p class="text-red-600 text-sm">오류가 발생했습니다.</p>`;
-        showCustomAlert('오류', '엑셀 불러오기 중 오류가 발생했습니다.', 'error');
-    }
-}
-
-// ============================================================================
-// DB 전체 삭제
-// ============================================================================
-
-async function clearAllRecords() {
-    if (!confirm('정말로 모든 작업 레코드를 삭제하시겠습니까?\n이 작업은 되돌릴 수 없습니다.')) return;
-    if (!confirm('한 번 더 확인합니다. 전체 데이터가 삭제됩니다. 계속하시겠습니까?')) return;
-
-    try {
-        showLoading(true, 'DB 전체 삭제 중...');
-        const result = await eel.clear_all_records()();
-        showLoading(false);
-
-        const resultDiv = document.getElementById('clearResult');
-        if (result.success) {
-            if (resultDiv) resultDiv.innerHTML = '<p class="text-green-600 text-sm font-semibold">전체 삭제 완료</p>';
-            showCustomAlert('성공', result.message, 'success');
-        } else {
-            if (resultDiv) resultDiv.innerHTML = '<p class="text-red-600 text-sm">오류: ' + escapeHtml(result.message) + '</p>';
-            showCustomAlert('실패', result.message, 'error');
-        }
-    } catch (error) {
-        showLoading(false);
-        console.error('DB 전체 삭제 오류:', error);
-        showCustomAlert('오류', 'DB 삭제 중 오류가 발생했습니다.', 'error');
-    }
-}
-
 // ============================================================================
 // 로그인 성공 후 패치 알림
 // ============================================================================
@@ -1806,7 +365,7 @@ async function clearAllRecords() {
 async function notifyLoginSuccess() {
     let appInfo = null;
     try {
-        appInfo = await eel.get_app_info()();
+        appInfo = await eelFetch('get_app_info');
     } catch(_) {}
 
     try {
@@ -1825,17 +384,10 @@ async function notifyLoginSuccess() {
         if (patchResult && patchResult.needs_restart) {
             // 우하단에 재시작 안내 알림 표시
             showRestartNotification(patchResult.applied_count);
-        } else {
-            // 스플래시가 성공적으로 업데이트 확인을 마친 경우에만 스킵 (오류/미확인 시 재확인)
-            // _splashUpdateResult 없음(오류) → 재확인 필요 / 있으면 closeSplash가 이미 처리
-            const splashAlreadyHandled = window._splashUpdateChecked
-                && window._splashUpdateResult
-                && !window._splashUpdateResult.error;
-            if (!splashAlreadyHandled) {
-                if (typeof checkForUpdatesAuto === 'function') {
-                    setTimeout(checkForUpdatesAuto, 3000);
-                }
-            }
+        } else if (typeof checkStagedUpdate === 'function') {
+            // 로그인 전에 백그라운드 확인이 끝나 패치가 준비돼 있으면 바로 재시작 안내
+            // (이후 준비되는 패치는 변경 알림 'update' 주제로 안내)
+            checkStagedUpdate();
         }
     } catch(e) {
         // 오류 시 무시
@@ -0,0 +1,126 @@
+// web/js/modules.js - 탭 모듈 지연 로드 + eel 조회 공유 계층
+// 일일 작업 입력에 필요 없는 화면(칸반/간트, 통계, 직원 관리, ERP, 관리자)은 web/js/tabs/*.js로 분리해
+// 처음 사용할 때 <script>로 불러온다. HTML 인라인 onclick 등 외부에서 부르는 함수는 아래 목록에
+// 대리 함수(stub)로 먼저 등록되고, 모듈이 로드되면 같은 이름의 실제 함수 선언이 전역을 덮어쓴다.
+// 인라인 핸들러가 전역 함수를 직접 부르므로 ES module(import/export) 대신 일반 스크립트로 불러온다.
+
+// 모듈별 외부 진입 함수 — 모듈 밖(index.html, 다른 js)에서 부르는 함수를 추가하면 여기에도 등록
+const TAB_MODULE_ENTRIES = {
+    board: [  // 간트 차트 · 칸반 보드
+        'changeGanttMonth', 'toggleGanttDualView', 'toggleGanttYearView', 'loadGanttChart', 'loadKanbanBoard',
+        'archiveChangeMonth', 'toggleArchive', 'showNewProjectModal', 'closeNewProjectModal',
+        'submitNewProject', 'closeStartProjectModal', 'confirmStartProject'
+    ],
+    employees: [  // 직원 관리 (연차 · 직원 명부 · 근로 시간)
+        'returnToAdminPanel', 'showEmployeeTab', 'addEmployeeDirectoryExternalColumn',
+        'addEmployeeDirectoryRow', 'saveEmployeeDirectory', 'loadLeaveMonthlyReport',
+        'printLeaveReport', 'showAddLeaveRowModal', 'confirmAddLeaveRow', 'loadLeaveEmployeeList',
+        'showLeaveEmployeeDropdown', 'renderLeaveEmployeeDropdown',
+        'handleLeaveEmployeeInputKeydown', 'searchEmployeeLeave'
+    ],
+    analytics: [  // 통계 대시보드 (Chart.js)
+        'loadStatsData', 'statsChangeYear'
+    ],
+    erp: [  // ERP 입력 자동화
+        'loadErpRecords', 'openErpInputWindow', 'diagnoseErpControls', 'installErpDeps'
+    ],
+    admin: [  // 관리자 페이지 · 권한 관리
+        'undoLastAdminMerge', 'showAdminTab', 'showAdminDbSubtab', 'loadAdminOwnerCompanyCatalog',
+        'promptMergeSelectedOwnerCompanies', 'promptMergeSelectedOwnerShips',
+        'loadAdminVendorCompanyCatalog', 'promptMergeSelectedVendorWorkers', 'loadAdminData',
+        'loadActivityLogTab', 'saveTelegramBotToken', 'loadAdminStatusTab', 'selectDbPath',
+        'selectCloudPath', 'selectBackupPath', 'updateLocalDbPath', 'updateBackupPath',
+        'updateCloudPath', 'connectExternalCloud', 'disconnectFromCloud', 'syncToCloudNow',
+        'createManualBackup', 'importExcelData', 'clearAllRecords', 'loadErpPermList'
+    ],
+};
+
+// 지연 로드 외부 라이브러리 (web/assets/vendor/ 우선, 없으면 CDN)
+const VENDOR_SCRIPTS = {
+    chart: { global: 'Chart', cdn: 'https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js' },
+    html2canvas: { global: 'html2canvas', cdn: 'https://html2canvas.hertzen.com/dist/html2canvas.min.js' },
+};
+
+const _scriptLoads = {};
+
+// <link rel="prefetch" data-*>에 서버가 붙인 ?v=<내용 해시> URL 사용 (장기 캐시)
+function _prefetchedUrl(attr, name, fallback) {
+    const link = document.querySelector(`link[${attr}="${name}"]`);
+    return link ? link.href : fallback;
+}
+
+function _loadScriptOnce(key, url, fallbackUrl) {
+    if (!_scriptLoads[key]) {
+        _scriptLoads[key] = new Promise((resolve, reject) => {
+            const inject = (src, onError) => {
+                const s = document.createElement('script');
+                s.src = src;
+                s.onload = () => resolve();
+                s.onerror = () => { s.remove(); onError(); };
+                document.body.appendChild(s);
+            };
+            inject(url, () => fallbackUrl
+                ? inject(fallbackUrl, () => reject(new Error(`스크립트 로드 실패: ${key}`)))
+                : reject(new Error(`스크립트 로드 실패: ${key}`)));
+        }).catch(e => {
+            delete _scriptLoads[key];   // 다음 호출 때 재시도
+            throw e;
+        });
+    }
+    return _scriptLoads[key];
+}
+
+/** 탭 모듈 로드 (한 번만) */
+function loadTabModule(name) {
+    return _loadScriptOnce(`tab:${name}`, _prefetchedUrl('data-tab-module', name, `js/tabs/${name}.js`));
+}
+
+/** 외부 라이브러리 로드 (한 번만, 이미 전역에 있으면 즉시) */
+function ensureVendor(name) {
+    const spec = VENDOR_SCRIPTS[name];
+    if (!spec || window[spec.global]) return Promise.resolve();
+    return _loadScriptOnce(`vendor:${name}`,
+        _prefetchedUrl('data-vendor', name, `/assets/vendor/${spec.global === 'Chart' ? 'chart.umd.min.js' : 'html2canvas.min.js'}`),
+        spec.cdn);
+}
+
+// 대리 함수 등록 — 호출되면 모듈을 불러온 뒤 (모듈이 덮어쓴) 실제 함수로 넘긴다
+Object.entries(TAB_MODULE_ENTRIES).forEach(([moduleName, names]) => {
+    names.forEach(fnName => {
+        const stub = async function (...args) {
+            await loadTabModule(moduleName);
+            const real = window[fnName];
+            if (real === stub) throw new Error(`${moduleName} 모듈에 ${fnName} 함수가 없습니다.`);
+            return real.apply(this, args);
+        };
+        window[fnName] = stub;
+    });
+});
+
+// ============================================================================
+// eel 조회 공유 계층 — 같은 조회가 동시에 여러 번 요청되면 한 번만 호출하고 결과를 공유
+// ============================================================================
+
+const _eelInflight = new Map();
+let _eelFetchGeneration = 0;
+
+/**
+ * 읽기 전용 eel 함수 호출: eelFetch('get_kanban_data', true)
+ * 진행 중인 같은 호출(이름+인자)이 있으면 그 Promise를 돌려준다. 완료 후에는 캐시하지 않는다.
+ * 저장·삭제 등 쓰기 호출에는 사용하지 않는다.
+ */
+function eelFetch(name, ...args) {
+    const key = `${_eelFetchGeneration}|${name}|${JSON.stringify(args)}`;
+    const pending = _eelInflight.get(key);
+    if (pending) return pending;
+    const promise = Promise.resolve()
+        .then(() => eel[name](...args)())
+        .finally(() => { if (_eelInflight.get(key) === promise) _eelInflight.delete(key); });
+    _eelInflight.set(key, promise);
+    return promise;
+}
+
+/** 데이터 변경 후 호출 — 이미 진행 중인(변경 전) 조회에 새 요청이 합류하지 않도록 한다 */
+function invalidateEelFetch() {
+    _eelFetchGeneration += 1;
+}
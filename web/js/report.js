@@ -969,6 +969,7 @@ async function auto_capture_daily_report() {
 
         const element = document.getElementById('dailyReportCapture');
         if (!element) return;
+        await ensureVendor('html2canvas');
 
         const replacements = [];
         element.querySelectorAll('input, textarea').forEach(inp => {
@@ -1031,6 +1032,7 @@ async function captureReport(elementId) {
     };
 
     try {
+        await ensureVendor('html2canvas');
         const canvas = await html2canvas(element, {
             backgroundColor: '#ffffff',
             scale: 2,
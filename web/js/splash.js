@@ -82,7 +82,7 @@
             setTimeout(checkUpdateAndClose, 400);
             return;
         }
-        setProgress(70, '🔄 업데이트 확인 중...', 'GitHub에서 최신 버전 확인합니다');
+        setProgress(70, '🔄 업데이트 확인 중...', '적용된 패치를 확인합니다');
         try {
             eel.get_startup_patch_result()(function(result) {
                 if (!result) { window.splashReady(); return; }
@@ -98,25 +98,10 @@
                     window._splashUpdateChecked = true;
                     setTimeout(() => window.splashReady(), 1500);
                 } else {
-                    // 패치 없음 → 새 업데이트 확인 (캐시 프라이밍, 로그인 전 알림용)
-                    setProgress(80, '🌐 서버 확인 중...', '최신 버전 정보를 가져옵니다');
-                    try {
-                        eel.check_for_updates(false)(function(updateResult) {
-                            window._splashUpdateResult = updateResult;
-                            window._splashUpdateChecked = true;
-                            if (updateResult && updateResult.update_available) {
-                                setProgress(90, '🆕 새 업데이트 발견!',
-                                    'v' + updateResult.latest_version + ' 업데이트가 있습니다');
-                            } else {
-                                setProgress(90, '✅ 최신 버전입니다', 'v' + (result.current_version || ''));
-                            }
-                            setTimeout(() => window.splashReady(), 1200);
-                        });
-                    } catch(e2) {
-                        window._splashUpdateChecked = true;
-                        setProgress(90, '✅ 최신 버전입니다', 'v' + (result.current_version || ''));
-                        setTimeout(() => window.splashReady(), 1200);
-                    }
+                    // 새 패치 확인은 창이 뜬 뒤 서버 백그라운드에서 진행 (시작을 네트워크에 묶지 않음)
+                    window._splashUpdateChecked = true;
+                    setProgress(90, '✅ 준비 완료', 'v' + (result.current_version || ''));
+                    setTimeout(() => window.splashReady(), 600);
                 }
             });
         } catch(e) {
@@ -150,12 +135,6 @@
                         const loginScreen = document.getElementById('loginScreen');
                         if (loginScreen) loginScreen.classList.remove('hidden');
                     }
-                    // 스플래시에서 확인한 새 버전이 있으면 업데이트 모달 즉시 표시 (로그인 전)
-                    if (window._splashUpdateResult && window._splashUpdateResult.update_available) {
-                        if (typeof showUpdateModalWithInfo === 'function') {
-                            setTimeout(() => showUpdateModalWithInfo(window._splashUpdateResult), 300);
-                        }
-                    }
                 }, 650);
             }
         }, 500);
@@ -221,6 +200,28 @@
         } catch(e) { console.warn('앱 정보 조회 실패:', e); }
     }
 
+    // =========================================================
+    // 시작 타임라인 마감 — 첫 화면 표시 시점을 서버에 알려 logs/startup.log에 기록
+    // =========================================================
+    function reportStartupTimeline() {
+        if (typeof eel === 'undefined' || typeof eel.report_startup_ready !== 'function') {
+            setTimeout(reportStartupTimeline, 200);
+            return;
+        }
+        try {
+            eel.report_startup_ready(Math.round(performance.now()))(function(timeline) {
+                if (!timeline || !timeline.success) return;
+                window._startupTimeline = timeline;
+                const firstPage = (timeline.marks || {}).first_page;
+                if (firstPage > timeline.budget_ms) {
+                    console.warn('시작 시간 예산 초과: ' + Math.round(firstPage) + 'ms', timeline.phases);
+                } else {
+                    console.info('시작 타임라인: ' + Math.round(firstPage) + 'ms', timeline.phases);
+                }
+            });
+        } catch(e) { console.warn('시작 타임라인 보고 실패:', e); }
+    }
+
     // =========================================================
     // 시작 — 웹 스플래시 방식 (DOMContentLoaded 즉시 표시)
     // =========================================================
@@ -231,6 +232,7 @@
 
         // 버전 텍스트 로드 시도
         tryLoadSplashVersion();
+        reportStartupTimeline();
 
         // 자동 진행 시작
         startAutoProgress();
@@ -0,0 +1,215 @@
+// web/js/tabs/analytics.js - 통계 대시보드 탭 (Chart.js)
+// 처음 사용할 때 modules.js의 loadTabModule('analytics')로 로드된다.
+
+// ============================================================================
+// E: 통계 대시보드
+// ============================================================================
+
+let _statsYear = new Date().getFullYear();
+let _manpowerChart = null;
+let _projectCountChart = null;
+let _manpowerRatioChart = null;
+
+async function loadStatsData() {
+    const label = document.getElementById('statsYearLabel');
+    if (label) label.textContent = `${_statsYear}년`;
+
+    let data;
+    try {
+        data = await eelFetch('get_analytics_data', _statsYear);
+    } catch (e) {
+        console.error('통계 데이터 로드 오류:', e);
+        return;
+    }
+    if (!data || !data.success) return;
+    try {
+        await ensureVendor('chart');
+    } catch (e) {
+        console.error('Chart.js 로드 오류:', e);
+        return;
+    }
+
+    // ── 월별 공수 누적 막대 차트 (본공 / 외주) ──────────────────────
+    const ctx = document.getElementById('manpowerChart');
+    if (ctx) {
+        if (_manpowerChart) { _manpowerChart.destroy(); _manpowerChart = null; }
+        _manpowerChart = new Chart(ctx, {
+            type: 'bar',
+            data: {
+                labels: ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'],
+                datasets: [
+                    {
+                        label: '본공',
+                        data: data.inHouseMonthly || data.monthly,
+                        backgroundColor: 'rgba(59,130,246,0.75)',
+                        borderRadius: 3,
+                        stack: 'total'
+                    },
+                    {
+                        label: '외주',
+                        data: data.outsourcedMonthly || [],
+                        backgroundColor: 'rgba(234,88,12,0.75)',
+                        borderRadius: 3,
+                        stack: 'total'
+                    }
+                ]
+            },
+            options: {
+                responsive: true,
+                plugins: {
+                    legend: { display: true, position: 'top' },
+                    tooltip: {
+                        mode: 'nearest',
+                        intersect: true,
+                        callbacks: {
+                            beforeBody: (items) => {
+                                if (!items.length) return '';
+                                const item = items[0];
+                                const dataIndex = item.dataIndex;
+                                const total = item.chart.data.datasets.reduce(
+                                    (s, ds) => s + (parseFloat(ds.data[dataIndex]) || 0), 0
+                                );
+                                return `합계: ${total.toFixed(1)}공`;
+                            }
+                        }
+                    }
+                },
+                scales: {
+                    x: { stacked: true },
+                    y: { stacked: true, beginAtZero: true }
+                }
+            }
+        });
+    }
+
+    // ── 공수 요약 (본공 / 외주 / 전체) ────────────────────────────────
+    const totalLabel   = document.getElementById('totalManpowerLabel');
+    const inHouseLabel = document.getElementById('inHouseLabel');
+    const outLabel     = document.getElementById('outsourcedLabel');
+    if (totalLabel && data.inHouseTotal !== undefined) {
+        totalLabel.textContent   = ((data.inHouseTotal || 0) + (data.outsourcedTotal || 0)).toFixed(1);
+        inHouseLabel.textContent = (data.inHouseTotal || 0).toFixed(1);
+        outLabel.textContent     = (data.outsourcedTotal || 0).toFixed(1);
+        document.getElementById('manpowerSummary')?.classList.remove('hidden');
+    }
+
+    // ── KPI 카드 ─────────────────────────────────────────────────────
+    const kpiCards = document.getElementById('kpiCards');
+    if (kpiCards && data.totalProjects !== undefined) {
+        const grandTotal = (data.inHouseTotal || 0) + (data.outsourcedTotal || 0);
+        document.getElementById('kpiTotalProjects').textContent  = data.totalProjects;
+        document.getElementById('kpiAsRate').textContent         = (data.asRate ?? 0).toFixed(1);
+        document.getElementById('kpiOutsourcedRate').textContent = (data.outsourcedRate ?? 0).toFixed(1);
+        document.getElementById('kpiTotalManpower').textContent  = grandTotal.toFixed(1);
+        const cRate = Math.min(data.asRate ?? 0, 100);
+        const oRate = Math.min(data.outsourcedRate ?? 0, 100);
+        document.getElementById('kpiAsBar').style.width          = `${cRate}%`;
+        document.getElementById('kpiOutsourcedBar').style.width  = `${oRate}%`;
+        kpiCards.classList.remove('hidden');
+    }
+
+    // ── 본공/외주 도넛 차트 + 월별 작업 건수 꺾은선 차트 ─────────────
+    const ratioBox = document.getElementById('ratioAndCountChartBox');
+    const ratioCtx = document.getElementById('manpowerRatioChart');
+    const pcCtx    = document.getElementById('projectCountChart');
+    const hasRatio = data.inHouseTotal !== undefined && (data.inHouseTotal + data.outsourcedTotal) > 0;
+    const hasCount = data.monthlyProjectCount;
+    if (ratioBox && (hasRatio || hasCount)) ratioBox.classList.remove('hidden');
+
+    if (ratioCtx && hasRatio) {
+        if (_manpowerRatioChart) { _manpowerRatioChart.destroy(); _manpowerRatioChart = null; }
+        _manpowerRatioChart = new Chart(ratioCtx, {
+            type: 'doughnut',
+            data: {
+                labels: ['본공', '외주'],
+                datasets: [{
+                    data: [data.inHouseTotal || 0, data.outsourcedTotal || 0],
+                    backgroundColor: ['rgba(59,130,246,0.8)', 'rgba(234,88,12,0.8)'],
+                    borderWidth: 1
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {
+                    legend: { position: 'bottom' },
+                    tooltip: {
+                        callbacks: {
+                            label: (item) => {
+                                const total = item.dataset.data.reduce((a, b) => a + b, 0);
+                                const pct = total > 0 ? (item.raw / total * 100).toFixed(1) : 0;
+                                return ` ${item.label}: ${item.raw}공 (${pct}%)`;
+                            }
+                        }
+                    }
+                }
+            }
+        });
+    }
+
+    if (pcCtx && hasCount) {
+        if (_projectCountChart) { _projectCountChart.destroy(); _projectCountChart = null; }
+        _projectCountChart = new Chart(pcCtx, {
+            type: 'line',
+            data: {
+                labels: ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'],
+                datasets: [{
+                    label: '작업 건수',
+                    data: data.monthlyProjectCount,
+                    borderColor: 'rgba(99,102,241,0.9)',
+                    backgroundColor: 'rgba(99,102,241,0.12)',
+                    tension: 0.3,
+                    pointRadius: 4,
+                    fill: true
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: { legend: { display: false } },
+                scales: { y: { beginAtZero: true, ticks: { stepSize: 1 } } }
+            }
+        });
+    }
+
+    // ── 회사별 상위 10 ────────────────────────────────────────────────
+    const compEl = document.getElementById('companyStatsList');
+    if (compEl) {
+        if (!data.companies || data.companies.length === 0) {
+            compEl.innerHTML = '<p class="text-sm text-slate-400 py-4 text-center">데이터 없음</p>';
+        } else {
+            const maxC = Math.max(...data.companies.map(c => c.total), 1);
+            compEl.innerHTML = data.companies.map(c => `
+                <div class="flex items-center gap-2 mb-2">
+                    <div class="text-xs w-24 truncate text-slate-600" title="${escapeHtml(c.name)}">${escapeHtml(c.name)}</div>
+                    <div class="flex-1 bg-slate-200 rounded-full h-3">
+                        <div class="bg-blue-500 h-3 rounded-full" style="width:${(c.total/maxC*100).toFixed(1)}%"></div>
+                    </div>
+                    <div class="text-xs w-10 text-right font-semibold text-slate-700">${c.total}</div>
+                </div>`).join('');
+        }
+    }
+
+    // ── 계약별 상위 10 ────────────────────────────────────────────────
+    const contEl = document.getElementById('contractStatsList');
+    if (contEl) {
+        if (!data.contracts || data.contracts.length === 0) {
+            contEl.innerHTML = '<p class="text-sm text-slate-400 py-4 text-center">데이터 없음</p>';
+        } else {
+            const maxR = Math.max(...data.contracts.map(r => r.total), 1);
+            contEl.innerHTML = data.contracts.map(r => `
+                <div class="flex items-center gap-2 mb-2">
+                    <div class="text-xs w-24 truncate text-slate-600" title="${escapeHtml(r.cn)}">${escapeHtml(r.ship || r.cn)}</div>
+                    <div class="flex-1 bg-slate-200 rounded-full h-3">
+                        <div class="bg-emerald-500 h-3 rounded-full" style="width:${(r.total/maxR*100).toFixed(1)}%"></div>
+                    </div>
+                    <div class="text-xs w-10 text-right font-semibold text-slate-700">${r.total}</div>
+                </div>`).join('');
+        }
+    }
+}
+
+function statsChangeYear(delta) {
+    _statsYear += delta;
+    loadStatsData();
+}
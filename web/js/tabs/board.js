@@ -0,0 +1,672 @@
+// web/js/tabs/board.js - 칸반 보드 · 간트 차트 · 프로젝트 보관함 탭
+// 처음 사용할 때 modules.js의 loadTabModule('board')로 로드된다.
+
+// ============================================================================
+// 간트 차트
+// ============================================================================
+
+let ganttYear = new Date().getFullYear();
+let ganttMonth = new Date().getMonth() + 1;
+let ganttDualView = false;
+let ganttYearView = false;
+
+// 간트 차트용 색상 팔레트 (프로젝트별 로테이션)
+const GANTT_COLORS = [
+    { bar: 'bg-blue-400', light: 'bg-blue-100' },
+    { bar: 'bg-emerald-400', light: 'bg-emerald-100' },
+    { bar: 'bg-amber-400', light: 'bg-amber-100' },
+    { bar: 'bg-purple-400', light: 'bg-purple-100' },
+    { bar: 'bg-rose-400', light: 'bg-rose-100' }
+];
+
+function changeGanttMonth(delta) {
+    if (ganttYearView) {
+        ganttYear += delta;
+        loadGanttChart();
+        return;
+    }
+    ganttMonth += delta;
+    if (ganttMonth < 1) { ganttMonth = 12; ganttYear--; }
+    if (ganttMonth > 12) { ganttMonth = 1; ganttYear++; }
+    loadGanttChart();
+}
+
+function toggleGanttDualView() {
+    ganttDualView = !ganttDualView;
+    if (ganttDualView) ganttYearView = false;
+    _updateGanttViewButtons();
+    loadGanttChart();
+}
+
+function toggleGanttYearView() {
+    ganttYearView = !ganttYearView;
+    if (ganttYearView) ganttDualView = false;
+    _updateGanttViewButtons();
+    loadGanttChart();
+}
+
+function _updateGanttViewButtons() {
+    const dualBtn = document.getElementById('ganttDualBtn');
+    if (dualBtn) dualBtn.textContent = ganttDualView ? '1개월 뷰' : '2개월 뷰';
+    const yearBtn = document.getElementById('ganttYearBtn');
+    if (yearBtn) yearBtn.textContent = ganttYearView ? '1개월 뷰' : '연간 뷰';
+}
+
+/** year년 month월부터 months개월 간트 데이터를 한 번에 조회 (작업일 비트맵 → workDates 복원) */
+async function _fetchGanttRange(year, month, months) {
+    const result = await eelFetch('get_gantt_range', year, month, months, true);
+    if (!result || !result.success) return [];
+    return (decodeColumnar(result.projects) || []).map(p => ({
+        ...p,
+        workDates: decodeDayBitmap(result.start, p.workOffset || 0, p.workBitmap || ''),
+    }));
+}
+
+/** 해당 월과 기간이 겹치는 프로젝트만 */
+function _ganttProjectsInMonth(projects, year, month) {
+    const mm = String(month).padStart(2, '0');
+    const first = `${year}-${mm}-01`;
+    const last = `${year}-${mm}-${String(new Date(year, month, 0).getDate()).padStart(2, '0')}`;
+    return projects.filter(p => p.endDate >= first && p.startDate <= last);
+}
+
+function _ganttMonthSection(projects, year, month) {
+    return `<div class="text-sm font-bold text-slate-500 mb-1 px-1">${year}년 ${month}월</div>
+        <div class="overflow-x-auto">
+            ${projects.length > 0
+                ? buildGanttTableHTML(projects, year, month)
+                : '<p class="text-slate-400 text-sm py-4 text-center">해당 월 작업 없음</p>'}
+        </div>`;
+}
+
+function buildGanttTableHTML(projects, year, month) {
+    const daysInMonth = new Date(year, month, 0).getDate();
+    const weekdays = ['일', '월', '화', '수', '목', '금', '토'];
+
+    let html = '<table class="w-full border-collapse text-sm"><thead>';
+
+    // 1행: 날짜
+    html += '<tr class="bg-slate-50">';
+    html += '<th rowspan="2" class="border p-2 text-center bg-slate-100 sticky left-0 z-10 min-w-32">선사/선명</th>';
+    html += '<th rowspan="2" class="border p-2 text-center bg-slate-100 min-w-28">작업내용</th>';
+    html += '<th rowspan="2" class="border p-2 text-center bg-slate-100 min-w-20">기간</th>';
+
+    for (let day = 1; day <= daysInMonth; day++) {
+        const date = new Date(year, month - 1, day);
+        const dow = date.getDay();
+        const dateStr = `${year}-${String(month).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
+        const isHoliday = KOREAN_HOLIDAYS[dateStr];
+        const isSunday = dow === 0;
+        const isSaturday = dow === 6;
+
+        let cellClass = 'border p-1 text-center text-xs min-w-7';
+        if (isSunday || isHoliday) {
+            cellClass += ' bg-red-100 text-red-600';
+        } else if (isSaturday) {
+            cellClass += ' bg-blue-100 text-blue-600';
+        }
+
+        html += `<th class="${cellClass}" title="${isHoliday || ''}">${day}</th>`;
+    }
+    html += '</tr>';
+
+    // 2행: 요일
+    html += '<tr class="bg-slate-50">';
+    for (let day = 1; day <= daysInMonth; day++) {
+        const date = new Date(year, month - 1, day);
+        const dow = date.getDay();
+        const dateStr = `${year}-${String(month).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
+        const isHoliday = KOREAN_HOLIDAYS[dateStr];
+        const isSunday = dow === 0;
+        const isSaturday = dow === 6;
+
+        let cellClass = 'border p-0 text-center text-xs';
+        if (isSunday || isHoliday) {
+            cellClass += ' bg-red-100 text-red-600 font-bold';
+        } else if (isSaturday) {
+            cellClass += ' bg-blue-100 text-blue-600 font-bold';
+        } else {
+            cellClass += ' text-slate-400';
+        }
+
+        let label = weekdays[dow];
+        if (isHoliday && !isSunday && !isSaturday) {
+            label = isHoliday.charAt(0);
+        }
+
+        html += `<th class="${cellClass}" title="${isHoliday || ''}">${label}</th>`;
+    }
+    html += '</tr></thead>';
+
+    // 프로젝트 행
+    html += '<tbody>';
+    projects.forEach((project, idx) => {
+        const color = GANTT_COLORS[idx % GANTT_COLORS.length];
+        const workDatesSet = new Set(project.workDates || []);
+        const safeCn = escapeHtml(project.contractNumber || '');
+
+        html += `<tr class="hover:bg-slate-50 cursor-pointer" data-gantt-cn="${safeCn}">`;
+        html += `<td class="border p-2 text-xs sticky left-0 bg-white z-10 whitespace-nowrap">
+            <div class="font-semibold">${escapeHtml(project.company || '')}</div>
+            <div class="text-slate-500">${escapeHtml(project.shipName || '')}</div>
+        </td>`;
+
+        let workDesc = '';
+        if (project.engineModel && project.workContent) {
+            workDesc = `${project.engineModel} ${project.workContent}`;
+        } else {
+            workDesc = project.engineModel || project.workContent || '';
+        }
+        html += `<td class="border p-2 text-xs">${escapeHtml(workDesc)}</td>`;
+        html += `<td class="border p-2 text-xs text-center whitespace-nowrap">${project.startMD}~${project.endMD}</td>`;
+
+        for (let day = 1; day <= daysInMonth; day++) {
+            const dateStr = `${year}-${String(month).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
+            const isWorkDate = workDatesSet.has(dateStr);
+            const isInRange = dateStr >= project.startDate && dateStr <= project.endDate;
+
+            let cellClass = 'border p-0';
+            if (isWorkDate) {
+                cellClass += ` ${color.bar}`;
+            } else if (isInRange) {
+                cellClass += ` ${color.light}`;
+            }
+
+            html += `<td class="${cellClass}"></td>`;
+        }
+        html += '</tr>';
+    });
+    html += '</tbody></table>';
+    return html;
+}
+
+async function loadGanttChart() {
+    try {
+        const display   = document.getElementById('ganttMonthDisplay');
+        const container = document.getElementById('ganttContainer');
+
+        // 최초 1회만 이벤트 위임 등록 (ondblclick 인라인 핸들러 대체)
+        if (container && !container._ganttDblClickAttached) {
+            container.addEventListener('dblclick', e => {
+                const row = e.target.closest('[data-gantt-cn]');
+                if (row) navigateToSearch(row.dataset.ganttCn);
+            });
+            container._ganttDblClickAttached = true;
+        }
+        const emptyDiv  = document.getElementById('ganttEmpty');
+
+        // 표시할 달 목록 — 여러 달이어도 서버 호출은 한 번
+        let months;
+        if (ganttYearView) {
+            months = Array.from({ length: 12 }, (_, i) => [ganttYear, i + 1]);
+            if (display) display.textContent = `${ganttYear}년 전체`;
+        } else if (ganttDualView) {
+            let prevMonth = ganttMonth - 1, prevYear = ganttYear;
+            if (prevMonth < 1) { prevMonth = 12; prevYear--; }
+            months = [[prevYear, prevMonth], [ganttYear, ganttMonth]];
+            if (display) display.textContent = `${prevYear}년 ${prevMonth}월 ~ ${ganttYear}년 ${ganttMonth}월`;
+        } else {
+            months = [[ganttYear, ganttMonth]];
+            if (display) display.textContent = `${ganttYear}년 ${ganttMonth}월`;
+        }
+
+        const projects = await _fetchGanttRange(months[0][0], months[0][1], months.length);
+        if (!projects.length) {
+            if (container) container.innerHTML = '';
+            if (emptyDiv) emptyDiv.classList.remove('hidden');
+            return;
+        }
+        if (emptyDiv) emptyDiv.classList.add('hidden');
+        if (!container) return;
+
+        if (months.length === 1) {
+            container.innerHTML =
+                `<div class="overflow-x-auto">${buildGanttTableHTML(projects, ganttYear, ganttMonth)}</div>`;
+        } else {
+            // 연간 뷰는 작업 없는 달을 생략
+            container.innerHTML = months
+                .map(([y, m]) => [y, m, _ganttProjectsInMonth(projects, y, m)])
+                .filter(([, , list]) => list.length > 0 || !ganttYearView)
+                .map(([y, m, list]) => _ganttMonthSection(list, y, m))
+                .join('<div class="border-t-2 border-slate-300 my-5"></div>');
+        }
+    } catch (error) {
+        console.error('간트 차트 로드 실패:', error);
+        showCustomAlert('오류', '간트 차트 로드에 실패했습니다.', 'error');
+    }
+}
+
+// ============================================================================
+// 칸반 보드
+// ============================================================================
+
+async function loadKanbanBoard() {
+    try {
+        const data = await eelFetch('get_kanban_data', true);
+        if (data) Object.keys(data).forEach(stage => { data[stage] = decodeColumnar(data[stage]); });
+        // #12 — 칸반 카드 더블클릭 이벤트 위임 (ondblclick 인라인 핸들러 대체, 최초 1회만 등록)
+        const _kc = document.getElementById('kanbanContainer');
+        if (_kc && !_kc._dblClickAttached) {
+            _kc.addEventListener('dblclick', e => {
+                const card = e.target.closest('[data-kanban-cn]');
+                if (card) navigateToSearch(card.dataset.kanbanCn);
+            });
+            _kc._dblClickAttached = true;
+        }
+
+        const receptionCards = document.getElementById('receptionCards');
+        const startedCards = document.getElementById('startedCards');
+        const doneCards = document.getElementById('doneCards');
+        const receptionCount = document.getElementById('receptionCount');
+        const startedCount = document.getElementById('startedCount');
+        const doneCount = document.getElementById('doneCount');
+
+        if (!receptionCards || !startedCards || !doneCards) return;
+
+        receptionCards.innerHTML = '';
+        startedCards.innerHTML = '';
+        doneCards.innerHTML = '';
+
+        if (receptionCount) receptionCount.textContent = (data.reception || []).length;
+        if (startedCount) startedCount.textContent = (data.started || []).length;
+        if (doneCount) doneCount.textContent = (data.done || []).length;
+
+        // 접수 / 착수 / 준공 — #5: innerHTML += 루프 → map().join() 한 번 대입 (O(n²)→O(n))
+        receptionCards.innerHTML = (data.reception || []).map(p => renderReceptionCard(p)).join('');
+        startedCards.innerHTML   = (data.started   || []).map(p => renderCard(p, 'border-blue-500')).join('');
+        doneCards.innerHTML      = (data.done       || []).map(p => renderCard(p, 'border-green-500')).join('');
+        // 아카이브: 전체 데이터 저장 후 달 필터링으로 렌더링
+        _archiveAllData = data.archive || [];
+        if (_archiveYear === null) {
+            const d = new Date();
+            d.setMonth(d.getMonth() - 1);
+            _archiveYear  = d.getFullYear();
+            _archiveMonth = d.getMonth() + 1;
+        }
+        renderArchiveForMonth();
+
+        // 빈 상태 표시
+        if ((data.reception || []).length === 0) {
+            receptionCards.innerHTML = '<p class="text-center text-slate-400 text-sm py-4">접수된 프로젝트가 없습니다.</p>';
+        }
+        if ((data.started || []).length === 0) {
+            startedCards.innerHTML = '<p class="text-center text-slate-400 text-sm py-4">착수된 프로젝트가 없습니다.</p>';
+        }
+        if ((data.done || []).length === 0) {
+            doneCards.innerHTML = '<p class="text-center text-slate-400 text-sm py-4">준공된 프로젝트가 없습니다.</p>';
+        }
+
+    } catch (error) {
+        console.error('칸반 보드 로드 실패:', error);
+        showCustomAlert('오류', '칸반 보드 로드에 실패했습니다.', 'error');
+    }
+}
+
+// ============================================================================
+// 칸반 카드 렌더링 (전역 — loadKanbanBoard + renderArchiveForMonth 공유)
+// ============================================================================
+
+function renderReceptionCard(project) {
+    let workDesc = '';
+    if (project.engineModel && project.workContent) {
+        workDesc = `${project.engineModel} ${project.workContent}`;
+    } else {
+        workDesc = project.engineModel || project.workContent || '';
+    }
+    const safeCompany  = escapeHtml(project.company  || '');
+    const safeShipName = escapeHtml(project.shipName || '');
+    const safeCn       = escapeHtml(project.contractNumber || '');
+    const jsTitle      = escapeJs(`${project.company || ''} ${project.shipName || ''}`);
+    return `
+        <div class="bg-white rounded-lg shadow-sm p-3 border-l-4 border-yellow-400 hover:shadow-md transition-shadow">
+            <div class="flex justify-between items-start">
+                <div class="font-bold text-sm">${safeCompany} ${safeShipName}</div>
+                <div class="flex gap-1">
+                    <button onclick="promptStartProject(${project.id})" class="text-xs px-2 py-0.5 bg-blue-100 text-blue-700 rounded hover:bg-blue-200" title="착수 전환">착수 ▶</button>
+                    <button onclick="deleteBoardProject(${project.id})" class="text-xs px-1 py-0.5 bg-red-100 text-red-600 rounded hover:bg-red-200" title="삭제">✕</button>
+                </div>
+            </div>
+            ${safeCn ? `<div class="text-xs text-slate-400 mt-0.5">${safeCn}</div>` : ''}
+            <div class="text-xs mt-1 text-slate-700">${escapeHtml(workDesc)}</div>
+            ${_renderMilestoneBadges(project)}
+            <div class="flex justify-between items-center mt-1">
+                <div class="flex gap-1 items-center">
+                    <div class="text-xs text-slate-400">접수 대기</div>
+                    <button onclick="event.stopPropagation(); openMilestoneModal(${project.id}, '${escapeJs(project.targetStartDate||'')}', '${escapeJs(project.targetEndDate||'')}', '${escapeJs(project.actualEndDate||'')}', '${escapeJs(project.engineModel||'')}', '${escapeJs(project.workContent||'')}')"
+                            class="text-xs px-1.5 py-0.5 bg-slate-100 text-slate-500 rounded hover:bg-slate-200" title="마일스톤 편집">📅</button>
+                </div>
+                <button onclick="event.stopPropagation(); openCommentModal('', ${project.id}, '${jsTitle}')" class="text-slate-400 hover:text-blue-500 text-sm" title="댓글">💬</button>
+            </div>
+        </div>
+    `;
+}
+
+function renderCard(project, borderColor) {
+    let workDesc = '';
+    if (project.engineModel && project.workContent) {
+        workDesc = `${project.engineModel} ${project.workContent}`;
+    } else {
+        workDesc = project.engineModel || project.workContent || '';
+    }
+    const cn            = project.contractNumber || '';
+    const safeCn        = escapeHtml(cn);
+    const jsCn          = escapeJs(cn);
+    const currentStatus = project.status || '';
+    const safeCompany   = escapeHtml(project.company  || '');
+    const safeShipName  = escapeHtml(project.shipName || '');
+    const jsTitle       = escapeJs(`${project.company || ''} ${project.shipName || ''}`);
+
+    let statusSelect = '';
+    if (currentStatus !== '아카이브') {
+        statusSelect = `
+            <select onchange="changeKanbanStatus('${jsCn}', this.value)" class="text-xs border rounded px-1 py-0.5 bg-slate-50">
+                <option value="착수" ${currentStatus === '착수' ? 'selected' : ''}>착수</option>
+                <option value="준공" ${currentStatus === '준공' ? 'selected' : ''}>준공</option>
+            </select>`;
+    } else {
+        // 아카이브 카드: manualStatus가 '준공'이면 처리됨 표시, 아니면 버튼
+        if (project.manualStatus === '준공') {
+            statusSelect = `<span class="text-xs px-2 py-0.5 bg-emerald-50 text-emerald-600 rounded border border-emerald-200 cursor-default">✓ 준공처리됨</span>`;
+        } else {
+            statusSelect = `<button onclick="changeKanbanStatus('${jsCn}', '준공')"
+                class="text-xs px-2 py-0.5 bg-emerald-100 text-emerald-700 rounded hover:bg-emerald-200"
+                title="월간 보고에 준공 날짜 반영">준공처리</button>`;
+        }
+    }
+
+    return `
+        <div class="bg-white rounded-lg shadow-sm p-3 border-l-4 ${borderColor} hover:shadow-md transition-shadow cursor-pointer"
+             data-kanban-cn="${escapeHtml(cn)}">
+            <div class="flex justify-between items-start">
+                <div class="font-bold text-sm">${safeCompany} ${safeShipName}</div>
+                ${statusSelect}
+            </div>
+            <div class="text-xs text-slate-500 mt-0.5">${safeCn}</div>
+            <div class="text-xs mt-1 text-slate-700">${escapeHtml(workDesc)}</div>
+            ${_renderMilestoneBadges(project)}
+            <div class="flex justify-between mt-2 text-xs text-slate-500">
+                <span>${escapeHtml(project.startMD || '')} ~ ${escapeHtml(project.endMD || '')}</span>
+                <span class="font-semibold text-blue-600">${project.totalManpower || 0}공</span>
+            </div>
+            <div class="flex justify-between items-center mt-1">
+                <div class="flex gap-1 items-center">
+                    <div class="text-xs text-slate-400">${project.workDays || 0}일 작업</div>
+                    ${project.boardProjectId
+                        ? `<button onclick="event.stopPropagation(); openMilestoneModal(${project.boardProjectId}, '${escapeJs(project.targetStartDate||'')}', '${escapeJs(project.targetEndDate||'')}', '${escapeJs(project.actualEndDate||'')}', '${escapeJs(project.engineModel||'')}', '${escapeJs(project.workContent||'')}')" class="text-xs px-1.5 py-0.5 bg-slate-100 text-slate-500 rounded hover:bg-slate-200" title="마일스톤 편집">📅</button>`
+                        : `<button onclick="event.stopPropagation(); _openMilestoneForNew('${jsCn}', '${escapeJs(project.engineModel||'')}', '${escapeJs(project.workContent||'')}')" class="text-xs px-1.5 py-0.5 bg-slate-100 text-slate-500 rounded hover:bg-slate-200" title="마일스톤 편집">📅</button>`}
+                </div>
+                <button onclick="event.stopPropagation(); openCommentModal(this.dataset.cn, null, this.dataset.title)" data-cn="${escapeHtml(cn)}" data-title="${escapeHtml(project.company || '')} ${escapeHtml(project.shipName || '')}" class="text-slate-400 hover:text-blue-500 text-sm" title="댓글">💬</button>
+            </div>
+        </div>
+    `;
+}
+
+// ============================================================================
+// 마일스톤 UI 헬퍼
+// ============================================================================
+
+function _renderMilestoneBadges(project) {
+    const ts = project.targetStartDate || '';
+    const te = project.targetEndDate   || '';
+    const ae = project.actualEndDate   || '';
+    const parts = [];
+    if (ts) parts.push(`<span class="text-slate-400">착수 ${escapeHtml(ts)}</span>`);
+    if (te) parts.push(`<span class="text-orange-500">완료예정 ${escapeHtml(te)}</span>`);
+    if (ae) parts.push(`<span class="text-green-600">완료 ✅ ${escapeHtml(ae)}</span>`);
+    return parts.length ? `<div class="flex flex-wrap gap-1 mt-1 text-xs">${parts.join('')}</div>` : '';
+}
+
+// boardProjectId 없는 카드(착수 직접 등록)에서 📅 클릭 시 호출
+// board_projects 행을 자동 생성 후 마일스톤 모달 열기
+async function _openMilestoneForNew(contractNumber, engineModel, workContent) {
+    try {
+        const res = await eel.get_or_create_board_project(contractNumber)();
+        if (res && res.success) {
+            openMilestoneModal(res.projectId, '', '', '', engineModel, workContent);
+        } else {
+            showToast(res?.message || '마일스톤 생성 중 오류가 발생했습니다.', 'error');
+        }
+    } catch(e) {
+        showToast('마일스톤 생성 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+function openMilestoneModal(projectId, targetStart, targetEnd, actualEnd, engineModel, workContent) {
+    // 기존 모달이 있으면 제거
+    const old = document.getElementById('milestoneModal');
+    if (old) old.remove();
+
+    const m = document.createElement('div');
+    m.id = 'milestoneModal';
+    m.className = 'fixed inset-0 bg-black bg-opacity-40 flex items-center justify-center z-50';
+    m.innerHTML = `
+        <div class="bg-white rounded-xl shadow-xl p-6 w-80">
+            <h3 class="font-bold text-base mb-4">📅 마일스톤 편집</h3>
+            <label class="block text-xs text-slate-500 mb-1">착수 예정일</label>
+            <input id="msTargetStart" type="date" value="${escapeHtml(targetStart || '')}"
+                   class="w-full border rounded px-2 py-1 text-sm mb-3"
+                   oninput="_fetchEtaSuggestion()">
+            <label class="block text-xs text-slate-500 mb-1">완료 예정일</label>
+            <input id="msTargetEnd" type="date" value="${escapeHtml(targetEnd || '')}"
+                   class="w-full border rounded px-2 py-1 text-sm mb-1">
+            <!-- ETA 제안 -->
+            <div id="msEtaHint" class="text-xs text-blue-600 mb-3 min-h-[1rem]"></div>
+            <label class="block text-xs text-slate-500 mb-1">실제 완료일</label>
+            <input id="msActualEnd" type="date" value="${escapeHtml(actualEnd || '')}"
+                   class="w-full border rounded px-2 py-1 text-sm mb-4">
+            <div class="flex justify-end gap-2">
+                <button onclick="document.getElementById('milestoneModal').remove()"
+                        class="px-3 py-1.5 text-sm border rounded text-slate-600 hover:bg-slate-50">취소</button>
+                <button onclick="saveMilestone(${projectId})"
+                        class="px-3 py-1.5 text-sm bg-blue-600 text-white rounded hover:bg-blue-700">저장</button>
+            </div>
+        </div>
+    `;
+    document.body.appendChild(m);
+    m.addEventListener('click', e => { if (e.target === m) m.remove(); });
+
+    // 모달 열릴 때 자동 ETA 조회
+    m._engineModel  = engineModel  || '';
+    m._workContent  = workContent  || '';
+    _fetchEtaSuggestion();
+}
+
+async function _fetchEtaSuggestion() {
+    const modal = document.getElementById('milestoneModal');
+    if (!modal) return;
+    const hint   = document.getElementById('msEtaHint');
+    const tsVal  = document.getElementById('msTargetStart')?.value || '';
+    if (!hint) return;
+    try {
+        const r = await eel.estimate_completion(modal._engineModel || '', modal._workContent || '', tsVal)();
+        if (r.success && r.medianDays) {
+            hint.innerHTML = `📊 과거 ${escapeHtml(r.basis || '')} 기준: 보통 <strong>${r.medianDays}일</strong>,
+                늦어도 ${r.p80Days}일 (80%, ${r.sampleCount}건)
+                ${r.suggestionEndDate ? ` &nbsp;<button onclick="document.getElementById('msTargetEnd').value='${escapeJs(r.suggestionEndDate)}'"
+                    class="underline text-blue-700 hover:text-blue-900">적용 (${escapeHtml(r.suggestionEndDate)})</button>` : ''}
+                ${r.p80EndDate && r.p80EndDate !== r.suggestionEndDate ? ` <button onclick="document.getElementById('msTargetEnd').value='${escapeJs(r.p80EndDate)}'"
+                    class="underline text-slate-600 hover:text-slate-800">여유 (${escapeHtml(r.p80EndDate)})</button>` : ''}`;
+        } else {
+            hint.textContent = '(과거 유사 작업 데이터 없음)';
+        }
+    } catch (_) {
+        hint.textContent = '';
+    }
+}
+
+async function saveMilestone(projectId) {
+    const ts = document.getElementById('msTargetStart')?.value || '';
+    const te = document.getElementById('msTargetEnd')?.value   || '';
+    const ae = document.getElementById('msActualEnd')?.value   || '';
+    try {
+        const result = await eel.update_project_milestones(projectId, ts, te, ae)();
+        if (result.success) {
+            showToast('마일스톤이 저장되었습니다.', 'success');
+            document.getElementById('milestoneModal')?.remove();
+            loadKanbanBoard();
+        } else {
+            showToast(result.message || '저장 실패', 'error');
+        }
+    } catch (e) {
+        showToast('마일스톤 저장 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+// ============================================================================
+// 아카이브 달 네비게이션
+// ============================================================================
+
+function renderArchiveForMonth() {
+    const archiveCards      = document.getElementById('archiveCards');
+    const archiveCount      = document.getElementById('archiveCount');
+    const archiveMonthLabel = document.getElementById('archiveMonthLabel');
+    const archiveNextBtn    = document.getElementById('archiveNextBtn');
+    if (!archiveCards) return;
+
+    if (archiveMonthLabel)
+        archiveMonthLabel.textContent = `${_archiveYear}년 ${_archiveMonth}월`;
+
+    const monthStr = `${_archiveYear}-${String(_archiveMonth).padStart(2, '0')}`;
+    const filtered = _archiveAllData.filter(p => p.endDate && p.endDate.startsWith(monthStr));
+
+    // 다음 달 버튼: 이전 달(오늘 기준)을 초과하면 비활성화
+    if (archiveNextBtn) {
+        const now  = new Date();
+        const prevY = now.getMonth() === 0 ? now.getFullYear() - 1 : now.getFullYear();
+        const prevM = now.getMonth() === 0 ? 12 : now.getMonth();
+        const atLatest = _archiveYear > prevY || (_archiveYear === prevY && _archiveMonth >= prevM);
+        archiveNextBtn.disabled     = atLatest;
+        archiveNextBtn.style.opacity = atLatest ? '0.3' : '';
+    }
+
+    archiveCards.innerHTML = filtered.length === 0
+        ? '<p class="text-center text-slate-400 text-sm py-4 col-span-3">해당 월 아카이브가 없습니다.</p>'
+        : filtered.map(p => renderCard(p, 'border-slate-400')).join('');
+
+    if (archiveCount) archiveCount.textContent = filtered.length;
+}
+
+function archiveChangeMonth(delta) {
+    if (_archiveYear === null || _archiveMonth === null) return; // #7 — 초기화 전 호출 방어
+    let m = _archiveMonth + delta, y = _archiveYear;
+    if (m < 1)  { m = 12; y--; }
+    if (m > 12) { m = 1;  y++; }
+    _archiveYear  = y;
+    _archiveMonth = m;
+    renderArchiveForMonth();
+}
+
+// 아카이브 토글
+function toggleArchive() {
+    const panel = document.getElementById('archivePanel');
+    const btn = document.getElementById('archiveToggleBtn');
+    if (panel) {
+        panel.classList.toggle('hidden');
+        if (btn) btn.textContent = panel.classList.contains('hidden') ? '아카이브 ▼' : '아카이브 ▲';
+    }
+}
+
+// 칸반 상태 변경 (드롭다운)
+async function changeKanbanStatus(contractNumber, newStatus) {
+    try {
+        const result = await eel.set_project_status(contractNumber, newStatus)();
+        if (result.success) {
+            if (newStatus === '준공') {
+                showToast('준공처리 완료. 월간 보고에 반영됩니다.');
+            }
+            loadKanbanBoard();
+        }
+    } catch (error) {
+        console.error('상태 변경 실패:', error);
+        showCustomAlert('오류', '상태 변경에 실패했습니다.', 'error');
+    }
+}
+
+// 새 프로젝트 접수 모달
+function showNewProjectModal() {
+    document.getElementById('npCompany').value = '';
+    document.getElementById('npShipName').value = '';
+    document.getElementById('npEngineModel').value = '';
+    document.getElementById('npWorkContent').value = '';
+    document.getElementById('newProjectModal').classList.remove('hidden');
+}
+
+function closeNewProjectModal() {
+    document.getElementById('newProjectModal').classList.add('hidden');
+}
+
+async function submitNewProject() {
+    const data = {
+        company: document.getElementById('npCompany').value.trim(),
+        ship_name: document.getElementById('npShipName').value.trim().toUpperCase(),
+        engine_model: document.getElementById('npEngineModel').value.trim(),
+        work_content: document.getElementById('npWorkContent').value.trim(),
+        username: currentUser ? currentUser.full_name : ''
+    };
+    if (!data.ship_name) {
+        showCustomAlert('알림', '선명을 입력해주세요.', 'info');
+        return;
+    }
+    try {
+        const result = await eel.create_board_project(data)();
+        if (result.success) {
+            closeNewProjectModal();
+            loadKanbanBoard();
+        } else {
+            showCustomAlert('오류', result.message, 'error');
+        }
+    } catch (error) {
+        console.error('프로젝트 접수 실패:', error);
+        showCustomAlert('오류', '프로젝트 접수에 실패했습니다.', 'error');
+    }
+}
+
+// 착수 전환 모달 (계약번호 입력)
+function promptStartProject(projectId) {
+    document.getElementById('spProjectId').value = projectId;
+    const now = new Date();
+    document.getElementById('spContractYear').value = now.getFullYear();
+    document.getElementById('spContractSeq').value = '001';
+    document.getElementById('startProjectModal').classList.remove('hidden');
+}
+
+function closeStartProjectModal() {
+    document.getElementById('startProjectModal').classList.add('hidden');
+}
+
+async function confirmStartProject() {
+    const projectId = parseInt(document.getElementById('spProjectId').value);
+    const year = document.getElementById('spContractYear').value.trim();
+    const seq = document.getElementById('spContractSeq').value.trim().padStart(3, '0');
+    const contractNumber = `SH-${year}-${seq}-T`;
+
+    try {
+        const result = await eel.update_board_project(projectId, {
+            contract_number: contractNumber,
+            status: '착수'
+        })();
+        if (result.success) {
+            closeStartProjectModal();
+            loadKanbanBoard();
+        } else {
+            showCustomAlert('오류', result.message, 'error');
+        }
+    } catch (error) {
+        console.error('착수 전환 실패:', error);
+        showCustomAlert('오류', '착수 전환에 실패했습니다.', 'error');
+    }
+}
+
+// 보드 프로젝트 삭제
+async function deleteBoardProject(projectId) {
+    if (!confirm('이 접수 프로젝트를 삭제하시겠습니까?')) return;
+    try {
+        const result = await eel.delete_board_project(projectId)();
+        if (result.success) {
+            loadKanbanBoard();
+        }
+    } catch (error) {
+        console.error('프로젝트 삭제 실패:', error);
+        showCustomAlert('오류', '프로젝트 삭제에 실패했습니다.', 'error');
+    }
+}
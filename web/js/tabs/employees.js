@@ -0,0 +1,1414 @@
+// web/js/tabs/employees.js - 직원 관리 탭 (연차 · 직원 명부 · 직원 프로필 · 근로 시간)
+// 처음 사용할 때 modules.js의 loadTabModule('employees')로 로드된다.
+
+// ============================================================================
+// 직원 관리 - 연차 관리
+// ============================================================================
+
+// 어드민 페이지 → 직원 관리 탭으로 전환 (mainApp 임시 사용)
+function showEmployeeFromAdmin() {
+    document.getElementById('adminApp').classList.add('hidden');
+    document.getElementById('mainApp').classList.remove('hidden');
+    const bar = document.getElementById('adminReturnBar');
+    if (bar) bar.classList.remove('hidden');
+    showView('employee');
+}
+
+// 직원 관리에서 어드민 페이지로 복귀
+function returnToAdminPanel() {
+    const bar = document.getElementById('adminReturnBar');
+    if (bar) bar.classList.add('hidden');
+    document.getElementById('mainApp').classList.add('hidden');
+    document.getElementById('adminApp').classList.remove('hidden');
+}
+
+function showEmployeeTab(tab) {
+    const tabMap = {
+        directory:  document.getElementById('employeeDirectoryTab'),
+        leave:      document.getElementById('employeeLeaveTab'),
+        leaveReport: document.getElementById('employeeLeaveReportTab'),
+        workhours:  document.getElementById('employeeWorkHoursTab')
+    };
+    const btnMap = {
+        directory:  document.getElementById('btnEmployeeDirectory'),
+        leave:      document.getElementById('btnEmployeeLeave'),
+        leaveReport: document.getElementById('btnEmployeeLeaveReport'),
+        workhours:  document.getElementById('btnEmployeeWorkHours')
+    };
+    // 모든 탭 패널 숨김
+    Object.values(tabMap).forEach(t => t && t.classList.add('hidden'));
+    // 버튼 스타일 업데이트
+    Object.keys(btnMap).forEach(key => {
+        const b = btnMap[key];
+        if (!b) return;
+        b.classList.remove('bg-blue-600', 'text-white', 'bg-slate-200',
+                           'bg-white', 'text-slate-600', 'border', 'border-slate-300', 'hover:bg-slate-50');
+        if (key === tab) {
+            b.classList.add('bg-blue-600', 'text-white');
+        } else {
+            b.classList.add('bg-white', 'text-slate-600', 'border', 'border-slate-300', 'hover:bg-slate-50');
+        }
+    });
+    if (tabMap[tab]) tabMap[tab].classList.remove('hidden');
+    if (tab === 'directory') loadEmployeeDirectory();
+    if (tab === 'leaveReport') loadLeaveMonthlyReport();
+    if (tab === 'workhours') _initWorkHoursSelectors();
+}
+
+function _normalizeEmployeeDirectoryExternalHeaders(headers = []) {
+    const normalized = Array.isArray(headers)
+        ? headers.map((header, index) => {
+            const value = String(header ?? '').trim();
+            return value || `외부계정${index + 1}`;
+        })
+        : [];
+    return normalized.length ? normalized : ['외부계정1', '외부계정2'];
+}
+
+function _normalizeEmployeeDirectoryExternalAccounts(accounts = [], headerCount = _employeeDirectoryExternalHeaders.length, fallback = []) {
+    const source = Array.isArray(accounts) ? accounts : [];
+    const result = [];
+    for (let i = 0; i < headerCount; i++) {
+        result.push(String(source[i] ?? fallback[i] ?? ''));
+    }
+    return result;
+}
+
+function _getEmployeeDirectoryColumnCount() {
+    return 8 + _employeeDirectoryExternalHeaders.length;
+}
+
+function _createEmptyEmployeeDirectoryRow(overrides = {}) {
+    const row = {
+        id: null,
+        department: '',
+        name: '',
+        rank: '',
+        phone: '',
+        address: '',
+        healthCheck: '',
+        ...overrides
+    };
+    row.externalAccounts = _normalizeEmployeeDirectoryExternalAccounts(
+        row.externalAccounts,
+        _employeeDirectoryExternalHeaders.length,
+        [row.externalAccount1 || '', row.externalAccount2 || '']
+    );
+    return row;
+}
+
+function _renderEmployeeDirectoryHeader() {
+    const headerRow = document.getElementById('employeeDirectoryHeaderRow');
+    if (!headerRow) return;
+
+    headerRow.innerHTML = `
+        <th class="border border-slate-200 px-3 py-3 text-center w-16">순번</th>
+        <th class="border border-slate-200 px-3 py-3 text-center w-32">부서</th>
+        <th class="border border-slate-200 px-3 py-3 text-center w-28">이름</th>
+        <th class="border border-slate-200 px-3 py-3 text-center w-24">직책</th>
+        <th class="border border-slate-200 px-3 py-3 text-center w-40">전화번호</th>
+        <th class="border border-slate-200 px-3 py-3 text-center" style="width: 28rem; min-width: 28rem;">주소</th>
+        ${_employeeDirectoryExternalHeaders.map((header, index) => `
+            <th class="border border-slate-200 px-2 py-2 text-center" style="min-width: 11rem; width: 11rem;">
+                <input type="text"
+                       value="${escapeHtml(header || '')}"
+                       class="w-full px-2 py-1.5 border border-slate-200 rounded bg-white text-center font-semibold text-sm focus:bg-blue-50"
+                       placeholder="외부계정${index + 1}"
+                       oninput="updateEmployeeDirectoryExternalHeader(${index}, this.value)">
+            </th>
+        `).join('')}
+        <th class="border border-slate-200 px-3 py-3 text-center w-36">건강검진</th>
+        <th class="border border-slate-200 px-3 py-3 text-center w-24">편집</th>
+    `;
+
+    const tableEl = document.getElementById('employeeDirectoryTableElement');
+    if (tableEl) {
+        tableEl.style.minWidth = `${1280 + Math.max(0, _employeeDirectoryExternalHeaders.length - 2) * 176}px`;
+    }
+}
+
+async function loadEmployeeDirectory() {
+    const tbody = document.getElementById('employeeDirectoryTable');
+    if (!tbody) return;
+    _renderEmployeeDirectoryHeader();
+    tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-slate-400">불러오는 중...</td></tr>`;
+    try {
+        const result = await eelFetch('get_employee_directory');
+        if (!result?.success) {
+            tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-red-500">${escapeHtml(result?.message || '직원 명부를 불러오지 못했습니다.')}</td></tr>`;
+            return;
+        }
+        _employeeDirectoryExternalHeaders = _normalizeEmployeeDirectoryExternalHeaders(result.externalHeaders || []);
+        _employeeDirectoryData = (result.employees || []).map(row => _createEmptyEmployeeDirectoryRow(row));
+        if (_employeeDirectoryData.length === 0) {
+            _employeeDirectoryData = [_createEmptyEmployeeDirectoryRow()];
+        }
+        renderEmployeeDirectoryTable();
+    } catch (e) {
+        console.error('직원 명부 로드 실패:', e);
+        tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-red-500">직원 명부를 불러오지 못했습니다.</td></tr>`;
+    }
+    return;
+    tbody.innerHTML = '<tr><td colspan="10" class="px-4 py-8 text-center text-slate-400">불러오는 중...</td></tr>';
+    try {
+        const result = await eelFetch('get_employee_directory');
+        if (!result?.success) {
+            tbody.innerHTML = `<tr><td colspan="10" class="px-4 py-8 text-center text-red-500">${escapeHtml(result?.message || '직원 명부를 불러오지 못했습니다.')}</td></tr>`;
+            return;
+        }
+        _employeeDirectoryData = (result.employees || []).map(row => _createEmptyEmployeeDirectoryRow(row));
+        if (_employeeDirectoryData.length === 0) {
+            _employeeDirectoryData = [_createEmptyEmployeeDirectoryRow()];
+        }
+        renderEmployeeDirectoryTable();
+    } catch (e) {
+        console.error('직원 명부 로드 실패:', e);
+        tbody.innerHTML = '<tr><td colspan="10" class="px-4 py-8 text-center text-red-500">직원 명부를 불러오지 못했습니다.</td></tr>';
+    }
+}
+
+function renderEmployeeDirectoryTable() {
+    const tbody = document.getElementById('employeeDirectoryTable');
+    if (!tbody) return;
+    _renderEmployeeDirectoryHeader();
+    if (!_employeeDirectoryData.length) {
+        tbody.innerHTML = `<tr><td colspan="${_getEmployeeDirectoryColumnCount()}" class="px-4 py-8 text-center text-slate-400">등록된 직원이 없습니다. 행 추가 버튼으로 시작해 주세요.</td></tr>`;
+        return;
+    }
+
+    tbody.innerHTML = _employeeDirectoryData.map((row, index) => `
+        <tr class="${index % 2 === 0 ? 'bg-white' : 'bg-slate-50'}">
+            <td class="border border-slate-200 px-2 py-2 text-center font-semibold text-slate-500">${index + 1}</td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.department || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'department', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.name || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center font-medium focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'name', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.rank || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'rank', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.phone || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'phone', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.address || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-left focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'address', this.value)">
+            </td>
+            ${(row.externalAccounts || []).map((value, accountIndex) => `
+                <td class="border border-slate-200 p-1">
+                    <input type="text" value="${escapeHtml(value || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                           oninput="updateEmployeeDirectoryExternalAccount(${index}, ${accountIndex}, this.value)">
+                </td>
+            `).join('')}
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.healthCheck || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'healthCheck', this.value)">
+            </td>
+            <td class="border border-slate-200 px-2 py-2 text-center">
+                <button onclick="removeEmployeeDirectoryRow(${index})" class="px-3 py-1.5 bg-red-50 text-red-600 rounded-lg text-xs font-semibold hover:bg-red-100">
+                    삭제
+                </button>
+            </td>
+        </tr>
+    `).join('');
+    return;
+    if (!_employeeDirectoryData.length) {
+        tbody.innerHTML = '<tr><td colspan="10" class="px-4 py-8 text-center text-slate-400">등록된 직원이 없습니다. 행 추가 버튼으로 시작해 주세요.</td></tr>';
+        return;
+    }
+
+    tbody.innerHTML = _employeeDirectoryData.map((row, index) => `
+        <tr class="${index % 2 === 0 ? 'bg-white' : 'bg-slate-50'}">
+            <td class="border border-slate-200 px-2 py-2 text-center font-semibold text-slate-500">${index + 1}</td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.department || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'department', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.name || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center font-medium focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'name', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.rank || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'rank', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.phone || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'phone', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.address || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-left focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'address', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.externalAccount1 || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'externalAccount1', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.externalAccount2 || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'externalAccount2', this.value)">
+            </td>
+            <td class="border border-slate-200 p-1">
+                <input type="text" value="${escapeHtml(row.healthCheck || '')}" class="w-full px-3 py-2 border-0 bg-transparent text-center focus:bg-blue-50 rounded"
+                       oninput="updateEmployeeDirectoryField(${index}, 'healthCheck', this.value)">
+            </td>
+            <td class="border border-slate-200 px-2 py-2 text-center">
+                <button onclick="removeEmployeeDirectoryRow(${index})" class="px-3 py-1.5 bg-red-50 text-red-600 rounded-lg text-xs font-semibold hover:bg-red-100">
+                    삭제
+                </button>
+            </td>
+        </tr>
+    `).join('');
+}
+
+function updateEmployeeDirectoryField(index, field, value) {
+    if (!_employeeDirectoryData[index]) return;
+    _employeeDirectoryData[index][field] = value;
+}
+
+function updateEmployeeDirectoryExternalHeader(index, value) {
+    if (index < 0 || index >= _employeeDirectoryExternalHeaders.length) return;
+    _employeeDirectoryExternalHeaders[index] = value;
+}
+
+function updateEmployeeDirectoryExternalAccount(rowIndex, accountIndex, value) {
+    if (!_employeeDirectoryData[rowIndex]) return;
+    if (!Array.isArray(_employeeDirectoryData[rowIndex].externalAccounts)) {
+        _employeeDirectoryData[rowIndex].externalAccounts = _normalizeEmployeeDirectoryExternalAccounts();
+    }
+    _employeeDirectoryData[rowIndex].externalAccounts[accountIndex] = value;
+}
+
+function addEmployeeDirectoryExternalColumn() {
+    _employeeDirectoryExternalHeaders.push(`외부계정${_employeeDirectoryExternalHeaders.length + 1}`);
+    _employeeDirectoryData = _employeeDirectoryData.map(row => _createEmptyEmployeeDirectoryRow(row));
+    renderEmployeeDirectoryTable();
+}
+
+function addEmployeeDirectoryRow() {
+    _employeeDirectoryData.push(_createEmptyEmployeeDirectoryRow());
+    renderEmployeeDirectoryTable();
+}
+
+function removeEmployeeDirectoryRow(index) {
+    if (!_employeeDirectoryData[index]) return;
+    _employeeDirectoryData.splice(index, 1);
+    if (_employeeDirectoryData.length === 0) {
+        _employeeDirectoryData.push(_createEmptyEmployeeDirectoryRow());
+    }
+    renderEmployeeDirectoryTable();
+}
+
+async function saveEmployeeDirectory() {
+    {
+    const rows = _employeeDirectoryData.map(row => ({
+        id: row.id || null,
+        department: (row.department || '').trim(),
+        name: (row.name || '').trim(),
+        rank: (row.rank || '').trim(),
+        phone: (row.phone || '').trim(),
+        address: (row.address || '').trim(),
+        externalAccounts: _normalizeEmployeeDirectoryExternalAccounts(row.externalAccounts).map(value => String(value || '').trim()),
+        healthCheck: (row.healthCheck || '').trim()
+    }));
+    const externalHeaders = _normalizeEmployeeDirectoryExternalHeaders(_employeeDirectoryExternalHeaders).map(header => header.trim());
+    const invalidRow = rows.findIndex(row => !row.name && (
+        row.department || row.rank || row.phone || row.address || row.healthCheck ||
+        (row.externalAccounts || []).some(value => value)
+    ));
+    if (invalidRow >= 0) {
+        showCustomAlert('알림', `${invalidRow + 1}번 행의 이름을 입력해 주세요.`, 'warning');
+        return;
+    }
+    try {
+        const result = await eel.save_employee_directory(JSON.stringify({
+            externalHeaders,
+            rows
+        }))();
+        if (!result?.success) {
+            showToast(result?.message || '직원 명부 저장에 실패했습니다.', 'error');
+            return;
+        }
+        showToast('직원 명부가 저장되었습니다.', 'success');
+        await Promise.all([
+            loadEmployeeDirectory(),
+            loadLeaveEmployeeList()
+        ]);
+    } catch (e) {
+        console.error('직원 명부 저장 실패:', e);
+        showToast('직원 명부 저장 중 오류가 발생했습니다.', 'error');
+    }
+    return;
+    }
+    const rows = _employeeDirectoryData.map(row => ({
+        id: row.id || null,
+        department: (row.department || '').trim(),
+        name: (row.name || '').trim(),
+        rank: (row.rank || '').trim(),
+        phone: (row.phone || '').trim(),
+        address: (row.address || '').trim(),
+        externalAccount1: (row.externalAccount1 || '').trim(),
+        externalAccount2: (row.externalAccount2 || '').trim(),
+        healthCheck: (row.healthCheck || '').trim()
+    }));
+    const invalidRow = rows.findIndex(row => !row.name && (row.department || row.rank || row.phone || row.address || row.externalAccount1 || row.externalAccount2 || row.healthCheck));
+    if (invalidRow >= 0) {
+        showCustomAlert('알림', `${invalidRow + 1}번 행의 이름을 입력해 주세요.`, 'warning');
+        return;
+    }
+    try {
+        const result = await eel.save_employee_directory(JSON.stringify(rows))();
+        if (!result?.success) {
+            showToast(result?.message || '직원 명부 저장에 실패했습니다.', 'error');
+            return;
+        }
+        showToast('직원 명부가 저장되었습니다.', 'success');
+        await Promise.all([
+            loadEmployeeDirectory(),
+            loadLeaveEmployeeList()
+        ]);
+    } catch (e) {
+        console.error('직원 명부 저장 실패:', e);
+        showToast('직원 명부 저장 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+// ============================================================================
+// 연차 월별 보고
+// ============================================================================
+
+let _leaveReportData = [];  // T3: 현재 표시 중인 직원 데이터 (순서 변경용)
+let _leaveExcluded = [];    // 제외된 직원 이름 목록
+let _leaveReportYear = 0;   // T3: 현재 조회 연도
+
+async function loadLeaveMonthlyReport() {
+    const sel = document.getElementById('leaveReportYear');
+    if (!sel) return;
+    // 연도 셀렉터 초기화 (처음 호출 시)
+    if (!sel.options.length) {
+        const curYear = new Date().getFullYear();
+        for (let y = curYear; y >= curYear - 2; y--) {
+            const opt = document.createElement('option');
+            opt.value = y;
+            opt.textContent = y + '년';
+            sel.appendChild(opt);
+        }
+    }
+    const year = parseInt(sel.value) || new Date().getFullYear();
+    const container = document.getElementById('leaveReportTableContainer');
+    if (!container) return;
+    container.innerHTML = '<p class="text-slate-400 text-sm">불러오는 중...</p>';
+    try {
+        // T3: 저장된 순서 먼저 로드
+        const [result, orderResult, excludedResult] = await Promise.all([
+            eelFetch('get_all_leave_monthly_report', year),
+            eelFetch('get_employee_leave_order'),
+            eelFetch('get_employee_leave_excluded')
+        ]);
+        // 제외 목록 파싱
+        _leaveExcluded = [];
+        if (excludedResult && excludedResult.excluded) {
+            try { _leaveExcluded = JSON.parse(excludedResult.excluded); } catch(e) { console.warn('연차 제외자 파싱 실패:', e); }
+        }
+        if (result && result.success) {
+            let data = result.data || [];
+            // 제외된 직원 필터링
+            data = data.filter(emp => !_leaveExcluded.includes(emp.name));
+            // T3: 저장된 순서가 있으면 적용
+            if (orderResult && orderResult.order) {
+                try {
+                    const savedOrder = JSON.parse(orderResult.order);
+                    data = _applyLeaveOrder(data, savedOrder);
+                } catch(e) { console.warn('직원 순서 파싱 실패:', e); }
+            }
+            renderLeaveMonthlyReport(data, year);
+        } else {
+            container.innerHTML = '<p class="text-red-500 text-sm">데이터 조회 실패</p>';
+        }
+    } catch (e) {
+        container.innerHTML = '<p class="text-red-500 text-sm">오류: ' + escapeHtml(String(e)) + '</p>';
+    }
+}
+
+// T3: 저장된 이름 순서대로 data 배열 재정렬 (저장된 이름 없는 항목은 뒤에 추가)
+function _applyLeaveOrder(data, savedOrder) {
+    const orderMap = {};
+    savedOrder.forEach((name, idx) => { orderMap[name] = idx; });
+    return [...data].sort((a, b) => {
+        const ia = orderMap[a.name] ?? 9999;
+        const ib = orderMap[b.name] ?? 9999;
+        return ia - ib;
+    });
+}
+
+// T3: 직원 행 이동
+function moveLeaveRow(idx, dir) {
+    const newIdx = idx + dir;
+    if (newIdx < 0 || newIdx >= _leaveReportData.length) return;
+    [_leaveReportData[idx], _leaveReportData[newIdx]] = [_leaveReportData[newIdx], _leaveReportData[idx]];
+    renderLeaveMonthlyReport(_leaveReportData, _leaveReportYear);
+}
+
+// T3: 현재 순서 DB에 저장
+async function saveLeaveOrder() {
+    const names = _leaveReportData.map(e => e.name);
+    try {
+        const r = await eel.save_employee_leave_order(JSON.stringify(names))();
+        if (r && r.success) {
+            showToast('직원 순서가 저장되었습니다.', 'success');
+        } else {
+            showToast('순서 저장 실패', 'error');
+        }
+    } catch(e) {
+        showToast('순서 저장 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+// 직원 제거 — 제외 목록에 추가 후 테이블에서 숨김
+async function removeLeaveEmployee(idx) {
+    const emp = _leaveReportData[idx];
+    if (!emp) return;
+    const name = emp.name;
+    if (!confirm(`"${name}"을(를) 보고서에서 제거하시겠습니까?\n하단 목록에서 복원할 수 있습니다.`)) return;
+    _leaveExcluded.push(name);
+    _leaveReportData.splice(idx, 1);
+    try {
+        await Promise.all([
+            eel.set_employee_leave_excluded(JSON.stringify(_leaveExcluded))(),
+            eel.save_employee_leave_order(JSON.stringify(_leaveReportData.map(e => e.name)))()
+        ]);
+        showToast(`${escapeHtml(name)}이(가) 보고서에서 제거되었습니다.`, 'success');
+        renderLeaveMonthlyReport(_leaveReportData, _leaveReportYear);
+    } catch(e) {
+        showToast('제거 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+// 제외된 직원 복원
+async function restoreLeaveEmployee(name) {
+    _leaveExcluded = _leaveExcluded.filter(n => n !== name);
+    try {
+        await eel.set_employee_leave_excluded(JSON.stringify(_leaveExcluded))();
+        showToast(`${escapeHtml(name)}이(가) 복원되었습니다.`, 'success');
+        loadLeaveMonthlyReport();
+    } catch(e) {
+        showToast('복원 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+function renderLeaveMonthlyReport(data, year) {
+    const container = document.getElementById('leaveReportTableContainer');
+    if (!container) return;
+    if (!data || data.length === 0) {
+        container.innerHTML = '<p class="text-slate-400 text-sm">연차 데이터가 없습니다.</p>';
+        return;
+    }
+
+    // T3: 모듈 변수 업데이트
+    _leaveReportData = data;
+    _leaveReportYear = year;
+
+    const curYear = new Date().getFullYear();
+    const maxMonth = (year === curYear) ? new Date().getMonth() + 1 : 12;
+    const monthNames = ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'];
+
+    let html = `<div id="leaveReportPrintArea">
+        <h3 class="text-lg font-bold text-center mb-3 hidden" id="leaveReportPrintTitle">${escapeHtml(String(year))}년 연차 현황</h3>
+        <div class="mb-2 no-print flex items-center gap-2">
+            <span class="text-xs text-slate-500">↑↓ 버튼으로 순서를 조정하고</span>
+            <button onclick="saveLeaveOrder()" class="px-3 py-1 bg-slate-600 text-white rounded text-xs font-semibold hover:bg-slate-700">💾 순서 저장</button>
+        </div>
+        <table class="w-full border-collapse text-sm">
+            <thead>
+                <tr class="bg-blue-50">
+                    <th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap no-print">순서</th>
+                    <th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">순번</th>
+                    <th class="border border-gray-400 px-3 py-2 text-center whitespace-nowrap">이름</th>`;
+    for (let m = 1; m <= maxMonth; m++) {
+        html += `<th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">${monthNames[m-1]}</th>`;
+    }
+    html += `<th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">연차 생성일</th>
+                    <th class="border border-gray-400 px-2 py-2 text-center whitespace-nowrap">잔여 연차</th>
+                    <th class="border border-gray-400 px-4 py-2 text-center whitespace-nowrap">서명</th>
+                </tr>
+            </thead>
+            <tbody>`;
+
+    data.forEach((emp, idx) => {
+        html += `<tr class="${idx % 2 === 0 ? 'bg-white' : 'bg-slate-50'}">
+            <td class="border border-gray-400 px-1 py-1 text-center no-print whitespace-nowrap">
+                <button onclick="moveLeaveRow(${idx}, -1)" class="px-1 text-slate-500 hover:text-blue-600 disabled:opacity-30 text-xs" ${idx === 0 ? 'disabled' : ''}>▲</button>
+                <button onclick="moveLeaveRow(${idx}, 1)" class="px-1 text-slate-500 hover:text-blue-600 disabled:opacity-30 text-xs" ${idx === data.length - 1 ? 'disabled' : ''}>▼</button>
+                <button onclick="removeLeaveEmployee(${idx})" class="px-1 text-red-400 hover:text-red-600 text-xs ml-1" title="보고서에서 제거">✕</button>
+            </td>
+            <td class="border border-gray-400 px-2 py-2 text-center">${idx + 1}</td>
+            <td class="border border-gray-400 px-3 py-2 text-center font-medium">${escapeHtml(emp.name)}</td>`;
+        for (let m = 1; m <= maxMonth; m++) {
+            const used = emp.monthly[m];
+            html += `<td class="border border-gray-400 px-2 py-2 text-center">${used != null ? formatLeaveDays(used) : '-'}</td>`;
+        }
+        const remaining = emp.remaining;
+        const remColor = remaining < 0 ? 'text-red-600 font-bold' : remaining === 0 ? 'text-slate-500' : 'text-green-700 font-semibold';
+        html += `<td class="border border-gray-400 px-2 py-2 text-center">${emp.generation_month}월 ${emp.generation_day || 1}일</td>
+            <td class="border border-gray-400 px-2 py-2 text-center ${remColor}">${formatLeaveDays(remaining)}</td>
+            <td class="border border-gray-400 px-4 py-2 text-center">&nbsp;</td>
+        </tr>`;
+    });
+
+    html += `</tbody></table>`;
+
+    // 제외된 직원 복원 영역 (인쇄 제외)
+    if (_leaveExcluded.length > 0) {
+        html += `<div class="mt-3 no-print p-3 bg-slate-50 rounded border border-slate-200">
+            <p class="text-xs text-slate-500 font-semibold mb-2">🚫 제외된 직원 — 클릭하면 복원됩니다</p>
+            <div class="flex flex-wrap gap-2">`;
+        _leaveExcluded.forEach(name => {
+            html += `<button onclick="restoreLeaveEmployee(this.dataset.name)" data-name="${escapeHtml(name)}"
+                class="px-2 py-1 bg-white border border-slate-300 rounded text-xs text-slate-600 hover:bg-blue-50 hover:border-blue-400 hover:text-blue-700">
+                ↩ ${escapeHtml(name)}</button>`;
+        });
+        html += `</div></div>`;
+    }
+
+    html += `</div>`;
+    container.innerHTML = html;
+}
+
+function printLeaveReport() {
+    // 인쇄 전 타이틀 임시 표시
+    const title = document.getElementById('leaveReportPrintTitle');
+    if (title) title.classList.remove('hidden');
+    window.print();
+    if (title) title.classList.add('hidden');
+}
+
+function showAddLeaveRowModal() {
+    const modal = document.getElementById('addLeaveRowModal');
+    const nameEl = document.getElementById('addLeaveRowName');
+    const dayEl = document.getElementById('addLeaveRowDay');
+    if (!modal) return;
+    if (nameEl) nameEl.value = '';
+    if (dayEl) dayEl.value = '1';
+    modal.classList.remove('hidden');
+    if (nameEl) nameEl.focus();
+}
+
+async function confirmAddLeaveRow() {
+    const nameEl = document.getElementById('addLeaveRowName');
+    const monthEl = document.getElementById('addLeaveRowMonth');
+    const dayEl = document.getElementById('addLeaveRowDay');
+    const name = nameEl ? nameEl.value.trim() : '';
+    const month = parseInt(monthEl ? monthEl.value : '1') || 1;
+    const day = parseInt(dayEl ? dayEl.value : '1') || 1;
+    if (!name) { showToast('직원명을 입력해주세요.', 'error'); return; }
+    try {
+        const r = await eel.save_employee_annual_config(name, month, '', day)();
+        document.getElementById('addLeaveRowModal').classList.add('hidden');
+        if (r && r.success) {
+            showToast(escapeHtml(name) + ' 추가 완료');
+            loadLeaveMonthlyReport();
+        } else {
+            showToast('추가 실패', 'error');
+        }
+    } catch(e) {
+        showToast('오류: ' + String(e), 'error');
+    }
+}
+
+let _leaveEmployeeNames = [];
+let _leaveEmployeeDropdownIndex = -1;
+
+async function loadLeaveEmployeeList() {
+    try {
+        const names = await eelFetch('get_employee_names_for_leave');
+        _leaveEmployeeNames = Array.isArray(names) ? names : [];
+        const datalist = document.getElementById('leaveEmployeeList');
+        const workHoursSelect = document.getElementById('workHoursEmployeeInput');
+        if (!datalist) return;
+        datalist.innerHTML = '';
+        _leaveEmployeeNames.forEach(name => {
+            const opt = document.createElement('option');
+            opt.value = name;
+            datalist.appendChild(opt);
+        });
+        if (workHoursSelect) {
+            const currentValue = workHoursSelect.value;
+            workHoursSelect.innerHTML = '<option value="">직원 선택</option>';
+            _leaveEmployeeNames.forEach(name => {
+                const opt = document.createElement('option');
+                opt.value = name;
+                opt.textContent = name;
+                workHoursSelect.appendChild(opt);
+            });
+            if (_leaveEmployeeNames.includes(currentValue)) {
+                workHoursSelect.value = currentValue;
+            }
+        }
+        renderLeaveEmployeeDropdown(document.getElementById('leaveEmployeeInput')?.value || '');
+    } catch (e) {
+        console.error('직원 목록 로드 실패:', e);
+    }
+}
+
+function _getLeaveEmployeeDisplayNames(query = '') {
+    const normalizedQuery = String(query || '').trim().toLowerCase();
+    if (!normalizedQuery) return _leaveEmployeeNames;
+    const matches = [];
+    const others = [];
+    _leaveEmployeeNames.forEach(name => {
+        const text = String(name || '');
+        if (text.toLowerCase().includes(normalizedQuery)) {
+            matches.push(name);
+        } else {
+            others.push(name);
+        }
+    });
+    return [...matches, ...others];
+}
+
+function showLeaveEmployeeDropdown() {
+    renderLeaveEmployeeDropdown(document.getElementById('leaveEmployeeInput')?.value || '');
+    const dropdown = document.getElementById('leaveEmployeeDropdown');
+    if (dropdown && _leaveEmployeeNames.length > 0) dropdown.classList.remove('hidden');
+    _bindLeaveEmployeeDropdownClose();
+}
+
+function hideLeaveEmployeeDropdown() {
+    const dropdown = document.getElementById('leaveEmployeeDropdown');
+    if (dropdown) dropdown.classList.add('hidden');
+    _leaveEmployeeDropdownIndex = -1;
+}
+
+function _bindLeaveEmployeeDropdownClose() {
+    if (window._leaveEmployeeDropdownCloseBound) return;
+    window._leaveEmployeeDropdownCloseBound = true;
+    document.addEventListener('mousedown', event => {
+        const input = document.getElementById('leaveEmployeeInput');
+        const dropdown = document.getElementById('leaveEmployeeDropdown');
+        if (!input || !dropdown) return;
+        if (event.target === input || dropdown.contains(event.target)) return;
+        hideLeaveEmployeeDropdown();
+    });
+}
+
+function renderLeaveEmployeeDropdown(query = '') {
+    const dropdown = document.getElementById('leaveEmployeeDropdown');
+    if (!dropdown) return;
+    const names = _getLeaveEmployeeDisplayNames(query);
+    _leaveEmployeeDropdownIndex = -1;
+    if (!names.length) {
+        dropdown.innerHTML = '<div class="px-3 py-2 text-slate-400">등록된 직원이 없습니다.</div>';
+        return;
+    }
+    dropdown.innerHTML = names.map((name, index) => `
+        <button type="button"
+                class="leave-employee-option block w-full text-left px-3 py-2 hover:bg-blue-50 focus:bg-blue-50 focus:outline-none ${index === 0 ? 'rounded-t-lg' : ''}"
+                data-name="${escapeHtml(name)}"
+                onclick="selectLeaveEmployeeName('${escapeJs(name)}')"
+                onmousedown="event.preventDefault()">
+            ${escapeHtml(name)}
+        </button>
+    `).join('');
+    dropdown.classList.remove('hidden');
+}
+
+function selectLeaveEmployeeName(name) {
+    const input = document.getElementById('leaveEmployeeInput');
+    if (!input || !name) return;
+    input.value = name;
+    hideLeaveEmployeeDropdown();
+    searchEmployeeLeave();
+}
+
+function handleLeaveEmployeeInputKeydown(event) {
+    const dropdown = document.getElementById('leaveEmployeeDropdown');
+    const options = dropdown ? Array.from(dropdown.querySelectorAll('.leave-employee-option')) : [];
+    if (event.key === 'ArrowDown' && options.length) {
+        event.preventDefault();
+        _leaveEmployeeDropdownIndex = Math.min(_leaveEmployeeDropdownIndex + 1, options.length - 1);
+        options[_leaveEmployeeDropdownIndex].focus();
+        return;
+    }
+    if (event.key === 'Escape') {
+        hideLeaveEmployeeDropdown();
+        return;
+    }
+    if (event.key === 'Enter') {
+        hideLeaveEmployeeDropdown();
+        searchEmployeeLeave();
+    }
+}
+
+async function searchEmployeeLeave() {
+    const input = document.getElementById('leaveEmployeeInput');
+    const name = input ? input.value.trim() : '';
+    if (!name) {
+        showCustomAlert('알림', '직원명을 입력하세요.', 'warning');
+        return;
+    }
+    hideLeaveEmployeeDropdown();
+    const resultDiv = document.getElementById('leaveResult');
+    if (resultDiv) resultDiv.innerHTML = '<p class="text-slate-400">조회 중...</p>';
+    try {
+        const info = await eelFetch('get_employee_leave_info', name);
+        renderLeaveResult(info, name);
+    } catch (e) {
+        if (resultDiv) resultDiv.innerHTML = '<p class="text-red-500">조회 실패: ' + escapeHtml(e.message) + '</p>';
+    }
+}
+
+// ----------------------------------------------------------------------------
+// 직원 개인 프로필 모달
+// ----------------------------------------------------------------------------
+
+let _empProfileChart = null;
+
+async function openEmployeeProfile(name) {
+    if (!name) return;
+    const year = new Date().getFullYear();
+    try {
+        const result = await eelFetch('get_employee_profile', name, year);
+        if (!result.success) { showToast('프로필 조회 실패', 'error'); return; }
+        await ensureVendor('chart');
+        _showEmployeeProfileModal(result);
+    } catch (e) {
+        console.error('직원 프로필 오류:', e);
+        showToast('프로필 조회 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+function _showEmployeeProfileModal(data) {
+    const old = document.getElementById('empProfileModal');
+    if (old) old.remove();
+    if (_empProfileChart) { _empProfileChart.destroy(); _empProfileChart = null; }
+
+    const leave = data.leaveBalance;
+    const leaveHtml = leave
+        ? `<div class="flex gap-4 text-sm text-center mt-2">
+            <div class="flex-1 bg-blue-50 rounded p-2"><div class="text-xs text-slate-500">총 부여</div><div class="font-bold text-blue-700">${leave.total}</div></div>
+            <div class="flex-1 bg-amber-50 rounded p-2"><div class="text-xs text-slate-500">사용</div><div class="font-bold text-amber-600">${leave.used}</div></div>
+            <div class="flex-1 bg-emerald-50 rounded p-2"><div class="text-xs text-slate-500">잔여</div><div class="font-bold text-emerald-600">${leave.remaining}</div></div>
+           </div>`
+        : '<p class="text-xs text-slate-400 mt-2">연차 데이터 없음</p>';
+
+    const modal = document.createElement('div');
+    modal.id = 'empProfileModal';
+    modal.className = 'fixed inset-0 bg-black bg-opacity-40 flex items-center justify-center z-50';
+    modal.innerHTML = `
+      <div class="bg-white rounded-xl shadow-xl p-6 w-96 max-h-[90vh] overflow-y-auto">
+        <div class="flex justify-between items-center mb-4">
+          <h3 class="font-bold text-lg">👤 ${escapeHtml(data.name)} (${data.year}년)</h3>
+          <button onclick="document.getElementById('empProfileModal').remove()"
+                  class="text-slate-400 hover:text-slate-600 text-xl leading-none">✕</button>
+        </div>
+        <!-- 요약 카드 -->
+        <div class="grid grid-cols-2 gap-3 mb-4">
+          <div class="bg-blue-50 rounded-lg p-3 text-center">
+            <div class="text-xs text-slate-500 mb-1">총 공수</div>
+            <div class="text-2xl font-bold text-blue-700">${data.totalManpower.toFixed(1)}</div>
+          </div>
+          <div class="bg-slate-50 rounded-lg p-3 text-center">
+            <div class="text-xs text-slate-500 mb-1">참여 프로젝트</div>
+            <div class="text-2xl font-bold text-slate-700">${data.projectCount}</div>
+          </div>
+        </div>
+        <!-- 월별 공수 차트 -->
+        <div class="mb-4">
+          <div class="text-xs text-slate-500 mb-1 font-semibold">월별 공수</div>
+          <canvas id="empMonthlyChart" height="80"></canvas>
+        </div>
+        <!-- 연차 -->
+        <div class="mb-4">
+          <div class="text-xs text-slate-500 font-semibold mb-1">연차 현황</div>
+          ${leaveHtml}
+        </div>
+        <!-- 최근 프로젝트 -->
+        ${data.projects.length ? `
+        <div>
+          <div class="text-xs text-slate-500 font-semibold mb-1">참여 계약 (최대 10건)</div>
+          <div class="flex flex-wrap gap-1">
+            ${data.projects.map(p => `<span class="text-xs bg-slate-100 rounded px-2 py-0.5">${escapeHtml(p)}</span>`).join('')}
+          </div>
+        </div>` : ''}
+      </div>`;
+    document.body.appendChild(modal);
+    modal.addEventListener('click', e => { if (e.target === modal) modal.remove(); });
+
+    // 차트 렌더링
+    const canvas = document.getElementById('empMonthlyChart');
+    if (canvas) {
+        const months = ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월'];
+        _empProfileChart = new Chart(canvas, {
+            type: 'bar',
+            data: {
+                labels: months,
+                datasets: [{ label: '공수', data: data.monthlyManpower, backgroundColor: 'rgba(59,130,246,0.6)' }]
+            },
+            options: {
+                responsive: true,
+                plugins: { legend: { display: false } },
+                scales: { y: { beginAtZero: true } }
+            }
+        });
+    }
+}
+
+function formatLeaveDays(value) {
+    const num = Number(value || 0);
+    if (!Number.isFinite(num)) return '0';
+    return num.toFixed(2).replace(/\.?0+$/, '');
+}
+
+function renderLeaveResult(info, name) {
+    const resultDiv = document.getElementById('leaveResult');
+    if (!resultDiv) return;
+
+    const cfg = info.config || {};
+    const grants = info.grants || [];
+    const usageThisYear = info.usage_this_year || [];
+    const allUsageCount = info.all_usage_count || 0;
+    const summary = info.summary || { total_granted: 0, total_used: 0, remaining: 0 };
+
+    const currentYear = new Date().getFullYear();
+
+    // ── 섹션 1: 잔여 연차 요약 ──
+    const remainingColor = summary.remaining < 0 ? 'text-red-600' : 'text-emerald-600';
+    let html = `
+    <div class="space-y-6">
+      <!-- 프로필 버튼 -->
+      <div class="flex justify-end">
+        <button onclick="openEmployeeProfile('${escapeJs(name)}')"
+                class="text-xs px-3 py-1.5 bg-blue-50 text-blue-700 rounded-lg hover:bg-blue-100 border border-blue-200">
+          📊 ${escapeHtml(name)} 공수 프로필 보기
+        </button>
+      </div>
+      <!-- 요약 박스 -->
+      <div class="grid grid-cols-3 gap-4">
+        <div class="bg-slate-50 border border-slate-200 rounded-xl p-4 text-center">
+          <p class="text-sm text-slate-500 mb-1">총 부여</p>
+          <p class="text-3xl font-bold text-blue-600">${formatLeaveDays(summary.total_granted)}</p>
+        </div>
+        <div class="bg-slate-50 border border-slate-200 rounded-xl p-4 text-center">
+          <p class="text-sm text-slate-500 mb-1">총 사용</p>
+          <p class="text-3xl font-bold text-amber-500">${formatLeaveDays(summary.total_used)}</p>
+        </div>
+        <div class="bg-slate-50 border border-slate-200 rounded-xl p-4 text-center">
+          <p class="text-sm text-slate-500 mb-1">잔여</p>
+          <p class="text-3xl font-bold ${remainingColor}">${formatLeaveDays(summary.remaining)}</p>
+        </div>
+      </div>
+
+      <!-- 섹션 2: 연차 설정 (생성월) -->
+      <div class="bg-white border border-slate-200 rounded-xl p-5">
+        <h3 class="text-lg font-semibold text-slate-700 mb-4">⚙️ 연차 설정</h3>
+        <div class="flex gap-3 items-center flex-wrap">
+          <label class="text-sm text-slate-600 font-medium">연차 생성 월/일:</label>
+          <select id="leaveGenMonth" class="border border-slate-300 rounded-lg px-3 py-2 text-sm">
+            ${Array.from({length:12},(_,i)=>`<option value="${i+1}" ${cfg.generation_month===(i+1)?'selected':''}>${i+1}월</option>`).join('')}
+          </select>
+          <select id="leaveGenDay" class="border border-slate-300 rounded-lg px-3 py-2 text-sm">
+            ${Array.from({length:31},(_,i)=>`<option value="${i+1}" ${(cfg.generation_day||1)===(i+1)?'selected':''}>${i+1}일</option>`).join('')}
+          </select>
+          <label class="text-sm text-slate-600 font-medium ml-2">메모:</label>
+          <input type="text" id="leaveConfigNote" value="${escapeHtml(cfg.note||'')}"
+                 class="border border-slate-300 rounded-lg px-3 py-2 text-sm w-48" placeholder="메모 (선택)">
+          <button onclick="saveLeaveConfig('${escapeJs(name)}')"
+                  class="px-4 py-2 bg-blue-600 text-white rounded-lg text-sm font-semibold hover:bg-blue-700">저장</button>
+        </div>
+      </div>
+
+      <!-- 섹션 3: 연차 부여 이력 -->
+      <div class="bg-white border border-slate-200 rounded-xl p-5">
+        <h3 class="text-lg font-semibold text-slate-700 mb-4">📋 연차 부여 이력 (전체)</h3>
+        <div class="overflow-x-auto">
+          <table class="w-full text-sm border-collapse">
+            <thead>
+              <tr class="bg-slate-100">
+                <th class="px-3 py-2 text-left border border-slate-200">연도</th>
+                <th class="px-3 py-2 text-left border border-slate-200">월</th>
+                <th class="px-3 py-2 text-right border border-slate-200">일수</th>
+                <th class="px-3 py-2 text-left border border-slate-200">메모</th>
+                <th class="px-3 py-2 text-center border border-slate-200">삭제</th>
+              </tr>
+            </thead>
+            <tbody>`;
+
+    if (grants.length === 0) {
+        html += `<tr><td colspan="5" class="px-3 py-3 text-center text-slate-400">부여 이력이 없습니다.</td></tr>`;
+    } else {
+        grants.forEach(g => {
+            html += `
+              <tr class="hover:bg-slate-50">
+                <td class="px-3 py-2 border border-slate-100">${g.grant_year}년</td>
+                <td class="px-3 py-2 border border-slate-100">${g.grant_month}월</td>
+                <td class="px-3 py-2 border border-slate-100 text-right font-medium">${g.days}일</td>
+                <td class="px-3 py-2 border border-slate-100 text-slate-500">${escapeHtml(g.note||'')}</td>
+                <td class="px-3 py-2 border border-slate-100 text-center">
+                  <button onclick="deleteLeaveGrant(${g.id},'${escapeJs(name)}')"
+                          class="px-2 py-1 bg-red-100 text-red-600 rounded hover:bg-red-200 text-xs">삭제</button>
+                </td>
+              </tr>`;
+        });
+    }
+
+    html += `
+            </tbody>
+          </table>
+        </div>
+        <!-- 부여 추가 폼 -->
+        <div class="flex gap-2 mt-4 items-center flex-wrap">
+          <span class="text-sm font-medium text-slate-600">추가:</span>
+          <input type="number" id="grantYear" value="${currentYear}"
+                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-20" placeholder="연도">
+          <select id="grantMonth" class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm">
+            ${Array.from({length:12},(_,i)=>`<option value="${i+1}">${i+1}월</option>`).join('')}
+          </select>
+          <input type="number" id="grantDays" value="15" step="0.5"
+                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-16" placeholder="일수">
+          <input type="text" id="grantNote"
+                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-36" placeholder="메모 (선택)">
+          <button onclick="addLeaveGrant('${escapeJs(name)}')"
+                  class="px-4 py-1.5 bg-green-600 text-white rounded-lg text-sm font-semibold hover:bg-green-700">추가</button>
+        </div>
+      </div>
+
+      <!-- 섹션 4: 연차 사용 내역 (올해) -->
+      <div class="bg-white border border-slate-200 rounded-xl p-5">
+        <h3 class="text-lg font-semibold text-slate-700 mb-1">📅 연차 사용 내역 (${currentYear}년)</h3>
+        <p class="text-xs text-slate-400 mb-4">전체 사용 건수: ${allUsageCount}건 (이전 연도 포함)</p>
+        <div class="overflow-x-auto">
+          <table class="w-full text-sm border-collapse">
+            <thead>
+              <tr class="bg-slate-100">
+                <th class="px-3 py-2 text-left border border-slate-200">날짜</th>
+                <th class="px-3 py-2 text-center border border-slate-200">종류</th>
+                <th class="px-3 py-2 text-right border border-slate-200">차감</th>
+                <th class="px-3 py-2 text-left border border-slate-200">메모</th>
+                <th class="px-3 py-2 text-center border border-slate-200">삭제</th>
+              </tr>
+            </thead>
+            <tbody>`;
+
+    if (usageThisYear.length === 0) {
+        html += `<tr><td colspan="5" class="px-3 py-3 text-center text-slate-400">올해 사용 내역이 없습니다.</td></tr>`;
+    } else {
+        usageThisYear.forEach(u => {
+            const isAuto = u.created_by === 'auto_vacation';
+            const deductLabel = u.leave_type === '공가' ? '<span class="text-slate-400">-</span>' :
+                `<span class="font-medium text-amber-600">${u.days}</span>`;
+            const typeBadge = u.leave_type === '연차' ? 'bg-blue-100 text-blue-700' :
+                              u.leave_type === '반차' ? 'bg-purple-100 text-purple-700' :
+                              u.leave_type === '반반차' ? 'bg-fuchsia-100 text-fuchsia-700' :
+                              'bg-slate-100 text-slate-600';
+            const noteDisplay = isAuto
+                ? `<span class="text-slate-400 text-xs">일일작업현황</span>${u.note && u.note !== '일일작업현황 자동' ? ' ' + escapeHtml(u.note) : ''}`
+                : escapeHtml(u.note || '');
+            const deleteBtn = isAuto
+                ? `<span class="text-xs text-slate-300">자동</span>`
+                : `<button onclick="deleteLeaveUsage(${u.id},'${escapeJs(name)}')"
+                           class="px-2 py-1 bg-red-100 text-red-600 rounded hover:bg-red-200 text-xs">삭제</button>`;
+            html += `
+              <tr class="${isAuto ? 'bg-slate-50/60' : 'hover:bg-slate-50'}">
+                <td class="px-3 py-2 border border-slate-100">${u.use_date}</td>
+                <td class="px-3 py-2 border border-slate-100 text-center">
+                  <span class="px-2 py-0.5 rounded text-xs font-semibold ${typeBadge}">${u.leave_type}</span>
+                </td>
+                <td class="px-3 py-2 border border-slate-100 text-right">${deductLabel}</td>
+                <td class="px-3 py-2 border border-slate-100 text-slate-500">${noteDisplay}</td>
+                <td class="px-3 py-2 border border-slate-100 text-center">${deleteBtn}</td>
+              </tr>`;
+        });
+    }
+
+    html += `
+            </tbody>
+          </table>
+        </div>
+        <!-- 사용 내역 추가 폼 -->
+        <div class="flex gap-2 mt-4 items-center flex-wrap">
+          <span class="text-sm font-medium text-slate-600">추가:</span>
+          <input type="date" id="usageDate" value="${new Date().toISOString().slice(0,10)}"
+                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm">
+          <select id="usageType" class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm">
+            <option value="연차">연차 (1공)</option>
+            <option value="반차">반차 (0.5공)</option>
+            <option value="반반차">반반차 (0.25공)</option>
+            <option value="공가">공가 (차감없음)</option>
+          </select>
+          <input type="text" id="usageNote"
+                 class="border border-slate-300 rounded-lg px-2 py-1.5 text-sm w-36" placeholder="메모 (선택)">
+          <button onclick="addLeaveUsage('${escapeJs(name)}')"
+                  class="px-4 py-1.5 bg-green-600 text-white rounded-lg text-sm font-semibold hover:bg-green-700">추가</button>
+        </div>
+      </div>
+    </div>`;
+
+    resultDiv.innerHTML = html;
+}
+
+async function saveLeaveConfig(name) {
+    const genMonth = parseInt(document.getElementById('leaveGenMonth').value);
+    const genDay = parseInt(document.getElementById('leaveGenDay').value);
+    const note = document.getElementById('leaveConfigNote').value.trim();
+    try {
+        const result = await eel.save_employee_annual_config(name, genMonth, note, genDay)();
+        if (result && result.success) {
+            showCustomAlert('성공', '연차 설정이 저장되었습니다.', 'success');
+        } else {
+            showCustomAlert('오류', (result && result.error) || '저장 실패', 'error');
+        }
+    } catch (e) {
+        showCustomAlert('오류', '저장 중 오류: ' + e.message, 'error');
+    }
+}
+
+async function addLeaveGrant(name) {
+    const year  = parseInt(document.getElementById('grantYear').value);
+    const month = parseInt(document.getElementById('grantMonth').value);
+    const days  = parseFloat(document.getElementById('grantDays').value);
+    const note  = document.getElementById('grantNote').value.trim();
+    if (!year || !month || isNaN(days) || days === 0) {
+        showCustomAlert('알림', '연도, 월, 일수를 올바르게 입력하세요. 일수는 음수도 입력할 수 있지만 0은 사용할 수 없습니다.', 'warning');
+        return;
+    }
+    try {
+        const result = await eel.add_leave_grant(name, year, month, days, note)();
+        if (result && result.success) {
+            await searchEmployeeLeave();
+        } else {
+            showCustomAlert('오류', (result && result.error) || '추가 실패', 'error');
+        }
+    } catch (e) {
+        showCustomAlert('오류', '추가 중 오류: ' + e.message, 'error');
+    }
+}
+
+async function deleteLeaveGrant(id, employeeName) {
+    if (!confirm('이 부여 이력을 삭제하시겠습니까?')) return;
+    try {
+        const result = await eel.delete_leave_grant(id)();
+        if (result && result.success) {
+            document.getElementById('leaveEmployeeInput').value = employeeName;
+            await searchEmployeeLeave();
+        } else {
+            showCustomAlert('오류', (result && result.error) || '삭제 실패', 'error');
+        }
+    } catch (e) {
+        showCustomAlert('오류', '삭제 중 오류: ' + e.message, 'error');
+    }
+}
+
+async function addLeaveUsage(name) {
+    const useDate   = document.getElementById('usageDate').value;
+    const leaveType = document.getElementById('usageType').value;
+    const note      = document.getElementById('usageNote').value.trim();
+    if (!useDate) {
+        showCustomAlert('알림', '날짜를 입력하세요.', 'warning');
+        return;
+    }
+    try {
+        const result = await eel.add_leave_usage(name, useDate, leaveType, note)();
+        if (result && result.success) {
+            await searchEmployeeLeave();
+        } else {
+            showCustomAlert('오류', (result && result.error) || '추가 실패', 'error');
+        }
+    } catch (e) {
+        showCustomAlert('오류', '추가 중 오류: ' + e.message, 'error');
+    }
+}
+
+async function deleteLeaveUsage(id, employeeName) {
+    if (!confirm('이 사용 내역을 삭제하시겠습니까?')) return;
+    try {
+        const result = await eel.delete_leave_usage(id)();
+        if (result && result.success) {
+            document.getElementById('leaveEmployeeInput').value = employeeName;
+            await searchEmployeeLeave();
+        } else {
+            showCustomAlert('오류', (result && result.error) || '삭제 실패', 'error');
+        }
+    } catch (e) {
+        showCustomAlert('오류', '삭제 중 오류: ' + e.message, 'error');
+    }
+}
+
+
+// ============================================================================
+// 근로 시간 관리
+// ============================================================================
+
+function _initWorkHoursSelectors() {
+    const employeeSel = document.getElementById('workHoursEmployeeInput');
+    const yearSel = document.getElementById('workHoursYear');
+    const monthSel = document.getElementById('workHoursMonth');
+    if (!employeeSel || !yearSel || !monthSel) return;
+    if (!yearSel.options.length) {
+        const curYear = new Date().getFullYear();
+        for (let y = curYear; y >= curYear - 3; y--) {
+            const opt = document.createElement('option');
+            opt.value = y; opt.textContent = y + '년';
+            yearSel.appendChild(opt);
+        }
+    }
+    if (!monthSel.options.length) {
+        for (let m = 1; m <= 12; m++) {
+            const opt = document.createElement('option');
+            opt.value = m; opt.textContent = m + '월';
+            monthSel.appendChild(opt);
+        }
+        monthSel.value = new Date().getMonth() + 1;
+    }
+    if (!employeeSel.dataset.autoSearchBound) {
+        [employeeSel, yearSel, monthSel].forEach(el => {
+            el.addEventListener('change', () => { triggerWorkHoursSearch(); });
+        });
+        employeeSel.dataset.autoSearchBound = 'true';
+    }
+}
+
+function triggerWorkHoursSearch() {
+    const name = document.getElementById('workHoursEmployeeInput')?.value?.trim();
+    const year = parseInt(document.getElementById('workHoursYear')?.value || 0);
+    const month = parseInt(document.getElementById('workHoursMonth')?.value || 0);
+    if (!name || !year || !month) return false;
+    return searchWorkHours({ silent: true });
+}
+
+async function searchWorkHours(options = {}) {
+    const name  = document.getElementById('workHoursEmployeeInput')?.value?.trim();
+    const year  = parseInt(document.getElementById('workHoursYear')?.value || 0);
+    const month = parseInt(document.getElementById('workHoursMonth')?.value || 0);
+    const resultDiv = document.getElementById('workHoursResult');
+    const silent = !!options.silent;
+
+    if (!name) {
+        if (!silent) showCustomAlert('알림', '직원명을 선택하세요.', 'info');
+        return false;
+    }
+    if (!year || !month) {
+        if (!silent) showCustomAlert('알림', '연도와 월을 선택하세요.', 'info');
+        return false;
+    }
+    if (resultDiv) resultDiv.innerHTML = '<p class="text-slate-400">조회 중...</p>';
+
+    try {
+        // 항상 meal_deduct=false로 원본 OT 조회, 석식 공제는 클라이언트 per-day 적용
+        const res = await eelFetch('get_work_hours_by_month', name, year, month, false);
+        if (!res || !res.success) {
+            if (resultDiv) resultDiv.innerHTML = `<p class="text-red-500">${escapeHtml(res?.message || '조회 실패')}</p>`;
+            return;
+        }
+        // 새 조회 시 석식 공제 초기화
+        if (resultDiv) resultDiv._mealDeductDays = new Set();
+        renderWorkHoursCalendar(res, resultDiv);
+        return true;
+    } catch (e) {
+        console.error('근로 시간 조회 오류:', e);
+        if (resultDiv) resultDiv.innerHTML = '<p class="text-red-500">오류가 발생했습니다.</p>';
+        return false;
+    }
+}
+
+function _toggleMealDeduct(dateStr, containerId) {
+    const container = document.getElementById(containerId);
+    if (!container || !container._whData) return;
+    if (!container._mealDeductDays) container._mealDeductDays = new Set();
+    if (container._mealDeductDays.has(dateStr)) {
+        container._mealDeductDays.delete(dateStr);
+    } else {
+        container._mealDeductDays.add(dateStr);
+    }
+    renderWorkHoursCalendar(container._whData, container);
+}
+
+async function editWorkHoursOt(dateStr, containerId) {
+    const container = document.getElementById(containerId);
+    const dayData = container?._whData?.days?.[dateStr] || {};
+    if (!container || dayData.is_future) return;
+
+    const name = document.getElementById('workHoursEmployeeInput')?.value?.trim();
+    if (!name) {
+        showToast('직원명을 먼저 선택하세요.', 'warning');
+        return;
+    }
+
+    const currentStart = dayData.ot_start_time || '17:00';
+    const currentEnd = dayData.ot_end_time || '';
+    const startInput = prompt(`${dateStr} 연장근로 시작 시간을 입력하세요.\n예: 1700 또는 17:00\n비우고 저장하면 이 날짜의 수동 수정값을 지웁니다.`, currentStart);
+    if (startInput === null) return;
+    const endInput = prompt(`${dateStr} 연장근로 종료 시간을 입력하세요.\n예: 2100 또는 21:00\n비우고 저장하면 이 날짜의 수동 수정값을 지웁니다.`, currentEnd);
+    if (endInput === null) return;
+
+    const start = normalizeEndTimeValue(startInput);
+    const end = normalizeEndTimeValue(endInput);
+    if ((startInput.trim() || endInput.trim()) && (!start || !end)) {
+        showCustomAlert('입력 오류', '시작 시간과 종료 시간을 1700 또는 17:00 형식으로 입력해 주세요.', 'warning');
+        return;
+    }
+
+    try {
+        const result = await eel.save_work_hours_ot_override(name, dateStr, start, end, '')();
+        if (!result || !result.success) {
+            showToast(result?.message || '연장근로 시간 저장 실패', 'error');
+            return;
+        }
+        showToast(start && end ? '연장근로 시간이 수정되었습니다.' : '연장근로 수동 수정값을 삭제했습니다.', 'success');
+        await searchWorkHours({ silent: true });
+    } catch (e) {
+        console.error('연장근로 시간 수정 오류:', e);
+        showToast('연장근로 시간 수정 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+function renderWorkHoursCalendar(data, container) {
+    if (!container) return;
+    // 데이터·상태 보존 (innerHTML 재렌더 후에도 유지)
+    container._whData = data;
+    if (!container._mealDeductDays) container._mealDeductDays = new Set();
+    const mealDeductDays = container._mealDeductDays;
+
+    const { days } = data;
+    const containerId = container.id || 'workHoursResult';
+
+    // per-day 석식 공제 적용 후 유효 OT 계산
+    let totalRegular = 0, totalOt = 0;
+    const effectiveDays = {};
+    for (const [dateStr, d] of Object.entries(days)) {
+        const isMealDeducted = mealDeductDays.has(dateStr);
+        const ot = isMealDeducted ? Math.max(0, (d.ot || 0) - 1) : (d.ot || 0);
+        effectiveDays[dateStr] = { ...d, ot, meal_deducted: isMealDeducted };
+        if (d.is_current_month) {
+            totalRegular += d.regular || 0;
+            totalOt += ot;
+        }
+    }
+    const dateEntries = Object.entries(effectiveDays).sort(([a], [b]) => a.localeCompare(b));
+
+    const leaveColors = {
+        '연차': 'bg-blue-100 text-blue-700',
+        '반차': 'bg-purple-100 text-purple-700',
+        '반반차': 'bg-fuchsia-100 text-fuchsia-700',
+        '공가': 'bg-slate-100 text-slate-500'
+    };
+    const dayLabels = ['일', '월', '화', '수', '목', '금', '토'];
+
+    let html = `
+    <div class="space-y-4">
+      <div class="grid grid-cols-3 gap-3">
+        <div class="bg-slate-50 border border-slate-200 rounded-xl p-3 text-center">
+          <p class="text-xs text-slate-500 mb-1">정규 근로시간</p>
+          <p class="text-2xl font-bold text-blue-600">${totalRegular.toFixed(1)}h</p>
+        </div>
+        <div class="bg-slate-50 border border-slate-200 rounded-xl p-3 text-center">
+          <p class="text-xs text-slate-500 mb-1">연장 근로시간</p>
+          <p class="text-2xl font-bold text-orange-500">${totalOt.toFixed(1)}h</p>
+        </div>
+        <div class="bg-slate-50 border border-slate-200 rounded-xl p-3 text-center">
+          <p class="text-xs text-slate-500 mb-1">총 근로시간</p>
+          <p class="text-2xl font-bold text-slate-700">${(totalRegular + totalOt).toFixed(1)}h</p>
+        </div>
+      </div>
+      <div class="overflow-x-auto">
+        <table class="w-full border-collapse text-sm">
+          <thead><tr>`;
+
+    dayLabels.forEach((lbl, i) => {
+        const cls = i === 0 ? 'text-red-600' : i === 6 ? 'text-blue-600' : 'text-slate-700';
+        html += `<th class="border border-slate-200 p-1 text-center text-xs font-semibold ${cls} bg-slate-50 w-14">${lbl}</th>`;
+    });
+    html += `<th class="border border-slate-200 p-1 text-center text-xs font-semibold text-slate-500 bg-slate-100 w-16">주 계</th>`;
+    html += `</tr></thead><tbody>`;
+
+    for (let rowStart = 0; rowStart < dateEntries.length; rowStart += 7) {
+        const weekEntries = dateEntries.slice(rowStart, rowStart + 7);
+        html += '<tr>';
+        let weekRegular = 0, weekOt = 0;
+
+        weekEntries.forEach(([dateStr, dayData], col) => {
+            const isWeekend = dayData.is_weekend || col === 0 || col === 6;
+            const isOutsideMonth = !dayData.is_current_month;
+            const lt = dayData.leave_type;
+            const leaveBadge = lt ? `<span class="inline-block mt-0.5 px-1 text-xs rounded ${leaveColors[lt] || 'bg-slate-100'}">${lt}</span>` : '';
+            const dayNum = parseInt(dateStr.slice(-2), 10);
+            const isFuture = !!dayData.is_future;
+
+            weekRegular += dayData.regular || 0;
+            weekOt += dayData.ot || 0;
+
+            const cellBg = isOutsideMonth
+                ? (isWeekend ? 'bg-slate-100' : 'bg-slate-50')
+                : isFuture
+                    ? 'bg-slate-50'
+                    : (isWeekend ? 'bg-slate-100 hover:bg-blue-50' : 'bg-white hover:bg-blue-50');
+            const dayNumColor = isOutsideMonth
+                ? (col === 0 ? 'text-red-400' : col === 6 ? 'text-blue-400' : 'text-slate-400')
+                : isFuture
+                    ? 'text-slate-300'
+                    : (col === 0 ? 'text-red-600' : col === 6 ? 'text-blue-600' : 'text-slate-700');
+            const regularDisplay = isFuture
+                ? '<span class="text-slate-200">&nbsp;</span>'
+                : dayData.regular > 0
+                ? `<span class="text-blue-700 font-medium">${dayData.regular.toFixed(1)}h</span>`
+                : '<span class="text-slate-300">-</span>';
+            const otDisplay = !isFuture && dayData.ot > 0
+                ? `<span class="text-orange-500 font-medium">+${dayData.ot.toFixed(1)}h</span>`
+                : '';
+            const otTimeDisplay = !isFuture && dayData.ot_start_time && dayData.ot_end_time
+                ? `<div class="text-[10px] text-slate-400 leading-tight">${escapeHtml(dayData.ot_start_time)}-${escapeHtml(dayData.ot_end_time)}</div>`
+                : '';
+            const overrideBadge = dayData.ot_overridden
+                ? `<div class="text-xs text-emerald-600 leading-tight">수정</div>` : '';
+            const mealBadge = dayData.meal_deducted
+                ? `<div class="text-xs text-amber-600 leading-tight">-석식</div>` : '';
+
+            // 야간 근무일(원본 OT > 0)에만 더블클릭 허용
+            const hasRawOt = (days[dateStr]?.ot || 0) > 0;
+            const dblAttr = (!isWeekend && hasRawOt && !isFuture)
+                ? `ondblclick="_toggleMealDeduct('${dateStr}','${containerId}')" style="cursor:pointer" title="더블클릭: 석식 공제 ${dayData.meal_deducted ? '해제' : '적용'}"`
+                : '';
+            const contextAttr = !isFuture
+                ? `oncontextmenu="event.preventDefault(); editWorkHoursOt('${dateStr}','${containerId}'); return false;" title="우클릭: 연장근로 시작/종료 시간 수정"`
+                : '';
+            const mealRing = dayData.meal_deducted ? ' ring-2 ring-inset ring-amber-300' : '';
+            const overrideRing = dayData.ot_overridden ? ' ring-2 ring-inset ring-emerald-300' : '';
+
+            html += `
+            <td class="border border-slate-200 p-1 align-top ${cellBg}${mealRing}${overrideRing} h-16 select-none" style="min-width:56px" ${dblAttr} ${contextAttr}>
+              <div class="text-xs font-semibold ${dayNumColor} mb-0.5">${dayNum}</div>
+              ${leaveBadge}
+              <div class="text-xs leading-tight">${regularDisplay}</div>
+              ${otDisplay ? `<div class="text-xs leading-tight">${otDisplay}</div>` : ''}
+              ${otTimeDisplay}
+              ${overrideBadge}
+              ${mealBadge}
+            </td>`;
+        });
+
+        // 주 계 열은 인접 월 표시분도 함께 합산
+        const weekTotal = weekRegular + weekOt;
+        html += `
+            <td class="border border-slate-200 p-1 align-middle bg-slate-50 h-16 text-center" style="min-width:56px">
+              <div class="text-xs font-bold text-slate-700">${weekTotal.toFixed(1)}h</div>
+              ${weekOt > 0 ? `<div class="text-xs text-orange-500 mt-0.5">+${weekOt.toFixed(1)}</div>` : ''}
+            </td>`;
+        html += '</tr>';
+    }
+
+    html += `
+        </tbody></table>
+      </div>
+      <p class="text-xs text-slate-400">* 오늘 이후 날짜는 근로시간을 표시하지 않습니다. &nbsp;|&nbsp; 야간 근무일 더블클릭 → 석식 공제(1h) 적용/해제 &nbsp;|&nbsp; 달력 우클릭 → 연장근로 시작/종료 시간 수정 &nbsp;|&nbsp; 초록 테두리 = 수동 수정</p>
+    </div>`;
+
+    container.innerHTML = html;
+    // innerHTML 이후 상태 복원
+    container._whData = data;
+    container._mealDeductDays = mealDeductDays;
+}
+
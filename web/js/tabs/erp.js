@@ -0,0 +1,230 @@
+// web/js/tabs/erp.js - ERP 입력 자동화 탭
+// 처음 사용할 때 modules.js의 loadTabModule('erp')로 로드된다.
+
+// ============================================================================
+// ERP 입력 자동화
+// ============================================================================
+
+let _erpPollInterval = null;
+
+/** ERP 입력용 레코드 조회 — 컬럼형으로 받아 날짜별 그룹(dates)으로 복원 */
+async function _fetchErpRecords(startDate, endDate) {
+    const res = await eelFetch('get_records_for_erp', startDate, endDate, currentUser?.user_id || '', true);
+    if (!res || !res.success || !res.records) return res;
+    const grouped = new Map();
+    for (const r of decodeColumnar(res.records)) {
+        const { date, ...rest } = r;
+        if (!grouped.has(date)) grouped.set(date, []);
+        grouped.get(date).push(rest);
+    }
+    return { success: true, dates: [...grouped.entries()].map(([date, records]) => ({ date, records })) };
+}
+
+async function loadErpRecords() {
+    const startDate = document.getElementById('erpStartDate')?.value;
+    const endDate   = document.getElementById('erpEndDate')?.value;
+    const listEl    = document.getElementById('erpRecordList');
+    if (!startDate || !endDate) {
+        showToast('시작일과 종료일을 입력하세요.', 'warning'); return;
+    }
+    if (!listEl) return;
+    listEl.innerHTML = '<p class="text-slate-400 text-sm">조회 중...</p>';
+    try {
+        const res = await _fetchErpRecords(startDate, endDate);
+        if (!res.success) {
+            listEl.innerHTML = `<p class="text-red-500 text-sm">${escapeHtml(res.message)}</p>`; return;
+        }
+        if (!res.dates || res.dates.length === 0) {
+            listEl.innerHTML = '<p class="text-slate-400 text-sm">해당 기간에 입력된 작업 레코드가 없습니다.</p>'; return;
+        }
+        renderErpRecordList(res.dates);
+    } catch (e) {
+        listEl.innerHTML = `<p class="text-red-500 text-sm">조회 실패: ${escapeHtml(e.message || '')}</p>`;
+    }
+}
+
+function renderErpRecordList(dates) {
+    const listEl = document.getElementById('erpRecordList');
+    if (!listEl) return;
+    listEl.innerHTML = dates.map(day => `
+        <div class="border border-slate-200 rounded-lg p-3">
+            <div class="flex items-center gap-2 mb-2">
+                <input type="checkbox" id="erpDay_${escapeHtml(day.date)}" checked
+                       class="w-4 h-4 accent-blue-600 erpDayCheck" data-date="${escapeHtml(day.date)}">
+                <label for="erpDay_${escapeHtml(day.date)}" class="font-semibold text-sm cursor-pointer">
+                    ${escapeHtml(day.date)} (${day.records.length}건)
+                </label>
+            </div>
+            <ul class="text-xs text-slate-600 ml-6 space-y-0.5">
+                ${day.records.map(r => `
+                    <li class="truncate">・ ${escapeHtml(r.contractNumber)} ${escapeHtml(r.workContent)}</li>
+                `).join('')}
+            </ul>
+        </div>
+    `).join('');
+}
+
+async function openErpInputWindow() {
+    const checks = document.querySelectorAll('.erpDayCheck:checked');
+    if (checks.length === 0) {
+        showToast('입력할 날짜를 선택하세요.', 'warning'); return;
+    }
+    const startDate = document.getElementById('erpStartDate')?.value;
+    const endDate   = document.getElementById('erpEndDate')?.value;
+    try {
+        const res = await _fetchErpRecords(startDate, endDate);
+        if (!res.success) { showToast(res.message || '레코드 조회 실패', 'error'); return; }
+
+        const selectedDates = new Set(Array.from(checks).map(c => c.dataset.date));
+        const filtered = (res.dates || []).filter(d => selectedDates.has(d.date));
+        if (filtered.length === 0) { showToast('선택된 날짜에 레코드가 없습니다.', 'warning'); return; }
+
+        const r = await eel.open_erp_input_window(JSON.stringify(filtered), currentUser?.user_id || '')();
+        if (!r.success) { showToast(r.message || '실행 실패', 'error'); return; }
+        showToast('ERP 입력 창이 열립니다. 잠시 후 새 창을 확인하세요.', 'success');
+    } catch (e) {
+        showToast('오류가 발생했습니다.', 'error');
+    }
+}
+
+async function startErpMacro() {
+    // 체크된 날짜의 레코드만 수집
+    const checks = document.querySelectorAll('.erpDayCheck:checked');
+    if (checks.length === 0) {
+        showToast('입력할 날짜를 선택하세요.', 'warning'); return;
+    }
+    const listEl = document.getElementById('erpRecordList');
+    const startDate = document.getElementById('erpStartDate')?.value;
+    const endDate   = document.getElementById('erpEndDate')?.value;
+
+    // 선택된 날짜 목록 재조회
+    try {
+        const res = await _fetchErpRecords(startDate, endDate);
+        if (!res.success) { showToast(res.message, 'error'); return; }
+
+        const selectedDates = new Set(Array.from(checks).map(c => c.dataset.date));
+        const filtered = (res.dates || []).filter(d => selectedDates.has(d.date));
+        if (filtered.length === 0) { showToast('선택된 날짜에 레코드가 없습니다.', 'warning'); return; }
+
+        const startRes = await eel.start_erp_macro(JSON.stringify(filtered), currentUser?.user_id || '')();
+        if (!startRes.success) { showToast(startRes.message, 'error'); return; }
+
+        document.getElementById('btnErpStart')?.classList.add('hidden');
+        document.getElementById('btnErpStop')?.classList.remove('hidden');
+        document.getElementById('erpProgressBar')?.classList.remove('hidden');
+        document.getElementById('erpLog')?.classList.remove('hidden');
+        showToast('ERP 입력 매크로를 시작합니다.', 'success');
+        _erpPollInterval = setInterval(pollErpStatus, 1000);
+    } catch (e) {
+        showToast('매크로 시작 중 오류: ' + escapeHtml(e.message || ''), 'error');
+    }
+}
+
+async function stopErpMacro() {
+    try {
+        const res = await eel.stop_erp_macro(currentUser?.user_id || '')();
+        showToast(res.success ? '중단 요청이 전송되었습니다.' : res.message,
+                  res.success ? 'warning' : 'error');
+    } catch (e) {
+        showToast('중단 요청 중 오류가 발생했습니다.', 'error');
+    }
+}
+
+async function pollErpStatus() {
+    try {
+        const res = await eelFetch('get_erp_macro_status', currentUser?.user_id || '');
+        if (!res.success) return;
+
+        // 진행 바
+        const fill = document.getElementById('erpProgressFill');
+        const text = document.getElementById('erpProgressText');
+        if (fill && res.total > 0) {
+            const pct = Math.round(res.progress / res.total * 100);
+            fill.style.width = pct + '%';
+            if (text) text.textContent = `${res.progress} / ${res.total} (${pct}%) — ${res.current || ''}`;
+        }
+
+        // 로그
+        const logEl = document.getElementById('erpLog');
+        if (logEl && res.log) {
+            logEl.textContent = res.log.join('\n');
+            logEl.scrollTop = logEl.scrollHeight;
+        }
+
+        // 라이브러리 누락 감지 → 설치 버튼 표시
+        if (res.log && res.log.some(l => l.includes('필수 라이브러리 누락'))) {
+            document.getElementById('btnInstallErpDeps')?.classList.remove('hidden');
+        }
+
+        // 완료 감지
+        if (!res.running) {
+            clearInterval(_erpPollInterval);
+            _erpPollInterval = null;
+            document.getElementById('btnErpStart')?.classList.remove('hidden');
+            document.getElementById('btnErpStop')?.classList.add('hidden');
+            // 오류/완료/종료 구분
+            const _hasErr = res.log && res.log.some(l =>
+                l.includes('찾을 수 없습니다') || l.includes('라이브러리 누락') || l.includes('오류 발생'));
+            if (_hasErr) {
+                showToast('ERP 입력 중 오류가 발생했습니다. 로그를 확인하세요.', 'error');
+            } else if (res.progress > 0) {
+                showToast('ERP 입력이 완료되었습니다.', 'success');
+            } else {
+                showToast('ERP 매크로가 종료되었습니다.', 'warning');
+            }
+        }
+    } catch (e) {
+        // 일시적 통신 오류 — 조용히 무시
+    }
+}
+
+async function diagnoseErpControls() {
+    const el = document.getElementById('erpDiagResult');
+    if (!el) return;
+    el.classList.remove('hidden');
+    el.textContent = '진단 중...';
+    try {
+        const res = await eel.diagnose_erp_controls(currentUser?.user_id || '')();
+        if (res && res.success) {
+            const cands = res.calendar_candidates || [];
+            const calInfo = cands.length
+                ? '✅ 달력 컨트롤 발견: ' + cands.map(c => c.cls).join(', ')
+                : '⚠️ 달력 컨트롤 미발견 (Win32 직접 설정 불가 — 좌표 폴백 사용)';
+            const lines = [
+                `ERP 창: "${escapeHtml(res.erp_title || '')}" (hwnd=${res.erp_hwnd})`,
+                calInfo,
+                `전체 자식 컨트롤: ${(res.controls || []).length}개`,
+                '',
+                ...(res.controls || []).slice(0, 25).map(c =>
+                    `[${c.hwnd}] ${escapeHtml(c.cls)} "${escapeHtml(c.text || '')}" rect=${JSON.stringify(c.rect)}`)
+            ];
+            el.textContent = lines.join('\n');
+        } else {
+            let msg = res?.message || '진단 실패';
+            if (res?.open_windows?.length) {
+                msg += '\n현재 열린 창: ' + res.open_windows.map(w => escapeHtml(w)).join(', ');
+            }
+            el.textContent = msg;
+        }
+    } catch(e) {
+        el.textContent = '진단 오류: ' + escapeHtml(e?.message || String(e));
+    }
+}
+
+async function installErpDeps() {
+    const btn = document.getElementById('btnInstallErpDeps');
+    if (btn) { btn.disabled = true; btn.textContent = '설치 중...'; }
+    try {
+        const res = await eel.install_erp_deps(currentUser?.user_id || '')();
+        if (res?.success) {
+            showToast(res.message, 'success');
+            if (btn) btn.classList.add('hidden');
+        } else {
+            showToast('설치 실패: ' + escapeHtml(res?.message || ''), 'error');
+            if (btn) { btn.disabled = false; btn.textContent = '📦 필수 라이브러리 설치'; }
+        }
+    } catch(e) {
+        showToast('오류가 발생했습니다.', 'error');
+        if (btn) { btn.disabled = false; btn.textContent = '📦 필수 라이브러리 설치'; }
+    }
+}
@@ -26,11 +26,56 @@ async function checkForUpdatesAuto() {
     }
 }
 
-// 스플래시에서 감지한 업데이트 정보로 모달 바로 표시 (로그인 전 호출용)
-function showUpdateModalWithInfo(info) {
-    if (!info || !info.update_available) return;
-    updateInfo = info;
-    showUpdateModal();
+// ============================================================================
+// 백그라운드에서 준비된 패치 (다음 시작 시 적용)
+// ============================================================================
+
+let _stagedUpdateNotified = 0;
+
+// 서버가 앱 시작 후 받아 둔 패치가 있으면 재시작 안내 (네트워크 호출 없음)
+async function checkStagedUpdate() {
+    try {
+        const result = await eel.get_staged_update()();
+        if (result && result.success && result.staged_count > _stagedUpdateNotified) {
+            _stagedUpdateNotified = result.staged_count;
+            showStagedUpdateNotification(result);
+        }
+    } catch (error) {
+        console.error('준비된 패치 확인 오류:', error);
+    }
+}
+
+function showStagedUpdateNotification(info) {
+    const existing = document.getElementById('restartNotification');
+    if (existing) existing.remove();
+
+    const versions = (info.versions || []).filter(Boolean);
+    const label = versions.length ? `v${versions[versions.length - 1]}` : `패치 ${info.staged_count}개`;
+
+    const div = document.createElement('div');
+    div.id = 'restartNotification';
+    div.style.cssText = 'position:fixed;bottom:24px;right:24px;z-index:9000;max-width:320px;';
+    div.innerHTML = `
+        <div style="background:#1d4ed8;color:#fff;border-radius:12px;padding:16px 20px;box-shadow:0 4px 20px rgba(0,0,0,0.3);">
+            <div style="font-weight:700;font-size:14px;margin-bottom:6px;">🆕 ${escapeHtml(label)} 업데이트 준비 완료</div>
+            <div style="font-size:13px;opacity:0.9;">지금 재시작하거나, 다음 실행 시 자동으로 적용됩니다.</div>
+            <div style="margin-top:12px;display:flex;gap:8px;">
+                <button id="stagedRestartBtn" style="flex:1;background:#fff;color:#1d4ed8;border:none;border-radius:6px;padding:6px 0;font-size:12px;font-weight:700;cursor:pointer;">재시작</button>
+                <button onclick="document.getElementById('restartNotification').remove()" style="flex:1;background:rgba(255,255,255,0.2);color:#fff;border:none;border-radius:6px;padding:6px 0;font-size:12px;cursor:pointer;">나중에</button>
+            </div>
+        </div>`;
+    document.body.appendChild(div);
+    document.getElementById('stagedRestartBtn').addEventListener('click', async () => {
+        if (typeof _hasUnsavedChanges === 'function' && _hasUnsavedChanges('any')) {
+            showCustomAlert('재시작 보류', '저장하지 않은 작업이 있습니다. 저장 후 다시 시도하세요.', 'warning');
+            return;
+        }
+        try {
+            await eel.restart_app_after_update()();
+        } catch (error) {
+            console.error('재시작 요청 오류:', error);
+        }
+    });
 }
 
 // ============================================================================
@@ -169,7 +214,7 @@ async function startUpdate() {
 
     try {
         // 패치 ZIP 다운로드 + 적용
-        const result = await eel.download_and_apply_patches()();
+        const result = await awaitJobResult(await eel.download_and_apply_patches()());
 
         updateDownloadProgress(100);
 
@@ -267,15 +312,7 @@ function formatReleaseNotes(markdown) {
 // 관리자 페이지: 업데이트 확인 버튼
 // ============================================================================
 
-// 관리자 페이지 초기화 시 호출
-if (typeof loadAdminData !== 'undefined') {
-    const originalLoadAdminData = loadAdminData;
-    loadAdminData = async function() {
-        await originalLoadAdminData();
-        addUpdateCheckButton();
-    };
-}
-
+// 관리자 페이지 초기화(tabs/admin.js loadAdminData) 시 호출
 function addUpdateCheckButton() {
     // 관리자 페이지에 업데이트 확인 버튼 추가
     const header = document.querySelector('#adminApp header .flex.items-center.gap-4');